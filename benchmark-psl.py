@@ -0,0 +1,316 @@
+#!/usr/bin/env python
+# Copyright (c) 2021 Felix Fontein
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+'''
+Offline benchmark for the Public Suffix List code and the domain_suffix filters.
+
+Run from the collection's root directory (ansible_collections/community/dns/):
+
+    ./benchmark-psl.py [--json results.json] [--compare baseline.json]
+
+The name corpora are generated deterministically from the PSL itself, so results of
+different runs (and of different versions of the matching engine) can be compared.
+Besides ops/sec and memory usage, a digest of all lookup results is reported; if the
+digests differ from the baseline, the matching engine returns different results.
+'''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import argparse
+import gc
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+
+try:
+    import tracemalloc
+    HAS_TRACEMALLOC = True
+except ImportError:
+    HAS_TRACEMALLOC = False
+
+
+PSL_FILENAME = os.path.join('plugins', 'public_suffix_list.dat')
+
+WORDS = [
+    'www', 'mail', 'api', 'dev', 'staging', 'shop', 'example', 'foo', 'bar', 'baz', 'cdn', 'static',
+    'eu-central-1', 'a1b2c3', 'blog', 'intranet', 'vpn', 'ns1', 'login', 'my-company',
+]
+
+IDN_WORDS = [u'bücher', u'münchen', u'食狮', u'пример', u'παράδειγμα', u'日本語', u'café', u'straße']
+
+
+def load_modules():
+    sys.path.append(os.path.join('..', '..', '..'))
+    from ansible_collections.community.dns.plugins.plugin_utils import public_suffix
+    from ansible_collections.community.dns.plugins.filter import domain_suffix
+    return public_suffix, domain_suffix
+
+
+def _decode_label(label):
+    if label.startswith('xn--'):
+        try:
+            return label.encode('ascii').decode('idna')
+        except UnicodeError:
+            pass
+    return label
+
+
+def create_corpora(snapshot, size, seed):
+    '''
+    Create a dictionary mapping corpus names to lists of DNS names.
+    '''
+    rnd = random.Random(seed)
+    plain_rules = []
+    wildcard_rules = []
+    exception_rules = []
+    idn_rules = []
+    for dummy, rules in snapshot:
+        for rule in rules:
+            if rule.startswith('!'):
+                exception_rules.append(rule[1:])
+            elif rule.startswith('*.'):
+                wildcard_rules.append(rule[2:])
+            elif '*' not in rule:
+                plain_rules.append(rule)
+                if 'xn--' in rule:
+                    idn_rules.append(rule)
+    known_tlds = set(rule.rsplit('.', 1)[-1] for rule in plain_rules + wildcard_rules + exception_rules)
+
+    def word():
+        return rnd.choice(WORDS)
+
+    def pick(rules):
+        return rnd.choice(rules)
+
+    def unknown_tld():
+        while True:
+            tld = ''.join(rnd.choice('abcdefghijklmnopqrstuvwxyz') for dummy in range(rnd.randint(5, 9)))
+            if tld not in known_tlds:
+                return tld
+
+    def variant(name):
+        # Some names are fully qualified or use upper-case letters
+        value = rnd.random()
+        if value < 0.1:
+            return name + '.'
+        if value < 0.2:
+            return name.upper()
+        return name
+
+    corpora = {}
+    corpora['short'] = [variant('{0}.{1}'.format(word(), pick(plain_rules))) for dummy in range(size)]
+    corpora['deep'] = [
+        variant('.'.join([word() for dummy in range(rnd.randint(4, 10))] + [pick(plain_rules)]))
+        for dummy in range(size)
+    ]
+    corpora['idn'] = [
+        u'{0}.{1}.{2}'.format(
+            word(),
+            rnd.choice(IDN_WORDS),
+            u'.'.join(_decode_label(label) for label in pick(idn_rules).split('.')),
+        )
+        for dummy in range(size)
+    ]
+    corpora['wildcard'] = [
+        variant('{0}.{1}.{2}'.format(word(), word(), pick(wildcard_rules))) for dummy in range(size)
+    ]
+    corpora['exception'] = [
+        variant('{0}.{1}'.format(word(), pick(exception_rules))) for dummy in range(size)
+    ]
+    corpora['unknown'] = [variant('{0}.example.{1}'.format(word(), unknown_tld())) for dummy in range(size)]
+    return corpora
+
+
+def measure(function, repeat):
+    '''
+    Run ``function`` ``repeat`` times and return the fastest run's duration in seconds.
+    '''
+    best = None
+    for dummy in range(repeat):
+        gc.collect()
+        start = time.time()
+        function()
+        duration = time.time() - start
+        if best is None or duration < best:
+            best = duration
+    return best
+
+
+def measure_memory(function):
+    '''
+    Return ``(result, retained, peak)`` for calling ``function``, where memory sizes are in bytes.
+    Memory sizes are ``None`` if tracemalloc is not available.
+    '''
+    if not HAS_TRACEMALLOC:
+        return function(), None, None
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, retained, peak
+
+
+def compute_digest(results):
+    sha256 = hashlib.sha256()
+    for result in results:
+        sha256.update(json.dumps(result).encode('utf-8'))
+        sha256.update(b'\n')
+    return sha256.hexdigest()
+
+
+def run_benchmarks(public_suffix, domain_suffix, psl_filename, corpora, repeat):
+    benchmarks = {}
+    PublicSuffixList = public_suffix.PublicSuffixList
+
+    psl, retained, peak = measure_memory(lambda: PublicSuffixList.load(psl_filename))
+    benchmarks['load'] = {
+        'ops': 1,
+        'seconds': measure(lambda: PublicSuffixList.load(psl_filename), repeat),
+        'memory_retained': retained,
+        'memory_peak': peak,
+    }
+    snapshot = psl.to_snapshot()
+    dummy, retained, peak = measure_memory(lambda: PublicSuffixList.from_snapshot(snapshot))
+    benchmarks['from_snapshot'] = {
+        'ops': 1,
+        'seconds': measure(lambda: PublicSuffixList.from_snapshot(snapshot), repeat),
+        'memory_retained': retained,
+        'memory_peak': peak,
+    }
+
+    def clear_cache():
+        domain_suffix.PUBLIC_SUFFIX_CACHE.clear()
+
+    def single(function, names, **kwargs):
+        def f():
+            clear_cache()
+            return [function(name, **kwargs) for name in names]
+        return f
+
+    def batch(function, names, **kwargs):
+        def f():
+            clear_cache()
+            return function(names, **kwargs)
+        return f
+
+    # The filters use the official PSL; make sure it uses the list that is benchmarked
+    domain_suffix.PUBLIC_SUFFIX_LIST = psl
+
+    operations = [
+        ('get_suffix', lambda names: single(psl.get_suffix, names)),
+        ('get_suffix[icann_only]', lambda names: single(psl.get_suffix, names, icann_only=True)),
+        ('get_registrable_domain', lambda names: single(psl.get_registrable_domain, names)),
+        ('get_registrable_domain[normalize_result]', lambda names: single(psl.get_registrable_domain, names, normalize_result=True)),
+        ('get_suffixes', lambda names: batch(psl.get_suffixes, names)),
+        ('get_registrable_domains', lambda names: batch(psl.get_registrable_domains, names)),
+        ('filter:get_public_suffix', lambda names: single(domain_suffix.get_public_suffix, names)),
+        ('filter:get_registrable_domain', lambda names: single(domain_suffix.get_registrable_domain, names)),
+        ('filter:remove_public_suffix', lambda names: single(domain_suffix.remove_public_suffix, names)),
+        ('filter:remove_registrable_domain', lambda names: single(domain_suffix.remove_registrable_domain, names)),
+        ('filter:get_public_suffix[list]', lambda names: batch(domain_suffix.get_public_suffix, names)),
+        ('filter:get_registrable_domain[list]', lambda names: batch(domain_suffix.get_registrable_domain, names)),
+    ]
+    for corpus_name, names in sorted(corpora.items()):
+        for operation_name, create_function in operations:
+            function = create_function(names)
+            results, retained, peak = measure_memory(function)
+            benchmarks['{0}/{1}'.format(operation_name, corpus_name)] = {
+                'ops': len(names),
+                'seconds': measure(function, repeat),
+                'memory_retained': retained,
+                'memory_peak': peak,
+                'digest': compute_digest(results),
+            }
+    return benchmarks
+
+
+def format_memory(value):
+    if value is None:
+        return 'n/a'
+    return '{0:.2f} MiB'.format(value / 1024.0 / 1024.0)
+
+
+def print_benchmarks(benchmarks, baseline=None):
+    width = max(len(name) for name in benchmarks)
+    print('{0:<{width}}  {1:>14}  {2:>12}  {3:>12}'.format(
+        'Benchmark', 'ops/sec', 'retained', 'peak', width=width))
+    for name, benchmark in sorted(benchmarks.items()):
+        ops_per_sec = benchmark['ops'] / benchmark['seconds'] if benchmark['seconds'] else float('inf')
+        line = '{0:<{width}}  {1:>14.1f}  {2:>12}  {3:>12}'.format(
+            name, ops_per_sec, format_memory(benchmark['memory_retained']), format_memory(benchmark['memory_peak']), width=width)
+        if baseline and name in baseline:
+            base = baseline[name]
+            if base['seconds'] and benchmark['seconds']:
+                line += '  {0:+7.1f}%'.format((base['seconds'] / benchmark['seconds'] - 1) * 100)
+        print(line)
+
+
+def compare_benchmarks(benchmarks, baseline, tolerance):
+    '''
+    Return a list of differences between ``benchmarks`` and ``baseline`` which are regressions.
+    '''
+    errors = []
+    for name, benchmark in sorted(benchmarks.items()):
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if 'digest' in base and base['digest'] != benchmark.get('digest'):
+            errors.append('{0}: results differ from baseline'.format(name))
+        if base['seconds'] and benchmark['seconds'] > base['seconds'] * (1 + tolerance):
+            errors.append('{0}: {1:.1f}% slower than baseline'.format(
+                name, (benchmark['seconds'] / base['seconds'] - 1) * 100))
+    return errors
+
+
+def main(program, arguments):
+    parser = argparse.ArgumentParser(prog=program, description='Benchmark the Public Suffix List code.')
+    parser.add_argument('--psl', default=PSL_FILENAME, help='Public Suffix List to use (default: %(default)s)')
+    parser.add_argument('--size', type=int, default=2000, help='Number of names per corpus (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of runs per benchmark; the fastest is used (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for corpus generation (default: %(default)s)')
+    parser.add_argument('--json', help='Store results as JSON in this file')
+    parser.add_argument('--compare', help='Compare to results stored with --json')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Relative slowdown accepted before reporting a regression (default: %(default)s)')
+    args = parser.parse_args(arguments)
+
+    public_suffix, domain_suffix = load_modules()
+    corpora = create_corpora(public_suffix.PublicSuffixList.load(args.psl).to_snapshot(), args.size, args.seed)
+    benchmarks = run_benchmarks(public_suffix, domain_suffix, args.psl, corpora, args.repeat)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)['benchmarks']
+
+    print_benchmarks(benchmarks, baseline)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'python': sys.version.split()[0],
+                'size': args.size,
+                'seed': args.seed,
+                'benchmarks': benchmarks,
+            }, f, indent=2, sort_keys=True)
+
+    if baseline is not None:
+        errors = compare_benchmarks(benchmarks, baseline, args.tolerance)
+        for error in errors:
+            print(error)
+        return 5 if errors else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[0], sys.argv[1:]))
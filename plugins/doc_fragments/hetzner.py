@@ -20,6 +20,47 @@ options:
           - api_token
         type: str
         required: true
+    hetzner_bulk_max_bytes:
+        description:
+          - The maximal size in bytes of the records created with one request when creating
+            multiple records at once.
+          - If more records need to be created, they are created with several requests. Every
+            request succeeds or fails on its own.
+        type: int
+        default: 1048576
+        version_added: 2.1.0
+    hetzner_bulk_max_records:
+        description:
+          - The maximal number of records created with one request when creating multiple records
+            at once.
+          - If more records need to be created, they are created with several requests. Every
+            request succeeds or fails on its own.
+        type: int
+        default: 1000
+        version_added: 2.1.0
+    hetzner_bulk_update:
+        description:
+          - Whether to use the bulk update API when several records need to be updated at once.
+            Then, for example, changing the TTL of all records of a zone needs only one request.
+          - Records which the bulk update API could not update are updated one by one. If the bulk
+            update API rejects the request, for example with HTTP status 422, all records are updated
+            one by one. Authentication errors are not handled this way.
+          - If the bulk update API is not available, all records are updated one by one, and the bulk
+            update API is not used again. For some time, the bulk update API did not work; set this
+            to C(false) to not use it at all.
+        type: bool
+        default: true
+        version_added: 2.1.0
+    hetzner_page_size:
+        description:
+          - The number of records to request per page when retrieving the records of a zone.
+          - A larger page size means that large zones need fewer requests. The API might limit the
+            page size.
+          - If I(max_concurrency) is larger than 1, all pages after the first one are requested
+            with up to I(max_concurrency) requests at the same time.
+        type: int
+        default: 100
+        version_added: 2.1.0
 '''
 
     # NOTE: This document fragment augments the above standard DOCUMENTATION document fragment
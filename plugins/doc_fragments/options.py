@@ -9,6 +9,162 @@ __metaclass__ = type
 
 class ModuleDocFragment(object):
 
+    API_CLIENT = r'''
+options:
+    connection_pool_size:
+        description:
+            - Determines whether connections to the API are kept open and reused for further requests.
+            - If set to a positive number, up to this number of idle connections are kept open. This
+              avoids establishing a new connection, including a TLS handshake, for every request, which
+              speeds up operations which need many API requests.
+            - The default value 0 means that every request uses a new connection.
+            - Requests which need to use a proxy always use a new connection.
+        type: int
+        default: 0
+        version_added: 2.1.0
+    max_concurrency:
+        description:
+            - Maximal number of API requests which are run at the same time when creating, updating or
+              deleting several records, if the API does not support doing this with one request.
+            - For the Hetzner API, this also limits the number of pages of records which are retrieved
+              at the same time.
+            - The default value 1 means that the requests are run one after another.
+            - Results are returned in the same order as for sequential requests. If an error happens
+              and the module stops on errors, requests which have not been started yet are cancelled.
+            - Requests are only run at the same time if the Python module C(concurrent.futures) is
+              available. It is part of the standard library for Python 3; for Python 2 it is provided
+              by the C(futures) package.
+        type: int
+        default: 1
+        version_added: 2.1.0
+    rate_limit:
+        description:
+            - Limits the number of API requests per second (on average).
+            - This avoids hitting the provider's rate limit, which makes the API reject requests
+              until the module waited long enough.
+            - If not set, the number of requests is not limited.
+        type: float
+        version_added: 2.1.0
+    rate_limit_burst:
+        description:
+            - The number of API requests which can be made at once after not making requests for a
+              while, if I(rate_limit) is set.
+        type: int
+        default: 1
+        version_added: 2.1.0
+    rate_limit_shared:
+        description:
+            - If set to C(true), the rate limit from I(rate_limit) is shared by all processes on this
+              machine using the same provider and credentials, for example by all forks of
+              C(ansible-playbook) running a module for multiple hosts.
+            - The state is stored in a file in C(~/.ansible/cache/community.dns), or in the directory
+              specified by the environment variable C(COMMUNITY_DNS_CACHE_DIR). For modules, this
+              is on the machine the module runs on.
+            - Sharing the rate limit is not supported on Windows.
+        type: bool
+        default: false
+        version_added: 2.1.0
+    max_retries:
+        description:
+            - Maximal number of times a request to the API is retried.
+            - Requests are retried if the API responds that too many requests have been made
+              (HTTP status 429). For requests which can safely be repeated (all requests except
+              C(POST) requests), they are also retried on gateway errors (HTTP status 502, 503
+              and 504) and on network errors.
+        type: int
+        default: 10
+        version_added: 2.1.0
+    retry_initial_delay:
+        description:
+            - The delay in seconds before the first retry after a gateway or network error.
+              The delay is doubled for every further retry, up to I(retry_max_delay).
+            - If the API responds that too many requests have been made, the delay is taken
+              from its response, or is 10 seconds if the response does not contain one.
+        type: float
+        default: 1
+        version_added: 2.1.0
+    retry_max_delay:
+        description:
+            - The maximal delay in seconds before a retry.
+            - If the API asks to slow down and tells how long to wait, this delay is always used. If
+              it would exceed I(retry_max_total_wait), the request is not retried.
+        type: float
+        default: 60
+        version_added: 2.1.0
+    retry_jitter:
+        description:
+            - Whether to randomize the delays before retrying after gateway or network errors.
+            - This avoids that several processes retry at the same time.
+        type: bool
+        default: true
+        version_added: 2.1.0
+    retry_max_total_wait:
+        description:
+            - The maximal total time in seconds to wait before retries of a single request.
+        type: float
+        default: 600
+        version_added: 2.1.0
+    response_cache:
+        description:
+            - Whether to cache responses to read requests on disk.
+            - If the API provided an C(ETag) or C(Last-Modified) header for a response, the next
+              identical request asks the API whether the data changed, and uses the cached response
+              if it did not. This avoids downloading unchanged zones again.
+            - Responses without these headers are only cached if I(response_cache_ttl) is positive.
+            - The cache is stored in C(~/.ansible/cache/community.dns), or in the directory specified
+              by the environment variable C(COMMUNITY_DNS_CACHE_DIR). Every combination of provider
+              and credentials uses its own cache. For modules, this is on the machine the module runs on.
+            - All cached responses for a provider and credentials are removed when a request that
+              changes data succeeds.
+            - The HostTech WSDL API does not use this cache, since it also uses POST requests to read data.
+        type: bool
+        default: false
+        version_added: 2.1.0
+    response_cache_ttl:
+        description:
+            - The time in seconds for which responses without C(ETag) or C(Last-Modified) header
+              are reused without asking the API, if I(response_cache=true).
+            - B(Note:) during this time, changes made by other means than this collection with the
+              same credentials are not noticed. Only use short times.
+            - The default value 0 means that these responses are not cached.
+        type: float
+        default: 0
+        version_added: 2.1.0
+    zone_id_cache:
+        description:
+            - Whether to remember the IDs of zones looked up by name on disk, so that later runs can
+              retrieve these zones by ID instead of searching for them by name. For the HostTech JSON
+              API, this saves at least one request per zone.
+            - The cache is stored in the same directory as the one for I(response_cache). Every
+              combination of provider and credentials uses its own cache.
+            - If a zone retrieved by its cached ID does not exist or has another name, the zone is
+              looked up by name again.
+            - For the Hetzner API, the records of a zone are retrieved with its cached ID directly, which
+              saves one request per zone. If no records or records of another zone are returned for that
+              ID, the zone is looked up by name again.
+            - The HostTech WSDL API does not use this cache, since it retrieves zones by name directly.
+        type: bool
+        default: false
+        version_added: 2.1.0
+    zone_id_cache_ttl:
+        description:
+            - The time in seconds for which zone IDs are remembered if I(zone_id_cache=true).
+        type: float
+        default: 86400
+        version_added: 2.1.0
+'''
+
+    API_STATS = r'''
+options:
+    collect_api_stats:
+        description:
+            - Whether to collect statistics on the API requests made by the module, and return them
+              in C(api_stats).
+        type: bool
+        default: false
+        version_added: 2.1.0
+'''
+
     BULK_OPERATIONS = r'''
 options:
     bulk_operation_threshold:
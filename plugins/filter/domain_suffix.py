@@ -6,9 +6,58 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+from ansible.errors import AnsibleFilterError
+from ansible.module_utils.common._collections_compat import Iterable, Mapping
+from ansible.module_utils.six import binary_type, string_types
+
+from ansible_collections.community.dns.plugins.plugin_utils.lru_cache import LRUCache
 from ansible_collections.community.dns.plugins.plugin_utils.public_suffix import PUBLIC_SUFFIX_LIST
 
 
+# Templates tend to apply these filters to the same names over and over, so we remember
+# the results of the latest Public Suffix List lookups. Use PUBLIC_SUFFIX_CACHE.cache_info()
+# to inspect the number of cache hits and misses.
+PUBLIC_SUFFIX_CACHE = LRUCache(maxsize=16384)
+
+
+def _get_suffix(dns_name, keep_unknown_suffix, normalize_result, icann_only):
+    return PUBLIC_SUFFIX_CACHE.get(
+        ('suffix', dns_name, keep_unknown_suffix, normalize_result, icann_only),
+        lambda: PUBLIC_SUFFIX_LIST.get_suffix(
+            dns_name,
+            keep_unknown_suffix=keep_unknown_suffix,
+            normalize_result=normalize_result,
+            icann_only=icann_only,
+        ),
+    )
+
+
+def _get_registrable_domain(dns_name, keep_unknown_suffix, only_if_registerable, normalize_result, icann_only):
+    return PUBLIC_SUFFIX_CACHE.get(
+        ('registrable_domain', dns_name, keep_unknown_suffix, only_if_registerable, normalize_result, icann_only),
+        lambda: PUBLIC_SUFFIX_LIST.get_registrable_domain(
+            dns_name,
+            keep_unknown_suffix=keep_unknown_suffix,
+            only_if_registerable=only_if_registerable,
+            normalize_result=normalize_result,
+            icann_only=icann_only,
+        ),
+    )
+
+
+def _is_list(dns_name):
+    if isinstance(dns_name, Mapping):
+        raise AnsibleFilterError('Expected a DNS name or a list of DNS names, but got a dictionary')
+    # Before ansible-core 2.19, map() passes a generator to the filter
+    return isinstance(dns_name, Iterable) and not isinstance(dns_name, (string_types, binary_type))
+
+
+def _add_leading_period(dns_name, suffix, keep_leading_period):
+    if suffix and len(suffix) < len(dns_name) and keep_leading_period:
+        suffix = '.' + suffix
+    return suffix
+
+
 def _remove_suffix(dns_name, suffix, keep_trailing_period):
     suffix_len = len(suffix)
     if suffix_len and suffix_len < len(dns_name) and not keep_trailing_period:
@@ -21,8 +70,16 @@ def get_registrable_domain(dns_name,
                            only_if_registerable=True,
                            normalize_result=False,
                            icann_only=False):
-    '''Given DNS name, returns the registrable domain.'''
-    return PUBLIC_SUFFIX_LIST.get_registrable_domain(
+    '''Given DNS name or list of DNS names, returns the registrable domain(s).'''
+    if _is_list(dns_name):
+        return PUBLIC_SUFFIX_LIST.get_registrable_domains(
+            list(dns_name),
+            keep_unknown_suffix=keep_unknown_suffix,
+            only_if_registerable=only_if_registerable,
+            normalize_result=normalize_result,
+            icann_only=icann_only,
+        )
+    return _get_registrable_domain(
         dns_name,
         keep_unknown_suffix=keep_unknown_suffix,
         only_if_registerable=only_if_registerable,
@@ -36,16 +93,23 @@ def get_public_suffix(dns_name,
                       keep_unknown_suffix=True,
                       normalize_result=False,
                       icann_only=False):
-    '''Given DNS name, returns the public suffix.'''
-    suffix = PUBLIC_SUFFIX_LIST.get_suffix(
+    '''Given DNS name or list of DNS names, returns the public suffix(es).'''
+    if _is_list(dns_name):
+        dns_names = list(dns_name)
+        suffixes = PUBLIC_SUFFIX_LIST.get_suffixes(
+            dns_names,
+            keep_unknown_suffix=keep_unknown_suffix,
+            normalize_result=normalize_result,
+            icann_only=icann_only,
+        )
+        return [_add_leading_period(name, suffix, keep_leading_period) for name, suffix in zip(dns_names, suffixes)]
+    suffix = _get_suffix(
         dns_name,
         keep_unknown_suffix=keep_unknown_suffix,
         normalize_result=normalize_result,
         icann_only=icann_only,
     )
-    if suffix and len(suffix) < len(dns_name) and keep_leading_period:
-        suffix = '.' + suffix
-    return suffix
+    return _add_leading_period(dns_name, suffix, keep_leading_period)
 
 
 def remove_registrable_domain(dns_name,
@@ -53,8 +117,18 @@ def remove_registrable_domain(dns_name,
                               keep_unknown_suffix=True,
                               only_if_registerable=True,
                               icann_only=False):
-    '''Given DNS name, returns the part before the registrable_domain.'''
-    suffix = PUBLIC_SUFFIX_LIST.get_registrable_domain(
+    '''Given DNS name or list of DNS names, returns the part(s) before the registrable_domain.'''
+    if _is_list(dns_name):
+        dns_names = list(dns_name)
+        suffixes = PUBLIC_SUFFIX_LIST.get_registrable_domains(
+            dns_names,
+            keep_unknown_suffix=keep_unknown_suffix,
+            only_if_registerable=only_if_registerable,
+            normalize_result=False,
+            icann_only=icann_only,
+        )
+        return [_remove_suffix(name, suffix, keep_trailing_period) for name, suffix in zip(dns_names, suffixes)]
+    suffix = _get_registrable_domain(
         dns_name,
         keep_unknown_suffix=keep_unknown_suffix,
         only_if_registerable=only_if_registerable,
@@ -68,8 +142,17 @@ def remove_public_suffix(dns_name,
                          keep_trailing_period=False,
                          keep_unknown_suffix=True,
                          icann_only=False):
-    '''Given DNS name, returns the part before the public suffix.'''
-    suffix = PUBLIC_SUFFIX_LIST.get_suffix(
+    '''Given DNS name or list of DNS names, returns the part(s) before the public suffix.'''
+    if _is_list(dns_name):
+        dns_names = list(dns_name)
+        suffixes = PUBLIC_SUFFIX_LIST.get_suffixes(
+            dns_names,
+            keep_unknown_suffix=keep_unknown_suffix,
+            normalize_result=False,
+            icann_only=icann_only,
+        )
+        return [_remove_suffix(name, suffix, keep_trailing_period) for name, suffix in zip(dns_names, suffixes)]
+    suffix = _get_suffix(
         dns_name,
         keep_unknown_suffix=keep_unknown_suffix,
         normalize_result=False,
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 Felix Fontein
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import re
+import threading
+
+from ansible.module_utils.six.moves.urllib.parse import urlparse
+
+
+# Upper bounds (in seconds) of the buckets of the latency histograms
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+_VERSION_SEGMENT = re.compile(r'^v[0-9]+$')
+_DIGIT = re.compile(r'[0-9]')
+
+
+def _is_id_segment(segment):
+    if _VERSION_SEGMENT.match(segment):
+        return False
+    return len(segment) >= 16 or _DIGIT.search(segment) is not None
+
+
+def get_endpoint_name(method, url, base_url=None):
+    """
+    Return a name for the endpoint of a request to ``url`` which is suitable for grouping requests.
+
+    The query is removed, as well as ``base_url`` if ``url`` starts with it. Path segments which
+    look like IDs (they contain digits, or are long) are replaced by ``{id}``.
+    """
+    if base_url and url.startswith(base_url):
+        path = url[len(base_url):].split('?', 1)[0]
+    else:
+        path = urlparse(url).path
+    segments = [('{id}' if _is_id_segment(segment) else segment) for segment in path.split('/')]
+    return '{0} {1}'.format(method, '/'.join(segments))
+
+
+def _format_bucket(index):
+    if index < len(LATENCY_BUCKETS):
+        return '<={0}s'.format(LATENCY_BUCKETS[index])
+    return '>{0}s'.format(LATENCY_BUCKETS[-1])
+
+
+class _EndpointStats(object):
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.min_time = None
+        self.max_time = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.retries = 0
+        self.sleep_time = 0.0
+        self.cache_hits = 0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def to_dict(self):
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'total_time': self.total_time,
+            'min_time': self.min_time,
+            'max_time': self.max_time,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'retries': self.retries,
+            'sleep_time': self.sleep_time,
+            'cache_hits': self.cache_hits,
+            'latency_histogram': dict((_format_bucket(index), count) for index, count in enumerate(self.histogram)),
+        }
+
+
+class APIStats(object):
+    """
+    Collects statistics on API requests: per endpoint latency histograms, transferred bytes,
+    the number of retries and time spent waiting for them, and the number of responses taken
+    from the response cache.
+
+    Statistics can be collected from multiple threads at the same time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def _get_endpoint(self, endpoint):
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = _EndpointStats()
+        return stats
+
+    def record_request(self, endpoint, seconds, bytes_sent=0, bytes_received=0, success=True):
+        """
+        Record a request (one HTTP round trip) to ``endpoint`` which took ``seconds`` seconds.
+        """
+        bucket = len(LATENCY_BUCKETS)
+        for index, upper_bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= upper_bound:
+                bucket = index
+                break
+        with self._lock:
+            stats = self._get_endpoint(endpoint)
+            stats.requests += 1
+            if not success:
+                stats.errors += 1
+            stats.total_time += seconds
+            stats.min_time = seconds if stats.min_time is None else min(stats.min_time, seconds)
+            stats.max_time = seconds if stats.max_time is None else max(stats.max_time, seconds)
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+            stats.histogram[bucket] += 1
+
+    def record_retry(self, endpoint, delay):
+        """
+        Record that a request to ``endpoint`` is retried after waiting ``delay`` seconds.
+        """
+        with self._lock:
+            stats = self._get_endpoint(endpoint)
+            stats.retries += 1
+            stats.sleep_time += delay
+
+    def record_cache_hit(self, endpoint):
+        """
+        Record that a response for ``endpoint`` was taken from the response cache without contacting the API.
+        """
+        with self._lock:
+            self._get_endpoint(endpoint).cache_hits += 1
+
+    def to_dict(self):
+        """
+        Return the statistics as a dictionary which can be returned by a module.
+        """
+        with self._lock:
+            endpoints = dict((endpoint, stats.to_dict()) for endpoint, stats in self._endpoints.items())
+        result = {'endpoints': endpoints}
+        for key in ('requests', 'errors', 'total_time', 'bytes_sent', 'bytes_received', 'retries', 'sleep_time', 'cache_hits'):
+            result[key] = sum(stats[key] for stats in endpoints.values())
+        return result
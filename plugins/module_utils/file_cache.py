@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 Felix Fontein
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import hashlib
+import json
+import os
+import tempfile
+
+from ansible.module_utils.common.text.converters import to_bytes
+
+
+CACHE_DIRECTORY_ENV_VARIABLE = 'COMMUNITY_DNS_CACHE_DIR'
+
+
+def get_cache_directory(cache_directory=None):
+    """
+    Return the directory to store cache files in.
+
+    If ``cache_directory`` is not provided, the environment variable ``COMMUNITY_DNS_CACHE_DIR`` is used.
+    If that is not set either, ``~/.ansible/cache/community.dns`` is used.
+    """
+    if cache_directory is None:
+        cache_directory = os.environ.get(CACHE_DIRECTORY_ENV_VARIABLE)
+    if cache_directory is None:
+        cache_directory = os.path.join('~', '.ansible', 'cache', 'community.dns')
+    return os.path.expanduser(cache_directory)
+
+
+def get_cache_key(*parts):
+    """
+    Combine the given strings into a key which can be used as part of a filename.
+
+    The key is a hash value, so it can also be used for secrets like API tokens.
+    """
+    sha256 = hashlib.sha256()
+    for part in parts:
+        sha256.update(to_bytes(part))
+        sha256.update(b'\0')
+    return sha256.hexdigest()
+
+
+def read_json_cache_file(path):
+    """
+    Read JSON data from a cache file.
+
+    Returns ``None`` if the file does not exist or cannot be read or parsed.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return json.loads(f.read().decode('utf-8'))
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def create_cache_directory(directory):
+    """
+    Create the cache directory ``directory`` if it does not exist yet.
+
+    Raises ``OSError`` if it cannot be created.
+    """
+    if not os.path.isdir(directory):
+        try:
+            os.makedirs(directory, 0o700)
+        except OSError:
+            # Another process might have created the directory in the meantime
+            if not os.path.isdir(directory):
+                raise
+
+
+def write_json_cache_file(path, data):
+    """
+    Atomically write JSON data to a cache file. The directory is created if necessary.
+
+    Returns ``False`` if the file could not be written.
+    """
+    directory = os.path.dirname(path)
+    try:
+        create_cache_directory(directory)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(json.dumps(data).encode('utf-8'))
+            os.rename(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        return True
+    except (IOError, OSError, ValueError, TypeError):
+        return False
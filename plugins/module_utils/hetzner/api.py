@@ -8,18 +8,35 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 
+try:
+    from concurrent import futures
+    HAS_CONCURRENT_FUTURES = True
+except ImportError:
+    HAS_CONCURRENT_FUTURES = False
+
 from ansible.module_utils.basic import env_fallback
 
 from ansible_collections.community.dns.plugins.module_utils.argspec import (
     ArgumentSpec,
 )
 
+from ansible_collections.community.dns.plugins.module_utils.options import (
+    create_api_client_argspec,
+    create_api_http_helper,
+    create_retry_policy,
+    create_zone_id_cache,
+)
+
 from ansible_collections.community.dns.plugins.module_utils.json_api_helper import (
     JSONAPIHelper,
     ERROR_CODES,
     UNKNOWN_ERROR,
 )
 
+from ansible_collections.community.dns.plugins.module_utils.json_codec import (
+    encode_json,
+)
+
 from ansible_collections.community.dns.plugins.module_utils.provider import (
     ProviderInformation,
 )
@@ -30,6 +47,7 @@ from ansible_collections.community.dns.plugins.module_utils.record import (
 
 from ansible_collections.community.dns.plugins.module_utils.zone import (
     DNSZone,
+    DNSZoneWithRecords,
 )
 
 from ansible_collections.community.dns.plugins.module_utils.zone_record_api import (
@@ -81,9 +99,48 @@ def _record_to_json(record, zone_id):
     return result
 
 
+# Responses to a bulk update request after which the records are updated one by one. Authentication
+# errors (401, 403) are raised, and rate limiting (429) is handled when sending the request.
+_BULK_UPDATE_FALLBACK_STATUSES = [status for status in range(400, 600) if status not in (401, 403, 429)]
+
+
+def _chunk_records(records_per_zone_id, max_records, max_bytes):
+    """
+    Iterate over chunks of the records in ``records_per_zone_id``. Every chunk is a list of tuples
+    ``(zone_id, record, json_record)``. A chunk contains at most ``max_records`` records, and the
+    JSON encoded records of a chunk have at most ``max_bytes`` bytes, unless a single record is
+    larger than that.
+    """
+    chunk = []
+    chunk_bytes = 0
+    for zone_id, records in records_per_zone_id.items():
+        for record in records:
+            json_record = _record_to_json(record, zone_id=zone_id)
+            # Also count the separating comma
+            size = len(encode_json(json_record)) + 1
+            if chunk and (len(chunk) >= max_records or chunk_bytes + size > max_bytes):
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+            chunk.append((zone_id, record, json_record))
+            chunk_bytes += size
+    if chunk:
+        yield chunk
+
+
 class HetznerAPI(ZoneRecordAPI, JSONAPIHelper):
-    def __init__(self, http_helper, token, api='https://dns.hetzner.com/api/', debug=False):
-        JSONAPIHelper.__init__(self, http_helper, token, api=api, debug=debug)
+    def __init__(self, http_helper, token, api='https://dns.hetzner.com/api/', debug=False, max_concurrency=1, retry_policy=None,
+                 api_stats=None, page_size=100, bulk_update=True, bulk_max_records=1000, bulk_max_bytes=1024 * 1024):
+        JSONAPIHelper.__init__(self, http_helper, token, api=api, debug=debug, retry_policy=retry_policy, api_stats=api_stats)
+        self.max_concurrency = max_concurrency
+        self.page_size = page_size
+        # Limits for the records sent with one bulk create request
+        self.bulk_max_records = bulk_max_records
+        self.bulk_max_bytes = bulk_max_bytes
+        # Whether update_records() should try the bulk update endpoint
+        self.bulk_update = bulk_update
+        # Set to False once the bulk update endpoint turned out to be unavailable
+        self._bulk_update_available = True
 
     def _create_headers(self):
         return {
@@ -128,20 +185,44 @@ class HetznerAPI(ZoneRecordAPI, JSONAPIHelper):
                 raise DNSAPIError(
                     '{0} {1} resulted in API error {2} ({3}){4}'.format(method, url, status, error_code, more))
 
+    def _get_page(self, url, query, block_size, page, expected):
+        query_ = query.copy() if query else dict()
+        query_['per_page'] = block_size
+        query_['page'] = page
+        return self._get(url, query_, must_have_content=[200], expected=expected)
+
+    def _get_pages_concurrently(self, url, query, block_size, pages):
+        """
+        Retrieve the given pages with up to ``max_concurrency`` requests at the same time.
+        Returns the results in the order of ``pages``.
+        """
+        executor = futures.ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(pages)))
+        tasks = [executor.submit(self._get_page, url, query, block_size, page, [200]) for page in pages]
+        try:
+            return [task.result()[0] for task in tasks]
+        finally:
+            # If a request failed, do not start the remaining ones
+            for task in tasks:
+                task.cancel()
+            executor.shutdown(wait=True)
+
     def _list_pagination(self, url, data_key, query=None, block_size=100, accept_404=False):
         result = []
         page = 1
         while True:
-            query_ = query.copy() if query else dict()
-            query_['per_page'] = block_size
-            query_['page'] = page
-            res, info = self._get(url, query_, must_have_content=[200], expected=[200, 404] if accept_404 and page == 1 else [200])
+            res, info = self._get_page(url, query, block_size, page, [200, 404] if accept_404 and page == 1 else [200])
             if accept_404 and page == 1 and info['status'] == 404:
                 return None
             result.extend(res[data_key])
             if 'meta' not in res and page == 1:
                 return result
-            if page >= res['meta']['pagination']['last_page']:
+            last_page = res['meta']['pagination']['last_page']
+            if page >= last_page:
+                return result
+            if page == 1 and last_page > 2 and self.max_concurrency > 1 and HAS_CONCURRENT_FUTURES:
+                # The number of pages is known, so the remaining ones can be retrieved at the same time
+                for res in self._get_pages_concurrently(url, query, block_size, list(range(2, last_page + 1))):
+                    result.extend(res[data_key])
                 return result
             page += 1
 
@@ -170,6 +251,35 @@ class HetznerAPI(ZoneRecordAPI, JSONAPIHelper):
             return None
         return _create_zone_from_json(result['zone'])
 
+    def get_zone_with_records_by_name(self, name, prefix=NOT_PROVIDED, record_type=NOT_PROVIDED):
+        """
+        Given a zone name, return the zone contents with records if found.
+
+        If the ID of the zone is cached, only the records are retrieved. The returned zone then
+        has no information besides its name and ID.
+
+        @param name: The zone name (string)
+        @param prefix: The prefix to filter for, if provided. Since None is a valid value,
+                       the special constant NOT_PROVIDED indicates that we are not filtering.
+        @param record_type: The record type to filter for, if provided
+        @return The zone information with records (DNSZoneWithRecords), or None if not found
+        """
+        zone_id = self.zone_id_cache.get(name) if self.zone_id_cache is not None else None
+        if zone_id is not None:
+            result = self._list_pagination(
+                'v1/records', data_key='records', query=dict(zone_id=zone_id), block_size=self.page_size, accept_404=True)
+            # Every zone has SOA and NS records, so if there are none, the zone no longer exists
+            if result and all(record.get('zone_id') == zone_id for record in result):
+                zone = DNSZone(name)
+                zone.id = zone_id
+                return DNSZoneWithRecords(zone, filter_records(
+                    [_create_record_from_json(record) for record in result],
+                    prefix=prefix,
+                    record_type=record_type,
+                ))
+            self.zone_id_cache.remove(name)
+        return super(HetznerAPI, self).get_zone_with_records_by_name(name, prefix=prefix, record_type=record_type)
+
     def get_zone_records(self, zone_id, prefix=NOT_PROVIDED, record_type=NOT_PROVIDED):
         """
         Given a zone ID, return a list of records, optionally filtered by the provided criteria.
@@ -180,7 +290,8 @@ class HetznerAPI(ZoneRecordAPI, JSONAPIHelper):
         @param record_type: The record type to filter for, if provided
         @return A list of DNSrecord objects, or None if zone was not found
         """
-        result = self._list_pagination('v1/records', data_key='records', query=dict(zone_id=zone_id), accept_404=True)
+        result = self._list_pagination(
+            'v1/records', data_key='records', query=dict(zone_id=zone_id), block_size=self.page_size, accept_404=True)
         if result is None:
             return None
         return filter_records(
@@ -265,15 +376,37 @@ class HetznerAPI(ZoneRecordAPI, JSONAPIHelper):
                 If it was not created, ``failed`` should be a ``DNSAPIError`` instance indicating why
                 it was not created. It is possible that the API only creates records if all succeed,
                 in that case ``failed`` can be ``None`` even though ``created`` is ``False``.
+
+        The records are sent in chunks of at most ``bulk_max_records`` records and
+        ``bulk_max_bytes`` bytes. Every chunk is accepted or rejected on its own.
         """
-        json_records = []
-        for zone_id, records in records_per_zone_id.items():
-            for record in records:
-                json_records.append(_record_to_json(record, zone_id=zone_id))
-        data = {'records': json_records}
-        # Error 422 means that at least one of the records was not valid
-        result, info = self._post('v1/records/bulk', data=data, expected=[200, 422])
         results_per_zone_id = {}
+        stopped = False
+        for index, chunk in enumerate(_chunk_records(records_per_zone_id, self.bulk_max_records, self.bulk_max_bytes)):
+            if stopped:
+                # Records of the remaining chunks are not created
+                for zone_id, record, dummy in chunk:
+                    self._append(results_per_zone_id, zone_id, (record, False, None))
+                continue
+            try:
+                result = self._add_records_chunk([json_record for dummy, dummy2, json_record in chunk], results_per_zone_id)
+            except DNSAPIError as e:
+                if index == 0:
+                    raise
+                for zone_id, record, dummy in chunk:
+                    self._append(results_per_zone_id, zone_id, (record, False, e))
+                result = False
+            if not result and stop_early_on_errors:
+                stopped = True
+        return results_per_zone_id
+
+    def _add_records_chunk(self, json_records, results_per_zone_id):
+        """
+        Create the records ``json_records`` with one bulk request, and add the results to
+        ``results_per_zone_id``. Return whether the records were accepted.
+        """
+        # Error 422 means that at least one of the records was not valid
+        result, info = self._post('v1/records/bulk', data={'records': json_records}, expected=[200, 422])
         # This is the list of invalid records that was detected before accepting the whole set
         for json_record in result.get('invalid_records') or []:
             record = _create_record_from_json(json_record, has_id=False)
@@ -294,7 +427,7 @@ class HetznerAPI(ZoneRecordAPI, JSONAPIHelper):
             record = _create_record_from_json(json_record)
             zone_id = json_record['zone_id']
             self._append(results_per_zone_id, zone_id, (record, True, None))
-        return results_per_zone_id
+        return info['status'] == 200 and not result.get('invalid_records')
 
     def update_records(self, records_per_zone_id, stop_early_on_errors=True):
         """
@@ -310,35 +443,78 @@ class HetznerAPI(ZoneRecordAPI, JSONAPIHelper):
                 records if all succeed, in that case ``failed`` can be ``None`` even though
                 ``updated`` is ``False``.
         """
-        # Currently Hetzner's bulk update API seems to be broken, it always returns the error message
-        # "An invalid response was received from the upstream server". That's why for now, we always
-        # fall back to the default implementation.
-        if True:  # pylint: disable=using-constant-test
+        if not self.bulk_update or not self._bulk_update_available:
             return super(HetznerAPI, self).update_records(records_per_zone_id, stop_early_on_errors=stop_early_on_errors)
 
         json_records = []
         for zone_id, records in records_per_zone_id.items():
             for record in records:
-                json_records.append(_record_to_json(record, zone_id=zone_id))
-        data = {'records': json_records}
-        result, dummy = self._put('v1/records/bulk', data=data, expected=[200])
+                if record.id is not None:
+                    json_record = _record_to_json(record, zone_id=zone_id)
+                    json_record['id'] = record.id
+                    json_records.append(json_record)
+        updated_json_records = {}
+        if json_records:
+            # Server errors are not retried, since the endpoint is likely unavailable
+            result, info = self._put(
+                'v1/records/bulk', data={'records': json_records}, must_have_content=[200], expected=[200] + _BULK_UPDATE_FALLBACK_STATUSES,
+                retry_server_errors=False)
+            if self._is_bulk_update_unavailable(result, info):
+                # Do not try the bulk endpoint again
+                self._bulk_update_available = False
+            if info['status'] != 200 or not self._bulk_update_available:
+                # The request was rejected, for example because the API does not accept a record in
+                # this form. Update every record on its own, which reports the errors per record.
+                return super(HetznerAPI, self).update_records(records_per_zone_id, stop_early_on_errors=stop_early_on_errors)
+            for json_record in result.get('records') or []:
+                if json_record.get('id') is not None:
+                    updated_json_records[json_record['id']] = json_record
+
+        def get_key(record):
+            # Records without ID are never updated, so they are identified by the object itself
+            return record.id if record.id is not None else id(record)
+
+        # Records which could not be updated (they are listed in 'failed_records'), for which no
+        # result was reported, or which have no ID, are updated one by one. This results in proper
+        # error messages for records which cannot be updated.
+        fallback_records_per_zone_id = {}
+        for zone_id, records in records_per_zone_id.items():
+            for record in records:
+                if record.id is None or record.id not in updated_json_records:
+                    fallback_records_per_zone_id.setdefault(zone_id, []).append(record)
+        fallback_results = {}
+        if fallback_records_per_zone_id:
+            fallback_results_per_zone_id = super(HetznerAPI, self).update_records(
+                fallback_records_per_zone_id, stop_early_on_errors=stop_early_on_errors)
+            for results in fallback_results_per_zone_id.values():
+                for result in results:
+                    fallback_results[get_key(result[0])] = result
+
+        # Return the results in the order of the records
         results_per_zone_id = {}
-        for json_record in result.get('failed_records') or []:
-            record = _create_record_from_json(json_record)
-            zone_id = json_record['zone_id']
-            self._append(results_per_zone_id, zone_id, (record, False, DNSAPIError(
-                'Updating {type} record #{id} "{target}" with TTL {ttl} for zone {zoneID} failed with unknown reason'.format(
-                    type=record.type,
-                    id=record.id,
-                    target=record.target,
-                    ttl=record.ttl,
-                    zoneID=zone_id))))
-        for json_record in result.get('records') or []:
-            record = _create_record_from_json(json_record)
-            zone_id = json_record['zone_id']
-            self._append(results_per_zone_id, zone_id, (record, True, None))
+        for zone_id, records in records_per_zone_id.items():
+            for record in records:
+                if record.id is not None and record.id in updated_json_records:
+                    self._append(results_per_zone_id, zone_id, (_create_record_from_json(updated_json_records[record.id]), True, None))
+                elif get_key(record) in fallback_results:
+                    self._append(results_per_zone_id, zone_id, fallback_results[get_key(record)])
         return results_per_zone_id
 
+    @staticmethod
+    def _is_bulk_update_unavailable(result, info):
+        """
+        Determine from the response to a bulk update request whether the bulk update endpoint is
+        unavailable. For some time, it always responded with an error message like "An invalid
+        response was received from the upstream server".
+        """
+        if info['status'] >= 500 or info['status'] in (404, 405):
+            return True
+        message = ''
+        if isinstance(result, dict):
+            error = result.get('error')
+            message = error.get('message') if isinstance(error, dict) else result.get('message')
+        return 'upstream server' in (message or '')
+
 
 class HetznerProviderInformation(ProviderInformation):
     def get_supported_record_types(self):
@@ -410,9 +586,27 @@ def create_hetzner_argument_spec():
                 aliases=['api_token'],
                 fallback=(env_fallback, ['HETZNER_DNS_TOKEN']),
             ),
+            hetzner_page_size=dict(type='int', default=100),
+            hetzner_bulk_update=dict(type='bool', default=True),
+            hetzner_bulk_max_records=dict(type='int', default=1000),
+            hetzner_bulk_max_bytes=dict(type='int', default=1024 * 1024),
         ),
-    )
+    ).merge(create_api_client_argspec())
 
 
 def create_hetzner_api(option_provider, http_helper):
-    return HetznerAPI(http_helper, option_provider.get_option('hetzner_token'))
+    token = option_provider.get_option('hetzner_token')
+    account = ('hetzner', token)
+    http_helper = create_api_http_helper(option_provider, http_helper, account)
+    api = HetznerAPI(
+        http_helper,
+        token,
+        max_concurrency=option_provider.get_option('max_concurrency') or 1,
+        retry_policy=create_retry_policy(option_provider),
+        page_size=option_provider.get_option('hetzner_page_size') or 100,
+        bulk_update=option_provider.get_option('hetzner_bulk_update') is not False,
+        bulk_max_records=option_provider.get_option('hetzner_bulk_max_records') or 1000,
+        bulk_max_bytes=option_provider.get_option('hetzner_bulk_max_bytes') or 1024 * 1024,
+    )
+    api.zone_id_cache = create_zone_id_cache(option_provider, account)
+    return api
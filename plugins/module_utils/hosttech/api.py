@@ -11,6 +11,13 @@ from ansible_collections.community.dns.plugins.module_utils.argspec import (
     ArgumentSpec,
 )
 
+from ansible_collections.community.dns.plugins.module_utils.options import (
+    create_api_client_argspec,
+    create_api_http_helper,
+    create_retry_policy,
+    create_zone_id_cache,
+)
+
 from ansible_collections.community.dns.plugins.module_utils.provider import (
     ProviderInformation,
 )
@@ -95,20 +102,28 @@ def create_hosttech_argument_spec():
         ),
         required_together=[('hosttech_username', 'hosttech_password')],
         mutually_exclusive=[('hosttech_username', 'hosttech_token')],
-    )
+    ).merge(create_api_client_argspec())
 
 
 def create_hosttech_api(option_provider, http_helper):
+    max_concurrency = option_provider.get_option('max_concurrency') or 1
     username = option_provider.get_option('hosttech_username')
     password = option_provider.get_option('hosttech_password')
     if username is not None and password is not None:
         if not HAS_LXML_ETREE:
             raise DNSAPIError('Needs lxml Python module (pip install lxml)')
 
-        return HostTechWSDLAPI(http_helper, username, password, debug=False)
+        # The WSDL API sends all requests as POST requests, so its responses cannot be cached
+        http_helper = create_api_http_helper(option_provider, http_helper, ('hosttech-wsdl', username, password), cache_responses=False)
+        return HostTechWSDLAPI(http_helper, username, password, debug=False, max_concurrency=max_concurrency)
 
     token = option_provider.get_option('hosttech_token')
     if token is not None:
-        return HostTechJSONAPI(http_helper, token)
+        account = ('hosttech-json', token)
+        http_helper = create_api_http_helper(option_provider, http_helper, account)
+        api = HostTechJSONAPI(http_helper, token, max_concurrency=max_concurrency, retry_policy=create_retry_policy(option_provider))
+        # The WSDL API retrieves zones by name directly, so only the JSON API uses the zone ID cache
+        api.zone_id_cache = create_zone_id_cache(option_provider, account)
+        return api
 
     raise DNSAPIError('One of hosttech_token or both hosttech_username and hosttech_password must be provided!')
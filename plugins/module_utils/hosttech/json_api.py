@@ -87,11 +87,11 @@ def _create_zone_from_json(source):
     return zone
 
 
-def _create_zone_with_records_from_json(source, prefix=NOT_PROVIDED, record_type=NOT_PROVIDED):
+def _create_zone_with_records_from_json(source, records, prefix=NOT_PROVIDED, record_type=NOT_PROVIDED):
     return DNSZoneWithRecords(
         _create_zone_from_json(source),
         filter_records(
-            [_create_record_from_json(record) for record in source['records']],
+            (_create_record_from_json(record) for record in records),
             prefix=prefix,
             record_type=record_type,
         ),
@@ -177,11 +177,13 @@ def _record_to_json(record, include_id=False, include_type=True):
 
 
 class HostTechJSONAPI(ZoneRecordAPI, JSONAPIHelper):
-    def __init__(self, http_helper, token, api='https://api.ns1.hosttech.eu/api/', debug=False):
+    def __init__(self, http_helper, token, api='https://api.ns1.hosttech.eu/api/', debug=False, max_concurrency=1, retry_policy=None,
+                 api_stats=None):
         """
         Create a new HostTech API instance with given API token.
         """
-        JSONAPIHelper.__init__(self, http_helper, token, api=api, debug=debug)
+        JSONAPIHelper.__init__(self, http_helper, token, api=api, debug=debug, retry_policy=retry_policy, api_stats=api_stats)
+        self.max_concurrency = max_concurrency
 
     def _extract_error_message(self, result):
         if result is None:
@@ -229,10 +231,11 @@ class HostTechJSONAPI(ZoneRecordAPI, JSONAPIHelper):
         @param record_type: The record type to filter for, if provided
         @return The zone information with records (DNSZoneWithRecords), or None if not found
         """
-        result, info = self._get('user/v1/zones/{0}'.format(id), expected=[200, 404], must_have_content=[200])
+        result, records, info = self._get_streamed(
+            'user/v1/zones/{0}'.format(id), ('data', 'records'), expected=[200, 404], must_have_content=[200])
         if info['status'] == 404:
             return None
-        return _create_zone_with_records_from_json(result['data'], prefix=prefix, record_type=record_type)
+        return _create_zone_with_records_from_json(result['data'], records, prefix=prefix, record_type=record_type)
 
     def get_zone_with_records_by_name(self, name, prefix=NOT_PROVIDED, record_type=NOT_PROVIDED):
         """
@@ -244,11 +247,17 @@ class HostTechJSONAPI(ZoneRecordAPI, JSONAPIHelper):
         @param record_type: The record type to filter for, if provided
         @return The zone information with records (DNSZoneWithRecords), or None if not found
         """
+        zone_with_records = self._get_zone_by_cached_id(
+            name, lambda zone_id: self.get_zone_with_records_by_id(zone_id, prefix=prefix, record_type=record_type))
+        if zone_with_records is not None:
+            return zone_with_records
         result = self._list_pagination('user/v1/zones', query=dict(query=name))
         for zone in result:
             if zone['name'] == name:
-                result, info = self._get('user/v1/zones/{0}'.format(zone['id']), expected=[200])
-                return _create_zone_with_records_from_json(result['data'], prefix=prefix, record_type=record_type)
+                result, records, info = self._get_streamed('user/v1/zones/{0}'.format(zone['id']), ('data', 'records'), expected=[200])
+                zone_with_records = _create_zone_with_records_from_json(result['data'], records, prefix=prefix, record_type=record_type)
+                self._remember_zone_id(zone_with_records.zone)
+                return zone_with_records
         return None
 
     def get_zone_records(self, zone_id, prefix=NOT_PROVIDED, record_type=NOT_PROVIDED):
@@ -264,11 +273,12 @@ class HostTechJSONAPI(ZoneRecordAPI, JSONAPIHelper):
         query = dict()
         if record_type is not NOT_PROVIDED:
             query['type'] = record_type.upper()
-        result, info = self._get('user/v1/zones/{0}/records'.format(zone_id), query=query, expected=[200, 404], must_have_content=[200])
+        result, records, info = self._get_streamed(
+            'user/v1/zones/{0}/records'.format(zone_id), ('data', ), query=query, expected=[200, 404], must_have_content=[200])
         if info['status'] == 404:
             return None
         return filter_records(
-            [_create_record_from_json(record) for record in result['data']],
+            (_create_record_from_json(record) for record in records),
             prefix=prefix,
             record_type=record_type,
         )
@@ -280,11 +290,16 @@ class HostTechJSONAPI(ZoneRecordAPI, JSONAPIHelper):
         @param name: The zone name (string)
         @return The zone information (DNSZone), or None if not found
         """
+        zone = self._get_zone_by_cached_id(name, self.get_zone_by_id)
+        if zone is not None:
+            return zone
         result = self._list_pagination('user/v1/zones', query=dict(query=name))
         for zone in result:
             if zone['name'] == name:
                 # We cannot simply return `_create_zone_from_json(zone)`, since this contains less information!
-                return self.get_zone_by_id(zone['id'])
+                zone = self.get_zone_by_id(zone['id'])
+                self._remember_zone_id(zone)
+                return zone
         return None
 
     def get_zone_by_id(self, id):
@@ -108,7 +108,8 @@ def _encode_zone(zone):
 
 
 class HostTechWSDLAPI(ZoneRecordAPI):
-    def __init__(self, http_helper, username, password, api='https://ns1.hosttech.eu/public/api', debug=False):
+    def __init__(self, http_helper, username, password, api='https://ns1.hosttech.eu/public/api', debug=False, max_concurrency=1,
+                 api_stats=None):
         """
         Create a new HostTech API instance with given username and password.
         """
@@ -120,9 +121,11 @@ class HostTechWSDLAPI(ZoneRecordAPI):
         self._username = username
         self._password = password
         self._debug = debug
+        self.max_concurrency = max_concurrency
+        self.api_stats = api_stats
 
     def _prepare(self):
-        command = Composer(self._http_helper, self._api, self._namespaces)
+        command = Composer(self._http_helper, self._api, self._namespaces, api_stats=self.api_stats)
         command.add_auth(self._username, self._password)
         return command
 
@@ -8,10 +8,19 @@ __metaclass__ = type
 
 
 import abc
+import errno
+import select
+import socket
+import ssl
+import threading
+import zlib
 
 from ansible.module_utils import six
 from ansible.module_utils.common.text.converters import to_native
 from ansible.module_utils.six import PY3
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.parse import urlsplit, urlunsplit
+from ansible.module_utils.six.moves.urllib.request import getproxies, proxy_bypass
 from ansible.module_utils.urls import fetch_url, open_url, urllib_error, NoSSLError, ConnectionError
 
 
@@ -19,6 +28,103 @@ class NetworkError(Exception):
     pass
 
 
+# Methods for which a request can be repeated if it is not known whether it was processed
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'])
+
+
+def _lower_key(key):
+    return key.lower() if isinstance(key, six.string_types) else key
+
+
+class HTTPInfo(dict):
+    """
+    The ``info`` dictionary returned by ``HTTPHelper.fetch_url()``. It contains the response headers
+    as well as ``status`` and ``url``.
+
+    Keys are case-insensitive: they are converted to lower-case when they are stored and looked up,
+    so headers can be looked up in constant time no matter how the server capitalized them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(HTTPInfo, self).__init__()
+        self.update(*args, **kwargs)
+
+    def __getitem__(self, key):
+        return super(HTTPInfo, self).__getitem__(_lower_key(key))
+
+    def __setitem__(self, key, value):
+        super(HTTPInfo, self).__setitem__(_lower_key(key), value)
+
+    def __delitem__(self, key):
+        super(HTTPInfo, self).__delitem__(_lower_key(key))
+
+    def __contains__(self, key):
+        return super(HTTPInfo, self).__contains__(_lower_key(key))
+
+    def get(self, key, default=None):
+        return super(HTTPInfo, self).get(_lower_key(key), default)
+
+    def pop(self, key, *args):
+        return super(HTTPInfo, self).pop(_lower_key(key), *args)
+
+    def setdefault(self, key, default=None):
+        return super(HTTPInfo, self).setdefault(_lower_key(key), default)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def copy(self):
+        return HTTPInfo(self)
+
+
+def normalize_info(info):
+    """
+    Convert an ``info`` dictionary to a ``HTTPInfo`` object, unless it already is one.
+    """
+    if isinstance(info, HTTPInfo):
+        return info
+    return HTTPInfo(info)
+
+
+ACCEPT_ENCODING = 'gzip, deflate'
+
+
+def add_accept_encoding(headers):
+    """
+    Return a copy of the headers dictionary which asks for compressed responses,
+    unless the headers already contain an Accept-Encoding header.
+    """
+    headers = dict(headers or {})
+    if not any(name.lower() == 'accept-encoding' for name in headers):
+        headers['Accept-Encoding'] = ACCEPT_ENCODING
+    return headers
+
+
+def decompress_content(content, info):
+    """
+    Decompress a response body according to the response's Content-Encoding header.
+
+    Bodies which are not compressed, for example because they have already been decompressed
+    by ``fetch_url()`` or ``open_url()``, are returned as-is.
+    """
+    encoding = (info.get('content-encoding') or '').strip().lower()
+    if not content or encoding not in ('gzip', 'x-gzip', 'deflate'):
+        return content
+    try:
+        if encoding != 'deflate':
+            if content[:2] != b'\x1f\x8b':
+                return content
+            return zlib.decompress(content, 16 + zlib.MAX_WBITS)
+        try:
+            return zlib.decompress(content)
+        except zlib.error:
+            # Some servers send raw deflate data without zlib header
+            return zlib.decompress(content, -zlib.MAX_WBITS)
+    except zlib.error:
+        return content
+
+
 @six.add_metaclass(abc.ABCMeta)
 class HTTPHelper(object):
     @abc.abstractmethod
@@ -26,6 +132,8 @@ class HTTPHelper(object):
         """
         Execute a HTTP request and return a tuple (response_content, info).
 
+        ``info`` is a ``HTTPInfo`` object, so header names are case-insensitive.
+
         In case of errors, either raise NetworkError or terminate the program (for modules only!).
         """
 
@@ -35,7 +143,12 @@ class ModuleHTTPHelper(HTTPHelper):
         self.module = module
 
     def fetch_url(self, url, method='GET', headers=None, data=None, timeout=None):
+        headers = add_accept_encoding(headers)
         response, info = fetch_url(self.module, url, method=method, headers=headers, data=data, timeout=timeout)
+        info = normalize_info(info)
+        if info.get('status') == -1:
+            # fetch_url() reports connection errors with status -1 instead of raising an exception
+            raise NetworkError(info.get('msg') or 'Unknown connection error')
         try:
             # In Python 2, reading from a closed response yields a TypeError.
             # In Python 3, read() simply returns ''
@@ -44,16 +157,17 @@ class ModuleHTTPHelper(HTTPHelper):
             content = response.read()
         except (AttributeError, TypeError):
             content = info.pop('body', None)
-        return content, info
+        return decompress_content(content, info), info
 
 
 class OpenURLHelper(HTTPHelper):
     def fetch_url(self, url, method='GET', headers=None, data=None, timeout=None):
-        info = {}
+        headers = add_accept_encoding(headers)
+        info = HTTPInfo()
         try:
             req = open_url(url, method=method, headers=headers, data=data, timeout=timeout)
             result = req.read()
-            info.update(dict((k.lower(), v) for k, v in req.info().items()))
+            info.update(req.info().items())
             info['status'] = req.code
             info['url'] = req.geturl()
             req.close()
@@ -63,7 +177,7 @@ class OpenURLHelper(HTTPHelper):
             except AttributeError:
                 result = ''
             try:
-                info.update(dict((k.lower(), v) for k, v in e.info().items()))
+                info.update(e.info().items())
             except Exception:
                 pass
             info['status'] = e.code
@@ -72,4 +186,153 @@ class OpenURLHelper(HTTPHelper):
         except (ConnectionError, ValueError) as e:
             raise NetworkError('Connection error: {0}'.format(to_native(e)))
 
-        return result, info
+        return decompress_content(result, info), info
+
+
+_STALE_CONNECTION_ERRNOS = frozenset([errno.ECONNRESET, errno.ECONNABORTED, errno.EPIPE, errno.EBADF, errno.ENOTCONN])
+
+_RemoteDisconnected = getattr(http_client, 'RemoteDisconnected', None)
+
+
+def _is_stale_connection_error(exc):
+    """
+    Check whether ``exc`` indicates that a reused connection was closed before the server sent
+    a response. Timeouts are not such errors, since the server might still process the request.
+    """
+    if isinstance(exc, socket.timeout):
+        return False
+    if _RemoteDisconnected is not None and isinstance(exc, _RemoteDisconnected):
+        return True
+    if isinstance(exc, http_client.BadStatusLine):
+        # On Python 2, this is raised with an empty line if the server closed the connection
+        return exc.line in ('', "''")
+    return isinstance(exc, socket.error) and exc.errno in _STALE_CONNECTION_ERRNOS
+
+
+class KeepAliveHTTPHelper(HTTPHelper):
+    """
+    HTTP helper which keeps connections open and reuses them for further requests to the same host.
+    This avoids a new TCP connection and TLS handshake for every request.
+
+    Up to ``pool_size`` idle connections are kept per host. The helper can be used from multiple
+    threads at the same time.
+
+    Requests which have to go through a proxy, or which do not use HTTP or HTTPS, are passed on
+    to ``fallback_helper``. Redirects are not followed.
+    """
+
+    DEFAULT_TIMEOUT = 10
+
+    def __init__(self, fallback_helper, pool_size=1, user_agent='ansible-httpget'):
+        self._fallback_helper = fallback_helper
+        self._pool_size = pool_size
+        self._user_agent = user_agent
+        self._pools = {}
+        self._use_fallback = {}
+        self._lock = threading.Lock()
+        self._ssl_context = None
+
+    def _should_use_fallback(self, scheme, host):
+        key = (scheme, host)
+        result = self._use_fallback.get(key)
+        if result is None:
+            result = scheme not in ('http', 'https') or (scheme in getproxies() and not proxy_bypass(host))
+            self._use_fallback[key] = result
+        return result
+
+    def _create_connection(self, key, timeout):
+        scheme, host, port = key
+        if scheme == 'https':
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            return http_client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl_context)
+        return http_client.HTTPConnection(host, port, timeout=timeout)
+
+    @staticmethod
+    def _is_connection_dropped(connection):
+        """
+        Check whether the server closed an idle connection. Such a connection is readable, since
+        the server does not send anything on an idle connection otherwise.
+        """
+        if connection.sock is None:
+            return True
+        try:
+            return bool(select.select([connection.sock], [], [], 0)[0])
+        except (select.error, socket.error, ValueError):
+            return True
+
+    def _acquire_connection(self, key, timeout):
+        """
+        Return a tuple ``(connection, reused)``.
+        """
+        while True:
+            with self._lock:
+                pool = self._pools.get(key)
+                connection = pool.pop() if pool else None
+            if connection is None:
+                return self._create_connection(key, timeout), False
+            if not self._is_connection_dropped(connection):
+                return connection, True
+            connection.close()
+
+    def _release_connection(self, key, connection):
+        with self._lock:
+            pool = self._pools.setdefault(key, [])
+            if len(pool) < self._pool_size:
+                pool.append(connection)
+                return
+        connection.close()
+
+    def close(self):
+        """
+        Close all idle connections.
+        """
+        with self._lock:
+            pools = self._pools
+            self._pools = {}
+        for pool in pools.values():
+            for connection in pool:
+                connection.close()
+
+    def fetch_url(self, url, method='GET', headers=None, data=None, timeout=None):
+        parts = urlsplit(url)
+        if self._should_use_fallback(parts.scheme, parts.hostname):
+            return self._fallback_helper.fetch_url(url, method=method, headers=headers, data=data, timeout=timeout)
+        if timeout is None:
+            timeout = self.DEFAULT_TIMEOUT
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = urlunsplit(('', '', parts.path or '/', parts.query, ''))
+        request_headers = add_accept_encoding(headers)
+        if not any(name.lower() == 'user-agent' for name in request_headers):
+            request_headers['User-Agent'] = self._user_agent
+
+        while True:
+            connection, reused = self._acquire_connection(key, timeout)
+            sent = False
+            try:
+                if reused and connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                connection.request(method, path, body=data, headers=request_headers)
+                sent = True
+                response = connection.getresponse()
+                content = response.read()
+                break
+            except (http_client.HTTPException, socket.error) as e:
+                connection.close()
+                # The server might have closed the connection while it was idle. In that case, try
+                # again with another one, unless the server could have processed the request.
+                if reused and _is_stale_connection_error(e) and (not sent or method in IDEMPOTENT_METHODS):
+                    continue
+                raise NetworkError('Connection error: {0}'.format(to_native(e)))
+            except ValueError as e:
+                connection.close()
+                raise NetworkError('Connection error: {0}'.format(to_native(e)))
+
+        info = HTTPInfo(response.getheaders())
+        info['status'] = response.status
+        info['url'] = url
+        if response.will_close:
+            connection.close()
+        else:
+            self._release_connection(key, connection)
+        return decompress_content(content, info), info
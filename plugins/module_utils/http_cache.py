@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 Felix Fontein
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import base64
+import os
+import shutil
+import time
+
+from ansible.module_utils.six import integer_types, string_types
+
+from ansible_collections.community.dns.plugins.module_utils.file_cache import (
+    get_cache_key,
+    read_json_cache_file,
+    write_json_cache_file,
+)
+
+from ansible_collections.community.dns.plugins.module_utils.http import (
+    HTTPHelper,
+    HTTPInfo,
+)
+
+
+_SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class CachingHTTPHelper(HTTPHelper):
+    """
+    HTTP helper which caches responses to GET requests on disk.
+
+    If the server provided an ETag or Last-Modified header, the cached response is revalidated
+    with a conditional request, and reused if the server responds with HTTP status 304. If the
+    server did not provide these headers, the cached response is reused for ``ttl`` seconds
+    without asking the server. If ``ttl`` is 0, such responses are not cached.
+
+    Responses taken from the cache without asking the server have ``info['response_cache']`` set
+    to ``'hit'``.
+
+    Cache entries are stored in ``directory``, which should be specific to the provider and the
+    credentials used. All cache entries are removed when a request with a method that modifies
+    data (like POST, PUT, or DELETE) succeeds. Therefore this helper must not be used for APIs
+    which also use these methods to read data, like SOAP APIs.
+    """
+
+    def __init__(self, http_helper, directory, ttl=0, clock=time.time):
+        self._http_helper = http_helper
+        self._directory = directory
+        self._ttl = ttl
+        self._clock = clock
+
+    def _get_path(self, url):
+        return os.path.join(self._directory, '{0}.json'.format(get_cache_key(url)))
+
+    def _load(self, path, url):
+        entry = read_json_cache_file(path)
+        if not isinstance(entry, dict) or entry.get('url') != url:
+            return None
+        try:
+            entry['content'] = base64.b64decode(entry['content'])
+            if not isinstance(entry['info'], dict) or not isinstance(entry['time'], (float, ) + integer_types):
+                return None
+        except (KeyError, TypeError, ValueError):
+            return None
+        return entry
+
+    def _store(self, path, url, content, info):
+        etag = info.get('etag')
+        last_modified = info.get('last-modified')
+        if etag is None and last_modified is None and self._ttl <= 0:
+            return
+        write_json_cache_file(path, {
+            'url': url,
+            'time': self._clock(),
+            'etag': etag,
+            'last_modified': last_modified,
+            'info': dict(
+                (key, value) for key, value in info.items()
+                if isinstance(key, string_types) and isinstance(value, string_types + integer_types)
+            ),
+            'content': base64.b64encode(content).decode('ascii'),
+        })
+
+    def _create_response(self, entry, url, hit=False):
+        info = HTTPInfo(entry['info'])
+        info['status'] = 200
+        info['url'] = url
+        if hit:
+            info['response_cache'] = 'hit'
+        return entry['content'], info
+
+    def clear(self):
+        """
+        Remove all cache entries.
+        """
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def fetch_url(self, url, method='GET', headers=None, data=None, timeout=None):
+        if method != 'GET':
+            content, info = self._http_helper.fetch_url(url, method=method, headers=headers, data=data, timeout=timeout)
+            if method not in _SAFE_METHODS and 200 <= info['status'] < 300:
+                self.clear()
+            return content, info
+
+        path = self._get_path(url)
+        entry = self._load(path, url)
+        if entry is not None:
+            if entry.get('etag') is None and entry.get('last_modified') is None:
+                if self._clock() - entry['time'] < self._ttl:
+                    return self._create_response(entry, url, hit=True)
+                entry = None
+            else:
+                headers = dict(headers or {})
+                if entry.get('etag') is not None:
+                    headers['If-None-Match'] = entry['etag']
+                if entry.get('last_modified') is not None:
+                    headers['If-Modified-Since'] = entry['last_modified']
+
+        content, info = self._http_helper.fetch_url(url, method=method, headers=headers, data=data, timeout=timeout)
+        if info['status'] == 304 and entry is not None:
+            return self._create_response(entry, url)
+        if info['status'] == 200 and content is not None:
+            self._store(path, url, content, info)
+        return content, info
@@ -8,12 +8,28 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 
-import json
+import random
 import time
 
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible.module_utils.common.text.converters import to_native
 
+from ansible_collections.community.dns.plugins.module_utils.api_stats import (
+    get_endpoint_name,
+)
+
+from ansible_collections.community.dns.plugins.module_utils.http import (
+    IDEMPOTENT_METHODS,
+    NetworkError,
+    normalize_info,
+)
+
+from ansible_collections.community.dns.plugins.module_utils.json_codec import (
+    decode_json,
+    decode_json_stream,
+    encode_json,
+)
+
 from ansible_collections.community.dns.plugins.module_utils.zone_record_api import (
     DNSAPIError,
     DNSAPIAuthenticationError,
@@ -33,23 +49,72 @@ UNKNOWN_ERROR = "Unknown Error"
 
 
 def _get_header_value(info, header_name):
-    header_name = header_name.lower()
-    header_value = info.get(header_name)
-    for k, v in info.items():
-        if k.lower() == header_name:
-            header_value = v
-    return header_value
+    # HTTP helpers return HTTPInfo objects; other dictionaries are only normalized for compatibility
+    return normalize_info(info).get(header_name)
+
+
+def _is_json_content_type(content_type):
+    return content_type == 'application/json' or (content_type is not None and content_type.startswith('application/json;'))
+
+
+class RetryPolicy(object):
+    """
+    Determines which requests are retried, and how long to wait before retrying.
+
+    Requests are retried if the API asks to slow down (HTTP status 429), and for idempotent
+    methods if a gateway error (HTTP status 502, 503, or 504) or a network error occurs.
+    For HTTP status 429, the delay is taken from the Retry-After header and is at least 1 second,
+    so that the API is not asked again before it allows it. If the header is not present, the
+    delay is 10 seconds, but at most ``max_delay``. In all other cases,
+    the delay grows exponentially from ``initial_delay`` to ``max_delay``, and if ``jitter`` is
+    ``True``, a random value between half the delay and the full delay is used.
+
+    Retrying stops after ``max_retries`` retries, or if the total time waited would exceed
+    ``max_total_wait`` seconds.
+    """
+
+    RETRY_STATUSES = frozenset([502, 503, 504])
+
+    def __init__(self, max_retries=10, initial_delay=1, max_delay=60, jitter=True, max_total_wait=600):
+        self.max_retries = max_retries
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.max_total_wait = max_total_wait
+
+    def get_backoff_delay(self, retry):
+        """
+        Return the delay in seconds before the given retry (counted from 0).
+        """
+        delay = min(self.max_delay, self.initial_delay * (2 ** min(retry, 32)))
+        if self.jitter:
+            delay = random.uniform(delay / 2.0, delay)
+        return delay
+
+    def get_rate_limit_delay(self, info):
+        """
+        Return the delay in seconds after the API responded with HTTP status 429.
+        """
+        try:
+            retry_after = float(_get_header_value(info, 'retry-after'))
+        except (ValueError, TypeError):
+            retry_after = min(10, self.max_delay)
+        return max(retry_after, 1)
 
 
 class JSONAPIHelper(object):
-    def __init__(self, http_helper, token, api, debug=False):
+    def __init__(self, http_helper, token, api, debug=False, retry_policy=None, api_stats=None):
         """
         Create a new JSON API helper instance with given API key.
+
+        If ``api_stats`` is an ``APIStats`` object, statistics on all requests are collected in it.
         """
         self._api = api
         self._http_helper = http_helper
         self._token = token
         self._debug = debug
+        self._retry_policy = retry_policy or RetryPolicy()
+        self.api_stats = api_stats
 
     def _build_url(self, url, query=None):
         return '{0}{1}{2}'.format(self._api, url, ('?' + urlencode(query)) if query else '')
@@ -86,7 +151,7 @@ class JSONAPIHelper(object):
         if info['status'] == 401:
             message = 'Unauthorized: the authentication parameters are incorrect (HTTP status 401)'
             try:
-                body = json.loads(content.decode('utf8'))
+                body = decode_json(content)
                 if body['message']:
                     message = '{0}: {1}'.format(message, body['message'])
             except Exception:
@@ -95,7 +160,7 @@ class JSONAPIHelper(object):
         if info['status'] == 403:
             message = 'Forbidden: you do not have access to this resource (HTTP status 403)'
             try:
-                body = json.loads(content.decode('utf8'))
+                body = decode_json(content)
                 if body['message']:
                     message = '{0}: {1}'.format(message, body['message'])
             except Exception:
@@ -103,7 +168,7 @@ class JSONAPIHelper(object):
             raise DNSAPIAuthenticationError(message)
         # Check Content-Type header
         content_type = _get_header_value(info, 'content-type')
-        if content_type != 'application/json' and (content_type is None or not content_type.startswith('application/json;')):
+        if not _is_json_content_type(content_type):
             if must_have_content:
                 raise DNSAPIError(
                     '{0} {1} did not yield JSON data, but HTTP status code {2} with Content-Type "{3}" and data: {4}'.format(
@@ -112,7 +177,7 @@ class JSONAPIHelper(object):
             return None, info
         # Decode content as JSON
         try:
-            result = json.loads(content.decode('utf8'))
+            result = decode_json(content)
         except Exception:
             if must_have_content:
                 raise DNSAPIError(
@@ -123,24 +188,58 @@ class JSONAPIHelper(object):
         self._validate(result=result, info=info, expected=expected, method=method)
         return result, info
 
-    def _request(self, url, **kwargs):
-        """Execute a HTTP request and handle common things like rate limiting."""
-        number_retries = 10
-        countdown = number_retries + 1
+    def _request(self, url, retry_server_errors=True, **kwargs):
+        """
+        Execute a HTTP request and handle common things like rate limiting and transient errors.
+
+        If ``retry_server_errors`` is ``False``, gateway and network errors are never retried.
+        """
+        policy = self._retry_policy
+        method = kwargs.get('method', 'GET')
+        idempotent = method in IDEMPOTENT_METHODS and retry_server_errors
+        api_stats = self.api_stats
+        if api_stats is not None:
+            endpoint = get_endpoint_name(method, url, base_url=self._api)
+            bytes_sent = len(kwargs.get('data') or b'')
+        retries = 0
+        total_wait = 0
         while True:
-            content, info = self._http_helper.fetch_url(url, **kwargs)
-            countdown -= 1
-            if info['status'] == 429:
-                if countdown <= 0:
-                    break
-                try:
-                    retry_after = max(min(float(_get_header_value(info, 'retry-after')), 60), 1)
-                except (ValueError, TypeError):
-                    retry_after = 10
-                time.sleep(retry_after)
-                continue
-            return content, info
-        raise DNSAPIError('Stopping after {0} failed retries with 429 Too Many Attempts'.format(number_retries))
+            network_error = None
+            start = time.time()
+            try:
+                content, info = self._http_helper.fetch_url(url, **kwargs)
+            except NetworkError as exc:
+                network_error = exc
+            if api_stats is not None and network_error is None and info.get('response_cache') == 'hit':
+                api_stats.record_cache_hit(endpoint)
+            elif api_stats is not None:
+                api_stats.record_request(
+                    endpoint,
+                    time.time() - start,
+                    bytes_sent=bytes_sent,
+                    bytes_received=len(content or b'') if network_error is None else 0,
+                    success=network_error is None and info['status'] < 400,
+                )
+            if network_error is not None:
+                delay = policy.get_backoff_delay(retries) if idempotent else None
+            elif info['status'] == 429:
+                delay = policy.get_rate_limit_delay(info)
+            elif idempotent and info['status'] in policy.RETRY_STATUSES:
+                delay = policy.get_backoff_delay(retries)
+            else:
+                return content, info
+            if delay is None or retries >= policy.max_retries or total_wait + delay > policy.max_total_wait:
+                break
+            if api_stats is not None:
+                api_stats.record_retry(endpoint, delay)
+            time.sleep(delay)
+            total_wait += delay
+            retries += 1
+        if network_error is not None:
+            raise DNSAPIError('Network error: {0}'.format(to_native(network_error)))
+        if info['status'] == 429:
+            raise DNSAPIError('Stopping after {0} failed retries with 429 Too Many Attempts'.format(retries))
+        return content, info
 
     def _create_headers(self):
         return dict(
@@ -156,6 +255,34 @@ class JSONAPIHelper(object):
         content, info = self._request(full_url, headers=headers, method='GET')
         return self._process_json_result(content, info, must_have_content=must_have_content, method='GET', expected=expected)
 
+    def _get_streamed(self, url, path, query=None, must_have_content=True, expected=None):
+        """
+        Like ``_get()``, but the list found by following the keys in ``path`` in a successful
+        result is not decoded at once. Returns a tuple ``(result, items, info)``, where ``result``
+        does not contain the list, and ``items`` is an iterator over the list's items.
+
+        If the request was not successful, the result is the same as for ``_get()``, and
+        ``items`` is ``None``.
+        """
+        full_url = self._build_url(url, query)
+        headers = self._create_headers()
+        content, info = self._request(full_url, headers=headers, method='GET')
+        if info['status'] == 200 and _is_json_content_type(_get_header_value(info, 'content-type')):
+            try:
+                result, items = decode_json_stream(content, path)
+            except ValueError:
+                # Let _process_json_result() report invalid JSON
+                result, info = self._process_json_result(content, info, must_have_content=must_have_content, method='GET', expected=expected)
+                if result is not None:
+                    raise DNSAPIError(
+                        'GET {0} did not yield the expected JSON data, but HTTP status code {1} with data: {2}'.format(
+                            info['url'], info['status'], to_native(content)))
+                return result, None, info
+            self._validate(result=result, info=info, expected=expected, method='GET')
+            return result, items, info
+        result, info = self._process_json_result(content, info, must_have_content=must_have_content, method='GET', expected=expected)
+        return result, None, info
+
     def _post(self, url, data=None, query=None, must_have_content=True, expected=None):
         full_url = self._build_url(url, query)
         if self._debug:
@@ -165,11 +292,11 @@ class JSONAPIHelper(object):
         encoded_data = None
         if data is not None:
             headers['content-type'] = 'application/json'
-            encoded_data = json.dumps(data).encode('utf-8')
+            encoded_data = encode_json(data)
         content, info = self._request(full_url, headers=headers, method='POST', data=encoded_data)
         return self._process_json_result(content, info, must_have_content=must_have_content, method='POST', expected=expected)
 
-    def _put(self, url, data=None, query=None, must_have_content=True, expected=None):
+    def _put(self, url, data=None, query=None, must_have_content=True, expected=None, retry_server_errors=True):
         full_url = self._build_url(url, query)
         if self._debug:
             pass
@@ -178,8 +305,8 @@ class JSONAPIHelper(object):
         encoded_data = None
         if data is not None:
             headers['content-type'] = 'application/json'
-            encoded_data = json.dumps(data).encode('utf-8')
-        content, info = self._request(full_url, headers=headers, method='PUT', data=encoded_data)
+            encoded_data = encode_json(data)
+        content, info = self._request(full_url, headers=headers, method='PUT', data=encoded_data, retry_server_errors=retry_server_errors)
         return self._process_json_result(content, info, must_have_content=must_have_content, method='PUT', expected=expected)
 
     def _delete(self, url, query=None, must_have_content=True, expected=None):
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 Felix Fontein
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import io
+import json
+import re
+import sys
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ujson
+    HAS_UJSON = True
+except ImportError:
+    HAS_UJSON = False
+
+try:
+    import ijson
+    # The use_float parameter was added in ijson 3.1
+    _IJSON_VERSION = re.match(r'^([0-9]+)\.([0-9]+)', getattr(ijson, '__version__', ''))
+    HAS_IJSON = _IJSON_VERSION is not None and (int(_IJSON_VERSION.group(1)), int(_IJSON_VERSION.group(2))) >= (3, 1)
+except ImportError:
+    HAS_IJSON = False
+
+
+def _stdlib_decode(content):
+    if sys.version_info < (3, 6):
+        # Before Python 3.6, json.loads() does not accept bytes on Python 3
+        content = content.decode('utf-8')
+    return json.loads(content)
+
+
+def _stdlib_encode(data):
+    return json.dumps(data).encode('utf-8')
+
+
+def _orjson_decode(content):
+    return orjson.loads(content)
+
+
+def _orjson_encode(data):
+    return orjson.dumps(data)
+
+
+def _ujson_decode(content):
+    return ujson.loads(content)
+
+
+def _ujson_encode(data):
+    return ujson.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+# Available codecs by name; the first entry is the preferred one
+CODECS = []
+if HAS_ORJSON:
+    CODECS.append(('orjson', _orjson_decode, _orjson_encode))
+if HAS_UJSON:
+    CODECS.append(('ujson', _ujson_decode, _ujson_encode))
+CODECS.append(('json', _stdlib_decode, _stdlib_encode))
+
+JSON_CODEC, _decode, _encode = CODECS[0]
+
+
+def decode_json(content):
+    """
+    Decode UTF-8 encoded JSON from bytes ``content``.
+
+    Uses orjson or ujson if installed, and the Python standard library otherwise.
+    Raises ``ValueError`` if ``content`` is not valid JSON.
+    """
+    return _decode(content)
+
+
+def encode_json(data):
+    """
+    Encode ``data`` as JSON. Returns UTF-8 encoded bytes.
+
+    Uses orjson or ujson if installed, and the Python standard library otherwise.
+    """
+    return _encode(data)
+
+
+def _ijson_decode_stream(content, path):
+    prefix = '.'.join(path)
+    item_prefix = prefix + '.item'
+    parent, key = '.'.join(path[:-1]), path[-1]
+    builder = ijson.ObjectBuilder()
+    items = []
+    item_builder = None
+    try:
+        for event_prefix, event, value in ijson.parse(io.BytesIO(content), use_float=True):
+            if item_builder is not None:
+                item_builder.event(event, value)
+                if event_prefix == item_prefix and event in ('end_map', 'end_array'):
+                    items.append(item_builder.value)
+                    item_builder = None
+            elif event_prefix == item_prefix:
+                if event in ('start_map', 'start_array'):
+                    item_builder = ijson.ObjectBuilder()
+                    item_builder.event(event, value)
+                else:
+                    items.append(value)
+            elif event_prefix == prefix:
+                if event not in ('start_array', 'end_array'):
+                    raise ValueError('JSON does not contain a list at {0}'.format(prefix))
+            elif not (event_prefix == parent and event == 'map_key' and value == key):
+                builder.event(event, value)
+    except ijson.JSONError as exc:
+        raise ValueError('Invalid JSON: {0}'.format(exc))
+    return builder.value, items
+
+
+def _get_container(data, path):
+    """
+    Return the dictionary which contains the list found by following the keys in ``path``.
+    """
+    container = data
+    for key in path[:-1]:
+        container = container.get(key) if isinstance(container, dict) else None
+    if not isinstance(container, dict):
+        raise ValueError('JSON does not contain a dictionary at {0}'.format('.'.join(path[:-1]) or 'top level'))
+    return container
+
+
+def decode_json_stream(content, path):
+    """
+    Decode UTF-8 encoded JSON from bytes ``content``, and iterate over the items of the list
+    found by following the keys in ``path``.
+
+    Returns a tuple ``(data, items)``, where ``data`` is the decoded JSON without the list, and
+    ``items`` is an iterator over the list's items. If ijson 3.1 or newer is installed, ``content``
+    is parsed in a single pass which builds ``data`` and every item separately. Otherwise, the
+    complete JSON is decoded at once.
+
+    Raises ``ValueError`` if ``content`` is not valid JSON, if the keys in ``path`` except the
+    last one do not lead to a dictionary, or if the last key does not lead to a list. If the last
+    key is missing, there are no items.
+    """
+    if HAS_IJSON:
+        data, items = _ijson_decode_stream(content, path)
+        _get_container(data, path)
+        return data, iter(items)
+    data = decode_json(content)
+    items = _get_container(data, path).pop(path[-1], [])
+    if not isinstance(items, list):
+        raise ValueError('JSON does not contain a list at {0}'.format('.'.join(path)))
+    return data, iter(items)
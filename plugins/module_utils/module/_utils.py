@@ -9,10 +9,12 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 
+from ansible_collections.community.dns.plugins.module_utils.api_stats import (
+    APIStats,
+)
+
 from ansible_collections.community.dns.plugins.module_utils.names import (
-    split_into_labels,
-    join_labels,
-    normalize_label,
+    parse_domain_name,
 )
 
 from ansible_collections.community.dns.plugins.module_utils.zone_record_api import (
@@ -23,8 +25,7 @@ from ansible_collections.community.dns.plugins.module_utils.zone_record_api impo
 def normalize_dns_name(name):
     if name is None:
         return name
-    labels, dummy = split_into_labels(name)
-    return join_labels([normalize_label(label) for label in labels])
+    return parse_domain_name(name).normalized
 
 
 def get_prefix(normalized_zone, provider_information, normalized_record=None, prefix=None):
@@ -40,3 +41,20 @@ def get_prefix(normalized_zone, provider_information, normalized_record=None, pr
         return normalized_record, None
     else:
         return normalized_record, normalized_record[:len(normalized_record) - len(normalized_zone) - 1]
+
+
+def setup_api_stats(module, api):
+    """
+    Start collecting statistics on API requests if the ``collect_api_stats`` option is enabled.
+    """
+    if module.params.get('collect_api_stats'):
+        api.api_stats = APIStats()
+
+
+def get_api_stats_result(api):
+    """
+    Return a dictionary with the ``api_stats`` return value, or an empty dictionary if no statistics were collected.
+    """
+    if api.api_stats is None:
+        return {}
+    return {'api_stats': api.api_stats.to_dict()}
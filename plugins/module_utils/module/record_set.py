@@ -27,6 +27,7 @@ from ansible_collections.community.dns.plugins.module_utils.conversion.converter
 )
 
 from ansible_collections.community.dns.plugins.module_utils.options import (
+    create_api_stats_argspec,
     create_bulk_operations_argspec,
     create_record_transformation_argspec,
 )
@@ -50,6 +51,8 @@ from ansible_collections.community.dns.plugins.module_utils.zone_record_helpers
 from ._utils import (
     normalize_dns_name,
     get_prefix,
+    get_api_stats_result,
+    setup_api_stats,
 )
 
 
@@ -80,7 +83,7 @@ def create_module_argument_spec(provider_information):
             ('on_existing', 'keep_and_warn', ['value']),
             ('on_existing', 'keep', ['value']),
         ],
-    ).merge(create_bulk_operations_argspec(provider_information)).merge(create_record_transformation_argspec())
+    ).merge(create_bulk_operations_argspec(provider_information)).merge(create_record_transformation_argspec()).merge(create_api_stats_argspec())
 
 
 def run_module(module, create_api, provider_information):
@@ -93,6 +96,7 @@ def run_module(module, create_api, provider_information):
     try:
         # Create API
         api = create_api()
+        setup_api_stats(module, api)
 
         # Get zone information
         if module.params.get('zone_name') is not None:
@@ -261,6 +265,7 @@ def run_module(module, create_api, provider_information):
                 ),
             )
 
+        result.update(get_api_stats_result(api))
         module.exit_json(**result)
     except DNSConversionError as e:
         module.fail_json(msg='Error while converting DNS values: {0}'.format(e.error_message), error=e.error_message, exception=traceback.format_exc())
@@ -27,6 +27,7 @@ from ansible_collections.community.dns.plugins.module_utils.conversion.converter
 )
 
 from ansible_collections.community.dns.plugins.module_utils.options import (
+    create_api_stats_argspec,
     create_record_transformation_argspec,
 )
 
@@ -43,6 +44,8 @@ from ansible_collections.community.dns.plugins.module_utils.zone_record_api impo
 from ._utils import (
     normalize_dns_name,
     get_prefix,
+    get_api_stats_result,
+    setup_api_stats,
 )
 
 
@@ -68,7 +71,7 @@ def create_module_argument_spec(provider_information):
             ('zone_name', 'zone_id'),
             ('record', 'prefix'),
         ],
-    ).merge(create_record_transformation_argspec())
+    ).merge(create_record_transformation_argspec()).merge(create_api_stats_argspec())
 
 
 def run_module(module, create_api, provider_information):
@@ -88,6 +91,7 @@ def run_module(module, create_api, provider_information):
     try:
         # Create API
         api = create_api()
+        setup_api_stats(module, api)
 
         # Get zone information
         if module.params.get('zone_name') is not None:
@@ -125,6 +129,7 @@ def run_module(module, create_api, provider_information):
                 changed=False,
                 set=data,
                 zone_id=zone.zone.id,
+                **get_api_stats_result(api)
             )
         else:
             # Extract prefix if necessary
@@ -164,6 +169,7 @@ def run_module(module, create_api, provider_information):
                 changed=False,
                 sets=data,
                 zone_id=zone.zone.id,
+                **get_api_stats_result(api)
             )
     except DNSConversionError as e:
         module.fail_json(msg='Error while converting DNS values: {0}'.format(e.error_message), error=e.error_message, exception=traceback.format_exc())
@@ -17,6 +17,10 @@ from ansible_collections.community.dns.plugins.module_utils.argspec import (
     ArgumentSpec,
 )
 
+from ansible_collections.community.dns.plugins.module_utils.options import (
+    create_api_stats_argspec,
+)
+
 from ansible_collections.community.dns.plugins.module_utils.zone_record_api import (
     DNSAPIError,
     DNSAPIAuthenticationError,
@@ -24,6 +28,8 @@ from ansible_collections.community.dns.plugins.module_utils.zone_record_api impo
 
 from ._utils import (
     normalize_dns_name,
+    get_api_stats_result,
+    setup_api_stats,
 )
 
 
@@ -39,13 +45,14 @@ def create_module_argument_spec(provider_information):
         mutually_exclusive=[
             ('zone_name', 'zone_id'),
         ],
-    )
+    ).merge(create_api_stats_argspec())
 
 
 def run_module(module, create_api, provider_information):
     try:
         # Create API
         api = create_api()
+        setup_api_stats(module, api)
 
         # Get zone information
         if module.params.get('zone_name') is not None:
@@ -63,6 +70,7 @@ def run_module(module, create_api, provider_information):
             zone_name=zone.name,
             zone_id=zone.id,
             zone_info=zone.info,
+            **get_api_stats_result(api)
         )
     except DNSAPIAuthenticationError as e:
         module.fail_json(msg='Cannot authenticate: {0}'.format(e), error=to_text(e), exception=traceback.format_exc())
@@ -8,17 +8,29 @@ __metaclass__ = type
 
 import re
 
+from collections import namedtuple
+
 from ansible.module_utils.common.text.converters import to_text
 
 
 _ASCII_PRINTABLE_MATCHER = re.compile(r'^[\x20-\x7e]*$')
 
+# Normalized labels are cached, so that common labels (like TLDs) have to be normalized only once,
+# and so that all occurrences of a normalized label share the same string object.
+_NORMALIZED_LABEL_CACHE = {}
+_NORMALIZED_LABEL_CACHE_SIZE = 16384
+
 
 def is_ascii_label(domain):
     '''
     Check whether domain name has only ASCII labels.
     '''
-    return _ASCII_PRINTABLE_MATCHER.match(domain) is not None
+    try:
+        # For ASCII characters, isprintable() accepts exactly the range 0x20 to 0x7E
+        return domain.isascii() and domain.isprintable()
+    except AttributeError:
+        # Python < 3.7, or a byte string
+        return _ASCII_PRINTABLE_MATCHER.match(domain) is not None
 
 
 class InvalidDomainName(Exception):
@@ -28,6 +40,22 @@ class InvalidDomainName(Exception):
     pass
 
 
+def _split(domain):
+    index = len(domain)
+    tail = ''
+    if domain.endswith('.'):
+        index -= 1
+        tail = '.'
+    if index == 0:
+        return [], tail
+    result = domain[:index].split('.')
+    for label in result:
+        if label == '' or label[0] == '-' or label[-1] == '-' or len(label) > 63:
+            raise InvalidDomainName(domain)
+    result.reverse()
+    return result, tail
+
+
 def split_into_labels(domain):
     '''
     Split domain name to a list of labels. Start with the top-most label.
@@ -35,21 +63,51 @@ def split_into_labels(domain):
     Returns a list of labels and a tail, which is either ``''`` or ``'.'``.
     Raises ``InvalidDomainName`` if the domain name is not valid.
     '''
-    result = []
+    return _split(domain)
+
+
+class DomainName(namedtuple('_DomainName', ['labels', 'normalized_labels', 'tail'])):
+    '''
+    A parsed domain name, as returned by ``parse_domain_name()``.
+
+    ``labels`` and ``normalized_labels`` are tuples of labels which start with the top-most label,
+    and ``tail`` is either ``''`` or ``'.'``. Objects are immutable and hashable.
+    '''
+    __slots__ = ()
+
+    @property
+    def normalized(self):
+        '''
+        The normalized domain name, without tail.
+        '''
+        return '.'.join(reversed(self.normalized_labels))
+
+
+def parse_domain_name(domain):
+    '''
+    Validate a domain name, split it into labels and normalize them in one step.
+
+    Returns a ``DomainName`` object. Raises ``InvalidDomainName`` if the domain name is not valid.
+    '''
     index = len(domain)
     tail = ''
     if domain.endswith('.'):
         index -= 1
         tail = '.'
-    if index > 0:
-        while index >= 0:
-            next_index = domain.rfind('.', 0, index)
-            label = domain[next_index + 1:index]
-            if label == '' or label[0] == '-' or label[-1] == '-' or len(label) > 63:
-                raise InvalidDomainName(domain)
-            result.append(label)
-            index = next_index
-    return result, tail
+    if index == 0:
+        return DomainName((), (), tail)
+    labels = domain[:index].split('.')
+    labels.reverse()
+    cache = _NORMALIZED_LABEL_CACHE
+    normalized_labels = []
+    for label in labels:
+        if label == '' or label[0] == '-' or label[-1] == '-' or len(label) > 63:
+            raise InvalidDomainName(domain)
+        normalized_label = cache.get(label)
+        if normalized_label is None:
+            normalized_label = normalize_label(label)
+        normalized_labels.append(normalized_label)
+    return DomainName(tuple(labels), tuple(normalized_labels), tail)
 
 
 def join_labels(labels, tail=''):
@@ -59,14 +117,40 @@ def join_labels(labels, tail=''):
     return '.'.join(reversed(labels)) + tail
 
 
+def _normalize_label(label):
+    if not is_ascii_label(label):
+        # Convert ulabel to alabel
+        label = to_text(b'xn--' + to_text(label).encode('punycode'))
+    # Always convert to lower-case
+    return label.lower()
+
+
 def normalize_label(label):
     '''
     Normalize a domain label. Returns a lower-case ASCII label.
 
     If a ulabel is provided, it is converted to an alabel.
     '''
-    if not is_ascii_label(label):
-        # Convert ulabel to alabel
-        label = to_text(b'xn--' + to_text(label).encode('punycode'))
-    # Always convert to lower-case
-    return label.lower()
+    normalized_label = _NORMALIZED_LABEL_CACHE.get(label)
+    if normalized_label is None:
+        normalized_label = _normalize_label(label)
+        if len(_NORMALIZED_LABEL_CACHE) >= _NORMALIZED_LABEL_CACHE_SIZE:
+            _NORMALIZED_LABEL_CACHE.clear()
+        _NORMALIZED_LABEL_CACHE[label] = normalized_label
+    return normalized_label
+
+
+def normalize_labels(labels):
+    '''
+    Normalize a list of domain labels, for example the result of ``split_into_labels()``.
+
+    Returns a list of lower-case ASCII labels.
+    '''
+    cache = _NORMALIZED_LABEL_CACHE
+    result = []
+    for label in labels:
+        normalized_label = cache.get(label)
+        if normalized_label is None:
+            normalized_label = normalize_label(label)
+        result.append(normalized_label)
+    return result
@@ -7,10 +7,39 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 
+import os
+
 from ansible_collections.community.dns.plugins.module_utils.argspec import (
     ArgumentSpec,
 )
 
+from ansible_collections.community.dns.plugins.module_utils.file_cache import (
+    get_cache_directory,
+    get_cache_key,
+)
+
+from ansible_collections.community.dns.plugins.module_utils.http import (
+    KeepAliveHTTPHelper,
+)
+
+from ansible_collections.community.dns.plugins.module_utils.http_cache import (
+    CachingHTTPHelper,
+)
+
+from ansible_collections.community.dns.plugins.module_utils.json_api_helper import (
+    RetryPolicy,
+)
+
+from ansible_collections.community.dns.plugins.module_utils.rate_limit import (
+    RateLimitedHTTPHelper,
+    SharedTokenBucket,
+    TokenBucket,
+)
+
+from ansible_collections.community.dns.plugins.module_utils.zone_id_cache import (
+    ZoneIDCache,
+)
+
 
 def create_bulk_operations_argspec(provider_information):
     """
@@ -33,3 +62,97 @@ def create_record_transformation_argspec():
             txt_transformation=dict(type='str', default='unquoted', choices=['api', 'quoted', 'unquoted']),
         ),
     )
+
+
+def create_api_stats_argspec():
+    return ArgumentSpec(
+        argument_spec=dict(
+            collect_api_stats=dict(type='bool', default=False),
+        ),
+    )
+
+
+def create_api_client_argspec():
+    return ArgumentSpec(
+        argument_spec=dict(
+            connection_pool_size=dict(type='int', default=0),
+            max_concurrency=dict(type='int', default=1),
+            rate_limit=dict(type='float'),
+            rate_limit_burst=dict(type='int', default=1),
+            rate_limit_shared=dict(type='bool', default=False),
+            max_retries=dict(type='int', default=10),
+            retry_initial_delay=dict(type='float', default=1),
+            retry_max_delay=dict(type='float', default=60),
+            retry_jitter=dict(type='bool', default=True),
+            retry_max_total_wait=dict(type='float', default=600),
+            response_cache=dict(type='bool', default=False),
+            response_cache_ttl=dict(type='float', default=0),
+            zone_id_cache=dict(type='bool', default=False),
+            zone_id_cache_ttl=dict(type='float', default=86400),
+        ),
+    )
+
+
+def create_api_http_helper(option_provider, http_helper, account, cache_responses=True):
+    """
+    Wrap the HTTP helper according to the options from ``create_api_client_argspec()``.
+
+    ``account`` must be a tuple of strings which identifies the provider and the credentials
+    used. It is used to share state between processes.
+
+    If ``cache_responses`` is ``False``, the ``response_cache`` option is ignored. This must be
+    used for APIs which also read data with POST requests.
+
+    Options which are not set (``None``) are treated like their default values.
+    """
+    connection_pool_size = option_provider.get_option('connection_pool_size') or 0
+    if connection_pool_size > 0:
+        http_helper = KeepAliveHTTPHelper(http_helper, pool_size=connection_pool_size)
+    rate_limit = option_provider.get_option('rate_limit')
+    if rate_limit is not None and rate_limit > 0:
+        burst = option_provider.get_option('rate_limit_burst') or 1
+        if option_provider.get_option('rate_limit_shared'):
+            path = os.path.join(get_cache_directory(), 'rate-limit-{0}'.format(get_cache_key(*account)))
+            rate_limiter = SharedTokenBucket(rate_limit, path, burst=burst)
+        else:
+            rate_limiter = TokenBucket(rate_limit, burst=burst)
+        http_helper = RateLimitedHTTPHelper(http_helper, rate_limiter)
+    if cache_responses and option_provider.get_option('response_cache'):
+        directory = os.path.join(get_cache_directory(), 'responses', get_cache_key(*account))
+        http_helper = CachingHTTPHelper(http_helper, directory, ttl=option_provider.get_option('response_cache_ttl') or 0)
+    return http_helper
+
+
+def create_zone_id_cache(option_provider, account):
+    """
+    Create a ``ZoneIDCache`` object according to the options from ``create_api_client_argspec()``,
+    or return ``None`` if zone IDs should not be cached.
+
+    ``account`` must be a tuple of strings which identifies the provider and the credentials
+    used, like for ``create_api_http_helper()``.
+    """
+    if not option_provider.get_option('zone_id_cache'):
+        return None
+    ttl = option_provider.get_option('zone_id_cache_ttl')
+    path = os.path.join(get_cache_directory(), 'zone-ids-{0}.json'.format(get_cache_key(*account)))
+    return ZoneIDCache(path, 86400 if ttl is None else ttl)
+
+
+def create_retry_policy(option_provider):
+    """
+    Create a ``RetryPolicy`` object according to the options from ``create_api_client_argspec()``.
+
+    Options which are not set (``None``) are treated like their default values.
+    """
+    kwargs = {}
+    for option, argument in [
+        ('max_retries', 'max_retries'),
+        ('retry_initial_delay', 'initial_delay'),
+        ('retry_max_delay', 'max_delay'),
+        ('retry_jitter', 'jitter'),
+        ('retry_max_total_wait', 'max_total_wait'),
+    ]:
+        value = option_provider.get_option(option)
+        if value is not None:
+            kwargs[argument] = value
+    return RetryPolicy(**kwargs)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 Felix Fontein
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import os
+import threading
+import time
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+from ansible_collections.community.dns.plugins.module_utils.http import (
+    HTTPHelper,
+)
+
+
+class TokenBucket(object):
+    """
+    Token bucket rate limiter. On average, ``rate`` tokens per second can be acquired,
+    and up to ``burst`` tokens can be acquired at once after a pause.
+
+    The rate limiter can be used from multiple threads at the same time.
+    """
+
+    def __init__(self, rate, burst=1, clock=time.time, sleep=time.sleep):
+        self._rate = float(rate)
+        self._burst = max(burst, 1)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = None
+        self._last = None
+
+    def _take_token(self, tokens, last, now):
+        """
+        Given the state ``(tokens, last)`` of the bucket, try to take a token at time ``now``.
+
+        Returns a tuple ``(tokens, last, wait)`` with the new state of the bucket. If no token
+        could be taken, ``wait`` is the number of seconds until the next token is available.
+        """
+        if tokens is None or last is None:
+            tokens = self._burst
+        else:
+            tokens = min(self._burst, tokens + max(now - last, 0) * self._rate)
+        if tokens >= 1:
+            return tokens - 1, now, 0
+        return tokens, now, (1 - tokens) / self._rate
+
+    def _try_acquire(self):
+        with self._lock:
+            self._tokens, self._last, wait = self._take_token(self._tokens, self._last, self._clock())
+        return wait
+
+    def acquire(self):
+        """
+        Take a token. Blocks until one is available.
+        """
+        while True:
+            wait = self._try_acquire()
+            if wait <= 0:
+                return
+            self._sleep(wait)
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    Token bucket rate limiter whose state is stored in a file, so that it can be shared by
+    multiple processes on the same machine, like Ansible's forks.
+
+    If the file cannot be used, the rate limiter is only shared in this process.
+    """
+
+    def __init__(self, rate, path, burst=1, clock=time.time, sleep=time.sleep):
+        super(SharedTokenBucket, self).__init__(rate, burst=burst, clock=clock, sleep=sleep)
+        self._path = path
+
+    def _try_acquire(self):
+        if not HAS_FCNTL:
+            return super(SharedTokenBucket, self)._try_acquire()
+        with self._lock:
+            try:
+                directory = os.path.dirname(self._path)
+                if directory and not os.path.isdir(directory):
+                    try:
+                        os.makedirs(directory, 0o700)
+                    except OSError:
+                        # Another process might have created the directory in the meantime
+                        if not os.path.isdir(directory):
+                            raise
+                fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+            except (IOError, OSError):
+                self._tokens, self._last, wait = self._take_token(self._tokens, self._last, self._clock())
+                return wait
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                tokens = last = None
+                try:
+                    tokens, last = [float(value) for value in os.read(fd, 100).decode('ascii').split()]
+                except (ValueError, UnicodeError):
+                    # File is new or has been corrupted
+                    pass
+                tokens, last, wait = self._take_token(tokens, last, self._clock())
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                os.write(fd, '{0!r} {1!r}'.format(tokens, last).encode('ascii'))
+                return wait
+            finally:
+                # Closing the file also releases the lock
+                os.close(fd)
+
+
+class RateLimitedHTTPHelper(HTTPHelper):
+    """
+    HTTP helper which passes requests on to ``http_helper`` after acquiring a token from
+    ``rate_limiter``.
+    """
+
+    def __init__(self, http_helper, rate_limiter):
+        self._http_helper = http_helper
+        self._rate_limiter = rate_limiter
+
+    def fetch_url(self, url, method='GET', headers=None, data=None, timeout=None):
+        self._rate_limiter.acquire()
+        return self._http_helper.fetch_url(url, method=method, headers=headers, data=data, timeout=timeout)
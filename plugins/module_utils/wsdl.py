@@ -7,6 +7,8 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 
+import time
+
 from ansible.module_utils.common.text.converters import to_native
 from ansible.module_utils.six import string_types
 
@@ -245,8 +247,9 @@ class Composer(object):
     def _create_envelope(self, tag, **kwarg):
         return self._create(tag, self._main_ns, **kwarg)
 
-    def __init__(self, http_helper, api, namespaces=None):
+    def __init__(self, http_helper, api, namespaces=None, api_stats=None):
         self._http_helper = http_helper
+        self._api_stats = api_stats
         self._main_ns = _NAMESPACE_ENVELOPE
         self._api = api
         # Compose basic document
@@ -286,6 +289,17 @@ class Composer(object):
             command.append(arg)
         self._body.append(command)
 
+    def _record_request(self, start, bytes_sent, code, result=None):
+        if self._api_stats is None:
+            return
+        self._api_stats.record_request(
+            'POST {0}'.format(self._command or ''),
+            time.time() - start,
+            bytes_sent=bytes_sent,
+            bytes_received=len(result or b''),
+            success=code is not None and code < 400,
+        )
+
     def execute(self, debug=False):
         payload = b'''<?xml version='1.0' encoding='utf-8'?>''' + b'\n' + lxml.etree.tostring(self._root) + b'\n'
         try:
@@ -295,10 +309,13 @@ class Composer(object):
             }
             if self._command:
                 headers['SOAPAction'] = '"{0}#{1}"'.format(self._api, self._command)
+            start = time.time()
             result, info = self._http_helper.fetch_url(self._api, data=payload, method='POST', timeout=300, headers=headers)
             code = info['status']
         except NetworkError as e:
+            self._record_request(start, len(payload), None)
             raise WSDLNetworkError(to_native(e))
+        self._record_request(start, len(payload), code, result)
         # if debug:
         #     q.q('Result: {0}, content: {1}'.format(code, result.decode('utf-8')))
         if code < 200 or code >= 300:
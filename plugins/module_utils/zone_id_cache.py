@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2021 Felix Fontein
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import os
+import time
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+from ansible.module_utils.six import integer_types
+
+from ansible_collections.community.dns.plugins.module_utils.file_cache import (
+    create_cache_directory,
+    read_json_cache_file,
+    write_json_cache_file,
+)
+
+
+class ZoneIDCache(object):
+    """
+    Maps zone names to zone IDs. The mapping is stored in the file ``path``, so that it can be
+    used by later module runs and by other processes. Entries expire after ``ttl`` seconds.
+
+    The file should be specific to the provider and the credentials used. While entries are
+    changed, the lock file ``path + '.lock'`` is locked, so that processes changing entries at
+    the same time do not lose each other's changes.
+    """
+
+    def __init__(self, path, ttl, clock=time.time):
+        self._path = path
+        self._ttl = ttl
+        self._clock = clock
+
+    def _is_valid(self, entry, now):
+        return (
+            isinstance(entry, dict)
+            and 'id' in entry
+            and isinstance(entry.get('time'), (float, ) + integer_types)
+            and 0 <= now - entry['time'] < self._ttl
+        )
+
+    def _load(self):
+        data = read_json_cache_file(self._path)
+        if not isinstance(data, dict):
+            return {}
+        now = self._clock()
+        return dict((name, entry) for name, entry in data.items() if self._is_valid(entry, now))
+
+    def get(self, name):
+        """
+        Return the cached ID of the zone ``name``, or ``None`` if it is not known.
+        """
+        entry = self._load().get(name)
+        return entry['id'] if entry is not None else None
+
+    def _lock(self):
+        """
+        Lock the lock file. Returns a file descriptor which must be closed to release the lock,
+        or ``None`` if the lock file cannot be used.
+        """
+        if not HAS_FCNTL:
+            return None
+        try:
+            create_cache_directory(os.path.dirname(self._path))
+            fd = os.open(self._path + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+        except (IOError, OSError):
+            return None
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        except (IOError, OSError):
+            os.close(fd)
+            return None
+        return fd
+
+    def _update(self, update):
+        """
+        Call ``update(entries)`` with the current entries, and write them back if it returns ``True``.
+        """
+        fd = self._lock()
+        try:
+            data = self._load()
+            if update(data):
+                write_json_cache_file(self._path, data)
+        finally:
+            if fd is not None:
+                # Closing the file also releases the lock
+                os.close(fd)
+
+    def set(self, name, zone_id):
+        """
+        Remember that zone ``name`` has the ID ``zone_id``.
+        """
+        def update(data):
+            data[name] = {'id': zone_id, 'time': self._clock()}
+            return True
+
+        self._update(update)
+
+    def remove(self, name):
+        """
+        Forget the ID of zone ``name``.
+        """
+        self._update(lambda data: data.pop(name, None) is not None)
@@ -11,6 +11,12 @@ import abc
 
 from ansible.module_utils import six
 
+try:
+    from concurrent import futures
+    HAS_CONCURRENT_FUTURES = True
+except ImportError:
+    HAS_CONCURRENT_FUTURES = False
+
 from ansible_collections.community.dns.plugins.module_utils.zone import (
     DNSZoneWithRecords,
 )
@@ -33,6 +39,16 @@ NOT_PROVIDED = NotProvidedType()
 
 @six.add_metaclass(abc.ABCMeta)
 class ZoneRecordAPI(object):
+    # Maximal number of calls to add_record(), update_record() and delete_record() that add_records(),
+    # update_records() and delete_records() run at the same time. Needs concurrent.futures.
+    max_concurrency = 1
+
+    # If set to an APIStats object, statistics on all API requests are collected in it.
+    api_stats = None
+
+    # If set to a ZoneIDCache object, zone IDs are looked up in it before looking up zones by name.
+    zone_id_cache = None
+
     @abc.abstractmethod
     def get_zone_by_name(self, name):
         """
@@ -61,11 +77,40 @@ class ZoneRecordAPI(object):
         @param record_type: The record type to filter for, if provided
         @return The zone information with records (DNSZoneWithRecords), or None if not found
         """
-        zone = self.get_zone_by_name(name)
+        zone = self._get_zone_by_cached_id(name, self.get_zone_by_id)
         if zone is None:
-            return None
+            zone = self.get_zone_by_name(name)
+            if zone is None:
+                return None
+            self._remember_zone_id(zone)
         return DNSZoneWithRecords(zone, self.get_zone_records(zone.id, prefix=prefix, record_type=record_type))
 
+    def _get_zone_by_cached_id(self, name, get_zone):
+        """
+        If the ID of the zone ``name`` is cached, return ``get_zone(zone_id)`` if it is a zone named
+        ``name`` (DNSZone or DNSZoneWithRecords). Otherwise, return None. ``get_zone`` must retrieve
+        the zone from the API, so that it can be checked whether the ID still belongs to the zone.
+        Cache entries for zones that no longer exist or got another ID are removed.
+        """
+        if self.zone_id_cache is None:
+            return None
+        zone_id = self.zone_id_cache.get(name)
+        if zone_id is None:
+            return None
+        result = get_zone(zone_id)
+        zone = result.zone if isinstance(result, DNSZoneWithRecords) else result
+        if zone is not None and zone.name == name:
+            return result
+        self.zone_id_cache.remove(name)
+        return None
+
+    def _remember_zone_id(self, zone):
+        """
+        Store the ID of ``zone`` (DNSZone or None) in the zone ID cache, if there is one.
+        """
+        if self.zone_id_cache is not None and zone is not None:
+            self.zone_id_cache.set(zone.name, zone.id)
+
     def get_zone_with_records_by_id(self, id, prefix=NOT_PROVIDED, record_type=NOT_PROVIDED):
         """
         Given a zone ID, return the zone contents with records if found.
@@ -137,18 +182,8 @@ class ZoneRecordAPI(object):
                 it was not created. It is possible that the API only creates records if all succeed,
                 in that case ``failed`` can be ``None`` even though ``created`` is ``False``.
         """
-        results_per_zone_id = {}
-        for zone_id, records in records_per_zone_id.items():
-            result = []
-            results_per_zone_id[zone_id] = result
-            for record in records:
-                try:
-                    result.append((self.add_record(zone_id, record), True, None))
-                except DNSAPIError as e:
-                    result.append((record, False, e))
-                    if stop_early_on_errors:
-                        return results_per_zone_id
-        return results_per_zone_id
+        return self._process_records(
+            records_per_zone_id, lambda zone_id, record: (self.add_record(zone_id, record), True, None), stop_early_on_errors=stop_early_on_errors)
 
     def update_records(self, records_per_zone_id, stop_early_on_errors=True):
         """
@@ -164,18 +199,8 @@ class ZoneRecordAPI(object):
                 records if all succeed, in that case ``failed`` can be ``None`` even though
                 ``updated`` is ``False``.
         """
-        results_per_zone_id = {}
-        for zone_id, records in records_per_zone_id.items():
-            result = []
-            results_per_zone_id[zone_id] = result
-            for record in records:
-                try:
-                    result.append((self.update_record(zone_id, record), True, None))
-                except DNSAPIError as e:
-                    result.append((record, False, e))
-                    if stop_early_on_errors:
-                        return results_per_zone_id
-        return results_per_zone_id
+        return self._process_records(
+            records_per_zone_id, lambda zone_id, record: (self.update_record(zone_id, record), True, None), stop_early_on_errors=stop_early_on_errors)
 
     def delete_records(self, records_per_zone_id, stop_early_on_errors=True):
         """
@@ -190,31 +215,75 @@ class ZoneRecordAPI(object):
                 while deleting, ``deleted`` is ``False`` and ``failed`` is a ``DNSAPIError``
                 instance hopefully providing information on the error.
         """
+        return self._process_records(
+            records_per_zone_id, lambda zone_id, record: (record, self.delete_record(zone_id, record), None), stop_early_on_errors=stop_early_on_errors)
+
+    def _process_records(self, records_per_zone_id, process, stop_early_on_errors=True):
+        """
+        Call ``process(zone_id, record)`` for every record, and collect the resulting tuples in
+        a dictionary mapping zone IDs to lists of tuples. If ``process`` raises a ``DNSAPIError``,
+        ``(record, False, error)`` is collected instead.
+
+        If ``max_concurrency`` is larger than 1, calls to ``process`` run concurrently. The order of
+        the results does not change. If ``stop_early_on_errors`` is ``True``, outstanding calls are
+        cancelled after the first error; the results of all calls that ran are still returned.
+        """
+        if self.max_concurrency > 1 and HAS_CONCURRENT_FUTURES:
+            return self._process_records_concurrently(records_per_zone_id, process, stop_early_on_errors=stop_early_on_errors)
         results_per_zone_id = {}
         for zone_id, records in records_per_zone_id.items():
             result = []
             results_per_zone_id[zone_id] = result
             for record in records:
                 try:
-                    result.append((record, self.delete_record(zone_id, record), None))
+                    result.append(process(zone_id, record))
                 except DNSAPIError as e:
                     result.append((record, False, e))
                     if stop_early_on_errors:
                         return results_per_zone_id
         return results_per_zone_id
 
+    def _process_records_concurrently(self, records_per_zone_id, process, stop_early_on_errors=True):
+        tasks = []
+        executor = futures.ThreadPoolExecutor(max_workers=self.max_concurrency)
+        try:
+            for zone_id, records in records_per_zone_id.items():
+                for record in records:
+                    tasks.append((zone_id, record, executor.submit(process, zone_id, record)))
+            if stop_early_on_errors:
+                dummy, not_done = futures.wait([task[2] for task in tasks], return_when=futures.FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+        finally:
+            executor.shutdown(wait=True)
+
+        results_per_zone_id = {}
+        for zone_id, record, future in tasks:
+            if future.cancelled():
+                continue
+            result = results_per_zone_id.setdefault(zone_id, [])
+            error = future.exception()
+            if error is None:
+                result.append(future.result())
+            elif isinstance(error, DNSAPIError):
+                result.append((record, False, error))
+            else:
+                raise error
+        return results_per_zone_id
+
 
 def filter_records(records, prefix=NOT_PROVIDED, record_type=NOT_PROVIDED):
     """
     Given a list of records, returns a filtered subset.
 
+    @param records: The records; can be any iterable, like a generator. It is only iterated once,
+                    so records which do not match are not kept in memory.
     @param prefix: The prefix to filter for, if provided. Since None is a valid value,
                    the special constant NOT_PROVIDED indicates that we are not filtering.
     @param record_type: The record type to filter for, if provided
     @return The list of records matching the provided filters.
     """
-    if prefix is not NOT_PROVIDED:
-        records = [record for record in records if record.prefix == prefix]
-    if record_type is not NOT_PROVIDED:
-        records = [record for record in records if record.type == record_type]
-    return records
+    return [
+        record for record in records
+        if (prefix is NOT_PROVIDED or record.prefix == prefix) and (record_type is NOT_PROVIDED or record.type == record_type)
+    ]
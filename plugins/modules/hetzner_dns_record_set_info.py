@@ -24,6 +24,8 @@ extends_documentation_fragment:
     - community.dns.hetzner.record_type_choices
     - community.dns.hetzner.zone_id_type
     - community.dns.module_record_set_info
+    - community.dns.options.api_client
+    - community.dns.options.api_stats
     - community.dns.options.record_transformation
 
 author:
@@ -155,6 +157,74 @@ zone_id:
     returned: success
     sample: 23
     version_added: 0.2.0
+
+api_stats:
+    description:
+        - Statistics on the API requests made by the module.
+        - Requests are grouped by endpoint, which consists of the HTTP method and the URL path.
+          Parts of the path which look like IDs are replaced by C({id}).
+        - Times are in seconds. A request which is retried is counted once for every attempt.
+        - Responses taken from the response cache without contacting the API (see I(response_cache))
+          are only counted in C(cache_hits), not as requests.
+    type: dict
+    returned: success and I(collect_api_stats=true)
+    version_added: 2.1.0
+    contains:
+        requests:
+            description: The total number of HTTP requests.
+            type: int
+        errors:
+            description: The total number of HTTP requests which failed with a network error or with a HTTP status of 400 or more.
+            type: int
+        total_time:
+            description: The total time spent waiting for responses.
+            type: float
+        bytes_sent:
+            description: The total size of all request bodies in bytes.
+            type: int
+        bytes_received:
+            description: The total size of all (decompressed) response bodies in bytes.
+            type: int
+        retries:
+            description: The total number of retries.
+            type: int
+        sleep_time:
+            description: The total time spent waiting before retries.
+            type: float
+        cache_hits:
+            description: The total number of responses taken from the response cache without contacting the API.
+            type: int
+        endpoints:
+            description:
+                - Statistics per endpoint.
+                - Every value is a dictionary with the keys C(requests), C(errors), C(total_time),
+                  C(bytes_sent), C(bytes_received), C(retries), C(sleep_time), and C(cache_hits) with the same meaning
+                  as above, the keys C(min_time) and C(max_time) with the minimal and maximal time of
+                  a request, and the key C(latency_histogram). The latency histogram is a dictionary
+                  mapping upper bounds of latency like C(<=0.25s) to the number of requests.
+            type: dict
+            sample:
+                GET v1/records:
+                    requests: 1
+                    errors: 0
+                    total_time: 0.2
+                    min_time: 0.2
+                    max_time: 0.2
+                    bytes_sent: 0
+                    bytes_received: 1432
+                    retries: 0
+                    sleep_time: 0
+                    cache_hits: 0
+                    latency_histogram:
+                        "<=0.05s": 0
+                        "<=0.1s": 0
+                        "<=0.25s": 1
+                        "<=0.5s": 0
+                        "<=1s": 0
+                        "<=2.5s": 0
+                        "<=5s": 0
+                        "<=10s": 0
+                        ">10s": 0
 '''
 
 from ansible.module_utils.basic import AnsibleModule
@@ -0,0 +1,9224 @@
+# -*- coding: utf-8 -*-
+
+# WARNING: This file is automatically generated by update-psl-data.py from plugins/public_suffix_list.dat.
+#          DO NOT EDIT MANUALLY!
+
+# The Public Suffix List is subject to the terms of the Mozilla Public License, v. 2.0.
+# See MPL or https://mozilla.org/MPL/2.0/ for details.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+SOURCE_SHA256 = '570d0d0e720f0c5c5094abf9c015f761b053ab1446c9462255f28a524d09c5f1'
+
+RULES = (
+    ('icann', (
+        'aaa',
+        'aarp',
+        'abarth',
+        'abb',
+        'abbott',
+        'abbvie',
+        'abc',
+        'able',
+        'abogado',
+        'abudhabi',
+        'ac',
+        'com.ac',
+        'edu.ac',
+        'gov.ac',
+        'mil.ac',
+        'net.ac',
+        'org.ac',
+        'academy',
+        'accenture',
+        'accountant',
+        'accountants',
+        'aco',
+        'actor',
+        'ad',
+        'nom.ad',
+        'adac',
+        'ads',
+        'adult',
+        'ae',
+        'ac.ae',
+        'co.ae',
+        'gov.ae',
+        'mil.ae',
+        'net.ae',
+        'org.ae',
+        'sch.ae',
+        'aeg',
+        'aero',
+        'accident-investigation.aero',
+        'accident-prevention.aero',
+        'aerobatic.aero',
+        'aeroclub.aero',
+        'aerodrome.aero',
+        'agents.aero',
+        'air-surveillance.aero',
+        'air-traffic-control.aero',
+        'aircraft.aero',
+        'airline.aero',
+        'airport.aero',
+        'airtraffic.aero',
+        'ambulance.aero',
+        'amusement.aero',
+        'association.aero',
+        'author.aero',
+        'ballooning.aero',
+        'broker.aero',
+        'caa.aero',
+        'cargo.aero',
+        'catering.aero',
+        'certification.aero',
+        'championship.aero',
+        'charter.aero',
+        'civilaviation.aero',
+        'club.aero',
+        'conference.aero',
+        'consultant.aero',
+        'consulting.aero',
+        'control.aero',
+        'council.aero',
+        'crew.aero',
+        'design.aero',
+        'dgca.aero',
+        'educator.aero',
+        'emergency.aero',
+        'engine.aero',
+        'engineer.aero',
+        'entertainment.aero',
+        'equipment.aero',
+        'exchange.aero',
+        'express.aero',
+        'federation.aero',
+        'flight.aero',
+        'fuel.aero',
+        'gliding.aero',
+        'government.aero',
+        'groundhandling.aero',
+        'group.aero',
+        'hanggliding.aero',
+        'homebuilt.aero',
+        'insurance.aero',
+        'journal.aero',
+        'journalist.aero',
+        'leasing.aero',
+        'logistics.aero',
+        'magazine.aero',
+        'maintenance.aero',
+        'media.aero',
+        'microlight.aero',
+        'modelling.aero',
+        'navigation.aero',
+        'parachuting.aero',
+        'paragliding.aero',
+        'passenger-association.aero',
+        'pilot.aero',
+        'press.aero',
+        'production.aero',
+        'recreation.aero',
+        'repbody.aero',
+        'res.aero',
+        'research.aero',
+        'rotorcraft.aero',
+        'safety.aero',
+        'scientist.aero',
+        'services.aero',
+        'show.aero',
+        'skydiving.aero',
+        'software.aero',
+        'student.aero',
+        'trader.aero',
+        'trading.aero',
+        'trainer.aero',
+        'union.aero',
+        'workinggroup.aero',
+        'works.aero',
+        'aetna',
+        'af',
+        'com.af',
+        'edu.af',
+        'gov.af',
+        'net.af',
+        'org.af',
+        'afl',
+        'africa',
+        'ag',
+        'co.ag',
+        'com.ag',
+        'net.ag',
+        'nom.ag',
+        'org.ag',
+        'agakhan',
+        'agency',
+        'ai',
+        'com.ai',
+        'net.ai',
+        'off.ai',
+        'org.ai',
+        'aig',
+        'airbus',
+        'airforce',
+        'airtel',
+        'akdn',
+        'al',
+        'com.al',
+        'edu.al',
+        'gov.al',
+        'mil.al',
+        'net.al',
+        'org.al',
+        'alfaromeo',
+        'alibaba',
+        'alipay',
+        'allfinanz',
+        'allstate',
+        'ally',
+        'alsace',
+        'alstom',
+        'am',
+        'co.am',
+        'com.am',
+        'commune.am',
+        'net.am',
+        'org.am',
+        'amazon',
+        'americanexpress',
+        'americanfamily',
+        'amex',
+        'amfam',
+        'amica',
+        'amsterdam',
+        'analytics',
+        'android',
+        'anquan',
+        'anz',
+        'ao',
+        'co.ao',
+        'ed.ao',
+        'gv.ao',
+        'it.ao',
+        'og.ao',
+        'pb.ao',
+        'aol',
+        'apartments',
+        'app',
+        'apple',
+        'aq',
+        'aquarelle',
+        'ar',
+        'bet.ar',
+        'com.ar',
+        'coop.ar',
+        'edu.ar',
+        'gob.ar',
+        'gov.ar',
+        'int.ar',
+        'mil.ar',
+        'musica.ar',
+        'mutual.ar',
+        'net.ar',
+        'org.ar',
+        'senasa.ar',
+        'tur.ar',
+        'arab',
+        'aramco',
+        'archi',
+        'army',
+        'arpa',
+        'e164.arpa',
+        'in-addr.arpa',
+        'ip6.arpa',
+        'iris.arpa',
+        'uri.arpa',
+        'urn.arpa',
+        'art',
+        'arte',
+        'as',
+        'gov.as',
+        'asda',
+        'asia',
+        'associates',
+        'at',
+        'ac.at',
+        'sth.ac.at',
+        'co.at',
+        'gv.at',
+        'or.at',
+        'athleta',
+        'attorney',
+        'au',
+        'act.au',
+        'asn.au',
+        'com.au',
+        'conf.au',
+        'edu.au',
+        'act.edu.au',
+        'catholic.edu.au',
+        'nsw.edu.au',
+        'schools.nsw.edu.au',
+        'nt.edu.au',
+        'qld.edu.au',
+        'sa.edu.au',
+        'tas.edu.au',
+        'vic.edu.au',
+        'wa.edu.au',
+        'gov.au',
+        'qld.gov.au',
+        'sa.gov.au',
+        'tas.gov.au',
+        'vic.gov.au',
+        'wa.gov.au',
+        'id.au',
+        'info.au',
+        'net.au',
+        'nsw.au',
+        'nt.au',
+        'org.au',
+        'oz.au',
+        'qld.au',
+        'sa.au',
+        'tas.au',
+        'vic.au',
+        'wa.au',
+        'auction',
+        'audi',
+        'audible',
+        'audio',
+        'auspost',
+        'author',
+        'auto',
+        'autos',
+        'avianca',
+        'aw',
+        'com.aw',
+        'aws',
+        'ax',
+        'axa',
+        'az',
+        'biz.az',
+        'com.az',
+        'edu.az',
+        'gov.az',
+        'info.az',
+        'int.az',
+        'mil.az',
+        'name.az',
+        'net.az',
+        'org.az',
+        'pp.az',
+        'pro.az',
+        'azure',
+        'ba',
+        'com.ba',
+        'edu.ba',
+        'gov.ba',
+        'mil.ba',
+        'net.ba',
+        'org.ba',
+        'baby',
+        'baidu',
+        'banamex',
+        'bananarepublic',
+        'band',
+        'bank',
+        'bar',
+        'barcelona',
+        'barclaycard',
+        'barclays',
+        'barefoot',
+        'bargains',
+        'baseball',
+        'basketball',
+        'bauhaus',
+        'bayern',
+        'bb',
+        'biz.bb',
+        'co.bb',
+        'com.bb',
+        'edu.bb',
+        'gov.bb',
+        'info.bb',
+        'net.bb',
+        'org.bb',
+        'store.bb',
+        'tv.bb',
+        'bbc',
+        'bbt',
+        'bbva',
+        'bcg',
+        'bcn',
+        '*.bd',
+        'be',
+        'ac.be',
+        'beats',
+        'beauty',
+        'beer',
+        'bentley',
+        'berlin',
+        'best',
+        'bestbuy',
+        'bet',
+        'bf',
+        'gov.bf',
+        'bg',
+        '0.bg',
+        '1.bg',
+        '2.bg',
+        '3.bg',
+        '4.bg',
+        '5.bg',
+        '6.bg',
+        '7.bg',
+        '8.bg',
+        '9.bg',
+        'a.bg',
+        'b.bg',
+        'c.bg',
+        'd.bg',
+        'e.bg',
+        'f.bg',
+        'g.bg',
+        'h.bg',
+        'i.bg',
+        'j.bg',
+        'k.bg',
+        'l.bg',
+        'm.bg',
+        'n.bg',
+        'o.bg',
+        'p.bg',
+        'q.bg',
+        'r.bg',
+        's.bg',
+        't.bg',
+        'u.bg',
+        'v.bg',
+        'w.bg',
+        'x.bg',
+        'y.bg',
+        'z.bg',
+        'bh',
+        'com.bh',
+        'edu.bh',
+        'gov.bh',
+        'net.bh',
+        'org.bh',
+        'bharti',
+        'bi',
+        'co.bi',
+        'com.bi',
+        'edu.bi',
+        'or.bi',
+        'org.bi',
+        'bible',
+        'bid',
+        'bike',
+        'bing',
+        'bingo',
+        'bio',
+        'biz',
+        'bj',
+        'asso.bj',
+        'barreau.bj',
+        'gouv.bj',
+        'black',
+        'blackfriday',
+        'blockbuster',
+        'blog',
+        'bloomberg',
+        'blue',
+        'bm',
+        'com.bm',
+        'edu.bm',
+        'gov.bm',
+        'net.bm',
+        'org.bm',
+        'bms',
+        'bmw',
+        'bn',
+        'com.bn',
+        'edu.bn',
+        'gov.bn',
+        'net.bn',
+        'org.bn',
+        'bnpparibas',
+        'bo',
+        'academia.bo',
+        'agro.bo',
+        'arte.bo',
+        'blog.bo',
+        'bolivia.bo',
+        'ciencia.bo',
+        'com.bo',
+        'cooperativa.bo',
+        'democracia.bo',
+        'deporte.bo',
+        'ecologia.bo',
+        'economia.bo',
+        'edu.bo',
+        'empresa.bo',
+        'gob.bo',
+        'indigena.bo',
+        'industria.bo',
+        'info.bo',
+        'int.bo',
+        'medicina.bo',
+        'mil.bo',
+        'movimiento.bo',
+        'musica.bo',
+        'natural.bo',
+        'net.bo',
+        'nombre.bo',
+        'noticias.bo',
+        'org.bo',
+        'patria.bo',
+        'plurinacional.bo',
+        'politica.bo',
+        'profesional.bo',
+        'pueblo.bo',
+        'revista.bo',
+        'salud.bo',
+        'tecnologia.bo',
+        'tksat.bo',
+        'transporte.bo',
+        'tv.bo',
+        'web.bo',
+        'wiki.bo',
+        'boats',
+        'boehringer',
+        'bofa',
+        'bom',
+        'bond',
+        'boo',
+        'book',
+        'booking',
+        'bosch',
+        'bostik',
+        'boston',
+        'bot',
+        'boutique',
+        'box',
+        'br',
+        '9guacu.br',
+        'abc.br',
+        'adm.br',
+        'adv.br',
+        'agr.br',
+        'aju.br',
+        'am.br',
+        'anani.br',
+        'aparecida.br',
+        'app.br',
+        'arq.br',
+        'art.br',
+        'ato.br',
+        'b.br',
+        'barueri.br',
+        'belem.br',
+        'bhz.br',
+        'bib.br',
+        'bio.br',
+        'blog.br',
+        'bmd.br',
+        'boavista.br',
+        'bsb.br',
+        'campinagrande.br',
+        'campinas.br',
+        'caxias.br',
+        'cim.br',
+        'cng.br',
+        'cnt.br',
+        'com.br',
+        'contagem.br',
+        'coop.br',
+        'coz.br',
+        'cri.br',
+        'cuiaba.br',
+        'curitiba.br',
+        'def.br',
+        'des.br',
+        'det.br',
+        'dev.br',
+        'ecn.br',
+        'eco.br',
+        'edu.br',
+        'emp.br',
+        'enf.br',
+        'eng.br',
+        'esp.br',
+        'etc.br',
+        'eti.br',
+        'far.br',
+        'feira.br',
+        'flog.br',
+        'floripa.br',
+        'fm.br',
+        'fnd.br',
+        'fortal.br',
+        'fot.br',
+        'foz.br',
+        'fst.br',
+        'g12.br',
+        'geo.br',
+        'ggf.br',
+        'goiania.br',
+        'gov.br',
+        'ac.gov.br',
+        'al.gov.br',
+        'am.gov.br',
+        'ap.gov.br',
+        'ba.gov.br',
+        'ce.gov.br',
+        'df.gov.br',
+        'es.gov.br',
+        'go.gov.br',
+        'ma.gov.br',
+        'mg.gov.br',
+        'ms.gov.br',
+        'mt.gov.br',
+        'pa.gov.br',
+        'pb.gov.br',
+        'pe.gov.br',
+        'pi.gov.br',
+        'pr.gov.br',
+        'rj.gov.br',
+        'rn.gov.br',
+        'ro.gov.br',
+        'rr.gov.br',
+        'rs.gov.br',
+        'sc.gov.br',
+        'se.gov.br',
+        'sp.gov.br',
+        'to.gov.br',
+        'gru.br',
+        'imb.br',
+        'ind.br',
+        'inf.br',
+        'jab.br',
+        'jampa.br',
+        'jdf.br',
+        'joinville.br',
+        'jor.br',
+        'jus.br',
+        'leg.br',
+        'lel.br',
+        'log.br',
+        'londrina.br',
+        'macapa.br',
+        'maceio.br',
+        'manaus.br',
+        'maringa.br',
+        'mat.br',
+        'med.br',
+        'mil.br',
+        'morena.br',
+        'mp.br',
+        'mus.br',
+        'natal.br',
+        'net.br',
+        'niteroi.br',
+        '*.nom.br',
+        'not.br',
+        'ntr.br',
+        'odo.br',
+        'ong.br',
+        'org.br',
+        'osasco.br',
+        'palmas.br',
+        'poa.br',
+        'ppg.br',
+        'pro.br',
+        'psc.br',
+        'psi.br',
+        'pvh.br',
+        'qsl.br',
+        'radio.br',
+        'rec.br',
+        'recife.br',
+        'rep.br',
+        'ribeirao.br',
+        'rio.br',
+        'riobranco.br',
+        'riopreto.br',
+        'salvador.br',
+        'sampa.br',
+        'santamaria.br',
+        'santoandre.br',
+        'saobernardo.br',
+        'saogonca.br',
+        'seg.br',
+        'sjc.br',
+        'slg.br',
+        'slz.br',
+        'sorocaba.br',
+        'srv.br',
+        'taxi.br',
+        'tc.br',
+        'tec.br',
+        'teo.br',
+        'the.br',
+        'tmp.br',
+        'trd.br',
+        'tur.br',
+        'tv.br',
+        'udi.br',
+        'vet.br',
+        'vix.br',
+        'vlog.br',
+        'wiki.br',
+        'zlg.br',
+        'bradesco',
+        'bridgestone',
+        'broadway',
+        'broker',
+        'brother',
+        'brussels',
+        'bs',
+        'com.bs',
+        'edu.bs',
+        'gov.bs',
+        'net.bs',
+        'org.bs',
+        'bt',
+        'com.bt',
+        'edu.bt',
+        'gov.bt',
+        'net.bt',
+        'org.bt',
+        'budapest',
+        'bugatti',
+        'build',
+        'builders',
+        'business',
+        'buy',
+        'buzz',
+        'bv',
+        'bw',
+        'co.bw',
+        'org.bw',
+        'by',
+        'com.by',
+        'gov.by',
+        'mil.by',
+        'of.by',
+        'bz',
+        'com.bz',
+        'edu.bz',
+        'gov.bz',
+        'net.bz',
+        'org.bz',
+        'bzh',
+        'ca',
+        'ab.ca',
+        'bc.ca',
+        'gc.ca',
+        'mb.ca',
+        'nb.ca',
+        'nf.ca',
+        'nl.ca',
+        'ns.ca',
+        'nt.ca',
+        'nu.ca',
+        'on.ca',
+        'pe.ca',
+        'qc.ca',
+        'sk.ca',
+        'yk.ca',
+        'cab',
+        'cafe',
+        'cal',
+        'call',
+        'calvinklein',
+        'cam',
+        'camera',
+        'camp',
+        'cancerresearch',
+        'canon',
+        'capetown',
+        'capital',
+        'capitalone',
+        'car',
+        'caravan',
+        'cards',
+        'care',
+        'career',
+        'careers',
+        'cars',
+        'casa',
+        'case',
+        'cash',
+        'casino',
+        'cat',
+        'catering',
+        'catholic',
+        'cba',
+        'cbn',
+        'cbre',
+        'cbs',
+        'cc',
+        'cd',
+        'gov.cd',
+        'center',
+        'ceo',
+        'cern',
+        'cf',
+        'cfa',
+        'cfd',
+        'cg',
+        'ch',
+        'chanel',
+        'channel',
+        'charity',
+        'chase',
+        'chat',
+        'cheap',
+        'chintai',
+        'christmas',
+        'chrome',
+        'church',
+        'ci',
+        'ac.ci',
+        'asso.ci',
+        'co.ci',
+        'com.ci',
+        'ed.ci',
+        'edu.ci',
+        'go.ci',
+        'gouv.ci',
+        'int.ci',
+        'md.ci',
+        'net.ci',
+        'or.ci',
+        'org.ci',
+        'presse.ci',
+        'xn--aroport-bya.ci',
+        'cipriani',
+        'circle',
+        'cisco',
+        'citadel',
+        'citi',
+        'citic',
+        'city',
+        'cityeats',
+        '*.ck',
+        '!www.ck',
+        'cl',
+        'co.cl',
+        'gob.cl',
+        'gov.cl',
+        'mil.cl',
+        'claims',
+        'cleaning',
+        'click',
+        'clinic',
+        'clinique',
+        'clothing',
+        'cloud',
+        'club',
+        'clubmed',
+        'cm',
+        'co.cm',
+        'com.cm',
+        'gov.cm',
+        'net.cm',
+        'cn',
+        'ac.cn',
+        'ah.cn',
+        'bj.cn',
+        'com.cn',
+        'cq.cn',
+        'edu.cn',
+        'fj.cn',
+        'gd.cn',
+        'gov.cn',
+        'gs.cn',
+        'gx.cn',
+        'gz.cn',
+        'ha.cn',
+        'hb.cn',
+        'he.cn',
+        'hi.cn',
+        'hk.cn',
+        'hl.cn',
+        'hn.cn',
+        'jl.cn',
+        'js.cn',
+        'jx.cn',
+        'ln.cn',
+        'mil.cn',
+        'mo.cn',
+        'net.cn',
+        'nm.cn',
+        'nx.cn',
+        'org.cn',
+        'qh.cn',
+        'sc.cn',
+        'sd.cn',
+        'sh.cn',
+        'sn.cn',
+        'sx.cn',
+        'tj.cn',
+        'tw.cn',
+        'xj.cn',
+        'xn--55qx5d.cn',
+        'xn--io0a7i.cn',
+        'xn--od0alg.cn',
+        'xz.cn',
+        'yn.cn',
+        'zj.cn',
+        'co',
+        'arts.co',
+        'com.co',
+        'edu.co',
+        'firm.co',
+        'gov.co',
+        'info.co',
+        'int.co',
+        'mil.co',
+        'net.co',
+        'nom.co',
+        'org.co',
+        'rec.co',
+        'web.co',
+        'coach',
+        'codes',
+        'coffee',
+        'college',
+        'cologne',
+        'com',
+        'comcast',
+        'commbank',
+        'community',
+        'company',
+        'compare',
+        'computer',
+        'comsec',
+        'condos',
+        'construction',
+        'consulting',
+        'contact',
+        'contractors',
+        'cooking',
+        'cookingchannel',
+        'cool',
+        'coop',
+        'corsica',
+        'country',
+        'coupon',
+        'coupons',
+        'courses',
+        'cpa',
+        'cr',
+        'ac.cr',
+        'co.cr',
+        'ed.cr',
+        'fi.cr',
+        'go.cr',
+        'or.cr',
+        'sa.cr',
+        'credit',
+        'creditcard',
+        'creditunion',
+        'cricket',
+        'crown',
+        'crs',
+        'cruise',
+        'cruises',
+        'csc',
+        'cu',
+        'com.cu',
+        'edu.cu',
+        'gov.cu',
+        'inf.cu',
+        'net.cu',
+        'org.cu',
+        'cuisinella',
+        'cv',
+        'com.cv',
+        'edu.cv',
+        'int.cv',
+        'nome.cv',
+        'org.cv',
+        'cw',
+        'com.cw',
+        'edu.cw',
+        'net.cw',
+        'org.cw',
+        'cx',
+        'gov.cx',
+        'cy',
+        'ac.cy',
+        'biz.cy',
+        'com.cy',
+        'ekloges.cy',
+        'gov.cy',
+        'ltd.cy',
+        'name.cy',
+        'net.cy',
+        'org.cy',
+        'parliament.cy',
+        'press.cy',
+        'pro.cy',
+        'tm.cy',
+        'cymru',
+        'cyou',
+        'cz',
+        'dabur',
+        'dad',
+        'dance',
+        'data',
+        'date',
+        'dating',
+        'datsun',
+        'day',
+        'dclk',
+        'dds',
+        'de',
+        'deal',
+        'dealer',
+        'deals',
+        'degree',
+        'delivery',
+        'dell',
+        'deloitte',
+        'delta',
+        'democrat',
+        'dental',
+        'dentist',
+        'desi',
+        'design',
+        'dev',
+        'dhl',
+        'diamonds',
+        'diet',
+        'digital',
+        'direct',
+        'directory',
+        'discount',
+        'discover',
+        'dish',
+        'diy',
+        'dj',
+        'dk',
+        'dm',
+        'com.dm',
+        'edu.dm',
+        'gov.dm',
+        'net.dm',
+        'org.dm',
+        'dnp',
+        'do',
+        'art.do',
+        'com.do',
+        'edu.do',
+        'gob.do',
+        'gov.do',
+        'mil.do',
+        'net.do',
+        'org.do',
+        'sld.do',
+        'web.do',
+        'docs',
+        'doctor',
+        'dog',
+        'domains',
+        'dot',
+        'download',
+        'drive',
+        'dtv',
+        'dubai',
+        'dunlop',
+        'dupont',
+        'durban',
+        'dvag',
+        'dvr',
+        'dz',
+        'art.dz',
+        'asso.dz',
+        'com.dz',
+        'edu.dz',
+        'gov.dz',
+        'net.dz',
+        'org.dz',
+        'pol.dz',
+        'soc.dz',
+        'tm.dz',
+        'earth',
+        'eat',
+        'ec',
+        'com.ec',
+        'edu.ec',
+        'fin.ec',
+        'gob.ec',
+        'gov.ec',
+        'info.ec',
+        'k12.ec',
+        'med.ec',
+        'mil.ec',
+        'net.ec',
+        'org.ec',
+        'pro.ec',
+        'eco',
+        'edeka',
+        'edu',
+        'education',
+        'ee',
+        'aip.ee',
+        'com.ee',
+        'edu.ee',
+        'fie.ee',
+        'gov.ee',
+        'lib.ee',
+        'med.ee',
+        'org.ee',
+        'pri.ee',
+        'riik.ee',
+        'eg',
+        'com.eg',
+        'edu.eg',
+        'eun.eg',
+        'gov.eg',
+        'mil.eg',
+        'name.eg',
+        'net.eg',
+        'org.eg',
+        'sci.eg',
+        'email',
+        'emerck',
+        'energy',
+        'engineer',
+        'engineering',
+        'enterprises',
+        'epson',
+        'equipment',
+        '*.er',
+        'ericsson',
+        'erni',
+        'es',
+        'com.es',
+        'edu.es',
+        'gob.es',
+        'nom.es',
+        'org.es',
+        'esq',
+        'estate',
+        'et',
+        'biz.et',
+        'com.et',
+        'edu.et',
+        'gov.et',
+        'info.et',
+        'name.et',
+        'net.et',
+        'org.et',
+        'etisalat',
+        'eu',
+        'eurovision',
+        'eus',
+        'events',
+        'exchange',
+        'expert',
+        'exposed',
+        'express',
+        'extraspace',
+        'fage',
+        'fail',
+        'fairwinds',
+        'faith',
+        'family',
+        'fan',
+        'fans',
+        'farm',
+        'farmers',
+        'fashion',
+        'fast',
+        'fedex',
+        'feedback',
+        'ferrari',
+        'ferrero',
+        'fi',
+        'aland.fi',
+        'fiat',
+        'fidelity',
+        'fido',
+        'film',
+        'final',
+        'finance',
+        'financial',
+        'fire',
+        'firestone',
+        'firmdale',
+        'fish',
+        'fishing',
+        'fit',
+        'fitness',
+        'fj',
+        'ac.fj',
+        'biz.fj',
+        'com.fj',
+        'gov.fj',
+        'info.fj',
+        'mil.fj',
+        'name.fj',
+        'net.fj',
+        'org.fj',
+        'pro.fj',
+        '*.fk',
+        'flickr',
+        'flights',
+        'flir',
+        'florist',
+        'flowers',
+        'fly',
+        'fm',
+        'com.fm',
+        'edu.fm',
+        'net.fm',
+        'org.fm',
+        'fo',
+        'foo',
+        'food',
+        'foodnetwork',
+        'football',
+        'ford',
+        'forex',
+        'forsale',
+        'forum',
+        'foundation',
+        'fox',
+        'fr',
+        'aeroport.fr',
+        'asso.fr',
+        'avocat.fr',
+        'avoues.fr',
+        'cci.fr',
+        'chambagri.fr',
+        'chirurgiens-dentistes.fr',
+        'com.fr',
+        'experts-comptables.fr',
+        'geometre-expert.fr',
+        'gouv.fr',
+        'greta.fr',
+        'huissier-justice.fr',
+        'medecin.fr',
+        'nom.fr',
+        'notaires.fr',
+        'pharmacien.fr',
+        'port.fr',
+        'prd.fr',
+        'tm.fr',
+        'veterinaire.fr',
+        'free',
+        'fresenius',
+        'frl',
+        'frogans',
+        'frontdoor',
+        'frontier',
+        'ftr',
+        'fujitsu',
+        'fun',
+        'fund',
+        'furniture',
+        'futbol',
+        'fyi',
+        'ga',
+        'gal',
+        'gallery',
+        'gallo',
+        'gallup',
+        'game',
+        'games',
+        'gap',
+        'garden',
+        'gay',
+        'gb',
+        'gbiz',
+        'gd',
+        'edu.gd',
+        'gov.gd',
+        'gdn',
+        'ge',
+        'com.ge',
+        'edu.ge',
+        'gov.ge',
+        'mil.ge',
+        'net.ge',
+        'org.ge',
+        'pvt.ge',
+        'gea',
+        'gent',
+        'genting',
+        'george',
+        'gf',
+        'gg',
+        'co.gg',
+        'net.gg',
+        'org.gg',
+        'ggee',
+        'gh',
+        'com.gh',
+        'edu.gh',
+        'gov.gh',
+        'mil.gh',
+        'org.gh',
+        'gi',
+        'com.gi',
+        'edu.gi',
+        'gov.gi',
+        'ltd.gi',
+        'mod.gi',
+        'org.gi',
+        'gift',
+        'gifts',
+        'gives',
+        'giving',
+        'gl',
+        'co.gl',
+        'com.gl',
+        'edu.gl',
+        'net.gl',
+        'org.gl',
+        'glass',
+        'gle',
+        'global',
+        'globo',
+        'gm',
+        'gmail',
+        'gmbh',
+        'gmo',
+        'gmx',
+        'gn',
+        'ac.gn',
+        'com.gn',
+        'edu.gn',
+        'gov.gn',
+        'net.gn',
+        'org.gn',
+        'godaddy',
+        'gold',
+        'goldpoint',
+        'golf',
+        'goo',
+        'goodyear',
+        'goog',
+        'google',
+        'gop',
+        'got',
+        'gov',
+        'gp',
+        'asso.gp',
+        'com.gp',
+        'edu.gp',
+        'mobi.gp',
+        'net.gp',
+        'org.gp',
+        'gq',
+        'gr',
+        'com.gr',
+        'edu.gr',
+        'gov.gr',
+        'net.gr',
+        'org.gr',
+        'grainger',
+        'graphics',
+        'gratis',
+        'green',
+        'gripe',
+        'grocery',
+        'group',
+        'gs',
+        'gt',
+        'com.gt',
+        'edu.gt',
+        'gob.gt',
+        'ind.gt',
+        'mil.gt',
+        'net.gt',
+        'org.gt',
+        'gu',
+        'com.gu',
+        'edu.gu',
+        'gov.gu',
+        'guam.gu',
+        'info.gu',
+        'net.gu',
+        'org.gu',
+        'web.gu',
+        'guardian',
+        'gucci',
+        'guge',
+        'guide',
+        'guitars',
+        'guru',
+        'gw',
+        'gy',
+        'co.gy',
+        'com.gy',
+        'edu.gy',
+        'gov.gy',
+        'net.gy',
+        'org.gy',
+        'hair',
+        'hamburg',
+        'hangout',
+        'haus',
+        'hbo',
+        'hdfc',
+        'hdfcbank',
+        'health',
+        'healthcare',
+        'help',
+        'helsinki',
+        'here',
+        'hermes',
+        'hgtv',
+        'hiphop',
+        'hisamitsu',
+        'hitachi',
+        'hiv',
+        'hk',
+        'com.hk',
+        'edu.hk',
+        'gov.hk',
+        'idv.hk',
+        'net.hk',
+        'org.hk',
+        'xn--55qx5d.hk',
+        'xn--ciqpn.hk',
+        'xn--gmq050i.hk',
+        'xn--gmqw5a.hk',
+        'xn--io0a7i.hk',
+        'xn--lcvr32d.hk',
+        'xn--mk0axi.hk',
+        'xn--mxtq1m.hk',
+        'xn--od0alg.hk',
+        'xn--od0aq3b.hk',
+        'xn--tn0ag.hk',
+        'xn--uc0atv.hk',
+        'xn--uc0ay4a.hk',
+        'xn--wcvs22d.hk',
+        'xn--zf0avx.hk',
+        'hkt',
+        'hm',
+        'hn',
+        'com.hn',
+        'edu.hn',
+        'gob.hn',
+        'mil.hn',
+        'net.hn',
+        'org.hn',
+        'hockey',
+        'holdings',
+        'holiday',
+        'homedepot',
+        'homegoods',
+        'homes',
+        'homesense',
+        'honda',
+        'horse',
+        'hospital',
+        'host',
+        'hosting',
+        'hot',
+        'hoteles',
+        'hotels',
+        'hotmail',
+        'house',
+        'how',
+        'hr',
+        'com.hr',
+        'from.hr',
+        'iz.hr',
+        'name.hr',
+        'hsbc',
+        'ht',
+        'adult.ht',
+        'art.ht',
+        'asso.ht',
+        'com.ht',
+        'coop.ht',
+        'edu.ht',
+        'firm.ht',
+        'gouv.ht',
+        'info.ht',
+        'med.ht',
+        'net.ht',
+        'org.ht',
+        'perso.ht',
+        'pol.ht',
+        'pro.ht',
+        'rel.ht',
+        'shop.ht',
+        'hu',
+        '2000.hu',
+        'agrar.hu',
+        'bolt.hu',
+        'casino.hu',
+        'city.hu',
+        'co.hu',
+        'erotica.hu',
+        'erotika.hu',
+        'film.hu',
+        'forum.hu',
+        'games.hu',
+        'hotel.hu',
+        'info.hu',
+        'ingatlan.hu',
+        'jogasz.hu',
+        'konyvelo.hu',
+        'lakas.hu',
+        'media.hu',
+        'news.hu',
+        'org.hu',
+        'priv.hu',
+        'reklam.hu',
+        'sex.hu',
+        'shop.hu',
+        'sport.hu',
+        'suli.hu',
+        'szex.hu',
+        'tm.hu',
+        'tozsde.hu',
+        'utazas.hu',
+        'video.hu',
+        'hughes',
+        'hyatt',
+        'hyundai',
+        'ibm',
+        'icbc',
+        'ice',
+        'icu',
+        'id',
+        'ac.id',
+        'biz.id',
+        'co.id',
+        'desa.id',
+        'go.id',
+        'mil.id',
+        'my.id',
+        'net.id',
+        'or.id',
+        'ponpes.id',
+        'sch.id',
+        'web.id',
+        'ie',
+        'gov.ie',
+        'ieee',
+        'ifm',
+        'ikano',
+        'il',
+        'ac.il',
+        'co.il',
+        'gov.il',
+        'idf.il',
+        'k12.il',
+        'muni.il',
+        'net.il',
+        'org.il',
+        'im',
+        'ac.im',
+        'co.im',
+        'ltd.co.im',
+        'plc.co.im',
+        'com.im',
+        'net.im',
+        'org.im',
+        'tt.im',
+        'tv.im',
+        'imamat',
+        'imdb',
+        'immo',
+        'immobilien',
+        'in',
+        'ac.in',
+        'co.in',
+        'edu.in',
+        'firm.in',
+        'gen.in',
+        'gov.in',
+        'ind.in',
+        'mil.in',
+        'net.in',
+        'nic.in',
+        'org.in',
+        'res.in',
+        'inc',
+        'industries',
+        'infiniti',
+        'info',
+        'ing',
+        'ink',
+        'institute',
+        'insurance',
+        'insure',
+        'int',
+        'eu.int',
+        'international',
+        'intuit',
+        'investments',
+        'io',
+        'com.io',
+        'ipiranga',
+        'iq',
+        'com.iq',
+        'edu.iq',
+        'gov.iq',
+        'mil.iq',
+        'net.iq',
+        'org.iq',
+        'ir',
+        'ac.ir',
+        'co.ir',
+        'gov.ir',
+        'id.ir',
+        'net.ir',
+        'org.ir',
+        'sch.ir',
+        'xn--mgba3a4f16a.ir',
+        'xn--mgba3a4fra.ir',
+        'irish',
+        'is',
+        'com.is',
+        'edu.is',
+        'gov.is',
+        'int.is',
+        'net.is',
+        'org.is',
+        'ismaili',
+        'ist',
+        'istanbul',
+        'it',
+        'abr.it',
+        'abruzzo.it',
+        'ag.it',
+        'agrigento.it',
+        'al.it',
+        'alessandria.it',
+        'alto-adige.it',
+        'altoadige.it',
+        'an.it',
+        'ancona.it',
+        'andria-barletta-trani.it',
+        'andria-trani-barletta.it',
+        'andriabarlettatrani.it',
+        'andriatranibarletta.it',
+        'ao.it',
+        'aosta.it',
+        'aosta-valley.it',
+        'aostavalley.it',
+        'aoste.it',
+        'ap.it',
+        'aq.it',
+        'aquila.it',
+        'ar.it',
+        'arezzo.it',
+        'ascoli-piceno.it',
+        'ascolipiceno.it',
+        'asti.it',
+        'at.it',
+        'av.it',
+        'avellino.it',
+        'ba.it',
+        'balsan.it',
+        'balsan-sudtirol.it',
+        'balsan-suedtirol.it',
+        'bari.it',
+        'barletta-trani-andria.it',
+        'barlettatraniandria.it',
+        'bas.it',
+        'basilicata.it',
+        'belluno.it',
+        'benevento.it',
+        'bergamo.it',
+        'bg.it',
+        'bi.it',
+        'biella.it',
+        'bl.it',
+        'bn.it',
+        'bo.it',
+        'bologna.it',
+        'bolzano.it',
+        'bolzano-altoadige.it',
+        'bozen.it',
+        'bozen-sudtirol.it',
+        'bozen-suedtirol.it',
+        'br.it',
+        'brescia.it',
+        'brindisi.it',
+        'bs.it',
+        'bt.it',
+        'bulsan.it',
+        'bulsan-sudtirol.it',
+        'bulsan-suedtirol.it',
+        'bz.it',
+        'ca.it',
+        'cagliari.it',
+        'cal.it',
+        'calabria.it',
+        'caltanissetta.it',
+        'cam.it',
+        'campania.it',
+        'campidano-medio.it',
+        'campidanomedio.it',
+        'campobasso.it',
+        'carbonia-iglesias.it',
+        'carboniaiglesias.it',
+        'carrara-massa.it',
+        'carraramassa.it',
+        'caserta.it',
+        'catania.it',
+        'catanzaro.it',
+        'cb.it',
+        'ce.it',
+        'cesena-forli.it',
+        'cesenaforli.it',
+        'ch.it',
+        'chieti.it',
+        'ci.it',
+        'cl.it',
+        'cn.it',
+        'co.it',
+        'como.it',
+        'cosenza.it',
+        'cr.it',
+        'cremona.it',
+        'crotone.it',
+        'cs.it',
+        'ct.it',
+        'cuneo.it',
+        'cz.it',
+        'dell-ogliastra.it',
+        'dellogliastra.it',
+        'edu.it',
+        'emilia-romagna.it',
+        'emiliaromagna.it',
+        'emr.it',
+        'en.it',
+        'enna.it',
+        'fc.it',
+        'fe.it',
+        'fermo.it',
+        'ferrara.it',
+        'fg.it',
+        'fi.it',
+        'firenze.it',
+        'florence.it',
+        'fm.it',
+        'foggia.it',
+        'forli-cesena.it',
+        'forlicesena.it',
+        'fr.it',
+        'friuli-v-giulia.it',
+        'friuli-ve-giulia.it',
+        'friuli-vegiulia.it',
+        'friuli-venezia-giulia.it',
+        'friuli-veneziagiulia.it',
+        'friuli-vgiulia.it',
+        'friuliv-giulia.it',
+        'friulive-giulia.it',
+        'friulivegiulia.it',
+        'friulivenezia-giulia.it',
+        'friuliveneziagiulia.it',
+        'friulivgiulia.it',
+        'frosinone.it',
+        'fvg.it',
+        'ge.it',
+        'genoa.it',
+        'genova.it',
+        'go.it',
+        'gorizia.it',
+        'gov.it',
+        'gr.it',
+        'grosseto.it',
+        'iglesias-carbonia.it',
+        'iglesiascarbonia.it',
+        'im.it',
+        'imperia.it',
+        'is.it',
+        'isernia.it',
+        'kr.it',
+        'la-spezia.it',
+        'laquila.it',
+        'laspezia.it',
+        'latina.it',
+        'laz.it',
+        'lazio.it',
+        'lc.it',
+        'le.it',
+        'lecce.it',
+        'lecco.it',
+        'li.it',
+        'lig.it',
+        'liguria.it',
+        'livorno.it',
+        'lo.it',
+        'lodi.it',
+        'lom.it',
+        'lombardia.it',
+        'lombardy.it',
+        'lt.it',
+        'lu.it',
+        'lucania.it',
+        'lucca.it',
+        'macerata.it',
+        'mantova.it',
+        'mar.it',
+        'marche.it',
+        'massa-carrara.it',
+        'massacarrara.it',
+        'matera.it',
+        'mb.it',
+        'mc.it',
+        'me.it',
+        'medio-campidano.it',
+        'mediocampidano.it',
+        'messina.it',
+        'mi.it',
+        'milan.it',
+        'milano.it',
+        'mn.it',
+        'mo.it',
+        'modena.it',
+        'mol.it',
+        'molise.it',
+        'monza.it',
+        'monza-brianza.it',
+        'monza-e-della-brianza.it',
+        'monzabrianza.it',
+        'monzaebrianza.it',
+        'monzaedellabrianza.it',
+        'ms.it',
+        'mt.it',
+        'na.it',
+        'naples.it',
+        'napoli.it',
+        'no.it',
+        'novara.it',
+        'nu.it',
+        'nuoro.it',
+        'og.it',
+        'ogliastra.it',
+        'olbia-tempio.it',
+        'olbiatempio.it',
+        'or.it',
+        'oristano.it',
+        'ot.it',
+        'pa.it',
+        'padova.it',
+        'padua.it',
+        'palermo.it',
+        'parma.it',
+        'pavia.it',
+        'pc.it',
+        'pd.it',
+        'pe.it',
+        'perugia.it',
+        'pesaro-urbino.it',
+        'pesarourbino.it',
+        'pescara.it',
+        'pg.it',
+        'pi.it',
+        'piacenza.it',
+        'piedmont.it',
+        'piemonte.it',
+        'pisa.it',
+        'pistoia.it',
+        'pmn.it',
+        'pn.it',
+        'po.it',
+        'pordenone.it',
+        'potenza.it',
+        'pr.it',
+        'prato.it',
+        'pt.it',
+        'pu.it',
+        'pug.it',
+        'puglia.it',
+        'pv.it',
+        'pz.it',
+        'ra.it',
+        'ragusa.it',
+        'ravenna.it',
+        'rc.it',
+        're.it',
+        'reggio-calabria.it',
+        'reggio-emilia.it',
+        'reggiocalabria.it',
+        'reggioemilia.it',
+        'rg.it',
+        'ri.it',
+        'rieti.it',
+        'rimini.it',
+        'rm.it',
+        'rn.it',
+        'ro.it',
+        'roma.it',
+        'rome.it',
+        'rovigo.it',
+        'sa.it',
+        'salerno.it',
+        'sar.it',
+        'sardegna.it',
+        'sardinia.it',
+        'sassari.it',
+        'savona.it',
+        'si.it',
+        'sic.it',
+        'sicilia.it',
+        'sicily.it',
+        'siena.it',
+        'siracusa.it',
+        'so.it',
+        'sondrio.it',
+        'sp.it',
+        'sr.it',
+        'ss.it',
+        'suedtirol.it',
+        'sv.it',
+        'ta.it',
+        'taa.it',
+        'taranto.it',
+        'te.it',
+        'tempio-olbia.it',
+        'tempioolbia.it',
+        'teramo.it',
+        'terni.it',
+        'tn.it',
+        'to.it',
+        'torino.it',
+        'tos.it',
+        'toscana.it',
+        'tp.it',
+        'tr.it',
+        'trani-andria-barletta.it',
+        'trani-barletta-andria.it',
+        'traniandriabarletta.it',
+        'tranibarlettaandria.it',
+        'trapani.it',
+        'trentin-sud-tirol.it',
+        'trentin-sudtirol.it',
+        'trentin-sued-tirol.it',
+        'trentin-suedtirol.it',
+        'trentino.it',
+        'trentino-a-adige.it',
+        'trentino-aadige.it',
+        'trentino-alto-adige.it',
+        'trentino-altoadige.it',
+        'trentino-s-tirol.it',
+        'trentino-stirol.it',
+        'trentino-sud-tirol.it',
+        'trentino-sudtirol.it',
+        'trentino-sued-tirol.it',
+        'trentino-suedtirol.it',
+        'trentinoa-adige.it',
+        'trentinoaadige.it',
+        'trentinoalto-adige.it',
+        'trentinoaltoadige.it',
+        'trentinos-tirol.it',
+        'trentinostirol.it',
+        'trentinosud-tirol.it',
+        'trentinosudtirol.it',
+        'trentinosued-tirol.it',
+        'trentinosuedtirol.it',
+        'trentinsud-tirol.it',
+        'trentinsudtirol.it',
+        'trentinsued-tirol.it',
+        'trentinsuedtirol.it',
+        'trento.it',
+        'treviso.it',
+        'trieste.it',
+        'ts.it',
+        'turin.it',
+        'tuscany.it',
+        'tv.it',
+        'ud.it',
+        'udine.it',
+        'umb.it',
+        'umbria.it',
+        'urbino-pesaro.it',
+        'urbinopesaro.it',
+        'va.it',
+        'val-d-aosta.it',
+        'val-daosta.it',
+        'vald-aosta.it',
+        'valdaosta.it',
+        'valle-aosta.it',
+        'valle-d-aosta.it',
+        'valle-daosta.it',
+        'valleaosta.it',
+        'valled-aosta.it',
+        'valledaosta.it',
+        'vallee-aoste.it',
+        'vallee-d-aoste.it',
+        'valleeaoste.it',
+        'valleedaoste.it',
+        'vao.it',
+        'varese.it',
+        'vb.it',
+        'vc.it',
+        'vda.it',
+        've.it',
+        'ven.it',
+        'veneto.it',
+        'venezia.it',
+        'venice.it',
+        'verbania.it',
+        'vercelli.it',
+        'verona.it',
+        'vi.it',
+        'vibo-valentia.it',
+        'vibovalentia.it',
+        'vicenza.it',
+        'viterbo.it',
+        'vr.it',
+        'vs.it',
+        'vt.it',
+        'vv.it',
+        'xn--balsan-sdtirol-nsb.it',
+        'xn--bozen-sdtirol-2ob.it',
+        'xn--bulsan-sdtirol-nsb.it',
+        'xn--cesena-forl-mcb.it',
+        'xn--cesenaforl-i8a.it',
+        'xn--forl-cesena-fcb.it',
+        'xn--forlcesena-c8a.it',
+        'xn--sdtirol-n2a.it',
+        'xn--trentin-sd-tirol-rzb.it',
+        'xn--trentin-sdtirol-7vb.it',
+        'xn--trentino-sd-tirol-c3b.it',
+        'xn--trentino-sdtirol-szb.it',
+        'xn--trentinosd-tirol-rzb.it',
+        'xn--trentinosdtirol-7vb.it',
+        'xn--trentinsd-tirol-6vb.it',
+        'xn--trentinsdtirol-nsb.it',
+        'xn--valle-aoste-ebb.it',
+        'xn--valle-d-aoste-ehb.it',
+        'xn--valleaoste-e7a.it',
+        'xn--valledaoste-ebb.it',
+        'itau',
+        'itv',
+        'jaguar',
+        'java',
+        'jcb',
+        'je',
+        'co.je',
+        'net.je',
+        'org.je',
+        'jeep',
+        'jetzt',
+        'jewelry',
+        'jio',
+        'jll',
+        '*.jm',
+        'jmp',
+        'jnj',
+        'jo',
+        'com.jo',
+        'edu.jo',
+        'gov.jo',
+        'mil.jo',
+        'name.jo',
+        'net.jo',
+        'org.jo',
+        'sch.jo',
+        'jobs',
+        'joburg',
+        'jot',
+        'joy',
+        'jp',
+        'ac.jp',
+        'ad.jp',
+        'aichi.jp',
+        'aisai.aichi.jp',
+        'ama.aichi.jp',
+        'anjo.aichi.jp',
+        'asuke.aichi.jp',
+        'chiryu.aichi.jp',
+        'chita.aichi.jp',
+        'fuso.aichi.jp',
+        'gamagori.aichi.jp',
+        'handa.aichi.jp',
+        'hazu.aichi.jp',
+        'hekinan.aichi.jp',
+        'higashiura.aichi.jp',
+        'ichinomiya.aichi.jp',
+        'inazawa.aichi.jp',
+        'inuyama.aichi.jp',
+        'isshiki.aichi.jp',
+        'iwakura.aichi.jp',
+        'kanie.aichi.jp',
+        'kariya.aichi.jp',
+        'kasugai.aichi.jp',
+        'kira.aichi.jp',
+        'kiyosu.aichi.jp',
+        'komaki.aichi.jp',
+        'konan.aichi.jp',
+        'kota.aichi.jp',
+        'mihama.aichi.jp',
+        'miyoshi.aichi.jp',
+        'nishio.aichi.jp',
+        'nisshin.aichi.jp',
+        'obu.aichi.jp',
+        'oguchi.aichi.jp',
+        'oharu.aichi.jp',
+        'okazaki.aichi.jp',
+        'owariasahi.aichi.jp',
+        'seto.aichi.jp',
+        'shikatsu.aichi.jp',
+        'shinshiro.aichi.jp',
+        'shitara.aichi.jp',
+        'tahara.aichi.jp',
+        'takahama.aichi.jp',
+        'tobishima.aichi.jp',
+        'toei.aichi.jp',
+        'togo.aichi.jp',
+        'tokai.aichi.jp',
+        'tokoname.aichi.jp',
+        'toyoake.aichi.jp',
+        'toyohashi.aichi.jp',
+        'toyokawa.aichi.jp',
+        'toyone.aichi.jp',
+        'toyota.aichi.jp',
+        'tsushima.aichi.jp',
+        'yatomi.aichi.jp',
+        'akita.jp',
+        'akita.akita.jp',
+        'daisen.akita.jp',
+        'fujisato.akita.jp',
+        'gojome.akita.jp',
+        'hachirogata.akita.jp',
+        'happou.akita.jp',
+        'higashinaruse.akita.jp',
+        'honjo.akita.jp',
+        'honjyo.akita.jp',
+        'ikawa.akita.jp',
+        'kamikoani.akita.jp',
+        'kamioka.akita.jp',
+        'katagami.akita.jp',
+        'kazuno.akita.jp',
+        'kitaakita.akita.jp',
+        'kosaka.akita.jp',
+        'kyowa.akita.jp',
+        'misato.akita.jp',
+        'mitane.akita.jp',
+        'moriyoshi.akita.jp',
+        'nikaho.akita.jp',
+        'noshiro.akita.jp',
+        'odate.akita.jp',
+        'oga.akita.jp',
+        'ogata.akita.jp',
+        'semboku.akita.jp',
+        'yokote.akita.jp',
+        'yurihonjo.akita.jp',
+        'aomori.jp',
+        'aomori.aomori.jp',
+        'gonohe.aomori.jp',
+        'hachinohe.aomori.jp',
+        'hashikami.aomori.jp',
+        'hiranai.aomori.jp',
+        'hirosaki.aomori.jp',
+        'itayanagi.aomori.jp',
+        'kuroishi.aomori.jp',
+        'misawa.aomori.jp',
+        'mutsu.aomori.jp',
+        'nakadomari.aomori.jp',
+        'noheji.aomori.jp',
+        'oirase.aomori.jp',
+        'owani.aomori.jp',
+        'rokunohe.aomori.jp',
+        'sannohe.aomori.jp',
+        'shichinohe.aomori.jp',
+        'shingo.aomori.jp',
+        'takko.aomori.jp',
+        'towada.aomori.jp',
+        'tsugaru.aomori.jp',
+        'tsuruta.aomori.jp',
+        'chiba.jp',
+        'abiko.chiba.jp',
+        'asahi.chiba.jp',
+        'chonan.chiba.jp',
+        'chosei.chiba.jp',
+        'choshi.chiba.jp',
+        'chuo.chiba.jp',
+        'funabashi.chiba.jp',
+        'futtsu.chiba.jp',
+        'hanamigawa.chiba.jp',
+        'ichihara.chiba.jp',
+        'ichikawa.chiba.jp',
+        'ichinomiya.chiba.jp',
+        'inzai.chiba.jp',
+        'isumi.chiba.jp',
+        'kamagaya.chiba.jp',
+        'kamogawa.chiba.jp',
+        'kashiwa.chiba.jp',
+        'katori.chiba.jp',
+        'katsuura.chiba.jp',
+        'kimitsu.chiba.jp',
+        'kisarazu.chiba.jp',
+        'kozaki.chiba.jp',
+        'kujukuri.chiba.jp',
+        'kyonan.chiba.jp',
+        'matsudo.chiba.jp',
+        'midori.chiba.jp',
+        'mihama.chiba.jp',
+        'minamiboso.chiba.jp',
+        'mobara.chiba.jp',
+        'mutsuzawa.chiba.jp',
+        'nagara.chiba.jp',
+        'nagareyama.chiba.jp',
+        'narashino.chiba.jp',
+        'narita.chiba.jp',
+        'noda.chiba.jp',
+        'oamishirasato.chiba.jp',
+        'omigawa.chiba.jp',
+        'onjuku.chiba.jp',
+        'otaki.chiba.jp',
+        'sakae.chiba.jp',
+        'sakura.chiba.jp',
+        'shimofusa.chiba.jp',
+        'shirako.chiba.jp',
+        'shiroi.chiba.jp',
+        'shisui.chiba.jp',
+        'sodegaura.chiba.jp',
+        'sosa.chiba.jp',
+        'tako.chiba.jp',
+        'tateyama.chiba.jp',
+        'togane.chiba.jp',
+        'tohnosho.chiba.jp',
+        'tomisato.chiba.jp',
+        'urayasu.chiba.jp',
+        'yachimata.chiba.jp',
+        'yachiyo.chiba.jp',
+        'yokaichiba.chiba.jp',
+        'yokoshibahikari.chiba.jp',
+        'yotsukaido.chiba.jp',
+        'co.jp',
+        'ed.jp',
+        'ehime.jp',
+        'ainan.ehime.jp',
+        'honai.ehime.jp',
+        'ikata.ehime.jp',
+        'imabari.ehime.jp',
+        'iyo.ehime.jp',
+        'kamijima.ehime.jp',
+        'kihoku.ehime.jp',
+        'kumakogen.ehime.jp',
+        'masaki.ehime.jp',
+        'matsuno.ehime.jp',
+        'matsuyama.ehime.jp',
+        'namikata.ehime.jp',
+        'niihama.ehime.jp',
+        'ozu.ehime.jp',
+        'saijo.ehime.jp',
+        'seiyo.ehime.jp',
+        'shikokuchuo.ehime.jp',
+        'tobe.ehime.jp',
+        'toon.ehime.jp',
+        'uchiko.ehime.jp',
+        'uwajima.ehime.jp',
+        'yawatahama.ehime.jp',
+        'fukui.jp',
+        'echizen.fukui.jp',
+        'eiheiji.fukui.jp',
+        'fukui.fukui.jp',
+        'ikeda.fukui.jp',
+        'katsuyama.fukui.jp',
+        'mihama.fukui.jp',
+        'minamiechizen.fukui.jp',
+        'obama.fukui.jp',
+        'ohi.fukui.jp',
+        'ono.fukui.jp',
+        'sabae.fukui.jp',
+        'sakai.fukui.jp',
+        'takahama.fukui.jp',
+        'tsuruga.fukui.jp',
+        'wakasa.fukui.jp',
+        'fukuoka.jp',
+        'ashiya.fukuoka.jp',
+        'buzen.fukuoka.jp',
+        'chikugo.fukuoka.jp',
+        'chikuho.fukuoka.jp',
+        'chikujo.fukuoka.jp',
+        'chikushino.fukuoka.jp',
+        'chikuzen.fukuoka.jp',
+        'chuo.fukuoka.jp',
+        'dazaifu.fukuoka.jp',
+        'fukuchi.fukuoka.jp',
+        'hakata.fukuoka.jp',
+        'higashi.fukuoka.jp',
+        'hirokawa.fukuoka.jp',
+        'hisayama.fukuoka.jp',
+        'iizuka.fukuoka.jp',
+        'inatsuki.fukuoka.jp',
+        'kaho.fukuoka.jp',
+        'kasuga.fukuoka.jp',
+        'kasuya.fukuoka.jp',
+        'kawara.fukuoka.jp',
+        'keisen.fukuoka.jp',
+        'koga.fukuoka.jp',
+        'kurate.fukuoka.jp',
+        'kurogi.fukuoka.jp',
+        'kurume.fukuoka.jp',
+        'minami.fukuoka.jp',
+        'miyako.fukuoka.jp',
+        'miyama.fukuoka.jp',
+        'miyawaka.fukuoka.jp',
+        'mizumaki.fukuoka.jp',
+        'munakata.fukuoka.jp',
+        'nakagawa.fukuoka.jp',
+        'nakama.fukuoka.jp',
+        'nishi.fukuoka.jp',
+        'nogata.fukuoka.jp',
+        'ogori.fukuoka.jp',
+        'okagaki.fukuoka.jp',
+        'okawa.fukuoka.jp',
+        'oki.fukuoka.jp',
+        'omuta.fukuoka.jp',
+        'onga.fukuoka.jp',
+        'onojo.fukuoka.jp',
+        'oto.fukuoka.jp',
+        'saigawa.fukuoka.jp',
+        'sasaguri.fukuoka.jp',
+        'shingu.fukuoka.jp',
+        'shinyoshitomi.fukuoka.jp',
+        'shonai.fukuoka.jp',
+        'soeda.fukuoka.jp',
+        'sue.fukuoka.jp',
+        'tachiarai.fukuoka.jp',
+        'tagawa.fukuoka.jp',
+        'takata.fukuoka.jp',
+        'toho.fukuoka.jp',
+        'toyotsu.fukuoka.jp',
+        'tsuiki.fukuoka.jp',
+        'ukiha.fukuoka.jp',
+        'umi.fukuoka.jp',
+        'usui.fukuoka.jp',
+        'yamada.fukuoka.jp',
+        'yame.fukuoka.jp',
+        'yanagawa.fukuoka.jp',
+        'yukuhashi.fukuoka.jp',
+        'fukushima.jp',
+        'aizubange.fukushima.jp',
+        'aizumisato.fukushima.jp',
+        'aizuwakamatsu.fukushima.jp',
+        'asakawa.fukushima.jp',
+        'bandai.fukushima.jp',
+        'date.fukushima.jp',
+        'fukushima.fukushima.jp',
+        'furudono.fukushima.jp',
+        'futaba.fukushima.jp',
+        'hanawa.fukushima.jp',
+        'higashi.fukushima.jp',
+        'hirata.fukushima.jp',
+        'hirono.fukushima.jp',
+        'iitate.fukushima.jp',
+        'inawashiro.fukushima.jp',
+        'ishikawa.fukushima.jp',
+        'iwaki.fukushima.jp',
+        'izumizaki.fukushima.jp',
+        'kagamiishi.fukushima.jp',
+        'kaneyama.fukushima.jp',
+        'kawamata.fukushima.jp',
+        'kitakata.fukushima.jp',
+        'kitashiobara.fukushima.jp',
+        'koori.fukushima.jp',
+        'koriyama.fukushima.jp',
+        'kunimi.fukushima.jp',
+        'miharu.fukushima.jp',
+        'mishima.fukushima.jp',
+        'namie.fukushima.jp',
+        'nango.fukushima.jp',
+        'nishiaizu.fukushima.jp',
+        'nishigo.fukushima.jp',
+        'okuma.fukushima.jp',
+        'omotego.fukushima.jp',
+        'ono.fukushima.jp',
+        'otama.fukushima.jp',
+        'samegawa.fukushima.jp',
+        'shimogo.fukushima.jp',
+        'shirakawa.fukushima.jp',
+        'showa.fukushima.jp',
+        'soma.fukushima.jp',
+        'sukagawa.fukushima.jp',
+        'taishin.fukushima.jp',
+        'tamakawa.fukushima.jp',
+        'tanagura.fukushima.jp',
+        'tenei.fukushima.jp',
+        'yabuki.fukushima.jp',
+        'yamato.fukushima.jp',
+        'yamatsuri.fukushima.jp',
+        'yanaizu.fukushima.jp',
+        'yugawa.fukushima.jp',
+        'gifu.jp',
+        'anpachi.gifu.jp',
+        'ena.gifu.jp',
+        'gifu.gifu.jp',
+        'ginan.gifu.jp',
+        'godo.gifu.jp',
+        'gujo.gifu.jp',
+        'hashima.gifu.jp',
+        'hichiso.gifu.jp',
+        'hida.gifu.jp',
+        'higashishirakawa.gifu.jp',
+        'ibigawa.gifu.jp',
+        'ikeda.gifu.jp',
+        'kakamigahara.gifu.jp',
+        'kani.gifu.jp',
+        'kasahara.gifu.jp',
+        'kasamatsu.gifu.jp',
+        'kawaue.gifu.jp',
+        'kitagata.gifu.jp',
+        'mino.gifu.jp',
+        'minokamo.gifu.jp',
+        'mitake.gifu.jp',
+        'mizunami.gifu.jp',
+        'motosu.gifu.jp',
+        'nakatsugawa.gifu.jp',
+        'ogaki.gifu.jp',
+        'sakahogi.gifu.jp',
+        'seki.gifu.jp',
+        'sekigahara.gifu.jp',
+        'shirakawa.gifu.jp',
+        'tajimi.gifu.jp',
+        'takayama.gifu.jp',
+        'tarui.gifu.jp',
+        'toki.gifu.jp',
+        'tomika.gifu.jp',
+        'wanouchi.gifu.jp',
+        'yamagata.gifu.jp',
+        'yaotsu.gifu.jp',
+        'yoro.gifu.jp',
+        'go.jp',
+        'gr.jp',
+        'gunma.jp',
+        'annaka.gunma.jp',
+        'chiyoda.gunma.jp',
+        'fujioka.gunma.jp',
+        'higashiagatsuma.gunma.jp',
+        'isesaki.gunma.jp',
+        'itakura.gunma.jp',
+        'kanna.gunma.jp',
+        'kanra.gunma.jp',
+        'katashina.gunma.jp',
+        'kawaba.gunma.jp',
+        'kiryu.gunma.jp',
+        'kusatsu.gunma.jp',
+        'maebashi.gunma.jp',
+        'meiwa.gunma.jp',
+        'midori.gunma.jp',
+        'minakami.gunma.jp',
+        'naganohara.gunma.jp',
+        'nakanojo.gunma.jp',
+        'nanmoku.gunma.jp',
+        'numata.gunma.jp',
+        'oizumi.gunma.jp',
+        'ora.gunma.jp',
+        'ota.gunma.jp',
+        'shibukawa.gunma.jp',
+        'shimonita.gunma.jp',
+        'shinto.gunma.jp',
+        'showa.gunma.jp',
+        'takasaki.gunma.jp',
+        'takayama.gunma.jp',
+        'tamamura.gunma.jp',
+        'tatebayashi.gunma.jp',
+        'tomioka.gunma.jp',
+        'tsukiyono.gunma.jp',
+        'tsumagoi.gunma.jp',
+        'ueno.gunma.jp',
+        'yoshioka.gunma.jp',
+        'hiroshima.jp',
+        'asaminami.hiroshima.jp',
+        'daiwa.hiroshima.jp',
+        'etajima.hiroshima.jp',
+        'fuchu.hiroshima.jp',
+        'fukuyama.hiroshima.jp',
+        'hatsukaichi.hiroshima.jp',
+        'higashihiroshima.hiroshima.jp',
+        'hongo.hiroshima.jp',
+        'jinsekikogen.hiroshima.jp',
+        'kaita.hiroshima.jp',
+        'kui.hiroshima.jp',
+        'kumano.hiroshima.jp',
+        'kure.hiroshima.jp',
+        'mihara.hiroshima.jp',
+        'miyoshi.hiroshima.jp',
+        'naka.hiroshima.jp',
+        'onomichi.hiroshima.jp',
+        'osakikamijima.hiroshima.jp',
+        'otake.hiroshima.jp',
+        'saka.hiroshima.jp',
+        'sera.hiroshima.jp',
+        'seranishi.hiroshima.jp',
+        'shinichi.hiroshima.jp',
+        'shobara.hiroshima.jp',
+        'takehara.hiroshima.jp',
+        'hokkaido.jp',
+        'abashiri.hokkaido.jp',
+        'abira.hokkaido.jp',
+        'aibetsu.hokkaido.jp',
+        'akabira.hokkaido.jp',
+        'akkeshi.hokkaido.jp',
+        'asahikawa.hokkaido.jp',
+        'ashibetsu.hokkaido.jp',
+        'ashoro.hokkaido.jp',
+        'assabu.hokkaido.jp',
+        'atsuma.hokkaido.jp',
+        'bibai.hokkaido.jp',
+        'biei.hokkaido.jp',
+        'bifuka.hokkaido.jp',
+        'bihoro.hokkaido.jp',
+        'biratori.hokkaido.jp',
+        'chippubetsu.hokkaido.jp',
+        'chitose.hokkaido.jp',
+        'date.hokkaido.jp',
+        'ebetsu.hokkaido.jp',
+        'embetsu.hokkaido.jp',
+        'eniwa.hokkaido.jp',
+        'erimo.hokkaido.jp',
+        'esan.hokkaido.jp',
+        'esashi.hokkaido.jp',
+        'fukagawa.hokkaido.jp',
+        'fukushima.hokkaido.jp',
+        'furano.hokkaido.jp',
+        'furubira.hokkaido.jp',
+        'haboro.hokkaido.jp',
+        'hakodate.hokkaido.jp',
+        'hamatonbetsu.hokkaido.jp',
+        'hidaka.hokkaido.jp',
+        'higashikagura.hokkaido.jp',
+        'higashikawa.hokkaido.jp',
+        'hiroo.hokkaido.jp',
+        'hokuryu.hokkaido.jp',
+        'hokuto.hokkaido.jp',
+        'honbetsu.hokkaido.jp',
+        'horokanai.hokkaido.jp',
+        'horonobe.hokkaido.jp',
+        'ikeda.hokkaido.jp',
+        'imakane.hokkaido.jp',
+        'ishikari.hokkaido.jp',
+        'iwamizawa.hokkaido.jp',
+        'iwanai.hokkaido.jp',
+        'kamifurano.hokkaido.jp',
+        'kamikawa.hokkaido.jp',
+        'kamishihoro.hokkaido.jp',
+        'kamisunagawa.hokkaido.jp',
+        'kamoenai.hokkaido.jp',
+        'kayabe.hokkaido.jp',
+        'kembuchi.hokkaido.jp',
+        'kikonai.hokkaido.jp',
+        'kimobetsu.hokkaido.jp',
+        'kitahiroshima.hokkaido.jp',
+        'kitami.hokkaido.jp',
+        'kiyosato.hokkaido.jp',
+        'koshimizu.hokkaido.jp',
+        'kunneppu.hokkaido.jp',
+        'kuriyama.hokkaido.jp',
+        'kuromatsunai.hokkaido.jp',
+        'kushiro.hokkaido.jp',
+        'kutchan.hokkaido.jp',
+        'kyowa.hokkaido.jp',
+        'mashike.hokkaido.jp',
+        'matsumae.hokkaido.jp',
+        'mikasa.hokkaido.jp',
+        'minamifurano.hokkaido.jp',
+        'mombetsu.hokkaido.jp',
+        'moseushi.hokkaido.jp',
+        'mukawa.hokkaido.jp',
+        'muroran.hokkaido.jp',
+        'naie.hokkaido.jp',
+        'nakagawa.hokkaido.jp',
+        'nakasatsunai.hokkaido.jp',
+        'nakatombetsu.hokkaido.jp',
+        'nanae.hokkaido.jp',
+        'nanporo.hokkaido.jp',
+        'nayoro.hokkaido.jp',
+        'nemuro.hokkaido.jp',
+        'niikappu.hokkaido.jp',
+        'niki.hokkaido.jp',
+        'nishiokoppe.hokkaido.jp',
+        'noboribetsu.hokkaido.jp',
+        'numata.hokkaido.jp',
+        'obihiro.hokkaido.jp',
+        'obira.hokkaido.jp',
+        'oketo.hokkaido.jp',
+        'okoppe.hokkaido.jp',
+        'otaru.hokkaido.jp',
+        'otobe.hokkaido.jp',
+        'otofuke.hokkaido.jp',
+        'otoineppu.hokkaido.jp',
+        'oumu.hokkaido.jp',
+        'ozora.hokkaido.jp',
+        'pippu.hokkaido.jp',
+        'rankoshi.hokkaido.jp',
+        'rebun.hokkaido.jp',
+        'rikubetsu.hokkaido.jp',
+        'rishiri.hokkaido.jp',
+        'rishirifuji.hokkaido.jp',
+        'saroma.hokkaido.jp',
+        'sarufutsu.hokkaido.jp',
+        'shakotan.hokkaido.jp',
+        'shari.hokkaido.jp',
+        'shibecha.hokkaido.jp',
+        'shibetsu.hokkaido.jp',
+        'shikabe.hokkaido.jp',
+        'shikaoi.hokkaido.jp',
+        'shimamaki.hokkaido.jp',
+        'shimizu.hokkaido.jp',
+        'shimokawa.hokkaido.jp',
+        'shinshinotsu.hokkaido.jp',
+        'shintoku.hokkaido.jp',
+        'shiranuka.hokkaido.jp',
+        'shiraoi.hokkaido.jp',
+        'shiriuchi.hokkaido.jp',
+        'sobetsu.hokkaido.jp',
+        'sunagawa.hokkaido.jp',
+        'taiki.hokkaido.jp',
+        'takasu.hokkaido.jp',
+        'takikawa.hokkaido.jp',
+        'takinoue.hokkaido.jp',
+        'teshikaga.hokkaido.jp',
+        'tobetsu.hokkaido.jp',
+        'tohma.hokkaido.jp',
+        'tomakomai.hokkaido.jp',
+        'tomari.hokkaido.jp',
+        'toya.hokkaido.jp',
+        'toyako.hokkaido.jp',
+        'toyotomi.hokkaido.jp',
+        'toyoura.hokkaido.jp',
+        'tsubetsu.hokkaido.jp',
+        'tsukigata.hokkaido.jp',
+        'urakawa.hokkaido.jp',
+        'urausu.hokkaido.jp',
+        'uryu.hokkaido.jp',
+        'utashinai.hokkaido.jp',
+        'wakkanai.hokkaido.jp',
+        'wassamu.hokkaido.jp',
+        'yakumo.hokkaido.jp',
+        'yoichi.hokkaido.jp',
+        'hyogo.jp',
+        'aioi.hyogo.jp',
+        'akashi.hyogo.jp',
+        'ako.hyogo.jp',
+        'amagasaki.hyogo.jp',
+        'aogaki.hyogo.jp',
+        'asago.hyogo.jp',
+        'ashiya.hyogo.jp',
+        'awaji.hyogo.jp',
+        'fukusaki.hyogo.jp',
+        'goshiki.hyogo.jp',
+        'harima.hyogo.jp',
+        'himeji.hyogo.jp',
+        'ichikawa.hyogo.jp',
+        'inagawa.hyogo.jp',
+        'itami.hyogo.jp',
+        'kakogawa.hyogo.jp',
+        'kamigori.hyogo.jp',
+        'kamikawa.hyogo.jp',
+        'kasai.hyogo.jp',
+        'kasuga.hyogo.jp',
+        'kawanishi.hyogo.jp',
+        'miki.hyogo.jp',
+        'minamiawaji.hyogo.jp',
+        'nishinomiya.hyogo.jp',
+        'nishiwaki.hyogo.jp',
+        'ono.hyogo.jp',
+        'sanda.hyogo.jp',
+        'sannan.hyogo.jp',
+        'sasayama.hyogo.jp',
+        'sayo.hyogo.jp',
+        'shingu.hyogo.jp',
+        'shinonsen.hyogo.jp',
+        'shiso.hyogo.jp',
+        'sumoto.hyogo.jp',
+        'taishi.hyogo.jp',
+        'taka.hyogo.jp',
+        'takarazuka.hyogo.jp',
+        'takasago.hyogo.jp',
+        'takino.hyogo.jp',
+        'tamba.hyogo.jp',
+        'tatsuno.hyogo.jp',
+        'toyooka.hyogo.jp',
+        'yabu.hyogo.jp',
+        'yashiro.hyogo.jp',
+        'yoka.hyogo.jp',
+        'yokawa.hyogo.jp',
+        'ibaraki.jp',
+        'ami.ibaraki.jp',
+        'asahi.ibaraki.jp',
+        'bando.ibaraki.jp',
+        'chikusei.ibaraki.jp',
+        'daigo.ibaraki.jp',
+        'fujishiro.ibaraki.jp',
+        'hitachi.ibaraki.jp',
+        'hitachinaka.ibaraki.jp',
+        'hitachiomiya.ibaraki.jp',
+        'hitachiota.ibaraki.jp',
+        'ibaraki.ibaraki.jp',
+        'ina.ibaraki.jp',
+        'inashiki.ibaraki.jp',
+        'itako.ibaraki.jp',
+        'iwama.ibaraki.jp',
+        'joso.ibaraki.jp',
+        'kamisu.ibaraki.jp',
+        'kasama.ibaraki.jp',
+        'kashima.ibaraki.jp',
+        'kasumigaura.ibaraki.jp',
+        'koga.ibaraki.jp',
+        'miho.ibaraki.jp',
+        'mito.ibaraki.jp',
+        'moriya.ibaraki.jp',
+        'naka.ibaraki.jp',
+        'namegata.ibaraki.jp',
+        'oarai.ibaraki.jp',
+        'ogawa.ibaraki.jp',
+        'omitama.ibaraki.jp',
+        'ryugasaki.ibaraki.jp',
+        'sakai.ibaraki.jp',
+        'sakuragawa.ibaraki.jp',
+        'shimodate.ibaraki.jp',
+        'shimotsuma.ibaraki.jp',
+        'shirosato.ibaraki.jp',
+        'sowa.ibaraki.jp',
+        'suifu.ibaraki.jp',
+        'takahagi.ibaraki.jp',
+        'tamatsukuri.ibaraki.jp',
+        'tokai.ibaraki.jp',
+        'tomobe.ibaraki.jp',
+        'tone.ibaraki.jp',
+        'toride.ibaraki.jp',
+        'tsuchiura.ibaraki.jp',
+        'tsukuba.ibaraki.jp',
+        'uchihara.ibaraki.jp',
+        'ushiku.ibaraki.jp',
+        'yachiyo.ibaraki.jp',
+        'yamagata.ibaraki.jp',
+        'yawara.ibaraki.jp',
+        'yuki.ibaraki.jp',
+        'ishikawa.jp',
+        'anamizu.ishikawa.jp',
+        'hakui.ishikawa.jp',
+        'hakusan.ishikawa.jp',
+        'kaga.ishikawa.jp',
+        'kahoku.ishikawa.jp',
+        'kanazawa.ishikawa.jp',
+        'kawakita.ishikawa.jp',
+        'komatsu.ishikawa.jp',
+        'nakanoto.ishikawa.jp',
+        'nanao.ishikawa.jp',
+        'nomi.ishikawa.jp',
+        'nonoichi.ishikawa.jp',
+        'noto.ishikawa.jp',
+        'shika.ishikawa.jp',
+        'suzu.ishikawa.jp',
+        'tsubata.ishikawa.jp',
+        'tsurugi.ishikawa.jp',
+        'uchinada.ishikawa.jp',
+        'wajima.ishikawa.jp',
+        'iwate.jp',
+        'fudai.iwate.jp',
+        'fujisawa.iwate.jp',
+        'hanamaki.iwate.jp',
+        'hiraizumi.iwate.jp',
+        'hirono.iwate.jp',
+        'ichinohe.iwate.jp',
+        'ichinoseki.iwate.jp',
+        'iwaizumi.iwate.jp',
+        'iwate.iwate.jp',
+        'joboji.iwate.jp',
+        'kamaishi.iwate.jp',
+        'kanegasaki.iwate.jp',
+        'karumai.iwate.jp',
+        'kawai.iwate.jp',
+        'kitakami.iwate.jp',
+        'kuji.iwate.jp',
+        'kunohe.iwate.jp',
+        'kuzumaki.iwate.jp',
+        'miyako.iwate.jp',
+        'mizusawa.iwate.jp',
+        'morioka.iwate.jp',
+        'ninohe.iwate.jp',
+        'noda.iwate.jp',
+        'ofunato.iwate.jp',
+        'oshu.iwate.jp',
+        'otsuchi.iwate.jp',
+        'rikuzentakata.iwate.jp',
+        'shiwa.iwate.jp',
+        'shizukuishi.iwate.jp',
+        'sumita.iwate.jp',
+        'tanohata.iwate.jp',
+        'tono.iwate.jp',
+        'yahaba.iwate.jp',
+        'yamada.iwate.jp',
+        'kagawa.jp',
+        'ayagawa.kagawa.jp',
+        'higashikagawa.kagawa.jp',
+        'kanonji.kagawa.jp',
+        'kotohira.kagawa.jp',
+        'manno.kagawa.jp',
+        'marugame.kagawa.jp',
+        'mitoyo.kagawa.jp',
+        'naoshima.kagawa.jp',
+        'sanuki.kagawa.jp',
+        'tadotsu.kagawa.jp',
+        'takamatsu.kagawa.jp',
+        'tonosho.kagawa.jp',
+        'uchinomi.kagawa.jp',
+        'utazu.kagawa.jp',
+        'zentsuji.kagawa.jp',
+        'kagoshima.jp',
+        'akune.kagoshima.jp',
+        'amami.kagoshima.jp',
+        'hioki.kagoshima.jp',
+        'isa.kagoshima.jp',
+        'isen.kagoshima.jp',
+        'izumi.kagoshima.jp',
+        'kagoshima.kagoshima.jp',
+        'kanoya.kagoshima.jp',
+        'kawanabe.kagoshima.jp',
+        'kinko.kagoshima.jp',
+        'kouyama.kagoshima.jp',
+        'makurazaki.kagoshima.jp',
+        'matsumoto.kagoshima.jp',
+        'minamitane.kagoshima.jp',
+        'nakatane.kagoshima.jp',
+        'nishinoomote.kagoshima.jp',
+        'satsumasendai.kagoshima.jp',
+        'soo.kagoshima.jp',
+        'tarumizu.kagoshima.jp',
+        'yusui.kagoshima.jp',
+        'kanagawa.jp',
+        'aikawa.kanagawa.jp',
+        'atsugi.kanagawa.jp',
+        'ayase.kanagawa.jp',
+        'chigasaki.kanagawa.jp',
+        'ebina.kanagawa.jp',
+        'fujisawa.kanagawa.jp',
+        'hadano.kanagawa.jp',
+        'hakone.kanagawa.jp',
+        'hiratsuka.kanagawa.jp',
+        'isehara.kanagawa.jp',
+        'kaisei.kanagawa.jp',
+        'kamakura.kanagawa.jp',
+        'kiyokawa.kanagawa.jp',
+        'matsuda.kanagawa.jp',
+        'minamiashigara.kanagawa.jp',
+        'miura.kanagawa.jp',
+        'nakai.kanagawa.jp',
+        'ninomiya.kanagawa.jp',
+        'odawara.kanagawa.jp',
+        'oi.kanagawa.jp',
+        'oiso.kanagawa.jp',
+        'sagamihara.kanagawa.jp',
+        'samukawa.kanagawa.jp',
+        'tsukui.kanagawa.jp',
+        'yamakita.kanagawa.jp',
+        'yamato.kanagawa.jp',
+        'yokosuka.kanagawa.jp',
+        'yugawara.kanagawa.jp',
+        'zama.kanagawa.jp',
+        'zushi.kanagawa.jp',
+        '*.kawasaki.jp',
+        '!city.kawasaki.jp',
+        '*.kitakyushu.jp',
+        '!city.kitakyushu.jp',
+        '*.kobe.jp',
+        '!city.kobe.jp',
+        'kochi.jp',
+        'aki.kochi.jp',
+        'geisei.kochi.jp',
+        'hidaka.kochi.jp',
+        'higashitsuno.kochi.jp',
+        'ino.kochi.jp',
+        'kagami.kochi.jp',
+        'kami.kochi.jp',
+        'kitagawa.kochi.jp',
+        'kochi.kochi.jp',
+        'mihara.kochi.jp',
+        'motoyama.kochi.jp',
+        'muroto.kochi.jp',
+        'nahari.kochi.jp',
+        'nakamura.kochi.jp',
+        'nankoku.kochi.jp',
+        'nishitosa.kochi.jp',
+        'niyodogawa.kochi.jp',
+        'ochi.kochi.jp',
+        'okawa.kochi.jp',
+        'otoyo.kochi.jp',
+        'otsuki.kochi.jp',
+        'sakawa.kochi.jp',
+        'sukumo.kochi.jp',
+        'susaki.kochi.jp',
+        'tosa.kochi.jp',
+        'tosashimizu.kochi.jp',
+        'toyo.kochi.jp',
+        'tsuno.kochi.jp',
+        'umaji.kochi.jp',
+        'yasuda.kochi.jp',
+        'yusuhara.kochi.jp',
+        'kumamoto.jp',
+        'amakusa.kumamoto.jp',
+        'arao.kumamoto.jp',
+        'aso.kumamoto.jp',
+        'choyo.kumamoto.jp',
+        'gyokuto.kumamoto.jp',
+        'kamiamakusa.kumamoto.jp',
+        'kikuchi.kumamoto.jp',
+        'kumamoto.kumamoto.jp',
+        'mashiki.kumamoto.jp',
+        'mifune.kumamoto.jp',
+        'minamata.kumamoto.jp',
+        'minamioguni.kumamoto.jp',
+        'nagasu.kumamoto.jp',
+        'nishihara.kumamoto.jp',
+        'oguni.kumamoto.jp',
+        'ozu.kumamoto.jp',
+        'sumoto.kumamoto.jp',
+        'takamori.kumamoto.jp',
+        'uki.kumamoto.jp',
+        'uto.kumamoto.jp',
+        'yamaga.kumamoto.jp',
+        'yamato.kumamoto.jp',
+        'yatsushiro.kumamoto.jp',
+        'kyoto.jp',
+        'ayabe.kyoto.jp',
+        'fukuchiyama.kyoto.jp',
+        'higashiyama.kyoto.jp',
+        'ide.kyoto.jp',
+        'ine.kyoto.jp',
+        'joyo.kyoto.jp',
+        'kameoka.kyoto.jp',
+        'kamo.kyoto.jp',
+        'kita.kyoto.jp',
+        'kizu.kyoto.jp',
+        'kumiyama.kyoto.jp',
+        'kyotamba.kyoto.jp',
+        'kyotanabe.kyoto.jp',
+        'kyotango.kyoto.jp',
+        'maizuru.kyoto.jp',
+        'minami.kyoto.jp',
+        'minamiyamashiro.kyoto.jp',
+        'miyazu.kyoto.jp',
+        'muko.kyoto.jp',
+        'nagaokakyo.kyoto.jp',
+        'nakagyo.kyoto.jp',
+        'nantan.kyoto.jp',
+        'oyamazaki.kyoto.jp',
+        'sakyo.kyoto.jp',
+        'seika.kyoto.jp',
+        'tanabe.kyoto.jp',
+        'uji.kyoto.jp',
+        'ujitawara.kyoto.jp',
+        'wazuka.kyoto.jp',
+        'yamashina.kyoto.jp',
+        'yawata.kyoto.jp',
+        'lg.jp',
+        'mie.jp',
+        'asahi.mie.jp',
+        'inabe.mie.jp',
+        'ise.mie.jp',
+        'kameyama.mie.jp',
+        'kawagoe.mie.jp',
+        'kiho.mie.jp',
+        'kisosaki.mie.jp',
+        'kiwa.mie.jp',
+        'komono.mie.jp',
+        'kumano.mie.jp',
+        'kuwana.mie.jp',
+        'matsusaka.mie.jp',
+        'meiwa.mie.jp',
+        'mihama.mie.jp',
+        'minamiise.mie.jp',
+        'misugi.mie.jp',
+        'miyama.mie.jp',
+        'nabari.mie.jp',
+        'shima.mie.jp',
+        'suzuka.mie.jp',
+        'tado.mie.jp',
+        'taiki.mie.jp',
+        'taki.mie.jp',
+        'tamaki.mie.jp',
+        'toba.mie.jp',
+        'tsu.mie.jp',
+        'udono.mie.jp',
+        'ureshino.mie.jp',
+        'watarai.mie.jp',
+        'yokkaichi.mie.jp',
+        'miyagi.jp',
+        'furukawa.miyagi.jp',
+        'higashimatsushima.miyagi.jp',
+        'ishinomaki.miyagi.jp',
+        'iwanuma.miyagi.jp',
+        'kakuda.miyagi.jp',
+        'kami.miyagi.jp',
+        'kawasaki.miyagi.jp',
+        'marumori.miyagi.jp',
+        'matsushima.miyagi.jp',
+        'minamisanriku.miyagi.jp',
+        'misato.miyagi.jp',
+        'murata.miyagi.jp',
+        'natori.miyagi.jp',
+        'ogawara.miyagi.jp',
+        'ohira.miyagi.jp',
+        'onagawa.miyagi.jp',
+        'osaki.miyagi.jp',
+        'rifu.miyagi.jp',
+        'semine.miyagi.jp',
+        'shibata.miyagi.jp',
+        'shichikashuku.miyagi.jp',
+        'shikama.miyagi.jp',
+        'shiogama.miyagi.jp',
+        'shiroishi.miyagi.jp',
+        'tagajo.miyagi.jp',
+        'taiwa.miyagi.jp',
+        'tome.miyagi.jp',
+        'tomiya.miyagi.jp',
+        'wakuya.miyagi.jp',
+        'watari.miyagi.jp',
+        'yamamoto.miyagi.jp',
+        'zao.miyagi.jp',
+        'miyazaki.jp',
+        'aya.miyazaki.jp',
+        'ebino.miyazaki.jp',
+        'gokase.miyazaki.jp',
+        'hyuga.miyazaki.jp',
+        'kadogawa.miyazaki.jp',
+        'kawaminami.miyazaki.jp',
+        'kijo.miyazaki.jp',
+        'kitagawa.miyazaki.jp',
+        'kitakata.miyazaki.jp',
+        'kitaura.miyazaki.jp',
+        'kobayashi.miyazaki.jp',
+        'kunitomi.miyazaki.jp',
+        'kushima.miyazaki.jp',
+        'mimata.miyazaki.jp',
+        'miyakonojo.miyazaki.jp',
+        'miyazaki.miyazaki.jp',
+        'morotsuka.miyazaki.jp',
+        'nichinan.miyazaki.jp',
+        'nishimera.miyazaki.jp',
+        'nobeoka.miyazaki.jp',
+        'saito.miyazaki.jp',
+        'shiiba.miyazaki.jp',
+        'shintomi.miyazaki.jp',
+        'takaharu.miyazaki.jp',
+        'takanabe.miyazaki.jp',
+        'takazaki.miyazaki.jp',
+        'tsuno.miyazaki.jp',
+        'nagano.jp',
+        'achi.nagano.jp',
+        'agematsu.nagano.jp',
+        'anan.nagano.jp',
+        'aoki.nagano.jp',
+        'asahi.nagano.jp',
+        'azumino.nagano.jp',
+        'chikuhoku.nagano.jp',
+        'chikuma.nagano.jp',
+        'chino.nagano.jp',
+        'fujimi.nagano.jp',
+        'hakuba.nagano.jp',
+        'hara.nagano.jp',
+        'hiraya.nagano.jp',
+        'iida.nagano.jp',
+        'iijima.nagano.jp',
+        'iiyama.nagano.jp',
+        'iizuna.nagano.jp',
+        'ikeda.nagano.jp',
+        'ikusaka.nagano.jp',
+        'ina.nagano.jp',
+        'karuizawa.nagano.jp',
+        'kawakami.nagano.jp',
+        'kiso.nagano.jp',
+        'kisofukushima.nagano.jp',
+        'kitaaiki.nagano.jp',
+        'komagane.nagano.jp',
+        'komoro.nagano.jp',
+        'matsukawa.nagano.jp',
+        'matsumoto.nagano.jp',
+        'miasa.nagano.jp',
+        'minamiaiki.nagano.jp',
+        'minamimaki.nagano.jp',
+        'minamiminowa.nagano.jp',
+        'minowa.nagano.jp',
+        'miyada.nagano.jp',
+        'miyota.nagano.jp',
+        'mochizuki.nagano.jp',
+        'nagano.nagano.jp',
+        'nagawa.nagano.jp',
+        'nagiso.nagano.jp',
+        'nakagawa.nagano.jp',
+        'nakano.nagano.jp',
+        'nozawaonsen.nagano.jp',
+        'obuse.nagano.jp',
+        'ogawa.nagano.jp',
+        'okaya.nagano.jp',
+        'omachi.nagano.jp',
+        'omi.nagano.jp',
+        'ookuwa.nagano.jp',
+        'ooshika.nagano.jp',
+        'otaki.nagano.jp',
+        'otari.nagano.jp',
+        'sakae.nagano.jp',
+        'sakaki.nagano.jp',
+        'saku.nagano.jp',
+        'sakuho.nagano.jp',
+        'shimosuwa.nagano.jp',
+        'shinanomachi.nagano.jp',
+        'shiojiri.nagano.jp',
+        'suwa.nagano.jp',
+        'suzaka.nagano.jp',
+        'takagi.nagano.jp',
+        'takamori.nagano.jp',
+        'takayama.nagano.jp',
+        'tateshina.nagano.jp',
+        'tatsuno.nagano.jp',
+        'togakushi.nagano.jp',
+        'togura.nagano.jp',
+        'tomi.nagano.jp',
+        'ueda.nagano.jp',
+        'wada.nagano.jp',
+        'yamagata.nagano.jp',
+        'yamanouchi.nagano.jp',
+        'yasaka.nagano.jp',
+        'yasuoka.nagano.jp',
+        'nagasaki.jp',
+        'chijiwa.nagasaki.jp',
+        'futsu.nagasaki.jp',
+        'goto.nagasaki.jp',
+        'hasami.nagasaki.jp',
+        'hirado.nagasaki.jp',
+        'iki.nagasaki.jp',
+        'isahaya.nagasaki.jp',
+        'kawatana.nagasaki.jp',
+        'kuchinotsu.nagasaki.jp',
+        'matsuura.nagasaki.jp',
+        'nagasaki.nagasaki.jp',
+        'obama.nagasaki.jp',
+        'omura.nagasaki.jp',
+        'oseto.nagasaki.jp',
+        'saikai.nagasaki.jp',
+        'sasebo.nagasaki.jp',
+        'seihi.nagasaki.jp',
+        'shimabara.nagasaki.jp',
+        'shinkamigoto.nagasaki.jp',
+        'togitsu.nagasaki.jp',
+        'tsushima.nagasaki.jp',
+        'unzen.nagasaki.jp',
+        '*.nagoya.jp',
+        '!city.nagoya.jp',
+        'nara.jp',
+        'ando.nara.jp',
+        'gose.nara.jp',
+        'heguri.nara.jp',
+        'higashiyoshino.nara.jp',
+        'ikaruga.nara.jp',
+        'ikoma.nara.jp',
+        'kamikitayama.nara.jp',
+        'kanmaki.nara.jp',
+        'kashiba.nara.jp',
+        'kashihara.nara.jp',
+        'katsuragi.nara.jp',
+        'kawai.nara.jp',
+        'kawakami.nara.jp',
+        'kawanishi.nara.jp',
+        'koryo.nara.jp',
+        'kurotaki.nara.jp',
+        'mitsue.nara.jp',
+        'miyake.nara.jp',
+        'nara.nara.jp',
+        'nosegawa.nara.jp',
+        'oji.nara.jp',
+        'ouda.nara.jp',
+        'oyodo.nara.jp',
+        'sakurai.nara.jp',
+        'sango.nara.jp',
+        'shimoichi.nara.jp',
+        'shimokitayama.nara.jp',
+        'shinjo.nara.jp',
+        'soni.nara.jp',
+        'takatori.nara.jp',
+        'tawaramoto.nara.jp',
+        'tenkawa.nara.jp',
+        'tenri.nara.jp',
+        'uda.nara.jp',
+        'yamatokoriyama.nara.jp',
+        'yamatotakada.nara.jp',
+        'yamazoe.nara.jp',
+        'yoshino.nara.jp',
+        'ne.jp',
+        'niigata.jp',
+        'aga.niigata.jp',
+        'agano.niigata.jp',
+        'gosen.niigata.jp',
+        'itoigawa.niigata.jp',
+        'izumozaki.niigata.jp',
+        'joetsu.niigata.jp',
+        'kamo.niigata.jp',
+        'kariwa.niigata.jp',
+        'kashiwazaki.niigata.jp',
+        'minamiuonuma.niigata.jp',
+        'mitsuke.niigata.jp',
+        'muika.niigata.jp',
+        'murakami.niigata.jp',
+        'myoko.niigata.jp',
+        'nagaoka.niigata.jp',
+        'niigata.niigata.jp',
+        'ojiya.niigata.jp',
+        'omi.niigata.jp',
+        'sado.niigata.jp',
+        'sanjo.niigata.jp',
+        'seiro.niigata.jp',
+        'seirou.niigata.jp',
+        'sekikawa.niigata.jp',
+        'shibata.niigata.jp',
+        'tagami.niigata.jp',
+        'tainai.niigata.jp',
+        'tochio.niigata.jp',
+        'tokamachi.niigata.jp',
+        'tsubame.niigata.jp',
+        'tsunan.niigata.jp',
+        'uonuma.niigata.jp',
+        'yahiko.niigata.jp',
+        'yoita.niigata.jp',
+        'yuzawa.niigata.jp',
+        'oita.jp',
+        'beppu.oita.jp',
+        'bungoono.oita.jp',
+        'bungotakada.oita.jp',
+        'hasama.oita.jp',
+        'hiji.oita.jp',
+        'himeshima.oita.jp',
+        'hita.oita.jp',
+        'kamitsue.oita.jp',
+        'kokonoe.oita.jp',
+        'kuju.oita.jp',
+        'kunisaki.oita.jp',
+        'kusu.oita.jp',
+        'oita.oita.jp',
+        'saiki.oita.jp',
+        'taketa.oita.jp',
+        'tsukumi.oita.jp',
+        'usa.oita.jp',
+        'usuki.oita.jp',
+        'yufu.oita.jp',
+        'okayama.jp',
+        'akaiwa.okayama.jp',
+        'asakuchi.okayama.jp',
+        'bizen.okayama.jp',
+        'hayashima.okayama.jp',
+        'ibara.okayama.jp',
+        'kagamino.okayama.jp',
+        'kasaoka.okayama.jp',
+        'kibichuo.okayama.jp',
+        'kumenan.okayama.jp',
+        'kurashiki.okayama.jp',
+        'maniwa.okayama.jp',
+        'misaki.okayama.jp',
+        'nagi.okayama.jp',
+        'niimi.okayama.jp',
+        'nishiawakura.okayama.jp',
+        'okayama.okayama.jp',
+        'satosho.okayama.jp',
+        'setouchi.okayama.jp',
+        'shinjo.okayama.jp',
+        'shoo.okayama.jp',
+        'soja.okayama.jp',
+        'takahashi.okayama.jp',
+        'tamano.okayama.jp',
+        'tsuyama.okayama.jp',
+        'wake.okayama.jp',
+        'yakage.okayama.jp',
+        'okinawa.jp',
+        'aguni.okinawa.jp',
+        'ginowan.okinawa.jp',
+        'ginoza.okinawa.jp',
+        'gushikami.okinawa.jp',
+        'haebaru.okinawa.jp',
+        'higashi.okinawa.jp',
+        'hirara.okinawa.jp',
+        'iheya.okinawa.jp',
+        'ishigaki.okinawa.jp',
+        'ishikawa.okinawa.jp',
+        'itoman.okinawa.jp',
+        'izena.okinawa.jp',
+        'kadena.okinawa.jp',
+        'kin.okinawa.jp',
+        'kitadaito.okinawa.jp',
+        'kitanakagusuku.okinawa.jp',
+        'kumejima.okinawa.jp',
+        'kunigami.okinawa.jp',
+        'minamidaito.okinawa.jp',
+        'motobu.okinawa.jp',
+        'nago.okinawa.jp',
+        'naha.okinawa.jp',
+        'nakagusuku.okinawa.jp',
+        'nakijin.okinawa.jp',
+        'nanjo.okinawa.jp',
+        'nishihara.okinawa.jp',
+        'ogimi.okinawa.jp',
+        'okinawa.okinawa.jp',
+        'onna.okinawa.jp',
+        'shimoji.okinawa.jp',
+        'taketomi.okinawa.jp',
+        'tarama.okinawa.jp',
+        'tokashiki.okinawa.jp',
+        'tomigusuku.okinawa.jp',
+        'tonaki.okinawa.jp',
+        'urasoe.okinawa.jp',
+        'uruma.okinawa.jp',
+        'yaese.okinawa.jp',
+        'yomitan.okinawa.jp',
+        'yonabaru.okinawa.jp',
+        'yonaguni.okinawa.jp',
+        'zamami.okinawa.jp',
+        'or.jp',
+        'osaka.jp',
+        'abeno.osaka.jp',
+        'chihayaakasaka.osaka.jp',
+        'chuo.osaka.jp',
+        'daito.osaka.jp',
+        'fujiidera.osaka.jp',
+        'habikino.osaka.jp',
+        'hannan.osaka.jp',
+        'higashiosaka.osaka.jp',
+        'higashisumiyoshi.osaka.jp',
+        'higashiyodogawa.osaka.jp',
+        'hirakata.osaka.jp',
+        'ibaraki.osaka.jp',
+        'ikeda.osaka.jp',
+        'izumi.osaka.jp',
+        'izumiotsu.osaka.jp',
+        'izumisano.osaka.jp',
+        'kadoma.osaka.jp',
+        'kaizuka.osaka.jp',
+        'kanan.osaka.jp',
+        'kashiwara.osaka.jp',
+        'katano.osaka.jp',
+        'kawachinagano.osaka.jp',
+        'kishiwada.osaka.jp',
+        'kita.osaka.jp',
+        'kumatori.osaka.jp',
+        'matsubara.osaka.jp',
+        'minato.osaka.jp',
+        'minoh.osaka.jp',
+        'misaki.osaka.jp',
+        'moriguchi.osaka.jp',
+        'neyagawa.osaka.jp',
+        'nishi.osaka.jp',
+        'nose.osaka.jp',
+        'osakasayama.osaka.jp',
+        'sakai.osaka.jp',
+        'sayama.osaka.jp',
+        'sennan.osaka.jp',
+        'settsu.osaka.jp',
+        'shijonawate.osaka.jp',
+        'shimamoto.osaka.jp',
+        'suita.osaka.jp',
+        'tadaoka.osaka.jp',
+        'taishi.osaka.jp',
+        'tajiri.osaka.jp',
+        'takaishi.osaka.jp',
+        'takatsuki.osaka.jp',
+        'tondabayashi.osaka.jp',
+        'toyonaka.osaka.jp',
+        'toyono.osaka.jp',
+        'yao.osaka.jp',
+        'saga.jp',
+        'ariake.saga.jp',
+        'arita.saga.jp',
+        'fukudomi.saga.jp',
+        'genkai.saga.jp',
+        'hamatama.saga.jp',
+        'hizen.saga.jp',
+        'imari.saga.jp',
+        'kamimine.saga.jp',
+        'kanzaki.saga.jp',
+        'karatsu.saga.jp',
+        'kashima.saga.jp',
+        'kitagata.saga.jp',
+        'kitahata.saga.jp',
+        'kiyama.saga.jp',
+        'kouhoku.saga.jp',
+        'kyuragi.saga.jp',
+        'nishiarita.saga.jp',
+        'ogi.saga.jp',
+        'omachi.saga.jp',
+        'ouchi.saga.jp',
+        'saga.saga.jp',
+        'shiroishi.saga.jp',
+        'taku.saga.jp',
+        'tara.saga.jp',
+        'tosu.saga.jp',
+        'yoshinogari.saga.jp',
+        'saitama.jp',
+        'arakawa.saitama.jp',
+        'asaka.saitama.jp',
+        'chichibu.saitama.jp',
+        'fujimi.saitama.jp',
+        'fujimino.saitama.jp',
+        'fukaya.saitama.jp',
+        'hanno.saitama.jp',
+        'hanyu.saitama.jp',
+        'hasuda.saitama.jp',
+        'hatogaya.saitama.jp',
+        'hatoyama.saitama.jp',
+        'hidaka.saitama.jp',
+        'higashichichibu.saitama.jp',
+        'higashimatsuyama.saitama.jp',
+        'honjo.saitama.jp',
+        'ina.saitama.jp',
+        'iruma.saitama.jp',
+        'iwatsuki.saitama.jp',
+        'kamiizumi.saitama.jp',
+        'kamikawa.saitama.jp',
+        'kamisato.saitama.jp',
+        'kasukabe.saitama.jp',
+        'kawagoe.saitama.jp',
+        'kawaguchi.saitama.jp',
+        'kawajima.saitama.jp',
+        'kazo.saitama.jp',
+        'kitamoto.saitama.jp',
+        'koshigaya.saitama.jp',
+        'kounosu.saitama.jp',
+        'kuki.saitama.jp',
+        'kumagaya.saitama.jp',
+        'matsubushi.saitama.jp',
+        'minano.saitama.jp',
+        'misato.saitama.jp',
+        'miyashiro.saitama.jp',
+        'miyoshi.saitama.jp',
+        'moroyama.saitama.jp',
+        'nagatoro.saitama.jp',
+        'namegawa.saitama.jp',
+        'niiza.saitama.jp',
+        'ogano.saitama.jp',
+        'ogawa.saitama.jp',
+        'ogose.saitama.jp',
+        'okegawa.saitama.jp',
+        'omiya.saitama.jp',
+        'otaki.saitama.jp',
+        'ranzan.saitama.jp',
+        'ryokami.saitama.jp',
+        'saitama.saitama.jp',
+        'sakado.saitama.jp',
+        'satte.saitama.jp',
+        'sayama.saitama.jp',
+        'shiki.saitama.jp',
+        'shiraoka.saitama.jp',
+        'soka.saitama.jp',
+        'sugito.saitama.jp',
+        'toda.saitama.jp',
+        'tokigawa.saitama.jp',
+        'tokorozawa.saitama.jp',
+        'tsurugashima.saitama.jp',
+        'urawa.saitama.jp',
+        'warabi.saitama.jp',
+        'yashio.saitama.jp',
+        'yokoze.saitama.jp',
+        'yono.saitama.jp',
+        'yorii.saitama.jp',
+        'yoshida.saitama.jp',
+        'yoshikawa.saitama.jp',
+        'yoshimi.saitama.jp',
+        '*.sapporo.jp',
+        '!city.sapporo.jp',
+        '*.sendai.jp',
+        '!city.sendai.jp',
+        'shiga.jp',
+        'aisho.shiga.jp',
+        'gamo.shiga.jp',
+        'higashiomi.shiga.jp',
+        'hikone.shiga.jp',
+        'koka.shiga.jp',
+        'konan.shiga.jp',
+        'kosei.shiga.jp',
+        'koto.shiga.jp',
+        'kusatsu.shiga.jp',
+        'maibara.shiga.jp',
+        'moriyama.shiga.jp',
+        'nagahama.shiga.jp',
+        'nishiazai.shiga.jp',
+        'notogawa.shiga.jp',
+        'omihachiman.shiga.jp',
+        'otsu.shiga.jp',
+        'ritto.shiga.jp',
+        'ryuoh.shiga.jp',
+        'takashima.shiga.jp',
+        'takatsuki.shiga.jp',
+        'torahime.shiga.jp',
+        'toyosato.shiga.jp',
+        'yasu.shiga.jp',
+        'shimane.jp',
+        'akagi.shimane.jp',
+        'ama.shimane.jp',
+        'gotsu.shimane.jp',
+        'hamada.shimane.jp',
+        'higashiizumo.shimane.jp',
+        'hikawa.shimane.jp',
+        'hikimi.shimane.jp',
+        'izumo.shimane.jp',
+        'kakinoki.shimane.jp',
+        'masuda.shimane.jp',
+        'matsue.shimane.jp',
+        'misato.shimane.jp',
+        'nishinoshima.shimane.jp',
+        'ohda.shimane.jp',
+        'okinoshima.shimane.jp',
+        'okuizumo.shimane.jp',
+        'shimane.shimane.jp',
+        'tamayu.shimane.jp',
+        'tsuwano.shimane.jp',
+        'unnan.shimane.jp',
+        'yakumo.shimane.jp',
+        'yasugi.shimane.jp',
+        'yatsuka.shimane.jp',
+        'shizuoka.jp',
+        'arai.shizuoka.jp',
+        'atami.shizuoka.jp',
+        'fuji.shizuoka.jp',
+        'fujieda.shizuoka.jp',
+        'fujikawa.shizuoka.jp',
+        'fujinomiya.shizuoka.jp',
+        'fukuroi.shizuoka.jp',
+        'gotemba.shizuoka.jp',
+        'haibara.shizuoka.jp',
+        'hamamatsu.shizuoka.jp',
+        'higashiizu.shizuoka.jp',
+        'ito.shizuoka.jp',
+        'iwata.shizuoka.jp',
+        'izu.shizuoka.jp',
+        'izunokuni.shizuoka.jp',
+        'kakegawa.shizuoka.jp',
+        'kannami.shizuoka.jp',
+        'kawanehon.shizuoka.jp',
+        'kawazu.shizuoka.jp',
+        'kikugawa.shizuoka.jp',
+        'kosai.shizuoka.jp',
+        'makinohara.shizuoka.jp',
+        'matsuzaki.shizuoka.jp',
+        'minamiizu.shizuoka.jp',
+        'mishima.shizuoka.jp',
+        'morimachi.shizuoka.jp',
+        'nishiizu.shizuoka.jp',
+        'numazu.shizuoka.jp',
+        'omaezaki.shizuoka.jp',
+        'shimada.shizuoka.jp',
+        'shimizu.shizuoka.jp',
+        'shimoda.shizuoka.jp',
+        'shizuoka.shizuoka.jp',
+        'susono.shizuoka.jp',
+        'yaizu.shizuoka.jp',
+        'yoshida.shizuoka.jp',
+        'tochigi.jp',
+        'ashikaga.tochigi.jp',
+        'bato.tochigi.jp',
+        'haga.tochigi.jp',
+        'ichikai.tochigi.jp',
+        'iwafune.tochigi.jp',
+        'kaminokawa.tochigi.jp',
+        'kanuma.tochigi.jp',
+        'karasuyama.tochigi.jp',
+        'kuroiso.tochigi.jp',
+        'mashiko.tochigi.jp',
+        'mibu.tochigi.jp',
+        'moka.tochigi.jp',
+        'motegi.tochigi.jp',
+        'nasu.tochigi.jp',
+        'nasushiobara.tochigi.jp',
+        'nikko.tochigi.jp',
+        'nishikata.tochigi.jp',
+        'nogi.tochigi.jp',
+        'ohira.tochigi.jp',
+        'ohtawara.tochigi.jp',
+        'oyama.tochigi.jp',
+        'sakura.tochigi.jp',
+        'sano.tochigi.jp',
+        'shimotsuke.tochigi.jp',
+        'shioya.tochigi.jp',
+        'takanezawa.tochigi.jp',
+        'tochigi.tochigi.jp',
+        'tsuga.tochigi.jp',
+        'ujiie.tochigi.jp',
+        'utsunomiya.tochigi.jp',
+        'yaita.tochigi.jp',
+        'tokushima.jp',
+        'aizumi.tokushima.jp',
+        'anan.tokushima.jp',
+        'ichiba.tokushima.jp',
+        'itano.tokushima.jp',
+        'kainan.tokushima.jp',
+        'komatsushima.tokushima.jp',
+        'matsushige.tokushima.jp',
+        'mima.tokushima.jp',
+        'minami.tokushima.jp',
+        'miyoshi.tokushima.jp',
+        'mugi.tokushima.jp',
+        'nakagawa.tokushima.jp',
+        'naruto.tokushima.jp',
+        'sanagochi.tokushima.jp',
+        'shishikui.tokushima.jp',
+        'tokushima.tokushima.jp',
+        'wajiki.tokushima.jp',
+        'tokyo.jp',
+        'adachi.tokyo.jp',
+        'akiruno.tokyo.jp',
+        'akishima.tokyo.jp',
+        'aogashima.tokyo.jp',
+        'arakawa.tokyo.jp',
+        'bunkyo.tokyo.jp',
+        'chiyoda.tokyo.jp',
+        'chofu.tokyo.jp',
+        'chuo.tokyo.jp',
+        'edogawa.tokyo.jp',
+        'fuchu.tokyo.jp',
+        'fussa.tokyo.jp',
+        'hachijo.tokyo.jp',
+        'hachioji.tokyo.jp',
+        'hamura.tokyo.jp',
+        'higashikurume.tokyo.jp',
+        'higashimurayama.tokyo.jp',
+        'higashiyamato.tokyo.jp',
+        'hino.tokyo.jp',
+        'hinode.tokyo.jp',
+        'hinohara.tokyo.jp',
+        'inagi.tokyo.jp',
+        'itabashi.tokyo.jp',
+        'katsushika.tokyo.jp',
+        'kita.tokyo.jp',
+        'kiyose.tokyo.jp',
+        'kodaira.tokyo.jp',
+        'koganei.tokyo.jp',
+        'kokubunji.tokyo.jp',
+        'komae.tokyo.jp',
+        'koto.tokyo.jp',
+        'kouzushima.tokyo.jp',
+        'kunitachi.tokyo.jp',
+        'machida.tokyo.jp',
+        'meguro.tokyo.jp',
+        'minato.tokyo.jp',
+        'mitaka.tokyo.jp',
+        'mizuho.tokyo.jp',
+        'musashimurayama.tokyo.jp',
+        'musashino.tokyo.jp',
+        'nakano.tokyo.jp',
+        'nerima.tokyo.jp',
+        'ogasawara.tokyo.jp',
+        'okutama.tokyo.jp',
+        'ome.tokyo.jp',
+        'oshima.tokyo.jp',
+        'ota.tokyo.jp',
+        'setagaya.tokyo.jp',
+        'shibuya.tokyo.jp',
+        'shinagawa.tokyo.jp',
+        'shinjuku.tokyo.jp',
+        'suginami.tokyo.jp',
+        'sumida.tokyo.jp',
+        'tachikawa.tokyo.jp',
+        'taito.tokyo.jp',
+        'tama.tokyo.jp',
+        'toshima.tokyo.jp',
+        'tottori.jp',
+        'chizu.tottori.jp',
+        'hino.tottori.jp',
+        'kawahara.tottori.jp',
+        'koge.tottori.jp',
+        'kotoura.tottori.jp',
+        'misasa.tottori.jp',
+        'nanbu.tottori.jp',
+        'nichinan.tottori.jp',
+        'sakaiminato.tottori.jp',
+        'tottori.tottori.jp',
+        'wakasa.tottori.jp',
+        'yazu.tottori.jp',
+        'yonago.tottori.jp',
+        'toyama.jp',
+        'asahi.toyama.jp',
+        'fuchu.toyama.jp',
+        'fukumitsu.toyama.jp',
+        'funahashi.toyama.jp',
+        'himi.toyama.jp',
+        'imizu.toyama.jp',
+        'inami.toyama.jp',
+        'johana.toyama.jp',
+        'kamiichi.toyama.jp',
+        'kurobe.toyama.jp',
+        'nakaniikawa.toyama.jp',
+        'namerikawa.toyama.jp',
+        'nanto.toyama.jp',
+        'nyuzen.toyama.jp',
+        'oyabe.toyama.jp',
+        'taira.toyama.jp',
+        'takaoka.toyama.jp',
+        'tateyama.toyama.jp',
+        'toga.toyama.jp',
+        'tonami.toyama.jp',
+        'toyama.toyama.jp',
+        'unazuki.toyama.jp',
+        'uozu.toyama.jp',
+        'yamada.toyama.jp',
+        'wakayama.jp',
+        'arida.wakayama.jp',
+        'aridagawa.wakayama.jp',
+        'gobo.wakayama.jp',
+        'hashimoto.wakayama.jp',
+        'hidaka.wakayama.jp',
+        'hirogawa.wakayama.jp',
+        'inami.wakayama.jp',
+        'iwade.wakayama.jp',
+        'kainan.wakayama.jp',
+        'kamitonda.wakayama.jp',
+        'katsuragi.wakayama.jp',
+        'kimino.wakayama.jp',
+        'kinokawa.wakayama.jp',
+        'kitayama.wakayama.jp',
+        'koya.wakayama.jp',
+        'koza.wakayama.jp',
+        'kozagawa.wakayama.jp',
+        'kudoyama.wakayama.jp',
+        'kushimoto.wakayama.jp',
+        'mihama.wakayama.jp',
+        'misato.wakayama.jp',
+        'nachikatsuura.wakayama.jp',
+        'shingu.wakayama.jp',
+        'shirahama.wakayama.jp',
+        'taiji.wakayama.jp',
+        'tanabe.wakayama.jp',
+        'wakayama.wakayama.jp',
+        'yuasa.wakayama.jp',
+        'yura.wakayama.jp',
+        'xn--0trq7p7nn.jp',
+        'xn--1ctwo.jp',
+        'xn--1lqs03n.jp',
+        'xn--1lqs71d.jp',
+        'xn--2m4a15e.jp',
+        'xn--32vp30h.jp',
+        'xn--4it168d.jp',
+        'xn--4it797k.jp',
+        'xn--4pvxs.jp',
+        'xn--5js045d.jp',
+        'xn--5rtp49c.jp',
+        'xn--5rtq34k.jp',
+        'xn--6btw5a.jp',
+        'xn--6orx2r.jp',
+        'xn--7t0a264c.jp',
+        'xn--8ltr62k.jp',
+        'xn--8pvr4u.jp',
+        'xn--c3s14m.jp',
+        'xn--d5qv7z876c.jp',
+        'xn--djrs72d6uy.jp',
+        'xn--djty4k.jp',
+        'xn--efvn9s.jp',
+        'xn--ehqz56n.jp',
+        'xn--elqq16h.jp',
+        'xn--f6qx53a.jp',
+        'xn--k7yn95e.jp',
+        'xn--kbrq7o.jp',
+        'xn--klt787d.jp',
+        'xn--kltp7d.jp',
+        'xn--kltx9a.jp',
+        'xn--klty5x.jp',
+        'xn--mkru45i.jp',
+        'xn--nit225k.jp',
+        'xn--ntso0iqx3a.jp',
+        'xn--ntsq17g.jp',
+        'xn--pssu33l.jp',
+        'xn--qqqt11m.jp',
+        'xn--rht27z.jp',
+        'xn--rht3d.jp',
+        'xn--rht61e.jp',
+        'xn--rny31h.jp',
+        'xn--tor131o.jp',
+        'xn--uist22h.jp',
+        'xn--uisz3g.jp',
+        'xn--uuwu58a.jp',
+        'xn--vgu402c.jp',
+        'xn--zbx025d.jp',
+        'yamagata.jp',
+        'asahi.yamagata.jp',
+        'funagata.yamagata.jp',
+        'higashine.yamagata.jp',
+        'iide.yamagata.jp',
+        'kahoku.yamagata.jp',
+        'kaminoyama.yamagata.jp',
+        'kaneyama.yamagata.jp',
+        'kawanishi.yamagata.jp',
+        'mamurogawa.yamagata.jp',
+        'mikawa.yamagata.jp',
+        'murayama.yamagata.jp',
+        'nagai.yamagata.jp',
+        'nakayama.yamagata.jp',
+        'nanyo.yamagata.jp',
+        'nishikawa.yamagata.jp',
+        'obanazawa.yamagata.jp',
+        'oe.yamagata.jp',
+        'oguni.yamagata.jp',
+        'ohkura.yamagata.jp',
+        'oishida.yamagata.jp',
+        'sagae.yamagata.jp',
+        'sakata.yamagata.jp',
+        'sakegawa.yamagata.jp',
+        'shinjo.yamagata.jp',
+        'shirataka.yamagata.jp',
+        'shonai.yamagata.jp',
+        'takahata.yamagata.jp',
+        'tendo.yamagata.jp',
+        'tozawa.yamagata.jp',
+        'tsuruoka.yamagata.jp',
+        'yamagata.yamagata.jp',
+        'yamanobe.yamagata.jp',
+        'yonezawa.yamagata.jp',
+        'yuza.yamagata.jp',
+        'yamaguchi.jp',
+        'abu.yamaguchi.jp',
+        'hagi.yamaguchi.jp',
+        'hikari.yamaguchi.jp',
+        'hofu.yamaguchi.jp',
+        'iwakuni.yamaguchi.jp',
+        'kudamatsu.yamaguchi.jp',
+        'mitou.yamaguchi.jp',
+        'nagato.yamaguchi.jp',
+        'oshima.yamaguchi.jp',
+        'shimonoseki.yamaguchi.jp',
+        'shunan.yamaguchi.jp',
+        'tabuse.yamaguchi.jp',
+        'tokuyama.yamaguchi.jp',
+        'toyota.yamaguchi.jp',
+        'ube.yamaguchi.jp',
+        'yuu.yamaguchi.jp',
+        'yamanashi.jp',
+        'chuo.yamanashi.jp',
+        'doshi.yamanashi.jp',
+        'fuefuki.yamanashi.jp',
+        'fujikawa.yamanashi.jp',
+        'fujikawaguchiko.yamanashi.jp',
+        'fujiyoshida.yamanashi.jp',
+        'hayakawa.yamanashi.jp',
+        'hokuto.yamanashi.jp',
+        'ichikawamisato.yamanashi.jp',
+        'kai.yamanashi.jp',
+        'kofu.yamanashi.jp',
+        'koshu.yamanashi.jp',
+        'kosuge.yamanashi.jp',
+        'minami-alps.yamanashi.jp',
+        'minobu.yamanashi.jp',
+        'nakamichi.yamanashi.jp',
+        'nanbu.yamanashi.jp',
+        'narusawa.yamanashi.jp',
+        'nirasaki.yamanashi.jp',
+        'nishikatsura.yamanashi.jp',
+        'oshino.yamanashi.jp',
+        'otsuki.yamanashi.jp',
+        'showa.yamanashi.jp',
+        'tabayama.yamanashi.jp',
+        'tsuru.yamanashi.jp',
+        'uenohara.yamanashi.jp',
+        'yamanakako.yamanashi.jp',
+        'yamanashi.yamanashi.jp',
+        '*.yokohama.jp',
+        '!city.yokohama.jp',
+        'jpmorgan',
+        'jprs',
+        'juegos',
+        'juniper',
+        'kaufen',
+        'kddi',
+        'ke',
+        'ac.ke',
+        'co.ke',
+        'go.ke',
+        'info.ke',
+        'me.ke',
+        'mobi.ke',
+        'ne.ke',
+        'or.ke',
+        'sc.ke',
+        'kerryhotels',
+        'kerrylogistics',
+        'kerryproperties',
+        'kfh',
+        'kg',
+        'com.kg',
+        'edu.kg',
+        'gov.kg',
+        'mil.kg',
+        'net.kg',
+        'org.kg',
+        '*.kh',
+        'ki',
+        'biz.ki',
+        'com.ki',
+        'edu.ki',
+        'gov.ki',
+        'info.ki',
+        'net.ki',
+        'org.ki',
+        'kia',
+        'kids',
+        'kim',
+        'kinder',
+        'kindle',
+        'kitchen',
+        'kiwi',
+        'km',
+        'ass.km',
+        'asso.km',
+        'com.km',
+        'coop.km',
+        'edu.km',
+        'gouv.km',
+        'gov.km',
+        'medecin.km',
+        'mil.km',
+        'nom.km',
+        'notaires.km',
+        'org.km',
+        'pharmaciens.km',
+        'prd.km',
+        'presse.km',
+        'tm.km',
+        'veterinaire.km',
+        'kn',
+        'edu.kn',
+        'gov.kn',
+        'net.kn',
+        'org.kn',
+        'koeln',
+        'komatsu',
+        'kosher',
+        'kp',
+        'com.kp',
+        'edu.kp',
+        'gov.kp',
+        'org.kp',
+        'rep.kp',
+        'tra.kp',
+        'kpmg',
+        'kpn',
+        'kr',
+        'ac.kr',
+        'busan.kr',
+        'chungbuk.kr',
+        'chungnam.kr',
+        'co.kr',
+        'daegu.kr',
+        'daejeon.kr',
+        'es.kr',
+        'gangwon.kr',
+        'go.kr',
+        'gwangju.kr',
+        'gyeongbuk.kr',
+        'gyeonggi.kr',
+        'gyeongnam.kr',
+        'hs.kr',
+        'incheon.kr',
+        'jeju.kr',
+        'jeonbuk.kr',
+        'jeonnam.kr',
+        'kg.kr',
+        'mil.kr',
+        'ms.kr',
+        'ne.kr',
+        'or.kr',
+        'pe.kr',
+        're.kr',
+        'sc.kr',
+        'seoul.kr',
+        'ulsan.kr',
+        'krd',
+        'kred',
+        'kuokgroup',
+        'kw',
+        'com.kw',
+        'edu.kw',
+        'emb.kw',
+        'gov.kw',
+        'ind.kw',
+        'net.kw',
+        'org.kw',
+        'ky',
+        'com.ky',
+        'edu.ky',
+        'gov.ky',
+        'net.ky',
+        'org.ky',
+        'kyoto',
+        'kz',
+        'com.kz',
+        'edu.kz',
+        'gov.kz',
+        'mil.kz',
+        'net.kz',
+        'org.kz',
+        'la',
+        'com.la',
+        'edu.la',
+        'gov.la',
+        'info.la',
+        'int.la',
+        'net.la',
+        'org.la',
+        'per.la',
+        'lacaixa',
+        'lamborghini',
+        'lamer',
+        'lancaster',
+        'lancia',
+        'land',
+        'landrover',
+        'lanxess',
+        'lasalle',
+        'lat',
+        'latino',
+        'latrobe',
+        'law',
+        'lawyer',
+        'lb',
+        'com.lb',
+        'edu.lb',
+        'gov.lb',
+        'net.lb',
+        'org.lb',
+        'lc',
+        'co.lc',
+        'com.lc',
+        'edu.lc',
+        'gov.lc',
+        'net.lc',
+        'org.lc',
+        'lds',
+        'lease',
+        'leclerc',
+        'lefrak',
+        'legal',
+        'lego',
+        'lexus',
+        'lgbt',
+        'li',
+        'lidl',
+        'life',
+        'lifeinsurance',
+        'lifestyle',
+        'lighting',
+        'like',
+        'lilly',
+        'limited',
+        'limo',
+        'lincoln',
+        'linde',
+        'link',
+        'lipsy',
+        'live',
+        'living',
+        'lk',
+        'ac.lk',
+        'assn.lk',
+        'com.lk',
+        'edu.lk',
+        'gov.lk',
+        'grp.lk',
+        'hotel.lk',
+        'int.lk',
+        'ltd.lk',
+        'net.lk',
+        'ngo.lk',
+        'org.lk',
+        'sch.lk',
+        'soc.lk',
+        'web.lk',
+        'llc',
+        'llp',
+        'loan',
+        'loans',
+        'locker',
+        'locus',
+        'loft',
+        'lol',
+        'london',
+        'lotte',
+        'lotto',
+        'love',
+        'lpl',
+        'lplfinancial',
+        'lr',
+        'com.lr',
+        'edu.lr',
+        'gov.lr',
+        'net.lr',
+        'org.lr',
+        'ls',
+        'ac.ls',
+        'biz.ls',
+        'co.ls',
+        'edu.ls',
+        'gov.ls',
+        'info.ls',
+        'net.ls',
+        'org.ls',
+        'sc.ls',
+        'lt',
+        'gov.lt',
+        'ltd',
+        'ltda',
+        'lu',
+        'lundbeck',
+        'luxe',
+        'luxury',
+        'lv',
+        'asn.lv',
+        'com.lv',
+        'conf.lv',
+        'edu.lv',
+        'gov.lv',
+        'id.lv',
+        'mil.lv',
+        'net.lv',
+        'org.lv',
+        'ly',
+        'com.ly',
+        'edu.ly',
+        'gov.ly',
+        'id.ly',
+        'med.ly',
+        'net.ly',
+        'org.ly',
+        'plc.ly',
+        'sch.ly',
+        'ma',
+        'ac.ma',
+        'co.ma',
+        'gov.ma',
+        'net.ma',
+        'org.ma',
+        'press.ma',
+        'macys',
+        'madrid',
+        'maif',
+        'maison',
+        'makeup',
+        'man',
+        'management',
+        'mango',
+        'map',
+        'market',
+        'marketing',
+        'markets',
+        'marriott',
+        'marshalls',
+        'maserati',
+        'mattel',
+        'mba',
+        'mc',
+        'asso.mc',
+        'tm.mc',
+        'mckinsey',
+        'md',
+        'me',
+        'ac.me',
+        'co.me',
+        'edu.me',
+        'gov.me',
+        'its.me',
+        'net.me',
+        'org.me',
+        'priv.me',
+        'med',
+        'media',
+        'meet',
+        'melbourne',
+        'meme',
+        'memorial',
+        'men',
+        'menu',
+        'merckmsd',
+        'mg',
+        'co.mg',
+        'com.mg',
+        'edu.mg',
+        'gov.mg',
+        'mil.mg',
+        'nom.mg',
+        'org.mg',
+        'prd.mg',
+        'tm.mg',
+        'mh',
+        'miami',
+        'microsoft',
+        'mil',
+        'mini',
+        'mint',
+        'mit',
+        'mitsubishi',
+        'mk',
+        'com.mk',
+        'edu.mk',
+        'gov.mk',
+        'inf.mk',
+        'name.mk',
+        'net.mk',
+        'org.mk',
+        'ml',
+        'com.ml',
+        'edu.ml',
+        'gouv.ml',
+        'gov.ml',
+        'net.ml',
+        'org.ml',
+        'presse.ml',
+        'mlb',
+        'mls',
+        '*.mm',
+        'mma',
+        'mn',
+        'edu.mn',
+        'gov.mn',
+        'org.mn',
+        'mo',
+        'com.mo',
+        'edu.mo',
+        'gov.mo',
+        'net.mo',
+        'org.mo',
+        'mobi',
+        'mobile',
+        'moda',
+        'moe',
+        'moi',
+        'mom',
+        'monash',
+        'money',
+        'monster',
+        'mormon',
+        'mortgage',
+        'moscow',
+        'moto',
+        'motorcycles',
+        'mov',
+        'movie',
+        'mp',
+        'mq',
+        'mr',
+        'gov.mr',
+        'ms',
+        'com.ms',
+        'edu.ms',
+        'gov.ms',
+        'net.ms',
+        'org.ms',
+        'msd',
+        'mt',
+        'com.mt',
+        'edu.mt',
+        'net.mt',
+        'org.mt',
+        'mtn',
+        'mtr',
+        'mu',
+        'ac.mu',
+        'co.mu',
+        'com.mu',
+        'gov.mu',
+        'net.mu',
+        'or.mu',
+        'org.mu',
+        'museum',
+        'academy.museum',
+        'agriculture.museum',
+        'air.museum',
+        'airguard.museum',
+        'alabama.museum',
+        'alaska.museum',
+        'amber.museum',
+        'ambulance.museum',
+        'american.museum',
+        'americana.museum',
+        'americanantiques.museum',
+        'americanart.museum',
+        'amsterdam.museum',
+        'and.museum',
+        'annefrank.museum',
+        'anthro.museum',
+        'anthropology.museum',
+        'antiques.museum',
+        'aquarium.museum',
+        'arboretum.museum',
+        'archaeological.museum',
+        'archaeology.museum',
+        'architecture.museum',
+        'art.museum',
+        'artanddesign.museum',
+        'artcenter.museum',
+        'artdeco.museum',
+        'arteducation.museum',
+        'artgallery.museum',
+        'arts.museum',
+        'artsandcrafts.museum',
+        'asmatart.museum',
+        'assassination.museum',
+        'assisi.museum',
+        'association.museum',
+        'astronomy.museum',
+        'atlanta.museum',
+        'austin.museum',
+        'australia.museum',
+        'automotive.museum',
+        'aviation.museum',
+        'axis.museum',
+        'badajoz.museum',
+        'baghdad.museum',
+        'bahn.museum',
+        'bale.museum',
+        'baltimore.museum',
+        'barcelona.museum',
+        'baseball.museum',
+        'basel.museum',
+        'baths.museum',
+        'bauern.museum',
+        'beauxarts.museum',
+        'beeldengeluid.museum',
+        'bellevue.museum',
+        'bergbau.museum',
+        'berkeley.museum',
+        'berlin.museum',
+        'bern.museum',
+        'bible.museum',
+        'bilbao.museum',
+        'bill.museum',
+        'birdart.museum',
+        'birthplace.museum',
+        'bonn.museum',
+        'boston.museum',
+        'botanical.museum',
+        'botanicalgarden.museum',
+        'botanicgarden.museum',
+        'botany.museum',
+        'brandywinevalley.museum',
+        'brasil.museum',
+        'bristol.museum',
+        'british.museum',
+        'britishcolumbia.museum',
+        'broadcast.museum',
+        'brunel.museum',
+        'brussel.museum',
+        'brussels.museum',
+        'bruxelles.museum',
+        'building.museum',
+        'burghof.museum',
+        'bus.museum',
+        'bushey.museum',
+        'cadaques.museum',
+        'california.museum',
+        'cambridge.museum',
+        'can.museum',
+        'canada.museum',
+        'capebreton.museum',
+        'carrier.museum',
+        'cartoonart.museum',
+        'casadelamoneda.museum',
+        'castle.museum',
+        'castres.museum',
+        'celtic.museum',
+        'center.museum',
+        'chattanooga.museum',
+        'cheltenham.museum',
+        'chesapeakebay.museum',
+        'chicago.museum',
+        'children.museum',
+        'childrens.museum',
+        'childrensgarden.museum',
+        'chiropractic.museum',
+        'chocolate.museum',
+        'christiansburg.museum',
+        'cincinnati.museum',
+        'cinema.museum',
+        'circus.museum',
+        'civilisation.museum',
+        'civilization.museum',
+        'civilwar.museum',
+        'clinton.museum',
+        'clock.museum',
+        'coal.museum',
+        'coastaldefence.museum',
+        'cody.museum',
+        'coldwar.museum',
+        'collection.museum',
+        'colonialwilliamsburg.museum',
+        'coloradoplateau.museum',
+        'columbia.museum',
+        'columbus.museum',
+        'communication.museum',
+        'communications.museum',
+        'community.museum',
+        'computer.museum',
+        'computerhistory.museum',
+        'contemporary.museum',
+        'contemporaryart.museum',
+        'convent.museum',
+        'copenhagen.museum',
+        'corporation.museum',
+        'corvette.museum',
+        'costume.museum',
+        'countryestate.museum',
+        'county.museum',
+        'crafts.museum',
+        'cranbrook.museum',
+        'creation.museum',
+        'cultural.museum',
+        'culturalcenter.museum',
+        'culture.museum',
+        'cyber.museum',
+        'cymru.museum',
+        'dali.museum',
+        'dallas.museum',
+        'database.museum',
+        'ddr.museum',
+        'decorativearts.museum',
+        'delaware.museum',
+        'delmenhorst.museum',
+        'denmark.museum',
+        'depot.museum',
+        'design.museum',
+        'detroit.museum',
+        'dinosaur.museum',
+        'discovery.museum',
+        'dolls.museum',
+        'donostia.museum',
+        'durham.museum',
+        'eastafrica.museum',
+        'eastcoast.museum',
+        'education.museum',
+        'educational.museum',
+        'egyptian.museum',
+        'eisenbahn.museum',
+        'elburg.museum',
+        'elvendrell.museum',
+        'embroidery.museum',
+        'encyclopedic.museum',
+        'england.museum',
+        'entomology.museum',
+        'environment.museum',
+        'environmentalconservation.museum',
+        'epilepsy.museum',
+        'essex.museum',
+        'estate.museum',
+        'ethnology.museum',
+        'exeter.museum',
+        'exhibition.museum',
+        'family.museum',
+        'farm.museum',
+        'farmequipment.museum',
+        'farmers.museum',
+        'farmstead.museum',
+        'field.museum',
+        'figueres.museum',
+        'filatelia.museum',
+        'film.museum',
+        'fineart.museum',
+        'finearts.museum',
+        'finland.museum',
+        'flanders.museum',
+        'florida.museum',
+        'force.museum',
+        'fortmissoula.museum',
+        'fortworth.museum',
+        'foundation.museum',
+        'francaise.museum',
+        'frankfurt.museum',
+        'franziskaner.museum',
+        'freemasonry.museum',
+        'freiburg.museum',
+        'fribourg.museum',
+        'frog.museum',
+        'fundacio.museum',
+        'furniture.museum',
+        'gallery.museum',
+        'garden.museum',
+        'gateway.museum',
+        'geelvinck.museum',
+        'gemological.museum',
+        'geology.museum',
+        'georgia.museum',
+        'giessen.museum',
+        'glas.museum',
+        'glass.museum',
+        'gorge.museum',
+        'grandrapids.museum',
+        'graz.museum',
+        'guernsey.museum',
+        'halloffame.museum',
+        'hamburg.museum',
+        'handson.museum',
+        'harvestcelebration.museum',
+        'hawaii.museum',
+        'health.museum',
+        'heimatunduhren.museum',
+        'hellas.museum',
+        'helsinki.museum',
+        'hembygdsforbund.museum',
+        'heritage.museum',
+        'histoire.museum',
+        'historical.museum',
+        'historicalsociety.museum',
+        'historichouses.museum',
+        'historisch.museum',
+        'historisches.museum',
+        'history.museum',
+        'historyofscience.museum',
+        'horology.museum',
+        'house.museum',
+        'humanities.museum',
+        'illustration.museum',
+        'imageandsound.museum',
+        'indian.museum',
+        'indiana.museum',
+        'indianapolis.museum',
+        'indianmarket.museum',
+        'intelligence.museum',
+        'interactive.museum',
+        'iraq.museum',
+        'iron.museum',
+        'isleofman.museum',
+        'jamison.museum',
+        'jefferson.museum',
+        'jerusalem.museum',
+        'jewelry.museum',
+        'jewish.museum',
+        'jewishart.museum',
+        'jfk.museum',
+        'journalism.museum',
+        'judaica.museum',
+        'judygarland.museum',
+        'juedisches.museum',
+        'juif.museum',
+        'karate.museum',
+        'karikatur.museum',
+        'kids.museum',
+        'koebenhavn.museum',
+        'koeln.museum',
+        'kunst.museum',
+        'kunstsammlung.museum',
+        'kunstunddesign.museum',
+        'labor.museum',
+        'labour.museum',
+        'lajolla.museum',
+        'lancashire.museum',
+        'landes.museum',
+        'lans.museum',
+        'larsson.museum',
+        'lewismiller.museum',
+        'lincoln.museum',
+        'linz.museum',
+        'living.museum',
+        'livinghistory.museum',
+        'localhistory.museum',
+        'london.museum',
+        'losangeles.museum',
+        'louvre.museum',
+        'loyalist.museum',
+        'lucerne.museum',
+        'luxembourg.museum',
+        'luzern.museum',
+        'mad.museum',
+        'madrid.museum',
+        'mallorca.museum',
+        'manchester.museum',
+        'mansion.museum',
+        'mansions.museum',
+        'manx.museum',
+        'marburg.museum',
+        'maritime.museum',
+        'maritimo.museum',
+        'maryland.museum',
+        'marylhurst.museum',
+        'media.museum',
+        'medical.museum',
+        'medizinhistorisches.museum',
+        'meeres.museum',
+        'memorial.museum',
+        'mesaverde.museum',
+        'michigan.museum',
+        'midatlantic.museum',
+        'military.museum',
+        'mill.museum',
+        'miners.museum',
+        'mining.museum',
+        'minnesota.museum',
+        'missile.museum',
+        'missoula.museum',
+        'modern.museum',
+        'moma.museum',
+        'money.museum',
+        'monmouth.museum',
+        'monticello.museum',
+        'montreal.museum',
+        'moscow.museum',
+        'motorcycle.museum',
+        'muenchen.museum',
+        'muenster.museum',
+        'mulhouse.museum',
+        'muncie.museum',
+        'museet.museum',
+        'museumcenter.museum',
+        'museumvereniging.museum',
+        'music.museum',
+        'national.museum',
+        'nationalfirearms.museum',
+        'nationalheritage.museum',
+        'nativeamerican.museum',
+        'naturalhistory.museum',
+        'naturalhistorymuseum.museum',
+        'naturalsciences.museum',
+        'nature.museum',
+        'naturhistorisches.museum',
+        'natuurwetenschappen.museum',
+        'naumburg.museum',
+        'naval.museum',
+        'nebraska.museum',
+        'neues.museum',
+        'newhampshire.museum',
+        'newjersey.museum',
+        'newmexico.museum',
+        'newport.museum',
+        'newspaper.museum',
+        'newyork.museum',
+        'niepce.museum',
+        'norfolk.museum',
+        'north.museum',
+        'nrw.museum',
+        'nyc.museum',
+        'nyny.museum',
+        'oceanographic.museum',
+        'oceanographique.museum',
+        'omaha.museum',
+        'online.museum',
+        'ontario.museum',
+        'openair.museum',
+        'oregon.museum',
+        'oregontrail.museum',
+        'otago.museum',
+        'oxford.museum',
+        'pacific.museum',
+        'paderborn.museum',
+        'palace.museum',
+        'paleo.museum',
+        'palmsprings.museum',
+        'panama.museum',
+        'paris.museum',
+        'pasadena.museum',
+        'pharmacy.museum',
+        'philadelphia.museum',
+        'philadelphiaarea.museum',
+        'philately.museum',
+        'phoenix.museum',
+        'photography.museum',
+        'pilots.museum',
+        'pittsburgh.museum',
+        'planetarium.museum',
+        'plantation.museum',
+        'plants.museum',
+        'plaza.museum',
+        'portal.museum',
+        'portland.museum',
+        'portlligat.museum',
+        'posts-and-telecommunications.museum',
+        'preservation.museum',
+        'presidio.museum',
+        'press.museum',
+        'project.museum',
+        'public.museum',
+        'pubol.museum',
+        'quebec.museum',
+        'railroad.museum',
+        'railway.museum',
+        'research.museum',
+        'resistance.museum',
+        'riodejaneiro.museum',
+        'rochester.museum',
+        'rockart.museum',
+        'roma.museum',
+        'russia.museum',
+        'saintlouis.museum',
+        'salem.museum',
+        'salvadordali.museum',
+        'salzburg.museum',
+        'sandiego.museum',
+        'sanfrancisco.museum',
+        'santabarbara.museum',
+        'santacruz.museum',
+        'santafe.museum',
+        'saskatchewan.museum',
+        'satx.museum',
+        'savannahga.museum',
+        'schlesisches.museum',
+        'schoenbrunn.museum',
+        'schokoladen.museum',
+        'school.museum',
+        'schweiz.museum',
+        'science.museum',
+        'science-fiction.museum',
+        'scienceandhistory.museum',
+        'scienceandindustry.museum',
+        'sciencecenter.museum',
+        'sciencecenters.museum',
+        'sciencehistory.museum',
+        'sciences.museum',
+        'sciencesnaturelles.museum',
+        'scotland.museum',
+        'seaport.museum',
+        'settlement.museum',
+        'settlers.museum',
+        'shell.museum',
+        'sherbrooke.museum',
+        'sibenik.museum',
+        'silk.museum',
+        'ski.museum',
+        'skole.museum',
+        'society.museum',
+        'sologne.museum',
+        'soundandvision.museum',
+        'southcarolina.museum',
+        'southwest.museum',
+        'space.museum',
+        'spy.museum',
+        'square.museum',
+        'stadt.museum',
+        'stalbans.museum',
+        'starnberg.museum',
+        'state.museum',
+        'stateofdelaware.museum',
+        'station.museum',
+        'steam.museum',
+        'steiermark.museum',
+        'stjohn.museum',
+        'stockholm.museum',
+        'stpetersburg.museum',
+        'stuttgart.museum',
+        'suisse.museum',
+        'surgeonshall.museum',
+        'surrey.museum',
+        'svizzera.museum',
+        'sweden.museum',
+        'sydney.museum',
+        'tank.museum',
+        'tcm.museum',
+        'technology.museum',
+        'telekommunikation.museum',
+        'television.museum',
+        'texas.museum',
+        'textile.museum',
+        'theater.museum',
+        'time.museum',
+        'timekeeping.museum',
+        'topology.museum',
+        'torino.museum',
+        'touch.museum',
+        'town.museum',
+        'transport.museum',
+        'tree.museum',
+        'trolley.museum',
+        'trust.museum',
+        'trustee.museum',
+        'uhren.museum',
+        'ulm.museum',
+        'undersea.museum',
+        'university.museum',
+        'usa.museum',
+        'usantiques.museum',
+        'usarts.museum',
+        'uscountryestate.museum',
+        'usculture.museum',
+        'usdecorativearts.museum',
+        'usgarden.museum',
+        'ushistory.museum',
+        'ushuaia.museum',
+        'uslivinghistory.museum',
+        'utah.museum',
+        'uvic.museum',
+        'valley.museum',
+        'vantaa.museum',
+        'versailles.museum',
+        'viking.museum',
+        'village.museum',
+        'virginia.museum',
+        'virtual.museum',
+        'virtuel.museum',
+        'vlaanderen.museum',
+        'volkenkunde.museum',
+        'wales.museum',
+        'wallonie.museum',
+        'war.museum',
+        'washingtondc.museum',
+        'watch-and-clock.museum',
+        'watchandclock.museum',
+        'western.museum',
+        'westfalen.museum',
+        'whaling.museum',
+        'wildlife.museum',
+        'williamsburg.museum',
+        'windmill.museum',
+        'workshop.museum',
+        'xn--9dbhblg6di.museum',
+        'xn--comunicaes-v6a2o.museum',
+        'xn--correios-e-telecomunicaes-ghc29a.museum',
+        'xn--h1aegh.museum',
+        'xn--lns-qla.museum',
+        'york.museum',
+        'yorkshire.museum',
+        'yosemite.museum',
+        'youth.museum',
+        'zoological.museum',
+        'zoology.museum',
+        'music',
+        'mutual',
+        'mv',
+        'aero.mv',
+        'biz.mv',
+        'com.mv',
+        'coop.mv',
+        'edu.mv',
+        'gov.mv',
+        'info.mv',
+        'int.mv',
+        'mil.mv',
+        'museum.mv',
+        'name.mv',
+        'net.mv',
+        'org.mv',
+        'pro.mv',
+        'mw',
+        'ac.mw',
+        'biz.mw',
+        'co.mw',
+        'com.mw',
+        'coop.mw',
+        'edu.mw',
+        'gov.mw',
+        'int.mw',
+        'museum.mw',
+        'net.mw',
+        'org.mw',
+        'mx',
+        'com.mx',
+        'edu.mx',
+        'gob.mx',
+        'net.mx',
+        'org.mx',
+        'my',
+        'biz.my',
+        'com.my',
+        'edu.my',
+        'gov.my',
+        'mil.my',
+        'name.my',
+        'net.my',
+        'org.my',
+        'mz',
+        'ac.mz',
+        'adv.mz',
+        'co.mz',
+        'edu.mz',
+        'gov.mz',
+        'mil.mz',
+        'net.mz',
+        'org.mz',
+        'na',
+        'ca.na',
+        'cc.na',
+        'co.na',
+        'com.na',
+        'dr.na',
+        'in.na',
+        'info.na',
+        'mobi.na',
+        'mx.na',
+        'name.na',
+        'or.na',
+        'org.na',
+        'pro.na',
+        'school.na',
+        'tv.na',
+        'us.na',
+        'ws.na',
+        'nab',
+        'nagoya',
+        'name',
+        'natura',
+        'navy',
+        'nba',
+        'nc',
+        'asso.nc',
+        'nom.nc',
+        'ne',
+        'nec',
+        'net',
+        'netbank',
+        'netflix',
+        'network',
+        'neustar',
+        'new',
+        'news',
+        'next',
+        'nextdirect',
+        'nexus',
+        'nf',
+        'arts.nf',
+        'com.nf',
+        'firm.nf',
+        'info.nf',
+        'net.nf',
+        'other.nf',
+        'per.nf',
+        'rec.nf',
+        'store.nf',
+        'web.nf',
+        'nfl',
+        'ng',
+        'com.ng',
+        'edu.ng',
+        'gov.ng',
+        'i.ng',
+        'mil.ng',
+        'mobi.ng',
+        'name.ng',
+        'net.ng',
+        'org.ng',
+        'sch.ng',
+        'ngo',
+        'nhk',
+        'ni',
+        'ac.ni',
+        'biz.ni',
+        'co.ni',
+        'com.ni',
+        'edu.ni',
+        'gob.ni',
+        'in.ni',
+        'info.ni',
+        'int.ni',
+        'mil.ni',
+        'net.ni',
+        'nom.ni',
+        'org.ni',
+        'web.ni',
+        'nico',
+        'nike',
+        'nikon',
+        'ninja',
+        'nissan',
+        'nissay',
+        'nl',
+        'no',
+        'aa.no',
+        'gs.aa.no',
+        'aarborte.no',
+        'aejrie.no',
+        'afjord.no',
+        'agdenes.no',
+        'ah.no',
+        'gs.ah.no',
+        'nes.akershus.no',
+        'aknoluokta.no',
+        'akrehamn.no',
+        'al.no',
+        'alaheadju.no',
+        'alesund.no',
+        'algard.no',
+        'alstahaug.no',
+        'alta.no',
+        'alvdal.no',
+        'amli.no',
+        'amot.no',
+        'andasuolo.no',
+        'andebu.no',
+        'andoy.no',
+        'ardal.no',
+        'aremark.no',
+        'arendal.no',
+        'arna.no',
+        'aseral.no',
+        'asker.no',
+        'askim.no',
+        'askoy.no',
+        'askvoll.no',
+        'asnes.no',
+        'audnedaln.no',
+        'aukra.no',
+        'aure.no',
+        'aurland.no',
+        'aurskog-holand.no',
+        'austevoll.no',
+        'austrheim.no',
+        'averoy.no',
+        'badaddja.no',
+        'bahcavuotna.no',
+        'bahccavuotna.no',
+        'baidar.no',
+        'bajddar.no',
+        'balat.no',
+        'balestrand.no',
+        'ballangen.no',
+        'balsfjord.no',
+        'bamble.no',
+        'bardu.no',
+        'barum.no',
+        'batsfjord.no',
+        'bearalvahki.no',
+        'beardu.no',
+        'beiarn.no',
+        'berg.no',
+        'bergen.no',
+        'berlevag.no',
+        'bievat.no',
+        'bindal.no',
+        'birkenes.no',
+        'bjarkoy.no',
+        'bjerkreim.no',
+        'bjugn.no',
+        'bodo.no',
+        'bokn.no',
+        'bomlo.no',
+        'bremanger.no',
+        'bronnoy.no',
+        'bronnoysund.no',
+        'brumunddal.no',
+        'bryne.no',
+        'bu.no',
+        'gs.bu.no',
+        'budejju.no',
+        'nes.buskerud.no',
+        'bygland.no',
+        'bykle.no',
+        'cahcesuolo.no',
+        'davvenjarga.no',
+        'davvesiida.no',
+        'deatnu.no',
+        'dep.no',
+        'dielddanuorri.no',
+        'divtasvuodna.no',
+        'divttasvuotna.no',
+        'donna.no',
+        'dovre.no',
+        'drammen.no',
+        'drangedal.no',
+        'drobak.no',
+        'dyroy.no',
+        'egersund.no',
+        'eid.no',
+        'eidfjord.no',
+        'eidsberg.no',
+        'eidskog.no',
+        'eidsvoll.no',
+        'eigersund.no',
+        'elverum.no',
+        'enebakk.no',
+        'engerdal.no',
+        'etne.no',
+        'etnedal.no',
+        'evenassi.no',
+        'evenes.no',
+        'evje-og-hornnes.no',
+        'farsund.no',
+        'fauske.no',
+        'fedje.no',
+        'fet.no',
+        'fetsund.no',
+        'fhs.no',
+        'finnoy.no',
+        'fitjar.no',
+        'fjaler.no',
+        'fjell.no',
+        'fla.no',
+        'flakstad.no',
+        'flatanger.no',
+        'flekkefjord.no',
+        'flesberg.no',
+        'flora.no',
+        'floro.no',
+        'fm.no',
+        'gs.fm.no',
+        'folkebibl.no',
+        'folldal.no',
+        'forde.no',
+        'forsand.no',
+        'fosnes.no',
+        'frana.no',
+        'fredrikstad.no',
+        'frei.no',
+        'frogn.no',
+        'froland.no',
+        'frosta.no',
+        'froya.no',
+        'fuoisku.no',
+        'fuossko.no',
+        'fusa.no',
+        'fylkesbibl.no',
+        'fyresdal.no',
+        'gaivuotna.no',
+        'galsa.no',
+        'gamvik.no',
+        'gangaviika.no',
+        'gaular.no',
+        'gausdal.no',
+        'giehtavuoatna.no',
+        'gildeskal.no',
+        'giske.no',
+        'gjemnes.no',
+        'gjerdrum.no',
+        'gjerstad.no',
+        'gjesdal.no',
+        'gjovik.no',
+        'gloppen.no',
+        'gol.no',
+        'gran.no',
+        'grane.no',
+        'granvin.no',
+        'gratangen.no',
+        'grimstad.no',
+        'grong.no',
+        'grue.no',
+        'gulen.no',
+        'guovdageaidnu.no',
+        'ha.no',
+        'habmer.no',
+        'hadsel.no',
+        'hagebostad.no',
+        'halden.no',
+        'halsa.no',
+        'hamar.no',
+        'hamaroy.no',
+        'hammarfeasta.no',
+        'hammerfest.no',
+        'hapmir.no',
+        'haram.no',
+        'hareid.no',
+        'harstad.no',
+        'hasvik.no',
+        'hattfjelldal.no',
+        'haugesund.no',
+        'os.hedmark.no',
+        'valer.hedmark.no',
+        'xn--vler-qoa.hedmark.no',
+        'hemne.no',
+        'hemnes.no',
+        'hemsedal.no',
+        'herad.no',
+        'hitra.no',
+        'hjartdal.no',
+        'hjelmeland.no',
+        'hl.no',
+        'gs.hl.no',
+        'hm.no',
+        'gs.hm.no',
+        'hobol.no',
+        'hof.no',
+        'hokksund.no',
+        'hol.no',
+        'hole.no',
+        'holmestrand.no',
+        'holtalen.no',
+        'honefoss.no',
+        'os.hordaland.no',
+        'hornindal.no',
+        'horten.no',
+        'hoyanger.no',
+        'hoylandet.no',
+        'hurdal.no',
+        'hurum.no',
+        'hvaler.no',
+        'hyllestad.no',
+        'ibestad.no',
+        'idrett.no',
+        'inderoy.no',
+        'iveland.no',
+        'ivgu.no',
+        'jan-mayen.no',
+        'gs.jan-mayen.no',
+        'jessheim.no',
+        'jevnaker.no',
+        'jolster.no',
+        'jondal.no',
+        'jorpeland.no',
+        'kafjord.no',
+        'karasjohka.no',
+        'karasjok.no',
+        'karlsoy.no',
+        'karmoy.no',
+        'kautokeino.no',
+        'kirkenes.no',
+        'klabu.no',
+        'klepp.no',
+        'kommune.no',
+        'kongsberg.no',
+        'kongsvinger.no',
+        'kopervik.no',
+        'kraanghke.no',
+        'kragero.no',
+        'kristiansand.no',
+        'kristiansund.no',
+        'krodsherad.no',
+        'krokstadelva.no',
+        'kvafjord.no',
+        'kvalsund.no',
+        'kvam.no',
+        'kvanangen.no',
+        'kvinesdal.no',
+        'kvinnherad.no',
+        'kviteseid.no',
+        'kvitsoy.no',
+        'laakesvuemie.no',
+        'lahppi.no',
+        'langevag.no',
+        'lardal.no',
+        'larvik.no',
+        'lavagis.no',
+        'lavangen.no',
+        'leangaviika.no',
+        'lebesby.no',
+        'leikanger.no',
+        'leirfjord.no',
+        'leirvik.no',
+        'leka.no',
+        'leksvik.no',
+        'lenvik.no',
+        'lerdal.no',
+        'lesja.no',
+        'levanger.no',
+        'lier.no',
+        'lierne.no',
+        'lillehammer.no',
+        'lillesand.no',
+        'lindas.no',
+        'lindesnes.no',
+        'loabat.no',
+        'lodingen.no',
+        'lom.no',
+        'loppa.no',
+        'lorenskog.no',
+        'loten.no',
+        'lund.no',
+        'lunner.no',
+        'luroy.no',
+        'luster.no',
+        'lyngdal.no',
+        'lyngen.no',
+        'malatvuopmi.no',
+        'malselv.no',
+        'malvik.no',
+        'mandal.no',
+        'marker.no',
+        'marnardal.no',
+        'masfjorden.no',
+        'masoy.no',
+        'matta-varjjat.no',
+        'meland.no',
+        'meldal.no',
+        'melhus.no',
+        'meloy.no',
+        'meraker.no',
+        'midsund.no',
+        'midtre-gauldal.no',
+        'mil.no',
+        'mjondalen.no',
+        'mo-i-rana.no',
+        'moareke.no',
+        'modalen.no',
+        'modum.no',
+        'molde.no',
+        'heroy.more-og-romsdal.no',
+        'sande.more-og-romsdal.no',
+        'mosjoen.no',
+        'moskenes.no',
+        'moss.no',
+        'mosvik.no',
+        'mr.no',
+        'gs.mr.no',
+        'muosat.no',
+        'museum.no',
+        'naamesjevuemie.no',
+        'namdalseid.no',
+        'namsos.no',
+        'namsskogan.no',
+        'nannestad.no',
+        'naroy.no',
+        'narviika.no',
+        'narvik.no',
+        'naustdal.no',
+        'navuotna.no',
+        'nedre-eiker.no',
+        'nesna.no',
+        'nesodden.no',
+        'nesoddtangen.no',
+        'nesseby.no',
+        'nesset.no',
+        'nissedal.no',
+        'nittedal.no',
+        'nl.no',
+        'gs.nl.no',
+        'nord-aurdal.no',
+        'nord-fron.no',
+        'nord-odal.no',
+        'norddal.no',
+        'nordkapp.no',
+        'bo.nordland.no',
+        'heroy.nordland.no',
+        'xn--b-5ga.nordland.no',
+        'xn--hery-ira.nordland.no',
+        'nordre-land.no',
+        'nordreisa.no',
+        'nore-og-uvdal.no',
+        'notodden.no',
+        'notteroy.no',
+        'nt.no',
+        'gs.nt.no',
+        'odda.no',
+        'of.no',
+        'gs.of.no',
+        'oksnes.no',
+        'ol.no',
+        'gs.ol.no',
+        'omasvuotna.no',
+        'oppdal.no',
+        'oppegard.no',
+        'orkanger.no',
+        'orkdal.no',
+        'orland.no',
+        'orskog.no',
+        'orsta.no',
+        'osen.no',
+        'oslo.no',
+        'gs.oslo.no',
+        'osoyro.no',
+        'osteroy.no',
+        'valer.ostfold.no',
+        'ostre-toten.no',
+        'overhalla.no',
+        'ovre-eiker.no',
+        'oyer.no',
+        'oygarden.no',
+        'oystre-slidre.no',
+        'porsanger.no',
+        'porsangu.no',
+        'porsgrunn.no',
+        'priv.no',
+        'rade.no',
+        'radoy.no',
+        'rahkkeravju.no',
+        'raholt.no',
+        'raisa.no',
+        'rakkestad.no',
+        'ralingen.no',
+        'rana.no',
+        'randaberg.no',
+        'rauma.no',
+        'rendalen.no',
+        'rennebu.no',
+        'rennesoy.no',
+        'rindal.no',
+        'ringebu.no',
+        'ringerike.no',
+        'ringsaker.no',
+        'risor.no',
+        'rissa.no',
+        'rl.no',
+        'gs.rl.no',
+        'roan.no',
+        'rodoy.no',
+        'rollag.no',
+        'romsa.no',
+        'romskog.no',
+        'roros.no',
+        'rost.no',
+        'royken.no',
+        'royrvik.no',
+        'ruovat.no',
+        'rygge.no',
+        'salangen.no',
+        'salat.no',
+        'saltdal.no',
+        'samnanger.no',
+        'sandefjord.no',
+        'sandnes.no',
+        'sandnessjoen.no',
+        'sandoy.no',
+        'sarpsborg.no',
+        'sauda.no',
+        'sauherad.no',
+        'sel.no',
+        'selbu.no',
+        'selje.no',
+        'seljord.no',
+        'sf.no',
+        'gs.sf.no',
+        'siellak.no',
+        'sigdal.no',
+        'siljan.no',
+        'sirdal.no',
+        'skanit.no',
+        'skanland.no',
+        'skaun.no',
+        'skedsmo.no',
+        'skedsmokorset.no',
+        'ski.no',
+        'skien.no',
+        'skierva.no',
+        'skiptvet.no',
+        'skjak.no',
+        'skjervoy.no',
+        'skodje.no',
+        'slattum.no',
+        'smola.no',
+        'snaase.no',
+        'snasa.no',
+        'snillfjord.no',
+        'snoasa.no',
+        'sogndal.no',
+        'sogne.no',
+        'sokndal.no',
+        'sola.no',
+        'solund.no',
+        'somna.no',
+        'sondre-land.no',
+        'songdalen.no',
+        'sor-aurdal.no',
+        'sor-fron.no',
+        'sor-odal.no',
+        'sor-varanger.no',
+        'sorfold.no',
+        'sorreisa.no',
+        'sortland.no',
+        'sorum.no',
+        'spjelkavik.no',
+        'spydeberg.no',
+        'st.no',
+        'gs.st.no',
+        'stange.no',
+        'stat.no',
+        'stathelle.no',
+        'stavanger.no',
+        'stavern.no',
+        'steigen.no',
+        'steinkjer.no',
+        'stjordal.no',
+        'stjordalshalsen.no',
+        'stokke.no',
+        'stor-elvdal.no',
+        'stord.no',
+        'stordal.no',
+        'storfjord.no',
+        'strand.no',
+        'stranda.no',
+        'stryn.no',
+        'sula.no',
+        'suldal.no',
+        'sund.no',
+        'sunndal.no',
+        'surnadal.no',
+        'svalbard.no',
+        'gs.svalbard.no',
+        'sveio.no',
+        'svelvik.no',
+        'sykkylven.no',
+        'tana.no',
+        'tananger.no',
+        'bo.telemark.no',
+        'xn--b-5ga.telemark.no',
+        'time.no',
+        'tingvoll.no',
+        'tinn.no',
+        'tjeldsund.no',
+        'tjome.no',
+        'tm.no',
+        'gs.tm.no',
+        'tokke.no',
+        'tolga.no',
+        'tonsberg.no',
+        'torsken.no',
+        'tr.no',
+        'gs.tr.no',
+        'trana.no',
+        'tranby.no',
+        'tranoy.no',
+        'troandin.no',
+        'trogstad.no',
+        'tromsa.no',
+        'tromso.no',
+        'trondheim.no',
+        'trysil.no',
+        'tvedestrand.no',
+        'tydal.no',
+        'tynset.no',
+        'tysfjord.no',
+        'tysnes.no',
+        'tysvar.no',
+        'ullensaker.no',
+        'ullensvang.no',
+        'ulvik.no',
+        'unjarga.no',
+        'utsira.no',
+        'va.no',
+        'gs.va.no',
+        'vaapste.no',
+        'vadso.no',
+        'vaga.no',
+        'vagan.no',
+        'vagsoy.no',
+        'vaksdal.no',
+        'valle.no',
+        'vang.no',
+        'vanylven.no',
+        'vardo.no',
+        'varggat.no',
+        'varoy.no',
+        'vefsn.no',
+        'vega.no',
+        'vegarshei.no',
+        'vennesla.no',
+        'verdal.no',
+        'verran.no',
+        'vestby.no',
+        'sande.vestfold.no',
+        'vestnes.no',
+        'vestre-slidre.no',
+        'vestre-toten.no',
+        'vestvagoy.no',
+        'vevelstad.no',
+        'vf.no',
+        'gs.vf.no',
+        'vgs.no',
+        'vik.no',
+        'vikna.no',
+        'vindafjord.no',
+        'voagat.no',
+        'volda.no',
+        'voss.no',
+        'vossevangen.no',
+        'xn--andy-ira.no',
+        'xn--asky-ira.no',
+        'xn--aurskog-hland-jnb.no',
+        'xn--avery-yua.no',
+        'xn--bdddj-mrabd.no',
+        'xn--bearalvhki-y4a.no',
+        'xn--berlevg-jxa.no',
+        'xn--bhcavuotna-s4a.no',
+        'xn--bhccavuotna-k7a.no',
+        'xn--bidr-5nac.no',
+        'xn--bievt-0qa.no',
+        'xn--bjarky-fya.no',
+        'xn--bjddar-pta.no',
+        'xn--blt-elab.no',
+        'xn--bmlo-gra.no',
+        'xn--bod-2na.no',
+        'xn--brnny-wuac.no',
+        'xn--brnnysund-m8ac.no',
+        'xn--brum-voa.no',
+        'xn--btsfjord-9za.no',
+        'xn--davvenjrga-y4a.no',
+        'xn--dnna-gra.no',
+        'xn--drbak-wua.no',
+        'xn--dyry-ira.no',
+        'xn--eveni-0qa01ga.no',
+        'xn--finny-yua.no',
+        'xn--fjord-lra.no',
+        'xn--fl-zia.no',
+        'xn--flor-jra.no',
+        'xn--frde-gra.no',
+        'xn--frna-woa.no',
+        'xn--frya-hra.no',
+        'xn--ggaviika-8ya47h.no',
+        'xn--gildeskl-g0a.no',
+        'xn--givuotna-8ya.no',
+        'xn--gjvik-wua.no',
+        'xn--gls-elac.no',
+        'xn--h-2fa.no',
+        'xn--hbmer-xqa.no',
+        'xn--hcesuolo-7ya35b.no',
+        'xn--hgebostad-g3a.no',
+        'xn--hmmrfeasta-s4ac.no',
+        'xn--hnefoss-q1a.no',
+        'xn--hobl-ira.no',
+        'xn--holtlen-hxa.no',
+        'xn--hpmir-xqa.no',
+        'xn--hyanger-q1a.no',
+        'xn--hylandet-54a.no',
+        'xn--indery-fya.no',
+        'xn--jlster-bya.no',
+        'xn--jrpeland-54a.no',
+        'xn--karmy-yua.no',
+        'xn--kfjord-iua.no',
+        'xn--klbu-woa.no',
+        'xn--koluokta-7ya57h.no',
+        'xn--krager-gya.no',
+        'xn--kranghke-b0a.no',
+        'xn--krdsherad-m8a.no',
+        'xn--krehamn-dxa.no',
+        'xn--krjohka-hwab49j.no',
+        'xn--ksnes-uua.no',
+        'xn--kvfjord-nxa.no',
+        'xn--kvitsy-fya.no',
+        'xn--kvnangen-k0a.no',
+        'xn--l-1fa.no',
+        'xn--laheadju-7ya.no',
+        'xn--langevg-jxa.no',
+        'xn--ldingen-q1a.no',
+        'xn--leagaviika-52b.no',
+        'xn--lesund-hua.no',
+        'xn--lgrd-poac.no',
+        'xn--lhppi-xqa.no',
+        'xn--linds-pra.no',
+        'xn--loabt-0qa.no',
+        'xn--lrdal-sra.no',
+        'xn--lrenskog-54a.no',
+        'xn--lt-liac.no',
+        'xn--lten-gra.no',
+        'xn--lury-ira.no',
+        'xn--mely-ira.no',
+        'xn--merker-kua.no',
+        'xn--mjndalen-64a.no',
+        'xn--mlatvuopmi-s4a.no',
+        'xn--mli-tla.no',
+        'xn--mlselv-iua.no',
+        'xn--moreke-jua.no',
+        'xn--mosjen-eya.no',
+        'xn--mot-tla.no',
+        'sande.xn--mre-og-romsdal-qqb.no',
+        'xn--hery-ira.xn--mre-og-romsdal-qqb.no',
+        'xn--msy-ula0h.no',
+        'xn--mtta-vrjjat-k7af.no',
+        'xn--muost-0qa.no',
+        'xn--nmesjevuemie-tcba.no',
+        'xn--nry-yla5g.no',
+        'xn--nttery-byae.no',
+        'xn--nvuotna-hwa.no',
+        'xn--oppegrd-ixa.no',
+        'xn--ostery-fya.no',
+        'xn--osyro-wua.no',
+        'xn--porsgu-sta26f.no',
+        'xn--rady-ira.no',
+        'xn--rdal-poa.no',
+        'xn--rde-ula.no',
+        'xn--rdy-0nab.no',
+        'xn--rennesy-v1a.no',
+        'xn--rhkkervju-01af.no',
+        'xn--rholt-mra.no',
+        'xn--risa-5na.no',
+        'xn--risr-ira.no',
+        'xn--rland-uua.no',
+        'xn--rlingen-mxa.no',
+        'xn--rmskog-bya.no',
+        'xn--rros-gra.no',
+        'xn--rskog-uua.no',
+        'xn--rst-0na.no',
+        'xn--rsta-fra.no',
+        'xn--ryken-vua.no',
+        'xn--ryrvik-bya.no',
+        'xn--s-1fa.no',
+        'xn--sandnessjen-ogb.no',
+        'xn--sandy-yua.no',
+        'xn--seral-lra.no',
+        'xn--sgne-gra.no',
+        'xn--skierv-uta.no',
+        'xn--skjervy-v1a.no',
+        'xn--skjk-soa.no',
+        'xn--sknit-yqa.no',
+        'xn--sknland-fxa.no',
+        'xn--slat-5na.no',
+        'xn--slt-elab.no',
+        'xn--smla-hra.no',
+        'xn--smna-gra.no',
+        'xn--snase-nra.no',
+        'xn--sndre-land-0cb.no',
+        'xn--snes-poa.no',
+        'xn--snsa-roa.no',
+        'xn--sr-aurdal-l8a.no',
+        'xn--sr-fron-q1a.no',
+        'xn--sr-odal-q1a.no',
+        'xn--sr-varanger-ggb.no',
+        'xn--srfold-bya.no',
+        'xn--srreisa-q1a.no',
+        'xn--srum-gra.no',
+        'xn--vler-qoa.xn--stfold-9xa.no',
+        'xn--stjrdal-s1a.no',
+        'xn--stjrdalshalsen-sqb.no',
+        'xn--stre-toten-zcb.no',
+        'xn--tjme-hra.no',
+        'xn--tnsberg-q1a.no',
+        'xn--trany-yua.no',
+        'xn--trgstad-r1a.no',
+        'xn--trna-woa.no',
+        'xn--troms-zua.no',
+        'xn--tysvr-vra.no',
+        'xn--unjrga-rta.no',
+        'xn--vads-jra.no',
+        'xn--vard-jra.no',
+        'xn--vegrshei-c0a.no',
+        'xn--vestvgy-ixa6o.no',
+        'xn--vg-yiab.no',
+        'xn--vgan-qoa.no',
+        'xn--vgsy-qoa0j.no',
+        'xn--vre-eiker-k8a.no',
+        'xn--vrggt-xqad.no',
+        'xn--vry-yla5g.no',
+        'xn--yer-zna.no',
+        'xn--ygarden-p1a.no',
+        'xn--ystre-slidre-ujb.no',
+        'nokia',
+        'northwesternmutual',
+        'norton',
+        'now',
+        'nowruz',
+        'nowtv',
+        '*.np',
+        'nr',
+        'biz.nr',
+        'com.nr',
+        'edu.nr',
+        'gov.nr',
+        'info.nr',
+        'net.nr',
+        'org.nr',
+        'nra',
+        'nrw',
+        'ntt',
+        'nu',
+        'nyc',
+        'nz',
+        'ac.nz',
+        'co.nz',
+        'cri.nz',
+        'geek.nz',
+        'gen.nz',
+        'govt.nz',
+        'health.nz',
+        'iwi.nz',
+        'kiwi.nz',
+        'maori.nz',
+        'mil.nz',
+        'net.nz',
+        'org.nz',
+        'parliament.nz',
+        'school.nz',
+        'xn--mori-qsa.nz',
+        'obi',
+        'observer',
+        'office',
+        'okinawa',
+        'olayan',
+        'olayangroup',
+        'oldnavy',
+        'ollo',
+        'om',
+        'co.om',
+        'com.om',
+        'edu.om',
+        'gov.om',
+        'med.om',
+        'museum.om',
+        'net.om',
+        'org.om',
+        'pro.om',
+        'omega',
+        'one',
+        'ong',
+        'onion',
+        'onl',
+        'online',
+        'ooo',
+        'open',
+        'oracle',
+        'orange',
+        'org',
+        'organic',
+        'origins',
+        'osaka',
+        'otsuka',
+        'ott',
+        'ovh',
+        'pa',
+        'abo.pa',
+        'ac.pa',
+        'com.pa',
+        'edu.pa',
+        'gob.pa',
+        'ing.pa',
+        'med.pa',
+        'net.pa',
+        'nom.pa',
+        'org.pa',
+        'sld.pa',
+        'page',
+        'panasonic',
+        'paris',
+        'pars',
+        'partners',
+        'parts',
+        'party',
+        'passagens',
+        'pay',
+        'pccw',
+        'pe',
+        'com.pe',
+        'edu.pe',
+        'gob.pe',
+        'mil.pe',
+        'net.pe',
+        'nom.pe',
+        'org.pe',
+        'pet',
+        'pf',
+        'com.pf',
+        'edu.pf',
+        'org.pf',
+        'pfizer',
+        '*.pg',
+        'ph',
+        'com.ph',
+        'edu.ph',
+        'gov.ph',
+        'i.ph',
+        'mil.ph',
+        'net.ph',
+        'ngo.ph',
+        'org.ph',
+        'pharmacy',
+        'phd',
+        'philips',
+        'phone',
+        'photo',
+        'photography',
+        'photos',
+        'physio',
+        'pics',
+        'pictet',
+        'pictures',
+        'pid',
+        'pin',
+        'ping',
+        'pink',
+        'pioneer',
+        'pizza',
+        'pk',
+        'biz.pk',
+        'com.pk',
+        'edu.pk',
+        'fam.pk',
+        'gob.pk',
+        'gok.pk',
+        'gon.pk',
+        'gop.pk',
+        'gos.pk',
+        'gov.pk',
+        'info.pk',
+        'net.pk',
+        'org.pk',
+        'web.pk',
+        'pl',
+        'agro.pl',
+        'aid.pl',
+        'atm.pl',
+        'augustow.pl',
+        'auto.pl',
+        'babia-gora.pl',
+        'bedzin.pl',
+        'beskidy.pl',
+        'bialowieza.pl',
+        'bialystok.pl',
+        'bielawa.pl',
+        'bieszczady.pl',
+        'biz.pl',
+        'boleslawiec.pl',
+        'bydgoszcz.pl',
+        'bytom.pl',
+        'cieszyn.pl',
+        'com.pl',
+        'czeladz.pl',
+        'czest.pl',
+        'dlugoleka.pl',
+        'edu.pl',
+        'elblag.pl',
+        'elk.pl',
+        'glogow.pl',
+        'gmina.pl',
+        'gniezno.pl',
+        'gorlice.pl',
+        'gov.pl',
+        'ap.gov.pl',
+        'griw.gov.pl',
+        'ic.gov.pl',
+        'is.gov.pl',
+        'kmpsp.gov.pl',
+        'konsulat.gov.pl',
+        'kppsp.gov.pl',
+        'kwp.gov.pl',
+        'kwpsp.gov.pl',
+        'mup.gov.pl',
+        'mw.gov.pl',
+        'oirm.gov.pl',
+        'oum.gov.pl',
+        'pa.gov.pl',
+        'pinb.gov.pl',
+        'piw.gov.pl',
+        'po.gov.pl',
+        'psp.gov.pl',
+        'psse.gov.pl',
+        'pup.gov.pl',
+        'rzgw.gov.pl',
+        'sa.gov.pl',
+        'sdn.gov.pl',
+        'sko.gov.pl',
+        'so.gov.pl',
+        'sr.gov.pl',
+        'starostwo.gov.pl',
+        'ug.gov.pl',
+        'ugim.gov.pl',
+        'um.gov.pl',
+        'umig.gov.pl',
+        'upow.gov.pl',
+        'uppo.gov.pl',
+        'us.gov.pl',
+        'uw.gov.pl',
+        'uzs.gov.pl',
+        'wif.gov.pl',
+        'wiih.gov.pl',
+        'winb.gov.pl',
+        'wios.gov.pl',
+        'witd.gov.pl',
+        'wiw.gov.pl',
+        'wsa.gov.pl',
+        'wskr.gov.pl',
+        'wuoz.gov.pl',
+        'wzmiuw.gov.pl',
+        'zp.gov.pl',
+        'grajewo.pl',
+        'gsm.pl',
+        'ilawa.pl',
+        'info.pl',
+        'jaworzno.pl',
+        'jelenia-gora.pl',
+        'jgora.pl',
+        'kalisz.pl',
+        'karpacz.pl',
+        'kartuzy.pl',
+        'kaszuby.pl',
+        'katowice.pl',
+        'kazimierz-dolny.pl',
+        'kepno.pl',
+        'ketrzyn.pl',
+        'klodzko.pl',
+        'kobierzyce.pl',
+        'kolobrzeg.pl',
+        'konin.pl',
+        'konskowola.pl',
+        'kutno.pl',
+        'lapy.pl',
+        'lebork.pl',
+        'legnica.pl',
+        'lezajsk.pl',
+        'limanowa.pl',
+        'lomza.pl',
+        'lowicz.pl',
+        'lubin.pl',
+        'lukow.pl',
+        'mail.pl',
+        'malbork.pl',
+        'malopolska.pl',
+        'mazowsze.pl',
+        'mazury.pl',
+        'media.pl',
+        'miasta.pl',
+        'mielec.pl',
+        'mielno.pl',
+        'mil.pl',
+        'mragowo.pl',
+        'naklo.pl',
+        'net.pl',
+        'nieruchomosci.pl',
+        'nom.pl',
+        'nowaruda.pl',
+        'nysa.pl',
+        'olawa.pl',
+        'olecko.pl',
+        'olkusz.pl',
+        'olsztyn.pl',
+        'opoczno.pl',
+        'opole.pl',
+        'org.pl',
+        'ostroda.pl',
+        'ostroleka.pl',
+        'ostrowiec.pl',
+        'ostrowwlkp.pl',
+        'pc.pl',
+        'pila.pl',
+        'pisz.pl',
+        'podhale.pl',
+        'podlasie.pl',
+        'polkowice.pl',
+        'pomorskie.pl',
+        'pomorze.pl',
+        'powiat.pl',
+        'priv.pl',
+        'prochowice.pl',
+        'pruszkow.pl',
+        'przeworsk.pl',
+        'pulawy.pl',
+        'radom.pl',
+        'rawa-maz.pl',
+        'realestate.pl',
+        'rel.pl',
+        'rybnik.pl',
+        'rzeszow.pl',
+        'sanok.pl',
+        'sejny.pl',
+        'sex.pl',
+        'shop.pl',
+        'sklep.pl',
+        'skoczow.pl',
+        'slask.pl',
+        'slupsk.pl',
+        'sos.pl',
+        'sosnowiec.pl',
+        'stalowa-wola.pl',
+        'starachowice.pl',
+        'stargard.pl',
+        'suwalki.pl',
+        'swidnica.pl',
+        'swiebodzin.pl',
+        'swinoujscie.pl',
+        'szczecin.pl',
+        'szczytno.pl',
+        'szkola.pl',
+        'targi.pl',
+        'tarnobrzeg.pl',
+        'tgory.pl',
+        'tm.pl',
+        'tourism.pl',
+        'travel.pl',
+        'turek.pl',
+        'turystyka.pl',
+        'tychy.pl',
+        'ustka.pl',
+        'walbrzych.pl',
+        'warmia.pl',
+        'warszawa.pl',
+        'waw.pl',
+        'wegrow.pl',
+        'wielun.pl',
+        'wlocl.pl',
+        'wloclawek.pl',
+        'wodzislaw.pl',
+        'wolomin.pl',
+        'wroclaw.pl',
+        'zachpomor.pl',
+        'zagan.pl',
+        'zarow.pl',
+        'zgora.pl',
+        'zgorzelec.pl',
+        'place',
+        'play',
+        'playstation',
+        'plumbing',
+        'plus',
+        'pm',
+        'pn',
+        'co.pn',
+        'edu.pn',
+        'gov.pn',
+        'net.pn',
+        'org.pn',
+        'pnc',
+        'pohl',
+        'poker',
+        'politie',
+        'porn',
+        'post',
+        'pr',
+        'ac.pr',
+        'biz.pr',
+        'com.pr',
+        'edu.pr',
+        'est.pr',
+        'gov.pr',
+        'info.pr',
+        'isla.pr',
+        'name.pr',
+        'net.pr',
+        'org.pr',
+        'pro.pr',
+        'prof.pr',
+        'pramerica',
+        'praxi',
+        'press',
+        'prime',
+        'pro',
+        'aaa.pro',
+        'aca.pro',
+        'acct.pro',
+        'avocat.pro',
+        'bar.pro',
+        'cpa.pro',
+        'eng.pro',
+        'jur.pro',
+        'law.pro',
+        'med.pro',
+        'recht.pro',
+        'prod',
+        'productions',
+        'prof',
+        'progressive',
+        'promo',
+        'properties',
+        'property',
+        'protection',
+        'pru',
+        'prudential',
+        'ps',
+        'com.ps',
+        'edu.ps',
+        'gov.ps',
+        'net.ps',
+        'org.ps',
+        'plo.ps',
+        'sec.ps',
+        'pt',
+        'com.pt',
+        'edu.pt',
+        'gov.pt',
+        'int.pt',
+        'net.pt',
+        'nome.pt',
+        'org.pt',
+        'publ.pt',
+        'pub',
+        'pw',
+        'belau.pw',
+        'co.pw',
+        'ed.pw',
+        'go.pw',
+        'ne.pw',
+        'or.pw',
+        'pwc',
+        'py',
+        'com.py',
+        'coop.py',
+        'edu.py',
+        'gov.py',
+        'mil.py',
+        'net.py',
+        'org.py',
+        'qa',
+        'com.qa',
+        'edu.qa',
+        'gov.qa',
+        'mil.qa',
+        'name.qa',
+        'net.qa',
+        'org.qa',
+        'sch.qa',
+        'qpon',
+        'quebec',
+        'quest',
+        'racing',
+        'radio',
+        're',
+        'asso.re',
+        'com.re',
+        'nom.re',
+        'read',
+        'realestate',
+        'realtor',
+        'realty',
+        'recipes',
+        'red',
+        'redstone',
+        'redumbrella',
+        'rehab',
+        'reise',
+        'reisen',
+        'reit',
+        'reliance',
+        'ren',
+        'rent',
+        'rentals',
+        'repair',
+        'report',
+        'republican',
+        'rest',
+        'restaurant',
+        'review',
+        'reviews',
+        'rexroth',
+        'rich',
+        'richardli',
+        'ricoh',
+        'ril',
+        'rio',
+        'rip',
+        'ro',
+        'arts.ro',
+        'com.ro',
+        'firm.ro',
+        'info.ro',
+        'nom.ro',
+        'nt.ro',
+        'org.ro',
+        'rec.ro',
+        'store.ro',
+        'tm.ro',
+        'www.ro',
+        'rocher',
+        'rocks',
+        'rodeo',
+        'rogers',
+        'room',
+        'rs',
+        'ac.rs',
+        'co.rs',
+        'edu.rs',
+        'gov.rs',
+        'in.rs',
+        'org.rs',
+        'rsvp',
+        'ru',
+        'rugby',
+        'ruhr',
+        'run',
+        'rw',
+        'ac.rw',
+        'co.rw',
+        'coop.rw',
+        'gov.rw',
+        'mil.rw',
+        'net.rw',
+        'org.rw',
+        'rwe',
+        'ryukyu',
+        'sa',
+        'com.sa',
+        'edu.sa',
+        'gov.sa',
+        'med.sa',
+        'net.sa',
+        'org.sa',
+        'pub.sa',
+        'sch.sa',
+        'saarland',
+        'safe',
+        'safety',
+        'sakura',
+        'sale',
+        'salon',
+        'samsclub',
+        'samsung',
+        'sandvik',
+        'sandvikcoromant',
+        'sanofi',
+        'sap',
+        'sarl',
+        'sas',
+        'save',
+        'saxo',
+        'sb',
+        'com.sb',
+        'edu.sb',
+        'gov.sb',
+        'net.sb',
+        'org.sb',
+        'sbi',
+        'sbs',
+        'sc',
+        'com.sc',
+        'edu.sc',
+        'gov.sc',
+        'net.sc',
+        'org.sc',
+        'sca',
+        'scb',
+        'schaeffler',
+        'schmidt',
+        'scholarships',
+        'school',
+        'schule',
+        'schwarz',
+        'science',
+        'scot',
+        'sd',
+        'com.sd',
+        'edu.sd',
+        'gov.sd',
+        'info.sd',
+        'med.sd',
+        'net.sd',
+        'org.sd',
+        'tv.sd',
+        'se',
+        'a.se',
+        'ac.se',
+        'b.se',
+        'bd.se',
+        'brand.se',
+        'c.se',
+        'd.se',
+        'e.se',
+        'f.se',
+        'fh.se',
+        'fhsk.se',
+        'fhv.se',
+        'g.se',
+        'h.se',
+        'i.se',
+        'k.se',
+        'komforb.se',
+        'kommunalforbund.se',
+        'komvux.se',
+        'l.se',
+        'lanbib.se',
+        'm.se',
+        'n.se',
+        'naturbruksgymn.se',
+        'o.se',
+        'org.se',
+        'p.se',
+        'parti.se',
+        'pp.se',
+        'press.se',
+        'r.se',
+        's.se',
+        't.se',
+        'tm.se',
+        'u.se',
+        'w.se',
+        'x.se',
+        'y.se',
+        'z.se',
+        'search',
+        'seat',
+        'secure',
+        'security',
+        'seek',
+        'select',
+        'sener',
+        'services',
+        'ses',
+        'seven',
+        'sew',
+        'sex',
+        'sexy',
+        'sfr',
+        'sg',
+        'com.sg',
+        'edu.sg',
+        'gov.sg',
+        'net.sg',
+        'org.sg',
+        'per.sg',
+        'sh',
+        'com.sh',
+        'gov.sh',
+        'mil.sh',
+        'net.sh',
+        'org.sh',
+        'shangrila',
+        'sharp',
+        'shaw',
+        'shell',
+        'shia',
+        'shiksha',
+        'shoes',
+        'shop',
+        'shopping',
+        'shouji',
+        'show',
+        'showtime',
+        'si',
+        'silk',
+        'sina',
+        'singles',
+        'site',
+        'sj',
+        'sk',
+        'ski',
+        'skin',
+        'sky',
+        'skype',
+        'sl',
+        'com.sl',
+        'edu.sl',
+        'gov.sl',
+        'net.sl',
+        'org.sl',
+        'sling',
+        'sm',
+        'smart',
+        'smile',
+        'sn',
+        'art.sn',
+        'com.sn',
+        'edu.sn',
+        'gouv.sn',
+        'org.sn',
+        'perso.sn',
+        'univ.sn',
+        'sncf',
+        'so',
+        'com.so',
+        'edu.so',
+        'gov.so',
+        'me.so',
+        'net.so',
+        'org.so',
+        'soccer',
+        'social',
+        'softbank',
+        'software',
+        'sohu',
+        'solar',
+        'solutions',
+        'song',
+        'sony',
+        'soy',
+        'spa',
+        'space',
+        'sport',
+        'spot',
+        'sr',
+        'srl',
+        'ss',
+        'biz.ss',
+        'com.ss',
+        'edu.ss',
+        'gov.ss',
+        'me.ss',
+        'net.ss',
+        'org.ss',
+        'sch.ss',
+        'st',
+        'co.st',
+        'com.st',
+        'consulado.st',
+        'edu.st',
+        'embaixada.st',
+        'mil.st',
+        'net.st',
+        'org.st',
+        'principe.st',
+        'saotome.st',
+        'store.st',
+        'stada',
+        'staples',
+        'star',
+        'statebank',
+        'statefarm',
+        'stc',
+        'stcgroup',
+        'stockholm',
+        'storage',
+        'store',
+        'stream',
+        'studio',
+        'study',
+        'style',
+        'su',
+        'sucks',
+        'supplies',
+        'supply',
+        'support',
+        'surf',
+        'surgery',
+        'suzuki',
+        'sv',
+        'com.sv',
+        'edu.sv',
+        'gob.sv',
+        'org.sv',
+        'red.sv',
+        'swatch',
+        'swiss',
+        'sx',
+        'gov.sx',
+        'sy',
+        'com.sy',
+        'edu.sy',
+        'gov.sy',
+        'mil.sy',
+        'net.sy',
+        'org.sy',
+        'sydney',
+        'systems',
+        'sz',
+        'ac.sz',
+        'co.sz',
+        'org.sz',
+        'tab',
+        'taipei',
+        'talk',
+        'taobao',
+        'target',
+        'tatamotors',
+        'tatar',
+        'tattoo',
+        'tax',
+        'taxi',
+        'tc',
+        'tci',
+        'td',
+        'tdk',
+        'team',
+        'tech',
+        'technology',
+        'tel',
+        'temasek',
+        'tennis',
+        'teva',
+        'tf',
+        'tg',
+        'th',
+        'ac.th',
+        'co.th',
+        'go.th',
+        'in.th',
+        'mi.th',
+        'net.th',
+        'or.th',
+        'thd',
+        'theater',
+        'theatre',
+        'tiaa',
+        'tickets',
+        'tienda',
+        'tiffany',
+        'tips',
+        'tires',
+        'tirol',
+        'tj',
+        'ac.tj',
+        'biz.tj',
+        'co.tj',
+        'com.tj',
+        'edu.tj',
+        'go.tj',
+        'gov.tj',
+        'int.tj',
+        'mil.tj',
+        'name.tj',
+        'net.tj',
+        'nic.tj',
+        'org.tj',
+        'test.tj',
+        'web.tj',
+        'tjmaxx',
+        'tjx',
+        'tk',
+        'tkmaxx',
+        'tl',
+        'gov.tl',
+        'tm',
+        'co.tm',
+        'com.tm',
+        'edu.tm',
+        'gov.tm',
+        'mil.tm',
+        'net.tm',
+        'nom.tm',
+        'org.tm',
+        'tmall',
+        'tn',
+        'com.tn',
+        'ens.tn',
+        'fin.tn',
+        'gov.tn',
+        'ind.tn',
+        'info.tn',
+        'intl.tn',
+        'mincom.tn',
+        'nat.tn',
+        'net.tn',
+        'org.tn',
+        'perso.tn',
+        'tourism.tn',
+        'to',
+        'com.to',
+        'edu.to',
+        'gov.to',
+        'mil.to',
+        'net.to',
+        'org.to',
+        'today',
+        'tokyo',
+        'tools',
+        'top',
+        'toray',
+        'toshiba',
+        'total',
+        'tours',
+        'town',
+        'toyota',
+        'toys',
+        'tr',
+        'av.tr',
+        'bbs.tr',
+        'bel.tr',
+        'biz.tr',
+        'com.tr',
+        'dr.tr',
+        'edu.tr',
+        'gen.tr',
+        'gov.tr',
+        'info.tr',
+        'k12.tr',
+        'kep.tr',
+        'mil.tr',
+        'name.tr',
+        'nc.tr',
+        'gov.nc.tr',
+        'net.tr',
+        'org.tr',
+        'pol.tr',
+        'tel.tr',
+        'tsk.tr',
+        'tv.tr',
+        'web.tr',
+        'trade',
+        'trading',
+        'training',
+        'travel',
+        'travelchannel',
+        'travelers',
+        'travelersinsurance',
+        'trust',
+        'trv',
+        'tt',
+        'aero.tt',
+        'biz.tt',
+        'co.tt',
+        'com.tt',
+        'coop.tt',
+        'edu.tt',
+        'gov.tt',
+        'info.tt',
+        'int.tt',
+        'jobs.tt',
+        'mobi.tt',
+        'museum.tt',
+        'name.tt',
+        'net.tt',
+        'org.tt',
+        'pro.tt',
+        'travel.tt',
+        'tube',
+        'tui',
+        'tunes',
+        'tushu',
+        'tv',
+        'tvs',
+        'tw',
+        'club.tw',
+        'com.tw',
+        'ebiz.tw',
+        'edu.tw',
+        'game.tw',
+        'gov.tw',
+        'idv.tw',
+        'mil.tw',
+        'net.tw',
+        'org.tw',
+        'xn--czrw28b.tw',
+        'xn--uc0atv.tw',
+        'xn--zf0ao64a.tw',
+        'tz',
+        'ac.tz',
+        'co.tz',
+        'go.tz',
+        'hotel.tz',
+        'info.tz',
+        'me.tz',
+        'mil.tz',
+        'mobi.tz',
+        'ne.tz',
+        'or.tz',
+        'sc.tz',
+        'tv.tz',
+        'ua',
+        'cherkassy.ua',
+        'cherkasy.ua',
+        'chernigov.ua',
+        'chernihiv.ua',
+        'chernivtsi.ua',
+        'chernovtsy.ua',
+        'ck.ua',
+        'cn.ua',
+        'com.ua',
+        'cr.ua',
+        'crimea.ua',
+        'cv.ua',
+        'dn.ua',
+        'dnepropetrovsk.ua',
+        'dnipropetrovsk.ua',
+        'donetsk.ua',
+        'dp.ua',
+        'edu.ua',
+        'gov.ua',
+        'if.ua',
+        'in.ua',
+        'ivano-frankivsk.ua',
+        'kh.ua',
+        'kharkiv.ua',
+        'kharkov.ua',
+        'kherson.ua',
+        'khmelnitskiy.ua',
+        'khmelnytskyi.ua',
+        'kiev.ua',
+        'kirovograd.ua',
+        'km.ua',
+        'kr.ua',
+        'krym.ua',
+        'ks.ua',
+        'kv.ua',
+        'kyiv.ua',
+        'lg.ua',
+        'lt.ua',
+        'lugansk.ua',
+        'lutsk.ua',
+        'lv.ua',
+        'lviv.ua',
+        'mk.ua',
+        'mykolaiv.ua',
+        'net.ua',
+        'nikolaev.ua',
+        'od.ua',
+        'odesa.ua',
+        'odessa.ua',
+        'org.ua',
+        'pl.ua',
+        'poltava.ua',
+        'rivne.ua',
+        'rovno.ua',
+        'rv.ua',
+        'sb.ua',
+        'sebastopol.ua',
+        'sevastopol.ua',
+        'sm.ua',
+        'sumy.ua',
+        'te.ua',
+        'ternopil.ua',
+        'uz.ua',
+        'uzhgorod.ua',
+        'vinnica.ua',
+        'vinnytsia.ua',
+        'vn.ua',
+        'volyn.ua',
+        'yalta.ua',
+        'zaporizhzhe.ua',
+        'zaporizhzhia.ua',
+        'zhitomir.ua',
+        'zhytomyr.ua',
+        'zp.ua',
+        'zt.ua',
+        'ubank',
+        'ubs',
+        'ug',
+        'ac.ug',
+        'co.ug',
+        'com.ug',
+        'go.ug',
+        'ne.ug',
+        'or.ug',
+        'org.ug',
+        'sc.ug',
+        'uk',
+        'ac.uk',
+        'co.uk',
+        'gov.uk',
+        'ltd.uk',
+        'me.uk',
+        'net.uk',
+        'nhs.uk',
+        'org.uk',
+        'plc.uk',
+        'police.uk',
+        '*.sch.uk',
+        'unicom',
+        'university',
+        'uno',
+        'uol',
+        'ups',
+        'us',
+        'ak.us',
+        'cc.ak.us',
+        'k12.ak.us',
+        'lib.ak.us',
+        'al.us',
+        'cc.al.us',
+        'k12.al.us',
+        'lib.al.us',
+        'ar.us',
+        'cc.ar.us',
+        'k12.ar.us',
+        'lib.ar.us',
+        'as.us',
+        'cc.as.us',
+        'k12.as.us',
+        'lib.as.us',
+        'az.us',
+        'cc.az.us',
+        'k12.az.us',
+        'lib.az.us',
+        'ca.us',
+        'cc.ca.us',
+        'k12.ca.us',
+        'lib.ca.us',
+        'co.us',
+        'cc.co.us',
+        'k12.co.us',
+        'lib.co.us',
+        'ct.us',
+        'cc.ct.us',
+        'k12.ct.us',
+        'lib.ct.us',
+        'dc.us',
+        'cc.dc.us',
+        'k12.dc.us',
+        'lib.dc.us',
+        'de.us',
+        'cc.de.us',
+        'k12.de.us',
+        'dni.us',
+        'fed.us',
+        'fl.us',
+        'cc.fl.us',
+        'k12.fl.us',
+        'lib.fl.us',
+        'ga.us',
+        'cc.ga.us',
+        'k12.ga.us',
+        'lib.ga.us',
+        'gu.us',
+        'cc.gu.us',
+        'k12.gu.us',
+        'lib.gu.us',
+        'hi.us',
+        'cc.hi.us',
+        'lib.hi.us',
+        'ia.us',
+        'cc.ia.us',
+        'k12.ia.us',
+        'lib.ia.us',
+        'id.us',
+        'cc.id.us',
+        'k12.id.us',
+        'lib.id.us',
+        'il.us',
+        'cc.il.us',
+        'k12.il.us',
+        'lib.il.us',
+        'in.us',
+        'cc.in.us',
+        'k12.in.us',
+        'lib.in.us',
+        'isa.us',
+        'kids.us',
+        'ks.us',
+        'cc.ks.us',
+        'k12.ks.us',
+        'lib.ks.us',
+        'ky.us',
+        'cc.ky.us',
+        'k12.ky.us',
+        'lib.ky.us',
+        'la.us',
+        'cc.la.us',
+        'k12.la.us',
+        'lib.la.us',
+        'ma.us',
+        'cc.ma.us',
+        'k12.ma.us',
+        'chtr.k12.ma.us',
+        'paroch.k12.ma.us',
+        'pvt.k12.ma.us',
+        'lib.ma.us',
+        'md.us',
+        'cc.md.us',
+        'k12.md.us',
+        'lib.md.us',
+        'me.us',
+        'cc.me.us',
+        'k12.me.us',
+        'lib.me.us',
+        'mi.us',
+        'ann-arbor.mi.us',
+        'cc.mi.us',
+        'cog.mi.us',
+        'dst.mi.us',
+        'eaton.mi.us',
+        'gen.mi.us',
+        'k12.mi.us',
+        'lib.mi.us',
+        'mus.mi.us',
+        'tec.mi.us',
+        'washtenaw.mi.us',
+        'mn.us',
+        'cc.mn.us',
+        'k12.mn.us',
+        'lib.mn.us',
+        'mo.us',
+        'cc.mo.us',
+        'k12.mo.us',
+        'lib.mo.us',
+        'ms.us',
+        'cc.ms.us',
+        'k12.ms.us',
+        'lib.ms.us',
+        'mt.us',
+        'cc.mt.us',
+        'k12.mt.us',
+        'lib.mt.us',
+        'nc.us',
+        'cc.nc.us',
+        'k12.nc.us',
+        'lib.nc.us',
+        'nd.us',
+        'cc.nd.us',
+        'lib.nd.us',
+        'ne.us',
+        'cc.ne.us',
+        'k12.ne.us',
+        'lib.ne.us',
+        'nh.us',
+        'cc.nh.us',
+        'k12.nh.us',
+        'lib.nh.us',
+        'nj.us',
+        'cc.nj.us',
+        'k12.nj.us',
+        'lib.nj.us',
+        'nm.us',
+        'cc.nm.us',
+        'k12.nm.us',
+        'lib.nm.us',
+        'nsn.us',
+        'nv.us',
+        'cc.nv.us',
+        'k12.nv.us',
+        'lib.nv.us',
+        'ny.us',
+        'cc.ny.us',
+        'k12.ny.us',
+        'lib.ny.us',
+        'oh.us',
+        'cc.oh.us',
+        'k12.oh.us',
+        'lib.oh.us',
+        'ok.us',
+        'cc.ok.us',
+        'k12.ok.us',
+        'lib.ok.us',
+        'or.us',
+        'cc.or.us',
+        'k12.or.us',
+        'lib.or.us',
+        'pa.us',
+        'cc.pa.us',
+        'k12.pa.us',
+        'lib.pa.us',
+        'pr.us',
+        'cc.pr.us',
+        'k12.pr.us',
+        'lib.pr.us',
+        'ri.us',
+        'cc.ri.us',
+        'lib.ri.us',
+        'sc.us',
+        'cc.sc.us',
+        'k12.sc.us',
+        'lib.sc.us',
+        'sd.us',
+        'cc.sd.us',
+        'lib.sd.us',
+        'tn.us',
+        'cc.tn.us',
+        'k12.tn.us',
+        'lib.tn.us',
+        'tx.us',
+        'cc.tx.us',
+        'k12.tx.us',
+        'lib.tx.us',
+        'ut.us',
+        'cc.ut.us',
+        'k12.ut.us',
+        'lib.ut.us',
+        'va.us',
+        'cc.va.us',
+        'k12.va.us',
+        'lib.va.us',
+        'vi.us',
+        'cc.vi.us',
+        'k12.vi.us',
+        'lib.vi.us',
+        'vt.us',
+        'cc.vt.us',
+        'k12.vt.us',
+        'lib.vt.us',
+        'wa.us',
+        'cc.wa.us',
+        'k12.wa.us',
+        'lib.wa.us',
+        'wi.us',
+        'cc.wi.us',
+        'k12.wi.us',
+        'lib.wi.us',
+        'wv.us',
+        'cc.wv.us',
+        'wy.us',
+        'cc.wy.us',
+        'k12.wy.us',
+        'lib.wy.us',
+        'uy',
+        'com.uy',
+        'edu.uy',
+        'gub.uy',
+        'mil.uy',
+        'net.uy',
+        'org.uy',
+        'uz',
+        'co.uz',
+        'com.uz',
+        'net.uz',
+        'org.uz',
+        'va',
+        'vacations',
+        'vana',
+        'vanguard',
+        'vc',
+        'com.vc',
+        'edu.vc',
+        'gov.vc',
+        'mil.vc',
+        'net.vc',
+        'org.vc',
+        've',
+        'arts.ve',
+        'bib.ve',
+        'co.ve',
+        'com.ve',
+        'e12.ve',
+        'edu.ve',
+        'firm.ve',
+        'gob.ve',
+        'gov.ve',
+        'info.ve',
+        'int.ve',
+        'mil.ve',
+        'net.ve',
+        'nom.ve',
+        'org.ve',
+        'rar.ve',
+        'rec.ve',
+        'store.ve',
+        'tec.ve',
+        'web.ve',
+        'vegas',
+        'ventures',
+        'verisign',
+        'versicherung',
+        'vet',
+        'vg',
+        'vi',
+        'co.vi',
+        'com.vi',
+        'k12.vi',
+        'net.vi',
+        'org.vi',
+        'viajes',
+        'video',
+        'vig',
+        'viking',
+        'villas',
+        'vin',
+        'vip',
+        'virgin',
+        'visa',
+        'vision',
+        'viva',
+        'vivo',
+        'vlaanderen',
+        'vn',
+        'ac.vn',
+        'biz.vn',
+        'com.vn',
+        'edu.vn',
+        'gov.vn',
+        'health.vn',
+        'info.vn',
+        'int.vn',
+        'name.vn',
+        'net.vn',
+        'org.vn',
+        'pro.vn',
+        'vodka',
+        'volkswagen',
+        'volvo',
+        'vote',
+        'voting',
+        'voto',
+        'voyage',
+        'vu',
+        'com.vu',
+        'edu.vu',
+        'net.vu',
+        'org.vu',
+        'vuelos',
+        'wales',
+        'walmart',
+        'walter',
+        'wang',
+        'wanggou',
+        'watch',
+        'watches',
+        'weather',
+        'weatherchannel',
+        'webcam',
+        'weber',
+        'website',
+        'wedding',
+        'weibo',
+        'weir',
+        'wf',
+        'whoswho',
+        'wien',
+        'wiki',
+        'williamhill',
+        'win',
+        'windows',
+        'wine',
+        'winners',
+        'wme',
+        'wolterskluwer',
+        'woodside',
+        'work',
+        'works',
+        'world',
+        'wow',
+        'ws',
+        'com.ws',
+        'edu.ws',
+        'gov.ws',
+        'net.ws',
+        'org.ws',
+        'wtc',
+        'wtf',
+        'xbox',
+        'xerox',
+        'xfinity',
+        'xihuan',
+        'xin',
+        'xn--11b4c3d',
+        'xn--1ck2e1b',
+        'xn--1qqw23a',
+        'xn--2scrj9c',
+        'xn--30rr7y',
+        'xn--3bst00m',
+        'xn--3ds443g',
+        'xn--3e0b707e',
+        'xn--3hcrj9c',
+        'xn--3pxu8k',
+        'xn--42c2d9a',
+        'xn--45br5cyl',
+        'xn--45brj9c',
+        'xn--45q11c',
+        'xn--4gbrim',
+        'xn--54b7fta0cc',
+        'xn--55qw42g',
+        'xn--55qx5d',
+        'xn--5su34j936bgsg',
+        'xn--5tzm5g',
+        'xn--6frz82g',
+        'xn--6qq986b3xl',
+        'xn--80adxhks',
+        'xn--80ao21a',
+        'xn--80aqecdr1a',
+        'xn--80asehdb',
+        'xn--80aswg',
+        'xn--8y0a063a',
+        'xn--90a3ac',
+        'xn--80au.xn--90a3ac',
+        'xn--90azh.xn--90a3ac',
+        'xn--c1avg.xn--90a3ac',
+        'xn--d1at.xn--90a3ac',
+        'xn--o1ac.xn--90a3ac',
+        'xn--o1ach.xn--90a3ac',
+        'xn--90ae',
+        'xn--90ais',
+        'xn--9dbq2a',
+        'xn--9et52u',
+        'xn--9krt00a',
+        'xn--b4w605ferd',
+        'xn--bck1b9a5dre4c',
+        'xn--c1avg',
+        'xn--c2br7g',
+        'xn--cck2b3b',
+        'xn--cckwcxetd',
+        'xn--cg4bki',
+        'xn--clchc0ea0b2g2a9gcd',
+        'xn--czr694b',
+        'xn--czrs0t',
+        'xn--czru2d',
+        'xn--d1acj3b',
+        'xn--d1alf',
+        'xn--e1a4c',
+        'xn--eckvdtc9d',
+        'xn--efvy88h',
+        'xn--fct429k',
+        'xn--fhbei',
+        'xn--fiq228c5hs',
+        'xn--fiq64b',
+        'xn--fiqs8s',
+        'xn--fiqz9s',
+        'xn--fjq720a',
+        'xn--flw351e',
+        'xn--fpcrj9c3d',
+        'xn--fzc2c9e2c',
+        'xn--fzys8d69uvgm',
+        'xn--g2xx48c',
+        'xn--gckr3f0f',
+        'xn--gecrj9c',
+        'xn--gk3at1e',
+        'xn--h2breg3eve',
+        'xn--h2brj9c',
+        'xn--h2brj9c8c',
+        'xn--hxt814e',
+        'xn--i1b6b1a6a2e',
+        'xn--imr513n',
+        'xn--io0a7i',
+        'xn--j1aef',
+        'xn--j1amh',
+        'xn--j6w193g',
+        'xn--55qx5d.xn--j6w193g',
+        'xn--gmqw5a.xn--j6w193g',
+        'xn--mxtq1m.xn--j6w193g',
+        'xn--od0alg.xn--j6w193g',
+        'xn--uc0atv.xn--j6w193g',
+        'xn--wcvs22d.xn--j6w193g',
+        'xn--jlq480n2rg',
+        'xn--jlq61u9w7b',
+        'xn--jvr189m',
+        'xn--kcrx77d1x4a',
+        'xn--kprw13d',
+        'xn--kpry57d',
+        'xn--kput3i',
+        'xn--l1acc',
+        'xn--lgbbat1ad8j',
+        'xn--mgb2ddes',
+        'xn--mgb9awbf',
+        'xn--mgba3a3ejt',
+        'xn--mgba3a4f16a',
+        'xn--mgba3a4fra',
+        'xn--mgba7c0bbn0a',
+        'xn--mgbaakc7dvf',
+        'xn--mgbaam7a8h',
+        'xn--mgbab2bd',
+        'xn--mgbah1a3hjkrd',
+        'xn--mgbai9a5eva00b',
+        'xn--mgbai9azgqp6j',
+        'xn--mgbayh7gpa',
+        'xn--mgbbh1a',
+        'xn--mgbbh1a71e',
+        'xn--mgbc0a9azcg',
+        'xn--mgbca7dzdo',
+        'xn--mgbcpq6gpa1a',
+        'xn--mgberp4a5d4a87g',
+        'xn--mgberp4a5d4ar',
+        'xn--mgbgu82a',
+        'xn--mgbi4ecexp',
+        'xn--mgbpl2fh',
+        'xn--mgbqly7c0a67fbc',
+        'xn--mgbqly7cvafr',
+        'xn--mgbt3dhd',
+        'xn--mgbtf8fl',
+        'xn--mgbtx2b',
+        'xn--mgbx4cd0ab',
+        'xn--mix082f',
+        'xn--mix891f',
+        'xn--mk1bu44c',
+        'xn--mxtq1m',
+        'xn--ngbc5azd',
+        'xn--ngbe9e0a',
+        'xn--ngbrx',
+        'xn--nnx388a',
+        'xn--node',
+        'xn--nqv7f',
+        'xn--nqv7fs00ema',
+        'xn--nyqy26a',
+        'xn--o3cw4h',
+        'xn--12c1fe0br.xn--o3cw4h',
+        'xn--12cfi8ixb8l.xn--o3cw4h',
+        'xn--12co0c3b4eva.xn--o3cw4h',
+        'xn--h3cuzk1di.xn--o3cw4h',
+        'xn--m3ch0j3a.xn--o3cw4h',
+        'xn--o3cyx2a.xn--o3cw4h',
+        'xn--ogbpf8fl',
+        'xn--otu796d',
+        'xn--p1acf',
+        'xn--p1ai',
+        'xn--pgbs0dh',
+        'xn--pssy2u',
+        'xn--q7ce6a',
+        'xn--q9jyb4c',
+        'xn--qcka1pmc',
+        'xn--qxa6a',
+        'xn--qxam',
+        'xn--rhqv96g',
+        'xn--rovu88b',
+        'xn--rvc1e0am3e',
+        'xn--s9brj9c',
+        'xn--ses554g',
+        'xn--t60b56a',
+        'xn--tckwe',
+        'xn--tiq49xqyj',
+        'xn--unup4y',
+        'xn--vermgensberater-ctb',
+        'xn--vermgensberatung-pwb',
+        'xn--vhquv',
+        'xn--vuq861b',
+        'xn--w4r85el8fhu5dnra',
+        'xn--w4rs40l',
+        'xn--wgbh1c',
+        'xn--wgbl6a',
+        'xn--xhq521b',
+        'xn--xkc2al3hye2a',
+        'xn--xkc2dl3a5ee0h',
+        'xn--y9a3aq',
+        'xn--yfro4i67o',
+        'xn--ygbi2ammx',
+        'xn--zfr164b',
+        'xxx',
+        'xyz',
+        'yachts',
+        'yahoo',
+        'yamaxun',
+        'yandex',
+        'ye',
+        'com.ye',
+        'edu.ye',
+        'gov.ye',
+        'mil.ye',
+        'net.ye',
+        'org.ye',
+        'yodobashi',
+        'yoga',
+        'yokohama',
+        'you',
+        'youtube',
+        'yt',
+        'yun',
+        'ac.za',
+        'agric.za',
+        'alt.za',
+        'co.za',
+        'edu.za',
+        'gov.za',
+        'grondar.za',
+        'law.za',
+        'mil.za',
+        'net.za',
+        'ngo.za',
+        'nic.za',
+        'nis.za',
+        'nom.za',
+        'org.za',
+        'school.za',
+        'tm.za',
+        'web.za',
+        'zappos',
+        'zara',
+        'zero',
+        'zip',
+        'zm',
+        'ac.zm',
+        'biz.zm',
+        'co.zm',
+        'com.zm',
+        'edu.zm',
+        'gov.zm',
+        'info.zm',
+        'mil.zm',
+        'net.zm',
+        'org.zm',
+        'sch.zm',
+        'zone',
+        'zuerich',
+        'zw',
+        'ac.zw',
+        'co.zw',
+        'gov.zw',
+        'mil.zw',
+        'org.zw',
+    )),
+    ('private', (
+        'drr.ac',
+        'official.academy',
+        'blogspot.ae',
+        'uwu.ai',
+        'blogspot.al',
+        'blogspot.am',
+        'neko.am',
+        'nyaa.am',
+        'radio.am',
+        'bookonline.app',
+        'clerk.app',
+        'clerkstage.app',
+        '*.developer.app',
+        'edgecompute.app',
+        'fireweb.app',
+        'framer.app',
+        'hasura.app',
+        'loginline.app',
+        'netlify.app',
+        'noop.app',
+        '*.northflank.app',
+        'ondigitalocean.app',
+        'onflashdrive.app',
+        'platform0.app',
+        'run.app',
+        'a.run.app',
+        'telebit.app',
+        'vercel.app',
+        'web.app',
+        'wnext.app',
+        'blogspot.com.ar',
+        'cloudns.asia',
+        '12hp.at',
+        '2ix.at',
+        '4lima.at',
+        'biz.at',
+        'blogspot.co.at',
+        'wien.funkfeuer.at',
+        '*.futurecms.at',
+        '*.ex.futurecms.at',
+        '*.in.futurecms.at',
+        'futurehosting.at',
+        'futuremailing.at',
+        'info.at',
+        'lima-city.at',
+        'myspreadshop.at',
+        '*.ex.ortsinfo.at',
+        '*.kunden.ortsinfo.at',
+        'priv.at',
+        'blogspot.com.au',
+        'mel.cloudlets.com.au',
+        'myspreadshop.com.au',
+        'be.ax',
+        'cat.ax',
+        'es.ax',
+        'eu.ax',
+        'gg.ax',
+        'mc.ax',
+        'us.ax',
+        'xy.ax',
+        'blogspot.ba',
+        'rs.ba',
+        'aus.basketball',
+        'nz.basketball',
+        'blogspot.be',
+        'cloud.interhostsolutions.be',
+        'ezproxy.kuleuven.be',
+        'myspreadshop.be',
+        '*.transurl.be',
+        'webhosting.be',
+        'barsy.bg',
+        'blogspot.bg',
+        'cloudns.biz',
+        'dscloud.biz',
+        'dyndns.biz',
+        'for-better.biz',
+        'for-more.biz',
+        'for-some.biz',
+        'for-the.biz',
+        'jozi.biz',
+        'mmafan.biz',
+        'myftp.biz',
+        'no-ip.biz',
+        'orx.biz',
+        'selfip.biz',
+        'webhop.biz',
+        'blogspot.bj',
+        'co.bn',
+        'blogspot.com.br',
+        'users.scale.virtualcloud.com.br',
+        'ac.leg.br',
+        'al.leg.br',
+        'am.leg.br',
+        'ap.leg.br',
+        'ba.leg.br',
+        'ce.leg.br',
+        'df.leg.br',
+        'es.leg.br',
+        'go.leg.br',
+        'ma.leg.br',
+        'mg.leg.br',
+        'ms.leg.br',
+        'mt.leg.br',
+        'pa.leg.br',
+        'pb.leg.br',
+        'pe.leg.br',
+        'pi.leg.br',
+        'pr.leg.br',
+        'rj.leg.br',
+        'rn.leg.br',
+        'ro.leg.br',
+        'rr.leg.br',
+        'rs.leg.br',
+        'sc.leg.br',
+        'se.leg.br',
+        'sp.leg.br',
+        'to.leg.br',
+        'we.bs',
+        'cloudsite.builders',
+        'co.business',
+        'blogspot.com.by',
+        'mediatech.by',
+        'mycloud.by',
+        'gsj.bz',
+        'za.bz',
+        '*.awdev.ca',
+        'barsy.ca',
+        'blogspot.ca',
+        'co.ca',
+        'myspreadshop.ca',
+        'no-ip.ca',
+        'ui.nabu.casa',
+        'cloudns.cc',
+        'csx.cc',
+        'fantasyleague.cc',
+        'ftpaccess.cc',
+        'game-server.cc',
+        'myphotos.cc',
+        'scrapping.cc',
+        'instances.spawn.cc',
+        'twmail.cc',
+        'blogspot.cf',
+        '12hp.ch',
+        '2ix.ch',
+        '4lima.ch',
+        'blogspot.ch',
+        'dnsking.ch',
+        '*.firenet.ch',
+        '*.svc.firenet.ch',
+        'alp1.ae.flow.ch',
+        'appengine.flow.ch',
+        'gotdns.ch',
+        'lima-city.ch',
+        'linkyard-cloud.ch',
+        'myspreadshop.ch',
+        'square7.ch',
+        'fin.ci',
+        'nl.ci',
+        'blogspot.cl',
+        'es-1.axarnet.cloud',
+        '*.banzai.cloud',
+        'diadem.cloud',
+        'elementor.cloud',
+        'eu.encoway.cloud',
+        'vip.jelastic.cloud',
+        'jele.cloud',
+        'it1.eur.aruba.jenv-aruba.cloud',
+        'it1.jenv-aruba.cloud',
+        'jotelulu.cloud',
+        'keliweb.cloud',
+        'cs.keliweb.cloud',
+        'kuleuven.cloud',
+        'linkyard.cloud',
+        '*.magentosite.cloud',
+        '*.on-rancher.cloud',
+        'oxa.cloud',
+        'tn.oxa.cloud',
+        'uk.oxa.cloud',
+        'perspecta.cloud',
+        'primetel.cloud',
+        'uk.primetel.cloud',
+        'ravendb.cloud',
+        'ca.reclaim.cloud',
+        'uk.reclaim.cloud',
+        'us.reclaim.cloud',
+        '*.sensiosite.cloud',
+        '*.statics.cloud',
+        'trafficplex.cloud',
+        'ch.trendhosting.cloud',
+        'de.trendhosting.cloud',
+        'urown.cloud',
+        'vapor.cloud',
+        'voorloper.cloud',
+        'barsy.club',
+        'cloudns.club',
+        'jele.club',
+        'pony.club',
+        's3.cn-north-1.amazonaws.com.cn',
+        '*.compute.amazonaws.com.cn',
+        'cn-north-1.eb.amazonaws.com.cn',
+        'cn-northwest-1.eb.amazonaws.com.cn',
+        '*.elb.amazonaws.com.cn',
+        'instantcloud.cn',
+        'carrd.co',
+        'blogspot.com.co',
+        'crd.co',
+        'leadpages.co',
+        'lpages.co',
+        'mypi.co',
+        'n4t.co',
+        '*.otap.co',
+        'repl.co',
+        'id.repl.co',
+        'supabase.co',
+        '*.owo.codes',
+        '001www.com',
+        '*.0emm.com',
+        '1kapp.com',
+        '3utilities.com',
+        '4u.com',
+        'adobeaemcloud.com',
+        '*.dev.adobeaemcloud.com',
+        'africa.com',
+        'alpha-myqnapcloud.com',
+        's3.dualstack.ap-northeast-1.amazonaws.com',
+        's3.dualstack.ap-northeast-2.amazonaws.com',
+        's3.ap-northeast-2.amazonaws.com',
+        's3-website.ap-northeast-2.amazonaws.com',
+        's3.dualstack.ap-south-1.amazonaws.com',
+        's3.ap-south-1.amazonaws.com',
+        's3-website.ap-south-1.amazonaws.com',
+        's3.dualstack.ap-southeast-1.amazonaws.com',
+        's3.dualstack.ap-southeast-2.amazonaws.com',
+        's3.dualstack.ca-central-1.amazonaws.com',
+        's3.ca-central-1.amazonaws.com',
+        's3-website.ca-central-1.amazonaws.com',
+        '*.compute.amazonaws.com',
+        '*.compute-1.amazonaws.com',
+        '*.elb.amazonaws.com',
+        's3.dualstack.eu-central-1.amazonaws.com',
+        's3.eu-central-1.amazonaws.com',
+        's3-website.eu-central-1.amazonaws.com',
+        's3.dualstack.eu-west-1.amazonaws.com',
+        's3.dualstack.eu-west-2.amazonaws.com',
+        's3.eu-west-2.amazonaws.com',
+        's3-website.eu-west-2.amazonaws.com',
+        's3.dualstack.eu-west-3.amazonaws.com',
+        's3.eu-west-3.amazonaws.com',
+        's3-website.eu-west-3.amazonaws.com',
+        's3.amazonaws.com',
+        's3-ap-northeast-1.amazonaws.com',
+        's3-ap-northeast-2.amazonaws.com',
+        's3-ap-south-1.amazonaws.com',
+        's3-ap-southeast-1.amazonaws.com',
+        's3-ap-southeast-2.amazonaws.com',
+        's3-ca-central-1.amazonaws.com',
+        's3-eu-central-1.amazonaws.com',
+        's3-eu-west-1.amazonaws.com',
+        's3-eu-west-2.amazonaws.com',
+        's3-eu-west-3.amazonaws.com',
+        's3-external-1.amazonaws.com',
+        's3-fips-us-gov-west-1.amazonaws.com',
+        's3-sa-east-1.amazonaws.com',
+        's3-us-east-2.amazonaws.com',
+        's3-us-gov-west-1.amazonaws.com',
+        's3-us-west-1.amazonaws.com',
+        's3-us-west-2.amazonaws.com',
+        's3-website-ap-northeast-1.amazonaws.com',
+        's3-website-ap-southeast-1.amazonaws.com',
+        's3-website-ap-southeast-2.amazonaws.com',
+        's3-website-eu-west-1.amazonaws.com',
+        's3-website-sa-east-1.amazonaws.com',
+        's3-website-us-east-1.amazonaws.com',
+        's3-website-us-west-1.amazonaws.com',
+        's3-website-us-west-2.amazonaws.com',
+        's3.dualstack.sa-east-1.amazonaws.com',
+        'us-east-1.amazonaws.com',
+        's3.dualstack.us-east-1.amazonaws.com',
+        's3.dualstack.us-east-2.amazonaws.com',
+        's3.us-east-2.amazonaws.com',
+        's3-website.us-east-2.amazonaws.com',
+        'amscompute.com',
+        'appchizi.com',
+        'applinzi.com',
+        'appspacehosted.com',
+        'appspaceusercontent.com',
+        'appspot.com',
+        '*.r.appspot.com',
+        'ar.com',
+        'authgear-staging.com',
+        'authgearapps.com',
+        'awsglobalaccelerator.com',
+        'awsmppl.com',
+        'balena-devices.com',
+        'barsycenter.com',
+        'barsyonline.com',
+        'betainabox.com',
+        'blogdns.com',
+        'blogspot.com',
+        'blogsyte.com',
+        'bloxcms.com',
+        'bounty-full.com',
+        'alpha.bounty-full.com',
+        'beta.bounty-full.com',
+        'boutir.com',
+        'bplaced.com',
+        'br.com',
+        'builtwithdark.com',
+        'cafjs.com',
+        'cechire.com',
+        'ciscofreak.com',
+        'clicketcloud.com',
+        'cloudcontrolapp.com',
+        'cloudcontrolled.com',
+        'cn.com',
+        'co.com',
+        'codespot.com',
+        '*.customer-oci.com',
+        '*.oci.customer-oci.com',
+        '*.ocp.customer-oci.com',
+        '*.ocs.customer-oci.com',
+        'damnserver.com',
+        'demo.datadetect.com',
+        'instance.datadetect.com',
+        'dattolocal.com',
+        'dattorelay.com',
+        'dattoweb.com',
+        'ddns5.com',
+        'ddnsfree.com',
+        'ddnsgeek.com',
+        'ddnsking.com',
+        'ddnslive.com',
+        'de.com',
+        'dev-myqnapcloud.com',
+        '*.devcdnaccesso.com',
+        '*.digitaloceanspaces.com',
+        'ditchyourip.com',
+        'dnsalias.com',
+        'dnsdojo.com',
+        'dnsiskinky.com',
+        'doesntexist.com',
+        'dontexist.com',
+        'doomdns.com',
+        'dopaas.com',
+        'drayddns.com',
+        'dreamhosters.com',
+        'dsmynas.com',
+        'dyn-o-saur.com',
+        'dynalias.com',
+        'dyndns-at-home.com',
+        'dyndns-at-work.com',
+        'dyndns-blog.com',
+        'dyndns-free.com',
+        'dyndns-home.com',
+        'dyndns-ip.com',
+        'dyndns-mail.com',
+        'dyndns-office.com',
+        'dyndns-pics.com',
+        'dyndns-remote.com',
+        'dyndns-server.com',
+        'dyndns-web.com',
+        'dyndns-wiki.com',
+        'dyndns-work.com',
+        'dynns.com',
+        'elasticbeanstalk.com',
+        'ap-northeast-1.elasticbeanstalk.com',
+        'ap-northeast-2.elasticbeanstalk.com',
+        'ap-northeast-3.elasticbeanstalk.com',
+        'ap-south-1.elasticbeanstalk.com',
+        'ap-southeast-1.elasticbeanstalk.com',
+        'ap-southeast-2.elasticbeanstalk.com',
+        'ca-central-1.elasticbeanstalk.com',
+        'eu-central-1.elasticbeanstalk.com',
+        'eu-west-1.elasticbeanstalk.com',
+        'eu-west-2.elasticbeanstalk.com',
+        'eu-west-3.elasticbeanstalk.com',
+        'sa-east-1.elasticbeanstalk.com',
+        'us-east-1.elasticbeanstalk.com',
+        'us-east-2.elasticbeanstalk.com',
+        'us-gov-west-1.elasticbeanstalk.com',
+        'us-west-1.elasticbeanstalk.com',
+        'us-west-2.elasticbeanstalk.com',
+        'est-a-la-maison.com',
+        'est-a-la-masion.com',
+        'est-le-patron.com',
+        'est-mon-blogueur.com',
+        'eu.com',
+        'eu-1.evennode.com',
+        'eu-2.evennode.com',
+        'eu-3.evennode.com',
+        'eu-4.evennode.com',
+        'us-1.evennode.com',
+        'us-2.evennode.com',
+        'us-3.evennode.com',
+        'us-4.evennode.com',
+        'familyds.com',
+        'fastly-terrarium.com',
+        'fastvps-server.com',
+        'apps.fbsbx.com',
+        'firebaseapp.com',
+        'firewall-gateway.com',
+        'fldrv.com',
+        'forgeblocks.com',
+        'framercanvas.com',
+        'freebox-os.com',
+        'freeboxos.com',
+        'freemyip.com',
+        'from-ak.com',
+        'from-al.com',
+        'from-ar.com',
+        'from-ca.com',
+        'from-ct.com',
+        'from-dc.com',
+        'from-de.com',
+        'from-fl.com',
+        'from-ga.com',
+        'from-hi.com',
+        'from-ia.com',
+        'from-id.com',
+        'from-il.com',
+        'from-in.com',
+        'from-ks.com',
+        'from-ky.com',
+        'from-ma.com',
+        'from-md.com',
+        'from-mi.com',
+        'from-mn.com',
+        'from-mo.com',
+        'from-ms.com',
+        'from-mt.com',
+        'from-nc.com',
+        'from-nd.com',
+        'from-ne.com',
+        'from-nh.com',
+        'from-nj.com',
+        'from-nm.com',
+        'from-nv.com',
+        'from-oh.com',
+        'from-ok.com',
+        'from-or.com',
+        'from-pa.com',
+        'from-pr.com',
+        'from-ri.com',
+        'from-sc.com',
+        'from-sd.com',
+        'from-tn.com',
+        'from-tx.com',
+        'from-ut.com',
+        'from-va.com',
+        'from-vt.com',
+        'from-wa.com',
+        'from-wi.com',
+        'from-wv.com',
+        'from-wy.com',
+        'geekgalaxy.com',
+        'gentapps.com',
+        'gentlentapis.com',
+        'getmyip.com',
+        'giize.com',
+        'githubusercontent.com',
+        'gleeze.com',
+        'googleapis.com',
+        'googlecode.com',
+        'gotdns.com',
+        'gotpantheon.com',
+        'gr.com',
+        'health-carereform.com',
+        'herokuapp.com',
+        'herokussl.com',
+        'hidora.com',
+        'hk.com',
+        'hobby-site.com',
+        'homelinux.com',
+        'homesecuritymac.com',
+        'homesecuritypc.com',
+        'homeunix.com',
+        'paas.hosted-by-previder.com',
+        'hostedpi.com',
+        'rag-cloud.hosteur.com',
+        'rag-cloud-ch.hosteur.com',
+        'hotelwithflight.com',
+        'hu.com',
+        'iamallama.com',
+        'idnblogger.com',
+        'jcloud.ik-server.com',
+        'jcloud-ver-jpc.ik-server.com',
+        'impertrix.com',
+        'impertrixcdn.com',
+        'indowapblog.com',
+        'is-a-anarchist.com',
+        'is-a-blogger.com',
+        'is-a-bookkeeper.com',
+        'is-a-bulls-fan.com',
+        'is-a-caterer.com',
+        'is-a-chef.com',
+        'is-a-conservative.com',
+        'is-a-cpa.com',
+        'is-a-cubicle-slave.com',
+        'is-a-democrat.com',
+        'is-a-designer.com',
+        'is-a-doctor.com',
+        'is-a-financialadvisor.com',
+        'is-a-geek.com',
+        'is-a-green.com',
+        'is-a-guru.com',
+        'is-a-hard-worker.com',
+        'is-a-hunter.com',
+        'is-a-landscaper.com',
+        'is-a-lawyer.com',
+        'is-a-liberal.com',
+        'is-a-libertarian.com',
+        'is-a-llama.com',
+        'is-a-musician.com',
+        'is-a-nascarfan.com',
+        'is-a-nurse.com',
+        'is-a-painter.com',
+        'is-a-personaltrainer.com',
+        'is-a-photographer.com',
+        'is-a-player.com',
+        'is-a-republican.com',
+        'is-a-rockstar.com',
+        'is-a-socialist.com',
+        'is-a-student.com',
+        'is-a-teacher.com',
+        'is-a-techie.com',
+        'is-a-therapist.com',
+        'is-an-accountant.com',
+        'is-an-actor.com',
+        'is-an-actress.com',
+        'is-an-anarchist.com',
+        'is-an-artist.com',
+        'is-an-engineer.com',
+        'is-an-entertainer.com',
+        'is-certified.com',
+        'is-gone.com',
+        'is-into-anime.com',
+        'is-into-cars.com',
+        'is-into-cartoons.com',
+        'is-into-games.com',
+        'is-leet.com',
+        'is-not-certified.com',
+        'is-slick.com',
+        'is-uberleet.com',
+        'is-with-theband.com',
+        'isa-geek.com',
+        'isa-hockeynut.com',
+        'issmarterthanyou.com',
+        'jdevcloud.com',
+        'demo.jelastic.com',
+        '*.cns.joyent.com',
+        'jpn.com',
+        'kasserver.com',
+        'kilatiron.com',
+        'kozow.com',
+        'kr.com',
+        'likes-pie.com',
+        'likescandy.com',
+        'members.linode.com',
+        '*.nodebalancer.linode.com',
+        '*.linodeobjects.com',
+        'ip.linodeusercontent.com',
+        'app.lmpm.com',
+        'logoip.com',
+        'loseyourip.com',
+        'lpusercontent.com',
+        'paas.massivegrid.com',
+        'mazeplay.com',
+        'meteorapp.com',
+        'eu.meteorapp.com',
+        'mex.com',
+        'miniserver.com',
+        'myactivedirectory.com',
+        'myasustor.com',
+        'mydatto.com',
+        'mydobiss.com',
+        'mydrobo.com',
+        'myiphost.com',
+        'myqnapcloud.com',
+        'myravendb.com',
+        'mysecuritycamera.com',
+        'myshopblocks.com',
+        'myshopify.com',
+        'myspreadshop.com',
+        'caracal.mythic-beasts.com',
+        'customer.mythic-beasts.com',
+        'fentiger.mythic-beasts.com',
+        'lynx.mythic-beasts.com',
+        'ocelot.mythic-beasts.com',
+        'oncilla.mythic-beasts.com',
+        'onza.mythic-beasts.com',
+        'sphinx.mythic-beasts.com',
+        'vs.mythic-beasts.com',
+        'x.mythic-beasts.com',
+        'yali.mythic-beasts.com',
+        'mytuleap.com',
+        'myvnc.com',
+        'neat-url.com',
+        'net-freaks.com',
+        'nfshost.com',
+        'no.com',
+        'cloud.nospamproxy.com',
+        'static.observableusercontent.com',
+        'on-aptible.com',
+        'onfabrica.com',
+        'onrender.com',
+        'onthewifi.com',
+        'ooguy.com',
+        'operaunite.com',
+        'orsites.com',
+        'outsystemscloud.com',
+        'ownprovider.com',
+        'pagefrontapp.com',
+        'pagespeedmobilizer.com',
+        'pagexl.com',
+        '*.paywhirl.com',
+        'pgfog.com',
+        'pixolino.com',
+        'platter-app.com',
+        'playstation-cloud.com',
+        'pleskns.com',
+        'point2this.com',
+        'postman-echo.com',
+        'xen.prgmr.com',
+        'publishproxy.com',
+        'pythonanywhere.com',
+        'eu.pythonanywhere.com',
+        'qa2.com',
+        'qbuser.com',
+        'qc.com',
+        'qualifioapp.com',
+        'quicksytes.com',
+        '*.quipelements.com',
+        'rackmaze.com',
+        'remotewd.com',
+        'app.render.com',
+        'reservd.com',
+        'reserve-online.com',
+        'rhcloud.com',
+        'ru.com',
+        'sa.com',
+        'saves-the-whales.com',
+        'scrysec.com',
+        'securitytactics.com',
+        'selfip.com',
+        'sells-for-less.com',
+        'sells-for-u.com',
+        'servebbs.com',
+        'servebeer.com',
+        'servecounterstrike.com',
+        'serveexchange.com',
+        'serveftp.com',
+        'servegame.com',
+        'servehalflife.com',
+        'servehttp.com',
+        'servehumour.com',
+        'serveirc.com',
+        'servemp3.com',
+        'servep2p.com',
+        'servepics.com',
+        'servequake.com',
+        'servesarcasm.com',
+        'shopitsite.com',
+        'siiites.com',
+        'simple-url.com',
+        'sinaapp.com',
+        'skygearapp.com',
+        'smushcdn.com',
+        'space-to-rent.com',
+        'stackhero-network.com',
+        'api.stdlib.com',
+        'stufftoread.com',
+        'site.tb-hosting.com',
+        'teaches-yoga.com',
+        'temp-dns.com',
+        'theworkpc.com',
+        'thingdustdata.com',
+        'townnews-staging.com',
+        'try-snowplow.com',
+        'trycloudflare.com',
+        'tuleap-partners.com',
+        'pro.typeform.com',
+        'uk.com',
+        'unusualperson.com',
+        'us.com',
+        'uy.com',
+        'vipsinaapp.com',
+        'jed.wafaicloud.com',
+        'lon.wafaicloud.com',
+        'ryd.wafaicloud.com',
+        'wafflecell.com',
+        'pages.wiardweb.com',
+        'withgoogle.com',
+        'withyoutube.com',
+        'wixsite.com',
+        'woltlab-demo.com',
+        'workisboring.com',
+        'wpdevcloud.com',
+        'wpenginepowered.com',
+        'js.wpenginepowered.com',
+        'wphostedmail.com',
+        'wpmucdn.com',
+        'writesthisblog.com',
+        'xnbay.com',
+        'u2.xnbay.com',
+        'u2-local.xnbay.com',
+        'yolasite.com',
+        'za.com',
+        'myforum.community',
+        'nog.community',
+        'ravendb.community',
+        'de.cool',
+        'elementor.cool',
+        'blogspot.cv',
+        'ath.cx',
+        'info.cx',
+        'blogspot.com.cy',
+        'j.scaleforce.com.cy',
+        'blogspot.cz',
+        'co.cz',
+        'e4.cz',
+        '*.cloud.metacentrum.cz',
+        'custom.metacentrum.cz',
+        'flt.cloud.muni.cz',
+        'usr.cloud.muni.cz',
+        'realm.cz',
+        '12hp.de',
+        '2ix.de',
+        '4lima.de',
+        'barsy.de',
+        'blogspot.de',
+        'bplaced.de',
+        'com.de',
+        'community-pro.de',
+        'dyn.cosidns.de',
+        'dd-dns.de',
+        'ddnss.de',
+        'dyn.ddnss.de',
+        'dyndns.ddnss.de',
+        'diskussionsbereich.de',
+        'dnshome.de',
+        'dnsupdater.de',
+        'dray-dns.de',
+        'draydns.de',
+        'dyn-berlin.de',
+        'dyn-ip24.de',
+        'dyn-vpn.de',
+        'dynamisches-dns.de',
+        'dyndns1.de',
+        'dynvpn.de',
+        'firewall-gateway.de',
+        '*.frusky.de',
+        'fuettertdasnetz.de',
+        'git-repos.de',
+        'goip.de',
+        'home-webserver.de',
+        'dyn.home-webserver.de',
+        'pages.it.hs-heilbronn.de',
+        'in-berlin.de',
+        'in-brb.de',
+        'in-butter.de',
+        'in-dsl.de',
+        'in-vpn.de',
+        'internet-dns.de',
+        'isteingeek.de',
+        'istmein.de',
+        'keymachine.de',
+        'l-o-g-i-n.de',
+        'lcube-server.de',
+        'lebtimnetz.de',
+        'leitungsen.de',
+        'lima-city.de',
+        'logoip.de',
+        'mein-iserv.de',
+        'mein-vigor.de',
+        'my-gateway.de',
+        'my-router.de',
+        'my-vigor.de',
+        'my-wan.de',
+        'myhome-server.de',
+        'myspreadshop.de',
+        'schulserver.de',
+        'spdns.de',
+        'customer.speedpartner.de',
+        'square7.de',
+        'svn-repos.de',
+        'syno-ds.de',
+        'synology-diskstation.de',
+        'synology-ds.de',
+        'taifun-dns.de',
+        'test-iserv.de',
+        'traeumtgerade.de',
+        '*.uberspace.de',
+        'virtual-user.de',
+        'virtualuser.de',
+        'xn--gnstigbestellen-zvb.de',
+        'xn--gnstigliefern-wob.de',
+        'bss.design',
+        'curv.dev',
+        'deno.dev',
+        'deno-staging.dev',
+        'fly.dev',
+        '*.gateway.dev',
+        'githubpreview.dev',
+        'iserv.dev',
+        '*.lcl.dev',
+        '*.lclstage.dev',
+        'loginline.dev',
+        'mediatech.dev',
+        'pages.dev',
+        'platter-app.dev',
+        'shiftcrypto.dev',
+        '*.stg.dev',
+        '*.stgstage.dev',
+        'vercel.dev',
+        '*.webhare.dev',
+        'workers.dev',
+        'cloudapps.digital',
+        'london.cloudapps.digital',
+        'biz.dk',
+        'blogspot.dk',
+        'co.dk',
+        'firm.dk',
+        'myspreadshop.dk',
+        'reg.dk',
+        'store.dk',
+        '*.dapps.earth',
+        '*.bzz.dapps.earth',
+        'base.ec',
+        'official.ec',
+        'git-pages.rit.edu',
+        'co.education',
+        'blogspot.com.ee',
+        'blogspot.com.eg',
+        'blogspot.com.es',
+        'myspreadshop.es',
+        '*.compute.estate',
+        'barsy.eu',
+        'cloudns.eu',
+        'diskstation.eu',
+        'jelastic.dogado.eu',
+        'mycd.eu',
+        'spdns.eu',
+        '*.transurl.eu',
+        'wellbeingzone.eu',
+        'user.party.eus',
+        'co.events',
+        'koobin.events',
+        'ybo.faith',
+        'storj.farm',
+        'of.fashion',
+        'blogspot.fi',
+        'fi.cloudplatform.fi',
+        'demo.datacenter.fi',
+        'paas.datacenter.fi',
+        'dy.fi',
+        'iki.fi',
+        'myspreadshop.fi',
+        'xn--hkkinen-5wa.fi',
+        'co.financial',
+        'radio.fm',
+        'blogspot.fr',
+        'chirurgiens-dentistes-en-france.fr',
+        'en-root.fr',
+        'fbx-os.fr',
+        'fbxos.fr',
+        'freebox-os.fr',
+        'freeboxos.fr',
+        'goupile.fr',
+        'myspreadshop.fr',
+        'on-web.fr',
+        'ynh.fr',
+        'cnpy.gdn',
+        'cya.gg',
+        'kaas.gg',
+        'panel.gg',
+        'daemon.panel.gg',
+        'biz.gl',
+        'xx.gl',
+        'cloud.goog',
+        'translate.goog',
+        '*.usercontent.goog',
+        'app.gp',
+        'blogspot.gr',
+        'discourse.group',
+        'blog.gt',
+        'de.gt',
+        'to.gt',
+        'be.gy',
+        'hra.health',
+        'blogspot.hk',
+        'inc.hk',
+        'ltd.hk',
+        'secaas.hk',
+        'cc.hn',
+        'cloudaccess.host',
+        'fastvps.host',
+        'freesite.host',
+        'half.host',
+        'jele.host',
+        'mircloud.host',
+        'myfast.host',
+        'pcloud.host',
+        'tempurl.host',
+        'wpmudev.host',
+        'opencraft.hosting',
+        'blogspot.hr',
+        'free.hr',
+        'blogspot.hu',
+        'bloger.id',
+        'blogspot.co.id',
+        'flap.id',
+        'forte.id',
+        '*.rss.my.id',
+        'wblog.id',
+        'blogspot.ie',
+        'myspreadshop.ie',
+        'blogspot.co.il',
+        'ravpage.co.il',
+        'tabitorder.co.il',
+        'ro.im',
+        'barsy.in',
+        'blogspot.in',
+        'cloudns.in',
+        'supabase.in',
+        'web.in',
+        'barrel-of-knowledge.info',
+        'barrell-of-knowledge.info',
+        'barsy.info',
+        'cloudns.info',
+        'dnsupdate.info',
+        'dvrcam.info',
+        'dynamic-dns.info',
+        'dyndns.info',
+        'for-our.info',
+        'forumz.info',
+        'groks-the.info',
+        'groks-this.info',
+        'here-for-more.info',
+        'ilovecollege.info',
+        'knowsitall.info',
+        'mayfirst.info',
+        'no-ip.info',
+        'nsupdate.info',
+        'selfip.info',
+        'v-info.info',
+        'webhop.info',
+        '2038.io',
+        'apigee.io',
+        '*.azurecontainer.io',
+        'b-data.io',
+        'backplaneapp.io',
+        'app.banzaicloud.io',
+        '*.backyards.banzaicloud.io',
+        'barsy.io',
+        'basicserver.io',
+        'paas.beebyte.io',
+        'sekd1.beebyteapp.io',
+        'uk0.bigv.io',
+        'bitbucket.io',
+        'bluebite.io',
+        'boxfuse.io',
+        'browsersafetymark.io',
+        'cleverapps.io',
+        'dyndns.dappnode.io',
+        'dedyn.io',
+        'definima.io',
+        'drud.io',
+        'dyn53.io',
+        'editorx.io',
+        'edugit.io',
+        'fh-muenster.io',
+        'id.forgerock.io',
+        'ghost.io',
+        'github.io',
+        'gitlab.io',
+        'hasura-app.io',
+        'hostyhosting.io',
+        'hzc.io',
+        'jele.io',
+        'apps.lair.io',
+        'loginline.io',
+        'lolipop.io',
+        'mo-siemens.io',
+        '*.moonscale.io',
+        'ngrok.io',
+        'nid.io',
+        'stage.nodeart.io',
+        '*.on-k3s.io',
+        '*.on-rio.io',
+        'pantheonsite.io',
+        'protonet.io',
+        'pstmn.io',
+        'mock.pstmn.io',
+        'qcx.io',
+        '*.sys.qcx.io',
+        'qoto.io',
+        'readthedocs.io',
+        'resindevice.io',
+        'devices.resinstaging.io',
+        '*.s5y.io',
+        'sandcats.io',
+        'shiftcrypto.io',
+        'shiftedit.io',
+        'shw.io',
+        'spacekit.io',
+        '*.stolos.io',
+        'telebit.io',
+        'cust.dev.thingdust.io',
+        'reservd.dev.thingdust.io',
+        'cust.disrec.thingdust.io',
+        'reservd.disrec.thingdust.io',
+        'cust.prod.thingdust.io',
+        'cust.testing.thingdust.io',
+        'reservd.testing.thingdust.io',
+        'tickets.io',
+        'cloud-fr1.unispace.io',
+        'upli.io',
+        'utwente.io',
+        'vaporcloud.io',
+        'g.vbrplsbx.io',
+        'virtualserver.io',
+        'webthings.io',
+        'wedeploy.io',
+        'blogspot.is',
+        'cupcake.is',
+        '16-b.it',
+        '32-b.it',
+        '64-b.it',
+        'blogspot.it',
+        'myspreadshop.it',
+        'jc.neen.it',
+        'syncloud.it',
+        'cloud.jelastic.open.tim.it',
+        'of.je',
+        'blogspot.jp',
+        'buyshop.jp',
+        'fashionstore.jp',
+        'handcrafted.jp',
+        'kawaiishop.jp',
+        'user.aseinet.ne.jp',
+        'gehirn.ne.jp',
+        'supersale.jp',
+        'theshop.jp',
+        'usercontent.jp',
+        'blogspot.co.ke',
+        'blog.kg',
+        'io.kg',
+        'jp.kg',
+        'tv.kg',
+        'uk.kg',
+        'us.kg',
+        'blogspot.kr',
+        'co.krd',
+        'edu.krd',
+        'jcloud.kz',
+        'upaas.kazteleport.kz',
+        'bnr.la',
+        'c.la',
+        'static.land',
+        'dev.static.land',
+        'sites.static.land',
+        'oy.lc',
+        'blogspot.li',
+        'caa.li',
+        'cyon.link',
+        '*.dweb.link',
+        'mypep.link',
+        'hlx.live',
+        'omg.lol',
+        'in.london',
+        'of.london',
+        'de.ls',
+        'blogspot.lt',
+        'blogspot.lu',
+        'router.management',
+        'from.marketing',
+        'with.marketing',
+        'at.md',
+        'blogspot.md',
+        'de.md',
+        'jp.md',
+        'to.md',
+        'barsy.me',
+        'brasilia.me',
+        'c66.me',
+        'couk.me',
+        'daplie.me',
+        'localhost.daplie.me',
+        'ddns.me',
+        'diskstation.me',
+        'dnsfor.me',
+        'dscloud.me',
+        'edgestack.me',
+        'filegear.me',
+        'filegear-au.me',
+        'filegear-de.me',
+        'filegear-gb.me',
+        'filegear-ie.me',
+        'filegear-jp.me',
+        'filegear-sg.me',
+        'glitch.me',
+        'hopto.me',
+        'i234.me',
+        'loginto.me',
+        'lohmus.me',
+        'mcdir.me',
+        'mcpe.me',
+        'myds.me',
+        'nohost.me',
+        'noip.me',
+        'ravendb.me',
+        'soundcast.me',
+        'synology.me',
+        'tbits.me',
+        'tcp4.me',
+        'ukco.me',
+        'vp4.me',
+        'wbq.me',
+        'webhop.me',
+        'wedeploy.me',
+        'yombo.me',
+        'for.men',
+        'repair.men',
+        'barsy.menu',
+        'blogspot.mk',
+        'nyc.mn',
+        'barsy.mobi',
+        'dscloud.mobi',
+        'and.mom',
+        'for.mom',
+        'ju.mp',
+        'blogspot.mr',
+        'lab.ms',
+        'minisite.ms',
+        'blogspot.com.mt',
+        'blogspot.mx',
+        'blogspot.my',
+        'forgot.her.name',
+        'forgot.his.name',
+        'adobeaemcloud.net',
+        'alwaysdata.net',
+        'appudo.net',
+        'at-band-camp.net',
+        'cdn.prod.atlassian-dev.net',
+        'azure-mobile.net',
+        'azurestaticapps.net',
+        'centralus.azurestaticapps.net',
+        'eastasia.azurestaticapps.net',
+        'eastus2.azurestaticapps.net',
+        'westeurope.azurestaticapps.net',
+        'westus2.azurestaticapps.net',
+        'azurewebsites.net',
+        'bar0.net',
+        'bar1.net',
+        'bar2.net',
+        'barsy.net',
+        'bitbridge.net',
+        'blackbaudcdn.net',
+        'blogdns.net',
+        'boomla.net',
+        'bounceme.net',
+        'bplaced.net',
+        'broke-it.net',
+        'buyshouses.net',
+        'casacam.net',
+        'cdn-edges.net',
+        'r.cdn77.net',
+        'cdn77-ssl.net',
+        'channelsdvr.net',
+        'u.channelsdvr.net',
+        'clickrising.net',
+        'cloudaccess.net',
+        'cloudapp.net',
+        'cloudfront.net',
+        'cloudfunctions.net',
+        'cloudjiffy.net',
+        'fra1-de.cloudjiffy.net',
+        'west1-us.cloudjiffy.net',
+        'cloudycluster.net',
+        'community-pro.net',
+        '*.cryptonomic.net',
+        'dattolocal.net',
+        'ddns.net',
+        'debian.net',
+        'definima.net',
+        'dnsalias.net',
+        'dnsdojo.net',
+        'dnsup.net',
+        'does-it.net',
+        'dontexist.net',
+        'dsmynas.net',
+        'dynalias.net',
+        'dynathome.net',
+        'dynu.net',
+        'dynv6.net',
+        'eating-organic.net',
+        'edgeapp.net',
+        'jls-sto1.elastx.net',
+        'jls-sto2.elastx.net',
+        'jls-sto3.elastx.net',
+        'endofinternet.net',
+        'familyds.net',
+        'fastblog.net',
+        'freetls.fastly.net',
+        'map.fastly.net',
+        'a.prod.fastly.net',
+        'global.prod.fastly.net',
+        'a.ssl.fastly.net',
+        'b.ssl.fastly.net',
+        'global.ssl.fastly.net',
+        'fastlylb.net',
+        'map.fastlylb.net',
+        'faststacks.net',
+        'feste-ip.net',
+        'firewall-gateway.net',
+        'flynnhosting.net',
+        'from-az.net',
+        'from-co.net',
+        'from-la.net',
+        'from-ny.net',
+        'gb.net',
+        'gets-it.net',
+        'ham-radio-op.net',
+        'hicam.net',
+        'homeftp.net',
+        'homeip.net',
+        'homelinux.net',
+        'homeunix.net',
+        'hu.net',
+        'in.net',
+        'in-dsl.net',
+        'in-the-band.net',
+        'in-vpn.net',
+        'iobb.net',
+        'ipifony.net',
+        'is-a-chef.net',
+        'is-a-geek.net',
+        'isa-geek.net',
+        'jp.net',
+        'kicks-ass.net',
+        'kinghost.net',
+        'knx-server.net',
+        'krellian.net',
+        'fr-1.paas.massivegrid.net',
+        'lon-1.paas.massivegrid.net',
+        'lon-2.paas.massivegrid.net',
+        'ny-1.paas.massivegrid.net',
+        'ny-2.paas.massivegrid.net',
+        'sg-1.paas.massivegrid.net',
+        'meinforum.net',
+        'memset.net',
+        'moonscale.net',
+        'mydatto.net',
+        'mydissent.net',
+        'myeffect.net',
+        'myfritz.net',
+        'mymediapc.net',
+        'mypsx.net',
+        'mysecuritycamera.net',
+        'myspreadshop.net',
+        'nhlfan.net',
+        'no-ip.net',
+        'now-dns.net',
+        'office-on-the.net',
+        'onavstack.net',
+        '*.hosting.ovh.net',
+        '*.webpaas.ovh.net',
+        'ownip.net',
+        'pgafan.net',
+        'podzone.net',
+        'privatizehealthinsurance.net',
+        'rackmaze.net',
+        'redirectme.net',
+        'reserve-online.net',
+        'ru.net',
+        'jelastic.saveincloud.net',
+        'nordeste-idc.saveincloud.net',
+        'j.scaleforce.net',
+        'schokokeks.net',
+        'scrapper-site.net',
+        'se.net',
+        'seidat.net',
+        'selfip.net',
+        'sells-it.net',
+        'senseering.net',
+        'servebbs.net',
+        'serveblog.net',
+        'serveftp.net',
+        'serveminecraft.net',
+        'shopselect.net',
+        'siteleaf.net',
+        'square7.net',
+        'soc.srcf.net',
+        'user.srcf.net',
+        'static-access.net',
+        'supabase.net',
+        'sytes.net',
+        't3l3p0rt.net',
+        'beta.tailscale.net',
+        'thruhere.net',
+        'torproject.net',
+        'pages.torproject.net',
+        'ts.net',
+        'jelastic.tsukaeru.net',
+        'twmail.net',
+        'uk.net',
+        'uni5.net',
+        'vpndns.net',
+        'vps-host.net',
+        'atl.jelastic.vps-host.net',
+        'njs.jelastic.vps-host.net',
+        'ric.jelastic.vps-host.net',
+        'webhop.net',
+        'yandexcloud.net',
+        'storage.yandexcloud.net',
+        'website.yandexcloud.net',
+        'za.net',
+        '*.alces.network',
+        'arvo.network',
+        'azimuth.network',
+        'co.network',
+        'tlon.network',
+        'noticeable.news',
+        'col.ng',
+        'blogspot.com.ng',
+        'firm.ng',
+        'gen.ng',
+        'ltd.ng',
+        'ngo.ng',
+        'blogspot.nl',
+        'cistron.nl',
+        'co.nl',
+        'demon.nl',
+        'hosting-cluster.nl',
+        'khplay.nl',
+        'myspreadshop.nl',
+        '*.transurl.nl',
+        'blogspot.no',
+        'co.no',
+        'myspreadshop.no',
+        'enterprisecloud.nu',
+        'merseine.nu',
+        'mine.nu',
+        'shacknet.nu',
+        'blogspot.co.nz',
+        'for.one',
+        'homelink.one',
+        'onred.one',
+        'staging.onred.one',
+        'service.one',
+        'under.one',
+        'barsy.online',
+        'eero.online',
+        'eero-stage.online',
+        'accesscam.org',
+        'ae.org',
+        'altervista.org',
+        'tele.amune.org',
+        'barsy.org',
+        'blogdns.org',
+        'blogsite.org',
+        'bmoattachments.org',
+        'boldlygoingnowhere.org',
+        'cable-modem.org',
+        'camdvr.org',
+        'c.cdn77.org',
+        'rsc.cdn77.org',
+        'ssl.origin.cdn77-secure.org',
+        'certmgr.org',
+        'cloudns.org',
+        'collegefan.org',
+        'couchpotatofries.org',
+        'ddnss.org',
+        'diskstation.org',
+        'dnsalias.org',
+        'dnsdojo.org',
+        'doesntexist.org',
+        'dontexist.org',
+        'doomdns.org',
+        'dsmynas.org',
+        'duckdns.org',
+        'dvrdns.org',
+        'dynalias.org',
+        'dyndns.org',
+        'go.dyndns.org',
+        'home.dyndns.org',
+        'dynserv.org',
+        'endofinternet.org',
+        'endoftheinternet.org',
+        'eu.org',
+        'al.eu.org',
+        'asso.eu.org',
+        'at.eu.org',
+        'au.eu.org',
+        'be.eu.org',
+        'bg.eu.org',
+        'ca.eu.org',
+        'cd.eu.org',
+        'ch.eu.org',
+        'cn.eu.org',
+        'cy.eu.org',
+        'cz.eu.org',
+        'de.eu.org',
+        'dk.eu.org',
+        'edu.eu.org',
+        'ee.eu.org',
+        'es.eu.org',
+        'fi.eu.org',
+        'fr.eu.org',
+        'gr.eu.org',
+        'hr.eu.org',
+        'hu.eu.org',
+        'ie.eu.org',
+        'il.eu.org',
+        'in.eu.org',
+        'int.eu.org',
+        'is.eu.org',
+        'it.eu.org',
+        'jp.eu.org',
+        'kr.eu.org',
+        'lt.eu.org',
+        'lu.eu.org',
+        'lv.eu.org',
+        'mc.eu.org',
+        'me.eu.org',
+        'mk.eu.org',
+        'mt.eu.org',
+        'my.eu.org',
+        'net.eu.org',
+        'ng.eu.org',
+        'nl.eu.org',
+        'no.eu.org',
+        'nz.eu.org',
+        'paris.eu.org',
+        'pl.eu.org',
+        'pt.eu.org',
+        'q-a.eu.org',
+        'ro.eu.org',
+        'ru.eu.org',
+        'se.eu.org',
+        'si.eu.org',
+        'sk.eu.org',
+        'tr.eu.org',
+        'uk.eu.org',
+        'us.eu.org',
+        'familyds.org',
+        'fedorainfracloud.org',
+        'fedorapeople.org',
+        'cloud.fedoraproject.org',
+        'app.os.fedoraproject.org',
+        'app.os.stg.fedoraproject.org',
+        'freeddns.org',
+        'freedesktop.org',
+        'from-me.org',
+        'game-host.org',
+        'gotdns.org',
+        'hepforge.org',
+        'hk.org',
+        'hobby-site.org',
+        'homedns.org',
+        'homeftp.org',
+        'homelinux.org',
+        'homeunix.org',
+        'hopto.org',
+        'httpbin.org',
+        'in-dsl.org',
+        'in-vpn.org',
+        'is-a-bruinsfan.org',
+        'is-a-candidate.org',
+        'is-a-celticsfan.org',
+        'is-a-chef.org',
+        'is-a-geek.org',
+        'is-a-knight.org',
+        'is-a-linux-user.org',
+        'is-a-patsfan.org',
+        'is-a-soxfan.org',
+        'is-found.org',
+        'is-lost.org',
+        'is-saved.org',
+        'is-very-bad.org',
+        'is-very-evil.org',
+        'is-very-good.org',
+        'is-very-nice.org',
+        'is-very-sweet.org',
+        'isa-geek.org',
+        'js.org',
+        'kicks-ass.org',
+        'mayfirst.org',
+        'misconfused.org',
+        'mlbfan.org',
+        'mozilla-iot.org',
+        'my-firewall.org',
+        'myfirewall.org',
+        'myftp.org',
+        'mysecuritycamera.org',
+        'mywire.org',
+        'nflfan.org',
+        'no-ip.org',
+        'now-dns.org',
+        'pimienta.org',
+        'podzone.org',
+        'poivron.org',
+        'potager.org',
+        'pubtls.org',
+        'read-books.org',
+        'readmyblog.org',
+        'selfip.org',
+        'sellsyourhome.org',
+        'servebbs.org',
+        'serveftp.org',
+        'servegame.org',
+        'small-web.org',
+        'spdns.org',
+        'stuff-4-sale.org',
+        'sweetpepper.org',
+        's3.teckids.org',
+        'toolforge.org',
+        'tunk.org',
+        'tuxfamily.org',
+        'twmail.org',
+        'ufcfan.org',
+        'us.org',
+        'webhop.org',
+        'webredirect.org',
+        'wmcloud.org',
+        'wmflabs.org',
+        'za.org',
+        'zapto.org',
+        'nerdpol.ovh',
+        'codeberg.page',
+        'hlx.page',
+        'hlx3.page',
+        'magnet.page',
+        'pdns.page',
+        'plesk.page',
+        'prvcy.page',
+        'ybo.party',
+        'blogspot.pe',
+        '1337.pictures',
+        'art.pl',
+        'beep.pl',
+        'co.pl',
+        'ecommerce-shop.pl',
+        'gda.pl',
+        'gdansk.pl',
+        'gdynia.pl',
+        'gliwice.pl',
+        'homesklep.pl',
+        'krakow.pl',
+        'krasnik.pl',
+        'leczna.pl',
+        'lubartow.pl',
+        'lublin.pl',
+        'med.pl',
+        'myspreadshop.pl',
+        'poniatowa.pl',
+        'poznan.pl',
+        'sdscloud.pl',
+        'shoparena.pl',
+        'sopot.pl',
+        'swidnik.pl',
+        'unicloud.pl',
+        'wroc.pl',
+        'zakopane.pl',
+        'co.place',
+        'own.pm',
+        'indie.porn',
+        'barsy.pro',
+        'cloudns.pro',
+        'bci.dnstrace.pro',
+        'blogspot.pt',
+        'barsy.pub',
+        'cloudns.pw',
+        'x443.pw',
+        'blogspot.qa',
+        'blogspot.re',
+        'ybo.review',
+        'clan.rip',
+        'barsy.ro',
+        'blogspot.ro',
+        'co.ro',
+        'shop.ro',
+        'lima-city.rocks',
+        'myddns.rocks',
+        'webspace.rocks',
+        'blogspot.rs',
+        'shop.brendly.rs',
+        'ox.rs',
+        'ua.rs',
+        'ac.ru',
+        'adygeya.ru',
+        'bashkiria.ru',
+        'bir.ru',
+        'blogspot.ru',
+        'cbg.ru',
+        'hb.cldmail.ru',
+        'com.ru',
+        'dagestan.ru',
+        'edu.ru',
+        'eurodir.ru',
+        'gov.ru',
+        'grozny.ru',
+        'int.ru',
+        'kalmykia.ru',
+        'kustanai.ru',
+        'lk3.ru',
+        'marine.ru',
+        'mcdir.ru',
+        'vps.mcdir.ru',
+        'mcpre.ru',
+        'mil.ru',
+        'mircloud.ru',
+        'mordovia.ru',
+        'msk.ru',
+        'myjino.ru',
+        '*.hosting.myjino.ru',
+        '*.landing.myjino.ru',
+        '*.spectrum.myjino.ru',
+        '*.vps.myjino.ru',
+        'mytis.ru',
+        'na4u.ru',
+        'nalchik.ru',
+        'net.ru',
+        'nov.ru',
+        'org.ru',
+        'pp.ru',
+        'pyatigorsk.ru',
+        'ras.ru',
+        'jelastic.regruhosting.ru',
+        'spb.ru',
+        'test.ru',
+        'vladikavkaz.ru',
+        'vladimir.ru',
+        '*.code.run',
+        'development.run',
+        'hs.run',
+        'ravendb.run',
+        'repl.run',
+        'servers.run',
+        'for.sale',
+        'ybo.science',
+        'edu.scot',
+        'gov.scot',
+        'service.gov.scot',
+        'blogspot.se',
+        'com.se',
+        'conf.se',
+        'iopsys.se',
+        'itcouldbewor.se',
+        'myspreadshop.se',
+        'su.paba.se',
+        'loginline.services',
+        'blogspot.sg',
+        'enscaled.sg',
+        'bip.sh',
+        'hashbang.sh',
+        'now.sh',
+        'bc.platform.sh',
+        'ent.platform.sh',
+        'eu.platform.sh',
+        'us.platform.sh',
+        'vxl.sh',
+        'wedeploy.sh',
+        'barsy.shop',
+        'base.shop',
+        'hoplix.shop',
+        'blogspot.si',
+        'gitapp.si',
+        'gitpage.si',
+        'barsy.site',
+        'byen.site',
+        '*.cloudera.site',
+        'cyon.site',
+        'fastvps.site',
+        'fnwk.site',
+        'folionetwork.site',
+        'jele.site',
+        'lelux.site',
+        'loginline.site',
+        'mintere.site',
+        'novecore.site',
+        'omniwe.site',
+        'opensocial.site',
+        '*.platformsh.site',
+        'srht.site',
+        '*.tst.site',
+        'blogspot.sk',
+        'blogspot.sn',
+        'sch.so',
+        '*.diher.solutions',
+        'myfast.space',
+        'uber.space',
+        'xs4all.space',
+        'noho.st',
+        'sellfy.store',
+        'shopware.store',
+        'storebase.store',
+        'abkhazia.su',
+        'adygeya.su',
+        'aktyubinsk.su',
+        'arkhangelsk.su',
+        'armenia.su',
+        'ashgabad.su',
+        'azerbaijan.su',
+        'balashov.su',
+        'bashkiria.su',
+        'bryansk.su',
+        'bukhara.su',
+        'chimkent.su',
+        'dagestan.su',
+        'east-kazakhstan.su',
+        'exnet.su',
+        'georgia.su',
+        'grozny.su',
+        'ivanovo.su',
+        'jambyl.su',
+        'kalmykia.su',
+        'kaluga.su',
+        'karacol.su',
+        'karaganda.su',
+        'karelia.su',
+        'khakassia.su',
+        'krasnodar.su',
+        'kurgan.su',
+        'kustanai.su',
+        'lenug.su',
+        'mangyshlak.su',
+        'mordovia.su',
+        'msk.su',
+        'murmansk.su',
+        'nalchik.su',
+        'navoi.su',
+        'north-kazakhstan.su',
+        'nov.su',
+        'obninsk.su',
+        'penza.su',
+        'pokrovsk.su',
+        'sochi.su',
+        'spb.su',
+        'tashkent.su',
+        'termez.su',
+        'togliatti.su',
+        'troitsk.su',
+        'tselinograd.su',
+        'tula.su',
+        'tuva.su',
+        'vladikavkaz.su',
+        'vladimir.su',
+        'vologda.su',
+        'barsy.support',
+        'knightpoint.systems',
+        'ch.tc',
+        'me.tc',
+        'we.tc',
+        'blogspot.td',
+        'discourse.team',
+        'jelastic.team',
+        'co.technology',
+        'online.th',
+        'shop.th',
+        'orangecloud.tn',
+        '611.to',
+        'nyan.to',
+        'oya.to',
+        'direct.quickconnect.to',
+        'rdv.to',
+        'vpnplus.to',
+        'prequalifyme.today',
+        'now-dns.top',
+        'ntdll.top',
+        'blogspot.com.tr',
+        'ybo.trade',
+        'better-than.tv',
+        'dyndns.tv',
+        'on-the-web.tv',
+        'worse-than.tv',
+        'blogspot.tw',
+        'mymailer.com.tw',
+        'url.tw',
+        'biz.ua',
+        'cc.ua',
+        'co.ua',
+        'cx.ua',
+        'inf.ua',
+        'ltd.ua',
+        'pp.ua',
+        'v.ua',
+        'blogspot.ug',
+        'barsy.uk',
+        'adimo.co.uk',
+        'barsy.co.uk',
+        'barsyonline.co.uk',
+        'blogspot.co.uk',
+        'dh.bytemark.co.uk',
+        'vm.bytemark.co.uk',
+        'gwiddle.co.uk',
+        'j.layershift.co.uk',
+        'myspreadshop.co.uk',
+        'nh-serv.co.uk',
+        'no-ip.co.uk',
+        'cust.retrosnub.co.uk',
+        'wellbeingzone.co.uk',
+        'conn.uk',
+        'copro.uk',
+        'homeoffice.gov.uk',
+        'service.gov.uk',
+        'hosp.uk',
+        'affinitylottery.org.uk',
+        'glug.org.uk',
+        'lug.org.uk',
+        'lugs.org.uk',
+        'raffleentry.org.uk',
+        'weeklylottery.org.uk',
+        'pymnt.uk',
+        'cloudns.us',
+        'lib.de.us',
+        'drud.us',
+        'phx.enscaled.us',
+        'freeddns.us',
+        'golffan.us',
+        'graphox.us',
+        'is-by.us',
+        'land-4-sale.us',
+        'mircloud.us',
+        'noip.us',
+        'platterp.us',
+        'pointto.us',
+        'stuff-4-sale.us',
+        'blogspot.com.uy',
+        '0e.vc',
+        'gv.vc',
+        'd.gv.vc',
+        'at.vg',
+        'blogspot.vn',
+        'blog.vu',
+        'cn.vu',
+        'dev.vu',
+        'me.vu',
+        'that.win',
+        'from.work',
+        'to.work',
+        '*.advisor.ws',
+        'cloud66.ws',
+        'dyndns.ws',
+        'mypets.ws',
+        'xn--41a.xn--p1acf',
+        'xn--80aaa0cvac.xn--p1acf',
+        'xn--90a1af.xn--p1acf',
+        'xn--90amc.xn--p1acf',
+        'xn--c1avg.xn--p1acf',
+        'xn--h1ahn.xn--p1acf',
+        'xn--h1aliz.xn--p1acf',
+        'xn--j1adp.xn--p1acf',
+        'xn--j1aef.xn--p1acf',
+        'xn--j1ael8b.xn--p1acf',
+        'blogsite.xyz',
+        'crafting.xyz',
+        'localzone.xyz',
+        '*.telebit.xyz',
+        'zapto.xyz',
+        'org.yt',
+        'blogspot.co.za',
+        'cloud66.zone',
+        'hs.zone',
+        'lima.zone',
+        '*.triton.zone',
+    )),
+)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2021, Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    '''
+    A size-bounded cache which discards the least recently used entries first.
+
+    The number of cache hits and misses is counted and can be obtained with ``cache_info()``.
+    '''
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def get(self, key, create):
+        '''
+        Return the value cached for ``key``. If there is none, ``create()`` is called to
+        compute the value, which is then stored in the cache.
+        '''
+        try:
+            value = self._data.pop(key)
+            self.hits += 1
+        except KeyError:
+            self.misses += 1
+            value = create()
+            if self.maxsize <= 0:
+                return value
+            if len(self._data) >= self.maxsize:
+                self._data.popitem(last=False)
+        self._data[key] = value
+        return value
+
+    def clear(self):
+        '''
+        Remove all entries from the cache and reset the statistics.
+        '''
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def cache_info(self):
+        '''
+        Return a dictionary with the number of cache hits and misses, the maximal size of
+        the cache, and the number of entries currently in the cache.
+        '''
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._data),
+        )
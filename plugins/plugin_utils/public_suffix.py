@@ -6,10 +6,20 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+import hashlib
 import os.path
 import re
 
-from ansible_collections.community.dns.plugins.module_utils.names import InvalidDomainName, split_into_labels, normalize_label
+from ansible_collections.community.dns.plugins.module_utils.file_cache import (
+    get_cache_directory,
+    get_cache_key,
+    read_json_cache_file,
+    write_json_cache_file,
+)
+from ansible_collections.community.dns.plugins.module_utils.names import (
+    InvalidDomainName,
+    parse_domain_name,
+)
 
 
 _BEGIN_SUBSET_MATCHER = re.compile(r'===BEGIN ([^=]*) DOMAINS===')
@@ -21,6 +31,8 @@ class PublicSuffixEntry(object):
     Contains a Public Suffix List entry with metadata.
     '''
 
+    __slots__ = ('labels', 'exception_rule', 'part')
+
     def __init__(self, labels, exception_rule=False, part=None):
         self.labels = labels
         self.exception_rule = exception_rule
@@ -56,6 +68,22 @@ def select_prevailing_rule(rules):
     return max_length_rule
 
 
+class _PublicSuffixTrieNode(object):
+    '''
+    A node of the Public Suffix List trie. Each node corresponds to a label, ``children`` maps
+    labels (including ``*`` for wildcards) to child nodes, and ``rules`` is a tuple of all rules
+    which end at this node (usually at most one normal and one exception rule). ``icann_rules``
+    contains the subset of ``rules`` from the ICANN part of the list.
+    '''
+
+    __slots__ = ('children', 'rules', 'icann_rules')
+
+    def __init__(self):
+        self.children = {}
+        self.rules = ()
+        self.icann_rules = ()
+
+
 class PublicSuffixList(object):
     '''
     Contains the Public Suffix List.
@@ -64,17 +92,67 @@ class PublicSuffixList(object):
     def __init__(self, rules):
         self._generic_rule = PublicSuffixEntry(('*', ))
         self._rules = sorted(rules, key=lambda entry: entry.labels)
+        self._trie = _PublicSuffixTrieNode()
+        for rule in self._rules:
+            node = self._trie
+            for label in rule.labels:
+                child = node.children.get(label)
+                if child is None:
+                    child = _PublicSuffixTrieNode()
+                    node.children[label] = child
+                node = child
+            node.rules += (rule, )
+            if rule.part == 'icann':
+                node.icann_rules += (rule, )
+        self._max_rule_length = max([len(rule.labels) for rule in self._rules] + [len(self._generic_rule.labels)])
+
+    def _find_matching_rules(self, normalized_labels, icann_only=False):
+        '''
+        Walk the trie along the given list of normalized labels and return all matching rules.
+
+        The rules are returned in the same order as they appear in ``self._rules``.
+        '''
+        rules_attribute = 'icann_rules' if icann_only else 'rules'
+        result = []
+        nodes = [self._trie]
+        for label in normalized_labels:
+            next_nodes = []
+            for node in nodes:
+                child = node.children.get(label)
+                if child is not None:
+                    next_nodes.append(child)
+                if label != '*':
+                    child = node.children.get('*')
+                    if child is not None:
+                        next_nodes.append(child)
+            if not next_nodes:
+                break
+            for node in next_nodes:
+                result.extend(getattr(node, rules_attribute))
+            nodes = next_nodes
+        if len(result) > 1:
+            # Since the sort is stable, rules with the same labels stay in the same order
+            result.sort(key=lambda rule: rule.labels)
+        return result
 
     @classmethod
     def load(cls, filename):
         '''
         Load Public Suffix List from the given filename.
+
+        The file is read line by line, so it never needs to be kept in memory as a whole.
+        '''
+        with open(filename, 'rb') as content_file:
+            return cls.parse(line.decode('utf-8') for line in content_file)
+
+    @classmethod
+    def parse(cls, lines):
+        '''
+        Parse Public Suffix List from an iterable of lines.
         '''
         rules = []
         part = None
-        with open(filename, 'rb') as content_file:
-            content = content_file.read().decode('utf-8')
-        for line in content.splitlines():
+        for line in lines:
             line = line.strip()
             if line.startswith('//') or not line:
                 m = _BEGIN_SUBSET_MATCHER.search(line)
@@ -92,10 +170,79 @@ class PublicSuffixList(object):
                 line = line[1:]
             if line.startswith('.'):
                 line = line[1:]
-            labels = tuple(normalize_label(label) for label in split_into_labels(line)[0])
+            labels = parse_domain_name(line).normalized_labels
             rules.append(PublicSuffixEntry(labels, exception_rule=exception_rule, part=part))
         return cls(rules)
 
+    @classmethod
+    def load_cached(cls, filename, cache_directory=None):
+        '''
+        Load Public Suffix List from the given filename, and keep a parsed snapshot of it in
+        the cache directory (see ``get_cache_directory()``).
+
+        The snapshot is used as long as the file's modification time and size did not change,
+        or if its SHA-256 checksum still matches.
+        '''
+        filename = os.path.abspath(filename)
+        cache_filename = os.path.join(
+            get_cache_directory(cache_directory), 'public-suffix-list-{0}.json'.format(get_cache_key(filename)))
+        stat = os.stat(filename)
+        cache = read_json_cache_file(cache_filename)
+        if isinstance(cache, dict) and cache.get('version') == 1 and 'rules' in cache:
+            try:
+                if cache.get('mtime') == stat.st_mtime and cache.get('size') == stat.st_size:
+                    return cls.from_snapshot(cache['rules'])
+                checksum = get_file_checksum(filename)
+                if cache.get('sha256') == checksum:
+                    cache['mtime'] = stat.st_mtime
+                    cache['size'] = stat.st_size
+                    write_json_cache_file(cache_filename, cache)
+                    return cls.from_snapshot(cache['rules'])
+            except (AttributeError, TypeError, ValueError):
+                # Cache file has been corrupted
+                pass
+        psl = cls.load(filename)
+        write_json_cache_file(cache_filename, {
+            'version': 1,
+            'source': filename,
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'sha256': get_file_checksum(filename),
+            'rules': psl.to_snapshot(),
+        })
+        return psl
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        '''
+        Create Public Suffix List from a snapshot created by ``to_snapshot()``.
+
+        Since the labels in a snapshot are already normalized, this is a lot faster than
+        parsing the original Public Suffix List file.
+        '''
+        rules = []
+        for part, part_rules in snapshot:
+            for rule in part_rules:
+                exception_rule = rule.startswith('!')
+                if exception_rule:
+                    rule = rule[1:]
+                labels = tuple(reversed(rule.split('.')))
+                rules.append(PublicSuffixEntry(labels, exception_rule=exception_rule, part=part))
+        return cls(rules)
+
+    def to_snapshot(self):
+        '''
+        Create a snapshot of the Public Suffix List that can be loaded by ``from_snapshot()``.
+
+        The snapshot is a tuple of pairs ``(part, rules)``, where ``rules`` is a tuple of rules in
+        PSL syntax with normalized labels.
+        '''
+        rules_per_part = {}
+        for rule in self._rules:
+            rules_per_part.setdefault(rule.part, []).append(
+                '{0}{1}'.format('!' if rule.exception_rule else '', '.'.join(reversed(rule.labels))))
+        return tuple((part, tuple(rules)) for part, rules in sorted(rules_per_part.items()))
+
     def get_suffix_length_and_rule(self, normalized_labels, icann_only=False):
         '''
         Given a list of normalized labels, searches for a matching rule.
@@ -110,12 +257,7 @@ class PublicSuffixList(object):
             return 0, None
 
         # Find matching rules
-        rules = []
-        for rule in self._rules:
-            if icann_only and rule.part != 'icann':
-                continue
-            if rule.matches(normalized_labels):
-                rules.append(rule)
+        rules = self._find_matching_rules(normalized_labels, icann_only=icann_only)
         if not rules:
             rules.append(self._generic_rule)
 
@@ -147,22 +289,8 @@ class PublicSuffixList(object):
         If ``icann_only`` is set to ``True``, only official ICANN rules are used. If
         ``icann_only`` is ``False`` (default), also private rules are used.
         '''
-        # Split into labels and normalize
-        try:
-            labels, tail = split_into_labels(domain)
-            normalized_labels = [normalize_label(label) for label in labels]
-        except InvalidDomainName:
-            return ''
-        if normalize_result:
-            labels = normalized_labels
-
-        # Get suffix length
-        suffix_length, rule = self.get_suffix_length_and_rule(normalized_labels, icann_only=icann_only)
-        if rule is None:
-            return ''
-        if not keep_unknown_suffix and rule is self._generic_rule:
-            return ''
-        return '.'.join(reversed(labels[:suffix_length])) + tail
+        return self._get_suffix(
+            domain, self._create_lookup(icann_only), keep_unknown_suffix=keep_unknown_suffix, normalize_result=normalize_result)
 
     def get_registrable_domain(self, domain, keep_unknown_suffix=True, only_if_registerable=True,
                                normalize_result=False, icann_only=False):
@@ -187,17 +315,134 @@ class PublicSuffixList(object):
         If ``icann_only`` is set to ``True``, only official ICANN rules are used. If
         ``icann_only`` is ``False`` (default), also private rules are used.
         '''
-        # Split into labels and normalize
+        return self._get_registrable_domain(
+            domain, self._create_lookup(icann_only), keep_unknown_suffix=keep_unknown_suffix,
+            only_if_registerable=only_if_registerable, normalize_result=normalize_result)
+
+    def get_suffix_part(self, domain, icann_only=False):
+        '''
+        Given a domain name, determines which part of the Public Suffix List contains the rule
+        that determines its public suffix.
+
+        Returns ``'icann'`` or ``'private'``, or ``None`` if the domain name is invalid or if
+        no explicit entry from the PSL matches.
+
+        If ``icann_only`` is set to ``True``, only official ICANN rules are used. If
+        ``icann_only`` is ``False`` (default), also private rules are used.
+        '''
+        split_domain = self._split_domain(domain, False)
+        if split_domain is None:
+            return None
+        dummy, rule = self.get_suffix_length_and_rule(split_domain[1], icann_only=icann_only)
+        if rule is None or rule is self._generic_rule:
+            return None
+        return rule.part
+
+    def get_suffixes(self, domains, keep_unknown_suffix=True, normalize_result=False, icann_only=False):
+        '''
+        Given an iterable of domain names, extracts the public suffix of every one of them.
+        Returns a list of the suffixes in the same order.
+
+        The options are the same as for ``get_suffix()``. This is faster than calling
+        ``get_suffix()`` for every domain name, since lookups are shared between names
+        with the same suffix.
+        '''
+        lookup = self._create_lookup(icann_only, memoize=True)
+        results = {}
+        result = []
+        for domain in domains:
+            suffix = results.get(domain)
+            if suffix is None:
+                suffix = self._get_suffix(
+                    domain, lookup, keep_unknown_suffix=keep_unknown_suffix, normalize_result=normalize_result)
+                results[domain] = suffix
+            result.append(suffix)
+        return result
+
+    def get_registrable_domains(self, domains, keep_unknown_suffix=True, only_if_registerable=True,
+                                normalize_result=False, icann_only=False):
+        '''
+        Given an iterable of domain names, extracts the registrable domain of every one of them.
+        Returns a list of the registrable domains in the same order.
+
+        The options are the same as for ``get_registrable_domain()``. This is faster than calling
+        ``get_registrable_domain()`` for every domain name, since lookups are shared between names
+        with the same suffix.
+        '''
+        lookup = self._create_lookup(icann_only, memoize=True)
+        results = {}
+        result = []
+        for domain in domains:
+            registrable_domain = results.get(domain)
+            if registrable_domain is None:
+                registrable_domain = self._get_registrable_domain(
+                    domain, lookup, keep_unknown_suffix=keep_unknown_suffix,
+                    only_if_registerable=only_if_registerable, normalize_result=normalize_result)
+                results[domain] = registrable_domain
+            result.append(registrable_domain)
+        return result
+
+    def _create_lookup(self, icann_only, memoize=False):
+        '''
+        Create a function which maps a list of normalized labels to ``(suffix_length, rule)``.
+
+        If ``memoize`` is ``True``, the results are memoized. Since a lookup only depends on the
+        top-most labels (as many as the longest rule has), names below a common domain share
+        the same entry.
+        '''
+        if not memoize:
+            return lambda normalized_labels: self.get_suffix_length_and_rule(normalized_labels, icann_only=icann_only)
+
+        cache = {}
+        max_rule_length = self._max_rule_length
+
+        def lookup(normalized_labels):
+            key = tuple(normalized_labels[:max_rule_length])
+            result = cache.get(key)
+            if result is None:
+                result = self.get_suffix_length_and_rule(normalized_labels, icann_only=icann_only)
+                cache[key] = result
+            return result
+
+        return lookup
+
+    def _split_domain(self, domain, normalize_result):
+        '''
+        Split domain name into labels and normalize them.
+
+        Returns a tuple ``(labels, normalized_labels, tail)``, or ``None`` if the domain name is invalid.
+        '''
         try:
-            labels, tail = split_into_labels(domain)
-            normalized_labels = [normalize_label(label) for label in labels]
+            name = parse_domain_name(domain)
         except InvalidDomainName:
+            return None
+        return name.normalized_labels if normalize_result else name.labels, name.normalized_labels, name.tail
+
+    def _get_suffix(self, domain, lookup, keep_unknown_suffix=True, normalize_result=False):
+        # Split into labels and normalize
+        split_domain = self._split_domain(domain, normalize_result)
+        if split_domain is None:
+            return ''
+        labels, normalized_labels, tail = split_domain
+
+        # Get suffix length
+        suffix_length, rule = lookup(normalized_labels)
+        if rule is None:
+            return ''
+        if not keep_unknown_suffix and rule is self._generic_rule:
+            return ''
+        return '.'.join(reversed(labels[:suffix_length])) + tail
+
+    def _get_registrable_domain(self, domain, lookup, keep_unknown_suffix=True, only_if_registerable=True,
+                                normalize_result=False):
+        # Split into labels and normalize
+        split_domain = self._split_domain(domain, normalize_result)
+        if split_domain is None:
             return ''
-        if normalize_result:
-            labels = normalized_labels
+        labels, normalized_labels, tail = split_domain
 
         # Get suffix length
-        suffix_length, rule = self.get_suffix_length_and_rule(normalized_labels, icann_only=icann_only)
+        suffix_length, rule = lookup(normalized_labels)
         if rule is None:
             return ''
         if not keep_unknown_suffix and rule is self._generic_rule:
@@ -209,5 +454,59 @@ class PublicSuffixList(object):
         return '.'.join(reversed(labels[:suffix_length])) + tail
 
 
-# The official Public Suffix List
-PUBLIC_SUFFIX_LIST = PublicSuffixList.load(os.path.join(os.path.dirname(__file__), '..', 'public_suffix_list.dat'))
+def get_file_checksum(filename):
+    '''
+    Compute the SHA-256 checksum of the given file.
+    '''
+    sha256 = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class LazyPublicSuffixList(object):
+    '''
+    Proxy for a Public Suffix List which is only loaded on first use.
+    '''
+
+    def __init__(self, loader):
+        self._loader = loader
+        self._psl = None
+
+    def get(self):
+        '''
+        Return the Public Suffix List, loading it if this did not happen so far.
+        '''
+        if self._psl is None:
+            self._psl = self._loader()
+        return self._psl
+
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
+
+
+PUBLIC_SUFFIX_LIST_FILENAME = os.path.join(os.path.dirname(__file__), '..', 'public_suffix_list.dat')
+
+PUBLIC_SUFFIX_LIST_ENV_VARIABLE = 'COMMUNITY_DNS_PUBLIC_SUFFIX_LIST'
+
+
+def _load_public_suffix_list():
+    # Allow the user to provide a Public Suffix List of their own
+    filename = os.environ.get(PUBLIC_SUFFIX_LIST_ENV_VARIABLE)
+    if filename:
+        return PublicSuffixList.load_cached(os.path.expanduser(filename))
+
+    try:
+        from ansible_collections.community.dns.plugins.plugin_utils import _public_suffix_list_data as snapshot
+        # Only use the precompiled snapshot when it was created from the current PSL file
+        if snapshot.SOURCE_SHA256 == get_file_checksum(PUBLIC_SUFFIX_LIST_FILENAME):
+            return PublicSuffixList.from_snapshot(snapshot.RULES)
+    except ImportError:
+        pass
+    return PublicSuffixList.load(PUBLIC_SUFFIX_LIST_FILENAME)
+
+
+# The Public Suffix List. This is the official list shipped with this collection, unless the
+# environment variable COMMUNITY_DNS_PUBLIC_SUFFIX_LIST points to another file.
+PUBLIC_SUFFIX_LIST = LazyPublicSuffixList(_load_public_suffix_list)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# (c) 2021, Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+import pytest
+
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.community.dns.plugins.filter.domain_suffix import (
+    PUBLIC_SUFFIX_CACHE,
+    get_public_suffix,
+    get_registrable_domain,
+    remove_public_suffix,
+    remove_registrable_domain,
+)
+
+
+def test_filter_cache():
+    PUBLIC_SUFFIX_CACHE.clear()
+    assert get_public_suffix('www.example.com') == '.com'
+    assert get_public_suffix('www.example.com', keep_leading_period=False) == 'com'
+    assert remove_public_suffix('www.example.com') == 'www.example'
+    assert PUBLIC_SUFFIX_CACHE.cache_info()['hits'] == 2
+    assert PUBLIC_SUFFIX_CACHE.cache_info()['misses'] == 1
+
+    assert get_public_suffix('www.example.com', normalize_result=True) == '.com'
+    assert PUBLIC_SUFFIX_CACHE.cache_info()['misses'] == 2
+
+    assert get_registrable_domain('www.example.com') == 'example.com'
+    assert remove_registrable_domain('www.example.com') == 'www'
+    assert remove_registrable_domain('www.example.com', keep_trailing_period=True) == 'www.'
+    assert PUBLIC_SUFFIX_CACHE.cache_info()['hits'] == 4
+    assert PUBLIC_SUFFIX_CACHE.cache_info()['misses'] == 3
+
+
+def test_filter_lists():
+    names = ['www.example.com', 'example.com', 'com', 'www.example.co.uk.', 'foo.bar.unknowntld', '-invalid.com']
+    for filter_function, kwargs in [
+        (get_public_suffix, {}),
+        (get_public_suffix, {'keep_leading_period': False, 'keep_unknown_suffix': False}),
+        (get_registrable_domain, {}),
+        (get_registrable_domain, {'only_if_registerable': False, 'normalize_result': True}),
+        (remove_public_suffix, {}),
+        (remove_public_suffix, {'keep_trailing_period': True}),
+        (remove_registrable_domain, {}),
+        (remove_registrable_domain, {'keep_trailing_period': True, 'icann_only': True}),
+    ]:
+        expected = [filter_function(name, **kwargs) for name in names]
+        assert filter_function(names, **kwargs) == expected
+        assert filter_function(tuple(names), **kwargs) == expected
+        assert filter_function((name for name in names), **kwargs) == expected
+        with pytest.raises(AnsibleFilterError) as exc:
+            filter_function(dict((name, name) for name in names), **kwargs)
+        assert exc.value.message == 'Expected a DNS name or a list of DNS names, but got a dictionary'
+    assert get_registrable_domain([]) == []
+    assert remove_public_suffix(['www.example.com', 'www.example.com']) == ['www.example', 'www.example']
@@ -14,15 +14,24 @@ import pytest
 
 from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import MagicMock, patch
 
+from ansible_collections.community.dns.plugins.module_utils.json_codec import (
+    encode_json,
+)
+
 from ansible_collections.community.dns.plugins.module_utils.record import (
     DNSRecord,
 )
 
+from ansible_collections.community.dns.plugins.module_utils.zone_id_cache import (
+    ZoneIDCache,
+)
+
 from ansible_collections.community.dns.plugins.module_utils.zone_record_api import (
     DNSAPIError,
 )
 
 from ansible_collections.community.dns.plugins.module_utils.hetzner.api import (
+    _chunk_records,
     _create_record_from_json,
     _record_to_json,
     HetznerAPI,
@@ -122,6 +131,295 @@ def test_list_pagination():
     assert result is None
 
 
+def test_list_pagination_concurrent():
+    def get(url, query=None, must_have_content=True, expected=None):
+        assert url == 'https://example.com'
+        assert expected == ([200, 404] if query['page'] == 1 else [200])
+        assert query['per_page'] == 2
+        assert query['foo'] == 'bar'
+        page = query['page']
+        return {
+            'data': [page * 2 - 1, page * 2] if page < 5 else [9],
+            'meta': {
+                'pagination': {
+                    'page': page,
+                    'per_page': 2,
+                    'last_page': 5,
+                    'total_entries': 9,
+                },
+            },
+        }, {'status': 200}
+
+    api = HetznerAPI(MagicMock(), '123', max_concurrency=3)
+    api._get = MagicMock(side_effect=get)
+    result = api._list_pagination('https://example.com', 'data', query=dict(foo='bar'), block_size=2, accept_404=True)
+    assert result == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    assert sorted(call[0][1]['page'] for call in api._get.call_args_list) == [1, 2, 3, 4, 5]
+
+    def get_error(url, query=None, must_have_content=True, expected=None):
+        if query['page'] == 3:
+            raise DNSAPIError('error')
+        return get(url, query=query, must_have_content=must_have_content, expected=expected)
+
+    api._get = MagicMock(side_effect=get_error)
+    with pytest.raises(DNSAPIError) as exc:
+        api._list_pagination('https://example.com', 'data', query=dict(foo='bar'), block_size=2, accept_404=True)
+    assert exc.value.args[0] == 'error'
+
+
+def _create_record(record_id, target):
+    record = DNSRecord()
+    record.id = record_id
+    record.type = 'A'
+    record.prefix = 'www'
+    record.target = target
+    record.ttl = 3600
+    return record
+
+
+def test_is_bulk_update_unavailable():
+    assert HetznerAPI._is_bulk_update_unavailable(None, {'status': 502}) is True
+    assert HetznerAPI._is_bulk_update_unavailable({'records': []}, {'status': 500}) is True
+    assert HetznerAPI._is_bulk_update_unavailable(
+        {'error': {'message': 'An invalid response was received from the upstream server', 'code': 502}}, {'status': 200}) is True
+    assert HetznerAPI._is_bulk_update_unavailable({'message': 'An invalid response was received from the upstream server'}, {'status': 200}) is True
+    assert HetznerAPI._is_bulk_update_unavailable({'records': [], 'failed_records': []}, {'status': 200}) is False
+    assert HetznerAPI._is_bulk_update_unavailable({'records': [], 'error': {'message': '', 'code': 0}}, {'status': 200}) is False
+    assert HetznerAPI._is_bulk_update_unavailable(None, {'status': 404}) is True
+    assert HetznerAPI._is_bulk_update_unavailable({'message': 'invalid record'}, {'status': 422}) is False
+
+
+def test_update_records_bulk():
+    records = [_create_record('1', '1.2.3.4'), _create_record('2', '1.2.3.5'), _create_record('3', '1.2.3.6')]
+
+    def put(url, data=None, query=None, must_have_content=True, expected=None, retry_server_errors=True):
+        assert url == 'v1/records/bulk'
+        assert retry_server_errors is False
+        assert [record['id'] for record in data['records']] == ['1', '2', '3']
+        return {
+            'records': [dict(record, zone_id='z') for record in data['records'] if record['id'] != '2'],
+            'failed_records': [dict(record, zone_id='z') for record in data['records'] if record['id'] == '2'],
+        }, {'status': 200}
+
+    api = HetznerAPI(MagicMock(), '123', bulk_update=True)
+    api._put = MagicMock(side_effect=put)
+    api.update_record = MagicMock(side_effect=lambda zone_id, record: record)
+    results = api.update_records({'z': records})
+    assert api._put.call_count == 1
+    # The results are in the order of the records
+    assert [(record.id, record.target, updated, failed) for record, updated, failed in results['z']] == [
+        ('1', '1.2.3.4', True, None),
+        ('2', '1.2.3.5', True, None),
+        ('3', '1.2.3.6', True, None),
+    ]
+    # Only the record the bulk update failed for is updated on its own
+    api.update_record.assert_called_once_with('z', records[1])
+
+
+def test_update_records_bulk_order():
+    records = [_create_record('1', '1.2.3.4'), _create_record(None, '1.2.3.5'), _create_record('3', '1.2.3.6')]
+    other_records = [_create_record('4', '1.2.3.7'), _create_record('5', '1.2.3.8')]
+
+    def put(url, data=None, query=None, must_have_content=True, expected=None, retry_server_errors=True):
+        assert [record['id'] for record in data['records']] == ['1', '3', '4', '5']
+        # The API does not return the records in the order they were sent
+        return {
+            'records': [dict(record, zone_id='y') for record in reversed(data['records']) if record['id'] in ('5', '3')],
+            'failed_records': [],
+        }, {'status': 200}
+
+    def update_record(zone_id, record):
+        if record.id is None:
+            raise DNSAPIError('Need record ID to update record!')
+        return record
+
+    api = HetznerAPI(MagicMock(), '123')
+    api._put = MagicMock(side_effect=put)
+    api.update_record = MagicMock(side_effect=update_record)
+    results = api.update_records({'z': records, 'y': other_records}, stop_early_on_errors=False)
+    assert [(record.id, updated, str(failed) if failed else None) for record, updated, failed in results['z']] == [
+        ('1', True, None),
+        (None, False, 'Need record ID to update record!'),
+        ('3', True, None),
+    ]
+    assert [(record.id, updated, failed) for record, updated, failed in results['y']] == [('4', True, None), ('5', True, None)]
+    assert api.update_record.call_count == 3
+
+
+def test_update_records_bulk_unavailable():
+    records = [_create_record('1', '1.2.3.4'), _create_record('2', '1.2.3.5')]
+    api = HetznerAPI(MagicMock(), '123', bulk_update=True)
+    api._put = MagicMock(return_value=({
+        'error': {'message': 'An invalid response was received from the upstream server', 'code': 502},
+    }, {'status': 502}))
+    api.update_record = MagicMock(side_effect=lambda zone_id, record: record)
+    results = api.update_records({'z': records})
+    assert [(record.id, updated, failed) for record, updated, failed in results['z']] == [('1', True, None), ('2', True, None)]
+    assert api.update_record.call_count == 2
+
+    # The bulk update endpoint is not used again
+    api.update_records({'z': records})
+    assert api._put.call_count == 1
+    assert api.update_record.call_count == 4
+
+
+def test_update_records_bulk_rejected():
+    records = [_create_record('1', '1.2.3.4'), _create_record('2', '1.2.3.5')]
+    api = HetznerAPI(MagicMock(), '123', bulk_update=True)
+    api._put = MagicMock(return_value=({'error': {'message': 'invalid record', 'code': 422}}, {'status': 422}))
+    api.update_record = MagicMock(side_effect=lambda zone_id, record: record)
+    results = api.update_records({'z': records})
+    assert [(record.id, updated, failed) for record, updated, failed in results['z']] == [('1', True, None), ('2', True, None)]
+    assert api.update_record.call_count == 2
+    assert api._put.call_args[1]['expected'][:3] == [200, 400, 402]
+
+    # The bulk update endpoint is still used
+    api.update_records({'z': records})
+    assert api._put.call_count == 2
+
+
+def test_update_records_no_bulk():
+    records = [_create_record('1', '1.2.3.4'), _create_record('2', '1.2.3.5')]
+    assert HetznerAPI(MagicMock(), '123').bulk_update is True
+    api = HetznerAPI(MagicMock(), '123', bulk_update=False)
+    api._put = MagicMock()
+    api.update_record = MagicMock(side_effect=lambda zone_id, record: record)
+    results = api.update_records({'z': records})
+    assert [(record.id, updated, failed) for record, updated, failed in results['z']] == [('1', True, None), ('2', True, None)]
+    api._put.assert_not_called()
+
+
+def test_chunk_records():
+    records = [_create_record(None, '1.2.3.{0}'.format(index)) for index in range(5)]
+    size = len(encode_json(_record_to_json(records[0], zone_id='z'))) + 1
+    chunks = list(_chunk_records({'z': records[:3], 'y': records[3:]}, 2, 10000))
+    assert [[(zone_id, json_record['value']) for zone_id, dummy, json_record in chunk] for chunk in chunks] == [
+        [('z', '1.2.3.0'), ('z', '1.2.3.1')],
+        [('z', '1.2.3.2'), ('y', '1.2.3.3')],
+        [('y', '1.2.3.4')],
+    ]
+    assert chunks[0][1][1] is records[1]
+    assert [len(chunk) for chunk in _chunk_records({'z': records}, 100, 3 * size + 10)] == [3, 2]
+    # Records larger than the limit are sent on their own
+    assert [len(chunk) for chunk in _chunk_records({'z': records}, 100, 1)] == [1, 1, 1, 1, 1]
+    assert list(_chunk_records({'z': []}, 100, 100)) == []
+
+
+def test_add_records_chunked():
+    records = [_create_record(None, '1.2.3.{0}'.format(index)) for index in range(5)]
+
+    def post(url, data=None, query=None, must_have_content=True, expected=None):
+        assert url == 'v1/records/bulk'
+        assert expected == [200, 422]
+        assert len(data['records']) <= 2
+        if any(record['value'] == '1.2.3.2' for record in data['records']):
+            return {
+                'invalid_records': [record for record in data['records'] if record['value'] == '1.2.3.2'],
+                'valid_records': [record for record in data['records'] if record['value'] != '1.2.3.2'],
+            }, {'status': 422}
+        return {
+            'records': [dict(record, id='id-{0}'.format(record['value'])) for record in data['records']],
+        }, {'status': 200}
+
+    api = HetznerAPI(MagicMock(), '123', bulk_max_records=2)
+    api._post = MagicMock(side_effect=post)
+    results = api.add_records({'z': records}, stop_early_on_errors=False)
+    assert api._post.call_count == 3
+    assert [(record.id, record.target, created, failed is not None) for record, created, failed in results['z']] == [
+        ('id-1.2.3.0', '1.2.3.0', True, False),
+        ('id-1.2.3.1', '1.2.3.1', True, False),
+        (None, '1.2.3.2', False, True),
+        (None, '1.2.3.3', False, False),
+        ('id-1.2.3.4', '1.2.3.4', True, False),
+    ]
+
+    # Remaining chunks are not sent after an error
+    api._post = MagicMock(side_effect=post)
+    results = api.add_records({'z': records}, stop_early_on_errors=True)
+    assert api._post.call_count == 2
+    assert [(record.target, created, failed is not None) for record, created, failed in results['z']] == [
+        ('1.2.3.0', True, False),
+        ('1.2.3.1', True, False),
+        ('1.2.3.2', False, True),
+        ('1.2.3.3', False, False),
+        ('1.2.3.4', False, False),
+    ]
+
+    # Errors of later chunks are reported per record
+    api._post = MagicMock(side_effect=[
+        ({'records': [dict(_record_to_json(record, zone_id='z'), id='1') for record in records[:2]]}, {'status': 200}),
+        DNSAPIError('error'),
+        ({'records': [dict(_record_to_json(records[4], zone_id='z'), id='2')]}, {'status': 200}),
+    ])
+    results = api.add_records({'z': records}, stop_early_on_errors=False)
+    assert [(created, str(failed) if failed else None) for record, created, failed in results['z']] == [
+        (True, None), (True, None), (False, 'error'), (False, 'error'), (True, None),
+    ]
+
+    # Errors of the first chunk are raised
+    api._post = MagicMock(side_effect=DNSAPIError('error'))
+    with pytest.raises(DNSAPIError) as exc:
+        api.add_records({'z': records})
+    assert exc.value.args[0] == 'error'
+
+
+def test_get_zone_with_records_by_name_zone_id_cache(tmpdir):
+    zones = {
+        'example.com': {'id': 'a', 'name': 'example.com', 'ttl': 3600},
+    }
+    records = {
+        'a': [
+            {'id': '1', 'type': 'SOA', 'name': '@', 'value': 'ns1 admin 1 2 3 4 5', 'zone_id': 'a'},
+            {'id': '2', 'type': 'A', 'name': 'www', 'value': '1.2.3.4', 'zone_id': 'a'},
+        ],
+        # The API returned records of another zone
+        'b': [
+            {'id': '3', 'type': 'SOA', 'name': '@', 'value': 'ns1 admin 1 2 3 4 5', 'zone_id': 'c'},
+        ],
+    }
+    calls = []
+
+    def get(url, query=None, must_have_content=True, expected=None):
+        calls.append(url)
+        if url == 'v1/zones':
+            return {'zones': [zone for zone in zones.values() if zone['name'] == query['name']]}, {'status': 200}
+        assert url == 'v1/records'
+        if query['zone_id'] not in records:
+            return None, {'status': 404}
+        result = records[query['zone_id']]
+        return {'records': result, 'meta': {'pagination': {'page': 1, 'per_page': 100, 'last_page': 1, 'total_entries': len(result)}}}, {'status': 200}
+
+    api = HetznerAPI(MagicMock(), '123')
+    api._get = MagicMock(side_effect=get)
+    api.zone_id_cache = ZoneIDCache(str(tmpdir / 'zone-ids.json'), 100)
+
+    # The zone is looked up by name, and its ID is remembered
+    result = api.get_zone_with_records_by_name('example.com', prefix='www')
+    assert (result.zone.id, result.zone.info['ttl'], [record.id for record in result.records]) == ('a', 3600, ['2'])
+    assert calls == ['v1/zones', 'v1/records']
+    assert api.zone_id_cache.get('example.com') == 'a'
+
+    # With the cached ID, only the records are retrieved
+    del calls[:]
+    result = api.get_zone_with_records_by_name('example.com', record_type='SOA')
+    assert (result.zone.id, result.zone.name, result.zone.info, [record.id for record in result.records]) == ('a', 'example.com', {}, ['1'])
+    assert calls == ['v1/records']
+
+    # The cached ID belongs to another zone, or the zone no longer exists
+    for zone_id in ('b', 'd'):
+        api.zone_id_cache.set('example.com', zone_id)
+        del calls[:]
+        result = api.get_zone_with_records_by_name('example.com')
+        assert (result.zone.id, [record.id for record in result.records]) == ('a', ['1', '2'])
+        assert calls == ['v1/records', 'v1/zones', 'v1/records']
+        assert api.zone_id_cache.get('example.com') == 'a'
+
+    # Zones which do not exist are not remembered
+    api.zone_id_cache.set('example.org', 'd')
+    assert api.get_zone_with_records_by_name('example.org') is None
+    assert api.zone_id_cache.get('example.org') is None
+
+
 def test_update_id_missing():
     api = HetznerAPI(MagicMock(), '123')
     with pytest.raises(DNSAPIError) as exc:
@@ -12,6 +12,10 @@ import pytest
 
 from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import MagicMock, patch
 
+from ansible_collections.community.dns.plugins.module_utils.http_cache import (
+    CachingHTTPHelper,
+)
+
 from ansible_collections.community.dns.plugins.module_utils.zone_record_api import (
     DNSAPIError,
 )
@@ -43,3 +47,27 @@ def test_wsdl_missing():
         assert exc.value.args[0] == 'Needs lxml Python module (pip install lxml)'
     finally:
         api.HAS_LXML_ETREE = old_value
+
+
+def test_response_cache(tmpdir):
+    with patch.dict('os.environ', {'COMMUNITY_DNS_CACHE_DIR': str(tmpdir)}):
+        option_provider = CustomProvideOptions({
+            'hosttech_token': 'foo',
+            'response_cache': True,
+        })
+        json_api = api.create_hosttech_api(option_provider, MagicMock())
+        assert isinstance(json_api._http_helper, CachingHTTPHelper)
+
+        # The WSDL API also reads data with POST requests, so its responses are not cached
+        option_provider = CustomProvideOptions({
+            'hosttech_username': 'foo',
+            'hosttech_password': 'foo',
+            'response_cache': True,
+        })
+        old_value = api.HAS_LXML_ETREE
+        try:
+            api.HAS_LXML_ETREE = True
+            wsdl_api = api.create_hosttech_api(option_provider, MagicMock())
+        finally:
+            api.HAS_LXML_ETREE = old_value
+        assert not isinstance(wsdl_api._http_helper, CachingHTTPHelper)
@@ -18,6 +18,10 @@ from ansible_collections.community.dns.plugins.module_utils.record import (
     DNSRecord,
 )
 
+from ansible_collections.community.dns.plugins.module_utils.zone_id_cache import (
+    ZoneIDCache,
+)
+
 from ansible_collections.community.dns.plugins.module_utils.zone_record_api import (
     DNSAPIError,
 )
@@ -380,3 +384,100 @@ def test_extract_error_message():
     assert api._extract_error_message(dict(message='foo', errors=dict())) == ' with message "foo"'
     assert api._extract_error_message(dict(message='foo', errors=dict(bar='baz'))) == ' with message "foo" (field "bar": baz)'
     assert api._extract_error_message(dict(errors=dict(bar=['baz', 'bam'], arf='fra'))) == ' (field "arf": fra) (field "bar": baz; bam)'
+
+
+def test_get_zone_with_records_by_id():
+    zone = {
+        'id': 42,
+        'name': 'example.com',
+        'email': 'test@example.com',
+        'ttl': 10800,
+        'nameserver': 'ns1.hosttech.ch',
+        'dnssec': False,
+        'records': [
+            {'id': 1, 'type': 'A', 'name': 'www', 'ipv4': '1.2.3.4', 'ttl': 3600, 'comment': ''},
+            {'id': 2, 'type': 'AAAA', 'name': 'www', 'ipv6': '::1', 'ttl': 3600, 'comment': ''},
+            {'id': 3, 'type': 'A', 'name': '', 'ipv4': '1.2.3.5', 'ttl': 3600, 'comment': ''},
+        ],
+    }
+    http_helper = MagicMock()
+    http_helper.fetch_url = MagicMock(return_value=(
+        json.dumps({'data': zone}).encode('utf-8'),
+        {'status': 200, 'url': 'https://example.com', 'content-type': 'application/json'},
+    ))
+    api = HostTechJSONAPI(http_helper, '123')
+    result = api.get_zone_with_records_by_id(42, prefix='www', record_type='A')
+    assert result.zone.id == 42
+    assert result.zone.name == 'example.com'
+    assert [record.id for record in result.records] == [1]
+    result = api.get_zone_with_records_by_id(42)
+    assert [record.id for record in result.records] == [1, 2, 3]
+
+    http_helper.fetch_url = MagicMock(return_value=(
+        b'{"message": "Not found"}',
+        {'status': 404, 'url': 'https://example.com', 'content-type': 'application/json'},
+    ))
+    assert api.get_zone_with_records_by_id(42) is None
+
+    http_helper.fetch_url = MagicMock(return_value=(
+        b'{"data": ',
+        {'status': 200, 'url': 'https://example.com', 'content-type': 'application/json'},
+    ))
+    with pytest.raises(DNSAPIError) as exc:
+        api.get_zone_with_records_by_id(42)
+    assert exc.value.args[0] == 'GET https://example.com did not yield JSON data, but HTTP status code 200 with data: {"data": '
+
+    http_helper.fetch_url = MagicMock(return_value=(
+        b'{"result": {"records": []}}',
+        {'status': 200, 'url': 'https://example.com', 'content-type': 'application/json'},
+    ))
+    with pytest.raises(DNSAPIError) as exc:
+        api.get_zone_with_records_by_id(42)
+    assert exc.value.args[0] == (
+        'GET https://example.com did not yield the expected JSON data, but HTTP status code 200 with data: {"result": {"records": []}}'
+    )
+
+
+def test_get_zone_with_records_by_name_zone_id_cache(tmpdir):
+    zone = {
+        'id': 42,
+        'name': 'example.com',
+        'email': 'test@example.com',
+        'ttl': 10800,
+        'nameserver': 'ns1.hosttech.ch',
+        'dnssec': False,
+        'records': [
+            {'id': 1, 'type': 'A', 'name': 'www', 'ipv4': '1.2.3.4', 'ttl': 3600, 'comment': ''},
+        ],
+    }
+    http_helper = MagicMock()
+    http_helper.fetch_url = MagicMock(return_value=(
+        json.dumps({'data': zone}).encode('utf-8'),
+        {'status': 200, 'url': 'https://example.com', 'content-type': 'application/json'},
+    ))
+    api = HostTechJSONAPI(http_helper, '123')
+    api.zone_id_cache = ZoneIDCache(str(tmpdir / 'zone-ids.json'), 100)
+    api._list_pagination = MagicMock(return_value=[{'id': 42, 'name': 'example.com'}])
+    result = api.get_zone_with_records_by_name('example.com')
+    assert result.zone.id == 42
+    assert api._list_pagination.call_count == 1
+    assert http_helper.fetch_url.call_count == 1
+
+    # The zone is not searched for again
+    result = api.get_zone_with_records_by_name('example.com')
+    assert result.zone.id == 42
+    assert result.zone.info['email'] == 'test@example.com'
+    assert [record.id for record in result.records] == [1]
+    assert api.get_zone_by_name('example.com').id == 42
+    assert api._list_pagination.call_count == 1
+    assert http_helper.fetch_url.call_count == 3
+
+    # The zone does not exist anymore
+    http_helper.fetch_url = MagicMock(return_value=(
+        b'{"message": "Not found"}',
+        {'status': 404, 'url': 'https://example.com', 'content-type': 'application/json'},
+    ))
+    api._list_pagination = MagicMock(return_value=[])
+    assert api.get_zone_with_records_by_name('example.com') is None
+    assert api._list_pagination.call_count == 1
+    assert api.zone_id_cache.get('example.com') is None
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# (c) 2021 Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import pytest
+
+from ansible_collections.community.dns.plugins.module_utils.api_stats import (
+    APIStats,
+    get_endpoint_name,
+)
+
+
+@pytest.mark.parametrize('method, url, base_url, expected', [
+    ('GET', 'https://dns.hetzner.com/api/v1/zones?name=example.com', 'https://dns.hetzner.com/api/', 'GET v1/zones'),
+    ('PUT', 'https://dns.hetzner.com/api/v1/records/bcb0fa2c08b8dd8dc2cc8e2d5fc2ef54', 'https://dns.hetzner.com/api/', 'PUT v1/records/{id}'),
+    ('GET', 'https://dns.hetzner.com/api/v1/zones/VxDnbQHkQTJVdfrXKJWKVd', 'https://dns.hetzner.com/api/', 'GET v1/zones/{id}'),
+    ('DELETE', 'https://api.ns1.hosttech.eu/api/user/v1/zones/42/records/123', 'https://api.ns1.hosttech.eu/api/', 'DELETE user/v1/zones/{id}/records/{id}'),
+    ('GET', 'https://example.com/v2/foo/bar?a=1', None, 'GET /v2/foo/bar'),
+])
+def test_get_endpoint_name(method, url, base_url, expected):
+    assert get_endpoint_name(method, url, base_url=base_url) == expected
+
+
+def test_api_stats():
+    api_stats = APIStats()
+    assert api_stats.to_dict() == {
+        'endpoints': {},
+        'requests': 0,
+        'errors': 0,
+        'total_time': 0,
+        'bytes_sent': 0,
+        'bytes_received': 0,
+        'retries': 0,
+        'sleep_time': 0,
+        'cache_hits': 0,
+    }
+
+    api_stats.record_request('GET v1/zones', 0.2, bytes_received=100)
+    api_stats.record_request('GET v1/zones', 12, success=False)
+    api_stats.record_retry('GET v1/zones', 5)
+    api_stats.record_request('POST v1/records', 0.05, bytes_sent=20, bytes_received=30)
+    api_stats.record_cache_hit('GET v1/zones')
+    result = api_stats.to_dict()
+    assert result['requests'] == 3
+    assert result['errors'] == 1
+    assert result['total_time'] == pytest.approx(12.25)
+    assert result['bytes_sent'] == 20
+    assert result['bytes_received'] == 130
+    assert result['retries'] == 1
+    assert result['sleep_time'] == 5
+    assert result['cache_hits'] == 1
+    zones = result['endpoints']['GET v1/zones']
+    assert zones['min_time'] == 0.2
+    assert zones['max_time'] == 12
+    assert zones['cache_hits'] == 1
+    assert zones['latency_histogram']['<=0.25s'] == 1
+    assert zones['latency_histogram']['>10s'] == 1
+    assert sum(zones['latency_histogram'].values()) == 2
+    assert result['endpoints']['POST v1/records']['latency_histogram']['<=0.05s'] == 1
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# (c) 2021 Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import os
+
+from ansible_collections.community.dns.plugins.module_utils.file_cache import (
+    CACHE_DIRECTORY_ENV_VARIABLE,
+    get_cache_directory,
+    get_cache_key,
+    read_json_cache_file,
+    write_json_cache_file,
+)
+
+
+def test_get_cache_directory(monkeypatch):
+    monkeypatch.delenv(CACHE_DIRECTORY_ENV_VARIABLE, raising=False)
+    assert get_cache_directory('/foo') == '/foo'
+    assert get_cache_directory() == os.path.expanduser(os.path.join('~', '.ansible', 'cache', 'community.dns'))
+    monkeypatch.setenv(CACHE_DIRECTORY_ENV_VARIABLE, '/bar')
+    assert get_cache_directory() == '/bar'
+    assert get_cache_directory('/foo') == '/foo'
+
+
+def test_get_cache_key():
+    assert get_cache_key('a', 'b') == get_cache_key('a', 'b')
+    assert get_cache_key('a', 'b') != get_cache_key('ab')
+    assert len(get_cache_key(u'ä')) == 64
+
+
+def test_read_write_json_cache_file(tmpdir):
+    path = str(tmpdir / 'sub' / 'dir' / 'cache.json')
+    assert read_json_cache_file(path) is None
+    assert write_json_cache_file(path, {'a': [1, 'b']}) is True
+    assert read_json_cache_file(path) == {'a': [1, 'b']}
+    assert os.listdir(os.path.dirname(path)) == ['cache.json']
+    assert write_json_cache_file(path, {'a': object()}) is False
+    assert read_json_cache_file(path) == {'a': [1, 'b']}
+    assert os.listdir(os.path.dirname(path)) == ['cache.json']
+    with open(path, 'w') as f:
+        f.write('{')
+    assert read_json_cache_file(path) is None
@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+# (c) 2021 Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import errno
+import gzip
+import io
+import socket
+import threading
+import zlib
+
+import pytest
+
+from ansible.module_utils.six.moves import BaseHTTPServer, http_client
+
+from ansible_collections.community.dns.plugins.module_utils.http import (
+    HTTPHelper,
+    HTTPInfo,
+    KeepAliveHTTPHelper,
+    NetworkError,
+    add_accept_encoding,
+    decompress_content,
+    normalize_info,
+)
+
+
+def _gzip(content):
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode='wb') as f:
+        f.write(content)
+    return buffer.getvalue()
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self):
+        self.server.clients.add(self.client_address)
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        content = '{0} {1} {2}'.format(self.command, self.path, body.decode('utf-8')).encode('utf-8')
+        compress = self.path.startswith('/compressed') and 'gzip' in (self.headers.get('Accept-Encoding') or '')
+        if compress:
+            content = _gzip(content)
+        self.send_response(404 if self.path.startswith('/missing') else 200)
+        self.send_header('Content-Type', 'text/plain')
+        if compress:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('X-Agent', self.headers.get('User-Agent'))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = _respond
+    do_POST = _respond
+
+
+@pytest.fixture
+def http_server():
+    server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    server.clients = set()
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class FallbackHelper(HTTPHelper):
+    def __init__(self):
+        self.calls = []
+
+    def fetch_url(self, url, method='GET', headers=None, data=None, timeout=None):
+        self.calls.append((url, method))
+        return b'fallback', {'status': 200, 'url': url}
+
+
+@pytest.fixture(autouse=True)
+def no_proxy(monkeypatch):
+    for name in ('http_proxy', 'https_proxy', 'HTTP_PROXY', 'HTTPS_PROXY', 'all_proxy', 'ALL_PROXY'):
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_keep_alive(http_server):
+    base_url = 'http://127.0.0.1:{0}'.format(http_server.server_address[1])
+    fallback = FallbackHelper()
+    helper = KeepAliveHTTPHelper(fallback, pool_size=1)
+
+    content, info = helper.fetch_url(base_url + '/foo?bar=baz')
+    assert content == b'GET /foo?bar=baz '
+    assert info['status'] == 200
+    assert info['url'] == base_url + '/foo?bar=baz'
+    assert info['content-type'] == 'text/plain'
+    assert info['Content-Type'] == 'text/plain'
+    assert isinstance(info, HTTPInfo)
+    assert info['x-agent'] == 'ansible-httpget'
+
+    content, info = helper.fetch_url(base_url, method='POST', data=b'data', headers={'User-Agent': 'test'})
+    assert content == b'POST / data'
+    assert info['x-agent'] == 'test'
+
+    content, info = helper.fetch_url(base_url + '/missing')
+    assert info['status'] == 404
+
+    content, info = helper.fetch_url(base_url + '/compressed')
+    assert content == b'GET /compressed '
+    assert info['content-encoding'] == 'gzip'
+
+    # All requests used the same connection
+    assert len(http_server.clients) == 1
+    assert fallback.calls == []
+
+    # Connections closed in the meantime are replaced
+    for pool in helper._pools.values():
+        for connection in pool:
+            connection.sock.close()
+    content, info = helper.fetch_url(base_url + '/foo')
+    assert content == b'GET /foo '
+    assert len(http_server.clients) == 2
+
+    helper.close()
+    assert helper._pools == {}
+
+
+def test_keep_alive_fallback():
+    fallback = FallbackHelper()
+    helper = KeepAliveHTTPHelper(fallback)
+    content, info = helper.fetch_url('ftp://example.com/foo')
+    assert content == b'fallback'
+    assert fallback.calls == [('ftp://example.com/foo', 'GET')]
+
+
+def test_keep_alive_proxy(monkeypatch):
+    monkeypatch.setenv('https_proxy', 'http://proxy.example.com:3128')
+    monkeypatch.delenv('no_proxy', raising=False)
+    monkeypatch.delenv('NO_PROXY', raising=False)
+    fallback = FallbackHelper()
+    helper = KeepAliveHTTPHelper(fallback)
+    content, info = helper.fetch_url('https://example.com/foo', method='PUT')
+    assert content == b'fallback'
+    assert fallback.calls == [('https://example.com/foo', 'PUT')]
+
+
+def test_keep_alive_connection_error():
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    helper = KeepAliveHTTPHelper(FallbackHelper())
+    with pytest.raises(NetworkError) as exc:
+        helper.fetch_url('http://127.0.0.1:{0}/'.format(port))
+    assert str(exc.value).startswith('Connection error: ')
+
+
+class FakeConnection(object):
+    def __init__(self, request_error=None, response_error=None):
+        # An idle connection whose peer did not close it
+        self.sock, self._peer = socket.socketpair()
+        self.request_error = request_error
+        self.response_error = response_error
+        self.requests = []
+
+    def request(self, method, path, body=None, headers=None):
+        self.requests.append((method, path))
+        if self.request_error is not None:
+            raise self.request_error
+
+    def getresponse(self):
+        raise self.response_error
+
+    def close(self):
+        self.sock.close()
+        self._peer.close()
+
+
+def test_keep_alive_stale_connection():
+    helper = KeepAliveHTTPHelper(FallbackHelper())
+    key = ('http', 'example.com', None)
+    fresh = []
+
+    def create_connection(key, timeout):
+        connection = FakeConnection(response_error=socket.timeout('timed out'))
+        fresh.append(connection)
+        return connection
+
+    helper._create_connection = create_connection
+
+    # Idempotent requests are repeated with a new connection if the server closed the connection
+    stale = FakeConnection(response_error=http_client.BadStatusLine("''"))
+    helper._pools[key] = [stale]
+    with pytest.raises(NetworkError) as exc:
+        helper.fetch_url('http://example.com/', method='PUT')
+    assert str(exc.value) == 'Connection error: timed out'
+    assert stale.requests == [('PUT', '/')]
+    assert len(fresh) == 1
+
+    # Other requests are only repeated if sending the request failed
+    stale = FakeConnection(request_error=socket.error(errno.EPIPE, 'Broken pipe'))
+    helper._pools[key] = [stale]
+    with pytest.raises(NetworkError):
+        helper.fetch_url('http://example.com/', method='POST')
+    assert len(fresh) == 2
+
+    stale = FakeConnection(response_error=http_client.BadStatusLine("''"))
+    helper._pools[key] = [stale]
+    with pytest.raises(NetworkError):
+        helper.fetch_url('http://example.com/', method='POST')
+    assert stale.requests == [('POST', '/')]
+    assert len(fresh) == 2
+
+    # Timeouts are never repeated
+    stale = FakeConnection(response_error=socket.timeout('timed out'))
+    helper._pools[key] = [stale]
+    with pytest.raises(NetworkError):
+        helper.fetch_url('http://example.com/', method='GET')
+    assert len(fresh) == 2
+
+    # Connections which the server closed while they were idle are not used
+    stale = FakeConnection()
+    stale._peer.close()
+    helper._pools[key] = [stale]
+    with pytest.raises(NetworkError):
+        helper.fetch_url('http://example.com/', method='POST')
+    assert stale.requests == []
+    assert len(fresh) == 3
+
+
+def test_http_info():
+    info = HTTPInfo({'Content-Type': 'application/json', 'status': 200}, URL='https://example.com')
+    assert info == {'content-type': 'application/json', 'status': 200, 'url': 'https://example.com'}
+    assert info['CONTENT-TYPE'] == 'application/json'
+    assert info.get('Content-type') == 'application/json'
+    assert info.get('Retry-After') is None
+    assert 'content-TYPE' in info
+    info['Retry-After'] = '10'
+    info.setdefault('retry-after', '20')
+    assert info['retry-after'] == '10'
+    assert info.pop('RETRY-AFTER') == '10'
+    assert info.pop('Retry-After', None) is None
+    del info['URL']
+    assert 'url' not in info
+    info.update([('X-Foo', 'bar')])
+    copy = info.copy()
+    assert isinstance(copy, HTTPInfo)
+    assert copy['x-FOO'] == 'bar'
+    with pytest.raises(KeyError):
+        info['x-bar']
+
+    assert normalize_info(info) is info
+    assert normalize_info({'X-Foo': 'bar'}) == {'x-foo': 'bar'}
+
+
+def test_add_accept_encoding():
+    assert add_accept_encoding(None) == {'Accept-Encoding': 'gzip, deflate'}
+    headers = {'accept': 'application/json'}
+    assert add_accept_encoding(headers) == {'accept': 'application/json', 'Accept-Encoding': 'gzip, deflate'}
+    assert headers == {'accept': 'application/json'}
+    assert add_accept_encoding({'accept-encoding': 'identity'}) == {'accept-encoding': 'identity'}
+
+
+def test_decompress_content():
+    content = b'{"records": []}' * 10
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+    raw_deflate = compressor.compress(content) + compressor.flush()
+    assert decompress_content(_gzip(content), {'content-encoding': 'gzip'}) == content
+    assert decompress_content(_gzip(content), {'content-encoding': 'x-gzip'}) == content
+    assert decompress_content(zlib.compress(content), {'content-encoding': 'deflate'}) == content
+    assert decompress_content(raw_deflate, {'content-encoding': 'Deflate'}) == content
+    # Content which is not compressed is not modified
+    assert decompress_content(_gzip(content), {}) == _gzip(content)
+    assert decompress_content(content, {'content-encoding': 'gzip'}) == content
+    assert decompress_content(content, {'content-encoding': 'deflate'}) == content
+    assert decompress_content(b'', {'content-encoding': 'gzip'}) == b''
+    assert decompress_content(None, {'content-encoding': 'gzip'}) is None
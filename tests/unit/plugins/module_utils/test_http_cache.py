@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# (c) 2021 Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import os
+
+from ansible_collections.community.dns.plugins.module_utils.http import (
+    HTTPHelper,
+)
+
+from ansible_collections.community.dns.plugins.module_utils.http_cache import (
+    CachingHTTPHelper,
+)
+
+
+class FakeHTTPHelper(HTTPHelper):
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    def fetch_url(self, url, method='GET', headers=None, data=None, timeout=None):
+        self.calls.append((url, method, headers))
+        return self.responses.pop(0)
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+def test_etag(tmpdir):
+    directory = str(tmpdir / 'cache')
+    url = 'https://example.com/zones'
+    fake = FakeHTTPHelper([
+        (b'data', {'status': 200, 'url': url, 'etag': '"1"', 'content-type': 'application/json'}),
+        (b'', {'status': 304, 'url': url}),
+        (b'new', {'status': 200, 'url': url, 'etag': '"2"', 'last-modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}),
+        (b'', {'status': 304, 'url': url}),
+    ])
+    helper = CachingHTTPHelper(fake, directory)
+    assert helper.fetch_url(url, headers={'accept': 'application/json'}) == (
+        b'data', {'status': 200, 'url': url, 'etag': '"1"', 'content-type': 'application/json'})
+    assert helper.fetch_url(url, headers={'accept': 'application/json'}) == (
+        b'data', {'status': 200, 'url': url, 'etag': '"1"', 'content-type': 'application/json'})
+    assert helper.fetch_url(url)[0] == b'new'
+    assert helper.fetch_url(url)[0] == b'new'
+    assert fake.calls == [
+        (url, 'GET', {'accept': 'application/json'}),
+        (url, 'GET', {'accept': 'application/json', 'If-None-Match': '"1"'}),
+        (url, 'GET', {'If-None-Match': '"1"'}),
+        (url, 'GET', {'If-None-Match': '"2"', 'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'}),
+    ]
+
+
+def test_ttl(tmpdir):
+    directory = str(tmpdir / 'cache')
+    clock = FakeClock()
+    url = 'https://example.com/zones'
+    fake = FakeHTTPHelper([
+        (b'data', {'status': 200, 'url': url}),
+        (b'new', {'status': 200, 'url': url}),
+        (b'error', {'status': 500, 'url': url}),
+        (b'error', {'status': 500, 'url': url}),
+    ])
+    helper = CachingHTTPHelper(fake, directory, ttl=60, clock=clock.time)
+    assert helper.fetch_url(url) == (b'data', {'status': 200, 'url': url})
+    clock.now += 59
+    assert helper.fetch_url(url) == (b'data', {'status': 200, 'url': url, 'response_cache': 'hit'})
+    assert len(fake.calls) == 1
+    clock.now += 1
+    assert helper.fetch_url(url) == (b'new', {'status': 200, 'url': url})
+    assert len(fake.calls) == 2
+    # Error responses are not cached
+    clock.now += 100
+    assert helper.fetch_url(url) == (b'error', {'status': 500, 'url': url})
+    assert helper.fetch_url(url) == (b'error', {'status': 500, 'url': url})
+
+    # Without TTL, responses without validators are not cached
+    fake = FakeHTTPHelper([
+        (b'data', {'status': 200, 'url': url}),
+        (b'data', {'status': 200, 'url': url}),
+    ])
+    helper = CachingHTTPHelper(fake, str(tmpdir / 'cache2'))
+    helper.fetch_url(url)
+    helper.fetch_url(url)
+    assert len(fake.calls) == 2
+    assert not os.path.exists(str(tmpdir / 'cache2'))
+
+
+def test_invalidation(tmpdir):
+    directory = str(tmpdir / 'cache')
+    url = 'https://example.com/records'
+    fake = FakeHTTPHelper([
+        (b'data', {'status': 200, 'url': url, 'etag': '"1"'}),
+        (b'error', {'status': 422, 'url': url}),
+        (b'', {'status': 304, 'url': url}),
+        (b'created', {'status': 201, 'url': url}),
+        (b'data', {'status': 200, 'url': url, 'etag': '"2"'}),
+    ])
+    helper = CachingHTTPHelper(fake, directory)
+    helper.fetch_url(url)
+    # Failed modifications do not clear the cache
+    assert helper.fetch_url(url, method='POST', data=b'x') == (b'error', {'status': 422, 'url': url})
+    assert helper.fetch_url(url)[0] == b'data'
+    assert fake.calls[2][2] == {'If-None-Match': '"1"'}
+    # Successful modifications clear the cache
+    assert helper.fetch_url(url, method='POST', data=b'x') == (b'created', {'status': 201, 'url': url})
+    assert helper.fetch_url(url)[0] == b'data'
+    assert fake.calls[4][2] is None
+
+
+def test_invalidation_safe_methods(tmpdir):
+    directory = str(tmpdir / 'cache')
+    url = 'https://example.com/records'
+    fake = FakeHTTPHelper([
+        (b'data', {'status': 200, 'url': url, 'etag': '"1"'}),
+        (b'', {'status': 200, 'url': url}),
+        (b'', {'status': 304, 'url': url}),
+        (b'', {'status': 204, 'url': url}),
+        (b'data', {'status': 200, 'url': url, 'etag': '"2"'}),
+    ])
+    helper = CachingHTTPHelper(fake, directory)
+    helper.fetch_url(url)
+    # Requests which do not modify data do not clear the cache
+    helper.fetch_url(url, method='HEAD')
+    assert helper.fetch_url(url)[0] == b'data'
+    assert fake.calls[2][2] == {'If-None-Match': '"1"'}
+    helper.fetch_url(url, method='DELETE')
+    assert helper.fetch_url(url)[0] == b'data'
+    assert fake.calls[4][2] is None
+
+
+def test_corrupt_cache(tmpdir):
+    directory = tmpdir / 'cache'
+    url = 'https://example.com/zones'
+    fake = FakeHTTPHelper([
+        (b'data', {'status': 200, 'url': url, 'etag': '"1"'}),
+        (b'data', {'status': 200, 'url': url, 'etag': '"1"'}),
+    ])
+    helper = CachingHTTPHelper(fake, str(directory))
+    helper.fetch_url(url)
+    for path in directory.listdir():
+        path.write('{"url": "https://example.com/zones", "content": 1}')
+    assert helper.fetch_url(url)[0] == b'data'
+    assert fake.calls[1][2] is None
@@ -14,6 +14,15 @@ import pytest
 
 from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import MagicMock, patch
 
+from ansible_collections.community.dns.plugins.module_utils.api_stats import (
+    APIStats,
+)
+
+from ansible_collections.community.dns.plugins.module_utils.http import (
+    ModuleHTTPHelper,
+    NetworkError,
+)
+
 from ansible_collections.community.dns.plugins.module_utils.zone_record_api import (
     DNSAPIError,
 )
@@ -21,6 +30,7 @@ from ansible_collections.community.dns.plugins.module_utils.zone_record_api impo
 from ansible_collections.community.dns.plugins.module_utils.json_api_helper import (
     _get_header_value,
     JSONAPIHelper,
+    RetryPolicy,
 )
 
 
@@ -95,3 +105,141 @@ def test_process_json_result():
     with pytest.raises(DNSAPIError) as exc:
         api._process_json_result(content='{}'.encode('utf-8'), info=info, expected=[200, 201])
     assert exc.value.args[0] == 'Expected HTTP status 200, 201 for GET https://example.com, but got HTTP status 404 (Not found) with data: {}'
+
+
+def test_retry_policy():
+    policy = RetryPolicy(initial_delay=2, max_delay=30, jitter=False)
+    assert [policy.get_backoff_delay(retry) for retry in range(6)] == [2, 4, 8, 16, 30, 30]
+    assert policy.get_backoff_delay(1000) == 30
+    assert policy.get_rate_limit_delay({'retry-after': '5'}) == 5
+    assert policy.get_rate_limit_delay({'Retry-After': '0'}) == 1
+    # The API's delay is used even if it is longer than max_delay
+    assert policy.get_rate_limit_delay({'retry-after': '61'}) == 61
+    assert policy.get_rate_limit_delay({'retry-after': 'foo'}) == 10
+    assert policy.get_rate_limit_delay({}) == 10
+    assert RetryPolicy(max_delay=5).get_rate_limit_delay({}) == 5
+
+    policy = RetryPolicy(initial_delay=2, max_delay=30)
+    for retry in range(6):
+        delay = policy.get_backoff_delay(retry)
+        assert min(2 * 2 ** retry, 30) / 2.0 <= delay <= min(2 * 2 ** retry, 30)
+
+
+def test_request_retries():
+    sleeps = []
+    http_helper = MagicMock()
+    http_helper.fetch_url = MagicMock(side_effect=[
+        (b'', dict(status=502, url='https://example.com')),
+        NetworkError('Connection reset'),
+        (b'', {'status': 429, 'url': 'https://example.com', 'retry-after': '3'}),
+        (b'', dict(status=503, url='https://example.com')),
+        (b'ok', dict(status=200, url='https://example.com')),
+    ])
+    api = JSONAPIHelper(http_helper, '123', 'https://example.com', retry_policy=RetryPolicy(jitter=False))
+    with patch('time.sleep', sleeps.append):
+        assert api._request('https://example.com', method='GET') == (b'ok', dict(status=200, url='https://example.com'))
+    assert sleeps == [1, 2, 3, 8]
+
+    # POST requests are only retried on 429
+    http_helper.fetch_url = MagicMock(side_effect=[
+        (b'', dict(status=429, url='https://example.com')),
+        (b'', dict(status=502, url='https://example.com')),
+    ])
+    sleeps = []
+    with patch('time.sleep', sleeps.append):
+        assert api._request('https://example.com', method='POST') == (b'', dict(status=502, url='https://example.com'))
+    assert sleeps == [10]
+
+    http_helper.fetch_url = MagicMock(side_effect=NetworkError('Connection reset'))
+    with patch('time.sleep', sleeps.append):
+        with pytest.raises(DNSAPIError) as exc:
+            api._request('https://example.com', method='POST')
+    assert exc.value.args[0] == 'Network error: Connection reset'
+
+    # Server errors are not retried if asked so
+    http_helper.fetch_url = MagicMock(side_effect=[
+        (b'', dict(status=502, url='https://example.com')),
+    ])
+    sleeps = []
+    with patch('time.sleep', sleeps.append):
+        assert api._request('https://example.com', method='PUT', retry_server_errors=False) == (b'', dict(status=502, url='https://example.com'))
+    assert sleeps == []
+
+
+def test_request_retries_module_helper():
+    fetch_url = MagicMock(side_effect=[
+        (None, {'status': -1, 'msg': 'Request failed: <urlopen error [Errno 111] Connection refused>', 'url': 'https://example.com'}),
+        (None, {'status': 200, 'body': b'ok', 'url': 'https://example.com'}),
+        (None, {'status': -1, 'msg': 'Connection failure: timed out', 'url': 'https://example.com'}),
+    ])
+    api = JSONAPIHelper(ModuleHTTPHelper(MagicMock()), '123', 'https://example.com', retry_policy=RetryPolicy(jitter=False))
+    sleeps = []
+    with patch('ansible_collections.community.dns.plugins.module_utils.http.fetch_url', fetch_url):
+        with patch('time.sleep', sleeps.append):
+            content, info = api._request('https://example.com', method='GET')
+            assert content == b'ok'
+            assert info['status'] == 200
+            assert sleeps == [1]
+
+            # POST requests are not retried
+            with pytest.raises(DNSAPIError) as exc:
+                api._request('https://example.com', method='POST')
+            assert exc.value.args[0] == 'Network error: Connection failure: timed out'
+            assert sleeps == [1]
+
+
+def test_request_retry_limits():
+    http_helper = MagicMock()
+    http_helper.fetch_url = MagicMock(return_value=(b'', dict(status=504, url='https://example.com')))
+    api = JSONAPIHelper(http_helper, '123', 'https://example.com', retry_policy=RetryPolicy(max_retries=3, jitter=False))
+    sleeps = []
+    with patch('time.sleep', sleeps.append):
+        assert api._request('https://example.com', method='GET') == (b'', dict(status=504, url='https://example.com'))
+    assert sleeps == [1, 2, 4]
+
+    http_helper.fetch_url = MagicMock(return_value=(b'', {'status': 429, 'url': 'https://example.com', 'retry-after': '20'}))
+    api = JSONAPIHelper(http_helper, '123', 'https://example.com', retry_policy=RetryPolicy(max_total_wait=50))
+    sleeps = []
+    with patch('time.sleep', sleeps.append):
+        with pytest.raises(DNSAPIError) as exc:
+            api._request('https://example.com', method='DELETE')
+    assert exc.value.args[0] == 'Stopping after 2 failed retries with 429 Too Many Attempts'
+    assert sleeps == [20, 20]
+
+
+def test_request_api_stats():
+    http_helper = MagicMock()
+    http_helper.fetch_url = MagicMock(side_effect=[
+        (b'', {'status': 429, 'url': 'https://example.com/v1/records', 'retry-after': '3'}),
+        (b'{"id": "1"}', {'status': 200, 'url': 'https://example.com/v1/records'}),
+    ])
+    api_stats = APIStats()
+    api = JSONAPIHelper(http_helper, '123', 'https://example.com/', api_stats=api_stats)
+    sleeps = []
+    with patch('time.sleep', sleeps.append):
+        api._request('https://example.com/v1/records?zone_id=42', method='POST', data=b'{}')
+    assert sleeps == [3]
+    stats = api_stats.to_dict()
+    assert stats['requests'] == 2
+    assert stats['errors'] == 1
+    assert stats['retries'] == 1
+    assert stats['sleep_time'] == 3
+    assert stats['bytes_sent'] == 4
+    assert stats['bytes_received'] == 11
+    assert list(stats['endpoints']) == ['POST v1/records']
+
+
+def test_request_api_stats_cache_hit():
+    http_helper = MagicMock()
+    http_helper.fetch_url = MagicMock(side_effect=[
+        (b'{"id": "1"}', {'status': 200, 'url': 'https://example.com/v1/records', 'response_cache': 'hit'}),
+        (b'{"id": "1"}', {'status': 200, 'url': 'https://example.com/v1/records'}),
+    ])
+    api_stats = APIStats()
+    api = JSONAPIHelper(http_helper, '123', 'https://example.com/', api_stats=api_stats)
+    api._request('https://example.com/v1/records', method='GET')
+    api._request('https://example.com/v1/records', method='GET')
+    stats = api_stats.to_dict()
+    assert stats['requests'] == 1
+    assert stats['cache_hits'] == 1
+    assert stats['bytes_received'] == 11
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# (c) 2021 Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import pytest
+
+from ansible_collections.community.dns.plugins.module_utils import json_codec
+
+from ansible_collections.community.dns.plugins.module_utils.json_codec import (
+    CODECS,
+    decode_json,
+    decode_json_stream,
+    encode_json,
+)
+
+
+DATA = {
+    'records': [
+        {'id': '1', 'name': u'bücher', 'ttl': 3600, 'value': '1.2.3.4', 'disabled': False, 'comment': None},
+    ],
+    'meta': {'pagination': {'page': 1, 'last_page': 1}},
+}
+
+
+@pytest.mark.parametrize('name, decode, encode', CODECS)
+def test_codecs(name, decode, encode):
+    encoded = encode(DATA)
+    assert isinstance(encoded, bytes)
+    assert decode(encoded) == DATA
+    assert decode(u'{"a": "bü"}'.encode('utf-8')) == {'a': u'bü'}
+    assert decode(b'[1, 2.5, true, null]') == [1, 2.5, True, None]
+    with pytest.raises(ValueError):
+        decode(b'{"a": ')
+
+
+def test_default_codec():
+    assert decode_json(encode_json(DATA)) == DATA
+    with pytest.raises(ValueError):
+        decode_json(b'')
+
+
+@pytest.mark.parametrize('use_ijson', [False, True] if json_codec.HAS_IJSON else [False])
+def test_decode_json_stream(monkeypatch, use_ijson):
+    monkeypatch.setattr(json_codec, 'HAS_IJSON', use_ijson)
+
+    data, items = decode_json_stream(encode_json(DATA), ('records', ))
+    assert data == {'meta': {'pagination': {'page': 1, 'last_page': 1}}}
+    assert list(items) == DATA['records']
+
+    content = b'{"data": {"id": 1, "records": [{"a": 1.5}, {"b": [1, {"c": null}]}], "name": "foo", "ttl": 3600}}'
+    data, items = decode_json_stream(content, ('data', 'records'))
+    assert data == {'data': {'id': 1, 'name': 'foo', 'ttl': 3600}}
+    assert list(items) == [{'a': 1.5}, {'b': [1, {'c': None}]}]
+
+    data, items = decode_json_stream(b'{"data": {"id": 1}}', ('data', 'records'))
+    assert data == {'data': {'id': 1}}
+    assert list(items) == []
+
+    with pytest.raises(ValueError):
+        decode_json_stream(b'{"data": {"records": [1, 2', ('data', 'records'))
+
+    # The keys except the last one must lead to a dictionary
+    with pytest.raises(ValueError):
+        decode_json_stream(b'{"result": {"records": []}}', ('data', 'records'))
+    with pytest.raises(ValueError):
+        decode_json_stream(b'{"data": [1, 2]}', ('data', 'records'))
+    with pytest.raises(ValueError):
+        decode_json_stream(b'[1, 2]', ('records', ))
+
+    # The last key must lead to a list
+    with pytest.raises(ValueError):
+        decode_json_stream(b'{"data": {"records": {"a": 1}}}', ('data', 'records'))
+    with pytest.raises(ValueError):
+        decode_json_stream(b'{"data": {"records": 1}}', ('data', 'records'))
+
+    data, items = decode_json_stream(b'{"records": [1, "a", [2, [3]], null], "records2": []}', ('records', ))
+    assert data == {'records2': []}
+    assert list(items) == [1, 'a', [2, [3]], None]
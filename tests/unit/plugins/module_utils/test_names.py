@@ -10,10 +10,15 @@ __metaclass__ = type
 
 import pytest
 
+from ansible_collections.community.dns.plugins.module_utils import names
+
 from ansible_collections.community.dns.plugins.module_utils.names import (
+    DomainName,
     join_labels,
     is_ascii_label,
     normalize_label,
+    normalize_labels,
+    parse_domain_name,
     split_into_labels,
     InvalidDomainName,
 )
@@ -25,6 +30,10 @@ TEST_IS_ASCII_LABEL = [
     ('ä', False),
     ('☹', False),
     ('_dmarc', True),
+    (u'_dmarc', True),
+    ('a b~', True),
+    ('a\tb', False),
+    ('a\x7fb', False),
 ]
 
 
@@ -65,6 +74,30 @@ TEST_LABEL_SPLIT_ERRORS = [
 def test_split_into_labels_errors(domain):
     with pytest.raises(InvalidDomainName):
         split_into_labels(domain)
+    with pytest.raises(InvalidDomainName):
+        parse_domain_name(domain)
+
+
+TEST_PARSE_DOMAIN_NAME = [
+    ('', (), (), '', ''),
+    ('.', (), (), '.', ''),
+    ('com', ('com', ), ('com', ), '', 'com'),
+    ('Foo.Bar.', ('Bar', 'Foo'), ('bar', 'foo'), '.', 'foo.bar'),
+    (u'*.hëllö.A', ('A', u'hëllö', '*'), ('a', 'xn--hll-jma1d', '*'), '', '*.xn--hll-jma1d.a'),
+]
+
+
+@pytest.mark.parametrize("domain, labels, normalized_labels, tail, normalized", TEST_PARSE_DOMAIN_NAME)
+def test_parse_domain_name(domain, labels, normalized_labels, tail, normalized):
+    name = parse_domain_name(domain)
+    assert isinstance(name, DomainName)
+    assert name.labels == labels
+    assert name.normalized_labels == normalized_labels
+    assert name.tail == tail
+    assert name.normalized == normalized
+    assert name == parse_domain_name(domain)
+    assert hash(name) == hash(parse_domain_name(domain))
+    assert join_labels(name.labels, name.tail) == domain
 
 
 TEST_LABEL_JOIN = [
@@ -101,3 +134,23 @@ TEST_LABEL_NORMALIZE = [
 def test_normalize_label(label, normalized_label):
     print(normalize_label(label))
     assert normalize_label(label) == normalized_label
+
+
+def test_normalize_labels():
+    labels = [label for label, dummy in TEST_LABEL_NORMALIZE]
+    normalized_labels = [normalized_label for dummy, normalized_label in TEST_LABEL_NORMALIZE]
+    assert normalize_labels(labels) == normalized_labels
+    assert normalize_labels(iter(labels)) == normalized_labels
+    assert normalize_labels([]) == []
+
+
+def test_normalize_label_cache(monkeypatch):
+    monkeypatch.setattr(names, '_NORMALIZED_LABEL_CACHE', {})
+    monkeypatch.setattr(names, '_NORMALIZED_LABEL_CACHE_SIZE', 2)
+    assert normalize_label('Foo') == 'foo'
+    assert normalize_label('Foo') is normalize_label('Foo')
+    assert normalize_labels(['Foo', 'bAr']) == ['foo', 'bar']
+    assert names._NORMALIZED_LABEL_CACHE == {'Foo': 'foo', 'bAr': 'bar'}
+    # The cache never grows beyond its maximal size
+    assert normalize_label(u'hëllö') == 'xn--hll-jma1d'
+    assert names._NORMALIZED_LABEL_CACHE == {u'hëllö': 'xn--hll-jma1d'}
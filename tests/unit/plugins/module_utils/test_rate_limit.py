@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# (c) 2021 Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import pytest
+
+from ansible_collections.community.dns.plugins.module_utils.http import (
+    HTTPHelper,
+)
+
+from ansible_collections.community.dns.plugins.module_utils.rate_limit import (
+    HAS_FCNTL,
+    RateLimitedHTTPHelper,
+    SharedTokenBucket,
+    TokenBucket,
+)
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, duration):
+        self.sleeps.append(duration)
+        self.now += duration
+
+
+def test_token_bucket():
+    clock = FakeClock()
+    bucket = TokenBucket(2, burst=3, clock=clock.time, sleep=clock.sleep)
+    # Burst
+    for dummy in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+    # Rate
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5), pytest.approx(0.5)]
+    # Tokens are refilled up to burst size
+    clock.now += 100
+    del clock.sleeps[:]
+    for dummy in range(4):
+        bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+@pytest.mark.skipif(not HAS_FCNTL, reason='needs fcntl')
+def test_shared_token_bucket(tmpdir):
+    clock = FakeClock()
+    path = str(tmpdir / 'sub' / 'rate-limit')
+    bucket_1 = SharedTokenBucket(1, path, burst=2, clock=clock.time, sleep=clock.sleep)
+    bucket_2 = SharedTokenBucket(1, path, burst=2, clock=clock.time, sleep=clock.sleep)
+    bucket_1.acquire()
+    bucket_2.acquire()
+    assert clock.sleeps == []
+    bucket_2.acquire()
+    assert clock.sleeps == [pytest.approx(1)]
+    bucket_1.acquire()
+    assert clock.sleeps == [pytest.approx(1), pytest.approx(1)]
+
+    # Corrupt state is ignored
+    with open(path, 'w') as f:
+        f.write('foo')
+    bucket_1.acquire()
+    assert len(clock.sleeps) == 2
+
+
+def test_shared_token_bucket_unusable_file(tmpdir):
+    clock = FakeClock()
+    path = tmpdir / 'file'
+    path.write('')
+    bucket = SharedTokenBucket(1, str(path / 'rate-limit'), clock=clock.time, sleep=clock.sleep)
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(1)]
+
+
+class FakeHTTPHelper(HTTPHelper):
+    def __init__(self):
+        self.calls = []
+
+    def fetch_url(self, url, method='GET', headers=None, data=None, timeout=None):
+        self.calls.append((url, method, headers, data, timeout))
+        return b'content', {'status': 200}
+
+
+def test_rate_limited_http_helper():
+    clock = FakeClock()
+    fake = FakeHTTPHelper()
+    helper = RateLimitedHTTPHelper(fake, TokenBucket(10, clock=clock.time, sleep=clock.sleep))
+    assert helper.fetch_url('https://example.com', method='POST', data=b'x') == (b'content', {'status': 200})
+    assert helper.fetch_url('https://example.com', timeout=5) == (b'content', {'status': 200})
+    assert fake.calls == [
+        ('https://example.com', 'POST', None, b'x', None),
+        ('https://example.com', 'GET', None, None, 5),
+    ]
+    assert clock.sleeps == [pytest.approx(0.1)]
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# (c) 2021 Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import threading
+
+from ansible_collections.community.dns.plugins.module_utils.zone_id_cache import (
+    ZoneIDCache,
+)
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+def test_zone_id_cache(tmpdir):
+    path = str(tmpdir / 'cache' / 'zone-ids.json')
+    clock = FakeClock()
+    cache = ZoneIDCache(path, 100, clock=clock.time)
+    assert cache.get('example.com') is None
+    cache.set('example.com', 42)
+    cache.set('example.org', 'abc')
+    assert cache.get('example.com') == 42
+    assert cache.get('example.org') == 'abc'
+
+    # Another process uses the same file
+    other = ZoneIDCache(path, 100, clock=clock.time)
+    assert other.get('example.com') == 42
+    other.remove('example.com')
+    other.remove('example.net')
+    assert cache.get('example.com') is None
+    assert cache.get('example.org') == 'abc'
+
+    # Entries expire
+    clock.now += 50
+    cache.set('example.com', 23)
+    clock.now += 60
+    assert cache.get('example.org') is None
+    assert cache.get('example.com') == 23
+
+
+def test_zone_id_cache_invalid(tmpdir):
+    path = tmpdir / 'zone-ids.json'
+    path.write('[1, 2')
+    cache = ZoneIDCache(str(path), 100)
+    assert cache.get('example.com') is None
+    cache.set('example.com', 42)
+    assert cache.get('example.com') == 42
+
+    path.write('{"example.com": {"id": 42}, "example.org": 5}')
+    assert cache.get('example.com') is None
+    assert cache.get('example.org') is None
+
+
+def test_zone_id_cache_concurrent(tmpdir):
+    path = str(tmpdir / 'cache' / 'zone-ids.json')
+    names = ['zone{0}.example.com'.format(index) for index in range(20)]
+
+    def set_id(name):
+        ZoneIDCache(path, 100).set(name, name)
+
+    threads = [threading.Thread(target=set_id, args=(name, )) for name in names]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # No entry is lost, even though all of them were written at the same time
+    cache = ZoneIDCache(path, 100)
+    assert [cache.get(name) for name in names] == names
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+# (c) 2021 Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import threading
+import time
+
+import pytest
+
+from ansible_collections.community.dns.plugins.module_utils.record import (
+    DNSRecord,
+)
+
+from ansible_collections.community.dns.plugins.module_utils.zone import (
+    DNSZone,
+)
+
+from ansible_collections.community.dns.plugins.module_utils.zone_id_cache import (
+    ZoneIDCache,
+)
+
+from ansible_collections.community.dns.plugins.module_utils.zone_record_api import (
+    DNSAPIError,
+    HAS_CONCURRENT_FUTURES,
+    ZoneRecordAPI,
+)
+
+
+class FakeAPI(ZoneRecordAPI):
+    def __init__(self, max_concurrency=1, fail=None):
+        self.max_concurrency = max_concurrency
+        self.fail = fail or set()
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def get_zone_by_name(self, name):
+        return None
+
+    def get_zone_by_id(self, id):
+        return None
+
+    def get_zone_records(self, zone_id, prefix=None, record_type=None):
+        return None
+
+    def _call(self, what, zone_id, record):
+        with self.lock:
+            self.calls.append((what, zone_id, record.target))
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            if record.target in self.fail:
+                raise DNSAPIError('Cannot {0} {1}'.format(what, record.target))
+            # Make later calls finish earlier
+            time.sleep(0.05 / (1 + int(record.target)))
+            return record
+        finally:
+            with self.lock:
+                self.running -= 1
+
+    def add_record(self, zone_id, record):
+        return self._call('add', zone_id, record)
+
+    def update_record(self, zone_id, record):
+        return self._call('update', zone_id, record)
+
+    def delete_record(self, zone_id, record):
+        self._call('delete', zone_id, record)
+        return True
+
+
+def create_records(count):
+    records = []
+    for index in range(count):
+        record = DNSRecord()
+        record.target = str(index)
+        records.append(record)
+    return records
+
+
+def simplify(results_per_zone_id):
+    return dict(
+        (zone_id, [(record.target, success, str(error) if error else None) for record, success, error in results])
+        for zone_id, results in results_per_zone_id.items()
+    )
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_process_records(max_concurrency):
+    api = FakeAPI(max_concurrency=max_concurrency, fail={'2'})
+    records = create_records(6)
+    for method, what in [(api.add_records, 'add'), (api.update_records, 'update'), (api.delete_records, 'delete')]:
+        results = method({1: records[:3], 2: records[3:]}, stop_early_on_errors=False)
+        assert simplify(results) == {
+            1: [('0', True, None), ('1', True, None), ('2', False, 'Cannot {0} 2'.format(what))],
+            2: [('3', True, None), ('4', True, None), ('5', True, None)],
+        }
+    if max_concurrency > 1 and HAS_CONCURRENT_FUTURES:
+        assert api.max_running > 1
+    else:
+        assert api.max_running == 1
+
+
+def test_process_records_stop_early_sequential():
+    api = FakeAPI(fail={'1'})
+    records = create_records(6)
+    results = api.add_records({1: records[:3], 2: records[3:]})
+    assert simplify(results) == {
+        1: [('0', True, None), ('1', False, 'Cannot add 1')],
+    }
+    assert len(api.calls) == 2
+
+
+@pytest.mark.skipif(not HAS_CONCURRENT_FUTURES, reason='needs concurrent.futures')
+def test_process_records_stop_early_concurrent():
+    api = FakeAPI(max_concurrency=2, fail={'0'})
+    records = create_records(20)
+    results = api.update_records({1: records[:10], 2: records[10:]})
+    results = simplify(results)
+    # The first call failed; all calls that ran are reported, in order, and no other call was started
+    assert results[1][0] == ('0', False, 'Cannot update 0')
+    reported = [target for zone_results in results.values() for target, dummy, dummy2 in zone_results]
+    assert reported == sorted(reported, key=int)
+    assert sorted(reported, key=int) == sorted([target for dummy, dummy2, target in api.calls], key=int)
+    assert len(api.calls) < 20
+
+
+class FakeZoneAPI(ZoneRecordAPI):
+    def __init__(self, zones):
+        self.zones = zones
+        self.calls = []
+
+    def _create_zone(self, zone_id):
+        zone = DNSZone(self.zones[zone_id], info={'foo': 'bar'})
+        zone.id = zone_id
+        return zone
+
+    def get_zone_by_name(self, name):
+        self.calls.append(('get_zone_by_name', name))
+        for zone_id, zone_name in self.zones.items():
+            if zone_name == name:
+                return self._create_zone(zone_id)
+        return None
+
+    def get_zone_by_id(self, id):
+        self.calls.append(('get_zone_by_id', id))
+        if id not in self.zones:
+            return None
+        return self._create_zone(id)
+
+    def get_zone_records(self, zone_id, prefix=None, record_type=None):
+        self.calls.append(('get_zone_records', zone_id))
+        if zone_id not in self.zones:
+            return None
+        return create_records(1)
+
+    def add_record(self, zone_id, record):
+        return record
+
+    def update_record(self, zone_id, record):
+        return record
+
+    def delete_record(self, zone_id, record):
+        return True
+
+
+def test_get_zone_with_records_by_name_zone_id_cache(tmpdir):
+    api = FakeZoneAPI({1: 'example.com'})
+    api.zone_id_cache = ZoneIDCache(str(tmpdir / 'zone-ids.json'), 100)
+    zone = api.get_zone_with_records_by_name('example.com')
+    assert (zone.zone.id, zone.zone.info) == (1, {'foo': 'bar'})
+    assert api.calls == [('get_zone_by_name', 'example.com'), ('get_zone_records', 1)]
+
+    # The zone is retrieved by its ID
+    api.calls = []
+    zone = api.get_zone_with_records_by_name('example.com')
+    assert (zone.zone.name, zone.zone.id, zone.zone.info) == ('example.com', 1, {'foo': 'bar'})
+    assert [record.target for record in zone.records] == ['0']
+    assert api.calls == [('get_zone_by_id', 1), ('get_zone_records', 1)]
+
+    # The ID belongs to another zone now
+    api.zones = {1: 'example.org', 2: 'example.com'}
+    api.calls = []
+    zone = api.get_zone_with_records_by_name('example.com')
+    assert zone.zone.id == 2
+    assert api.calls == [('get_zone_by_id', 1), ('get_zone_by_name', 'example.com'), ('get_zone_records', 2)]
+    assert api.zone_id_cache.get('example.com') == 2
+
+    # The zone no longer exists
+    api.zones = {}
+    assert api.get_zone_with_records_by_name('example.com') is None
+    assert api.zone_id_cache.get('example.com') is None
@@ -1427,65 +1427,55 @@ class TestHetznerDNSRecordJSON(BaseTestModule):
             FetchUrlCall('PUT', 200)
             .expect_header('accept', 'application/json')
             .expect_header('auth-api-token', 'foo')
-            .expect_url('https://dns.hetzner.com/api/v1/records/132')
-            .expect_json_value_absent(['id'])
-            .expect_json_value(['type'], 'NS')
-            .expect_json_value(['ttl'], 10800)
-            .expect_json_value(['zone_id'], '42')
-            .expect_json_value(['name'], '@')
-            .expect_json_value(['value'], 'a1')
-            .return_header('Content-Type', 'application/json')
-            .result_json({
-                'record': {
-                    'id': '132',
-                    'type': 'NS',
-                    'name': '@',
-                    'value': 'a1',
-                    'ttl': 10800,
-                    'zone_id': '42',
-                },
-            }),
-            FetchUrlCall('PUT', 200)
-            .expect_header('accept', 'application/json')
-            .expect_header('auth-api-token', 'foo')
-            .expect_url('https://dns.hetzner.com/api/v1/records/131')
-            .expect_json_value_absent(['id'])
-            .expect_json_value(['type'], 'NS')
-            .expect_json_value(['ttl'], 10800)
-            .expect_json_value(['zone_id'], '42')
-            .expect_json_value(['name'], '@')
-            .expect_json_value(['value'], 'a2')
-            .return_header('Content-Type', 'application/json')
-            .result_json({
-                'record': {
-                    'id': '131',
-                    'type': 'NS',
-                    'name': '@',
-                    'value': 'a2',
-                    'ttl': 10800,
-                    'zone_id': '42',
-                },
-            }),
-            FetchUrlCall('PUT', 200)
-            .expect_header('accept', 'application/json')
-            .expect_header('auth-api-token', 'foo')
-            .expect_url('https://dns.hetzner.com/api/v1/records/130')
-            .expect_json_value_absent(['id'])
-            .expect_json_value(['type'], 'NS')
-            .expect_json_value(['ttl'], 10800)
-            .expect_json_value(['zone_id'], '42')
-            .expect_json_value(['name'], '@')
-            .expect_json_value(['value'], 'a3')
+            .expect_url('https://dns.hetzner.com/api/v1/records/bulk')
+            .expect_json_value(['records', 0, 'id'], '132')
+            .expect_json_value(['records', 0, 'type'], 'NS')
+            .expect_json_value(['records', 0, 'ttl'], 10800)
+            .expect_json_value(['records', 0, 'zone_id'], '42')
+            .expect_json_value(['records', 0, 'name'], '@')
+            .expect_json_value(['records', 0, 'value'], 'a1')
+            .expect_json_value(['records', 1, 'id'], '131')
+            .expect_json_value(['records', 1, 'type'], 'NS')
+            .expect_json_value(['records', 1, 'ttl'], 10800)
+            .expect_json_value(['records', 1, 'zone_id'], '42')
+            .expect_json_value(['records', 1, 'name'], '@')
+            .expect_json_value(['records', 1, 'value'], 'a2')
+            .expect_json_value(['records', 2, 'id'], '130')
+            .expect_json_value(['records', 2, 'type'], 'NS')
+            .expect_json_value(['records', 2, 'ttl'], 10800)
+            .expect_json_value(['records', 2, 'zone_id'], '42')
+            .expect_json_value(['records', 2, 'name'], '@')
+            .expect_json_value(['records', 2, 'value'], 'a3')
+            .expect_json_value_absent(['records', 3])
             .return_header('Content-Type', 'application/json')
             .result_json({
-                'record': {
-                    'id': '130',
-                    'type': 'NS',
-                    'name': '@',
-                    'value': 'a3',
-                    'ttl': 10800,
-                    'zone_id': '42',
-                },
+                'records': [
+                    {
+                        'id': '132',
+                        'type': 'NS',
+                        'name': '@',
+                        'value': 'a1',
+                        'ttl': 10800,
+                        'zone_id': '42',
+                    },
+                    {
+                        'id': '131',
+                        'type': 'NS',
+                        'name': '@',
+                        'value': 'a2',
+                        'ttl': 10800,
+                        'zone_id': '42',
+                    },
+                    {
+                        'id': '130',
+                        'type': 'NS',
+                        'name': '@',
+                        'value': 'a3',
+                        'ttl': 10800,
+                        'zone_id': '42',
+                    },
+                ],
+                'failed_records': [],
             }),
             FetchUrlCall('POST', 200)
             .expect_header('accept', 'application/json')
@@ -1582,6 +1572,16 @@ class TestHetznerDNSRecordJSON(BaseTestModule):
             .expect_query_values('per_page', '100')
             .return_header('Content-Type', 'application/json')
             .result_json(HETZNER_JSON_ZONE_RECORDS_GET_RESULT),
+            FetchUrlCall('PUT', 422)
+            .expect_header('accept', 'application/json')
+            .expect_header('auth-api-token', 'foo')
+            .expect_url('https://dns.hetzner.com/api/v1/records/bulk')
+            .expect_json_value(['records', 0, 'id'], '132')
+            .expect_json_value(['records', 1, 'id'], '131')
+            .expect_json_value(['records', 2, 'id'], '130')
+            .expect_json_value_absent(['records', 3])
+            .return_header('Content-Type', 'application/json')
+            .result_json({'message': 'invalid record'}),
             FetchUrlCall('PUT', 500)
             .expect_header('accept', 'application/json')
             .expect_header('auth-api-token', 'foo')
@@ -1639,65 +1639,55 @@ class TestHetznerDNSRecordJSON(BaseTestModule):
             FetchUrlCall('PUT', 200)
             .expect_header('accept', 'application/json')
             .expect_header('auth-api-token', 'foo')
-            .expect_url('https://dns.hetzner.com/api/v1/records/132')
-            .expect_json_value_absent(['id'])
-            .expect_json_value(['type'], 'NS')
-            .expect_json_value(['ttl'], 10800)
-            .expect_json_value(['zone_id'], '42')
-            .expect_json_value(['name'], '@')
-            .expect_json_value(['value'], 'a1')
-            .return_header('Content-Type', 'application/json')
-            .result_json({
-                'record': {
-                    'id': '132',
-                    'type': 'NS',
-                    'name': '@',
-                    'value': 'a1',
-                    'ttl': 10800,
-                    'zone_id': '42',
-                },
-            }),
-            FetchUrlCall('PUT', 200)
-            .expect_header('accept', 'application/json')
-            .expect_header('auth-api-token', 'foo')
-            .expect_url('https://dns.hetzner.com/api/v1/records/131')
-            .expect_json_value_absent(['id'])
-            .expect_json_value(['type'], 'NS')
-            .expect_json_value(['ttl'], 10800)
-            .expect_json_value(['zone_id'], '42')
-            .expect_json_value(['name'], '@')
-            .expect_json_value(['value'], 'a2')
-            .return_header('Content-Type', 'application/json')
-            .result_json({
-                'record': {
-                    'id': '131',
-                    'type': 'NS',
-                    'name': '@',
-                    'value': 'a2',
-                    'ttl': 10800,
-                    'zone_id': '42',
-                },
-            }),
-            FetchUrlCall('PUT', 200)
-            .expect_header('accept', 'application/json')
-            .expect_header('auth-api-token', 'foo')
-            .expect_url('https://dns.hetzner.com/api/v1/records/130')
-            .expect_json_value_absent(['id'])
-            .expect_json_value(['type'], 'NS')
-            .expect_json_value(['ttl'], 10800)
-            .expect_json_value(['zone_id'], '42')
-            .expect_json_value(['name'], '@')
-            .expect_json_value(['value'], 'a3')
+            .expect_url('https://dns.hetzner.com/api/v1/records/bulk')
+            .expect_json_value(['records', 0, 'id'], '132')
+            .expect_json_value(['records', 0, 'type'], 'NS')
+            .expect_json_value(['records', 0, 'ttl'], 10800)
+            .expect_json_value(['records', 0, 'zone_id'], '42')
+            .expect_json_value(['records', 0, 'name'], '@')
+            .expect_json_value(['records', 0, 'value'], 'a1')
+            .expect_json_value(['records', 1, 'id'], '131')
+            .expect_json_value(['records', 1, 'type'], 'NS')
+            .expect_json_value(['records', 1, 'ttl'], 10800)
+            .expect_json_value(['records', 1, 'zone_id'], '42')
+            .expect_json_value(['records', 1, 'name'], '@')
+            .expect_json_value(['records', 1, 'value'], 'a2')
+            .expect_json_value(['records', 2, 'id'], '130')
+            .expect_json_value(['records', 2, 'type'], 'NS')
+            .expect_json_value(['records', 2, 'ttl'], 10800)
+            .expect_json_value(['records', 2, 'zone_id'], '42')
+            .expect_json_value(['records', 2, 'name'], '@')
+            .expect_json_value(['records', 2, 'value'], 'a3')
+            .expect_json_value_absent(['records', 3])
             .return_header('Content-Type', 'application/json')
             .result_json({
-                'record': {
-                    'id': '130',
-                    'type': 'NS',
-                    'name': '@',
-                    'value': 'a3',
-                    'ttl': 10800,
-                    'zone_id': '42',
-                },
+                'records': [
+                    {
+                        'id': '132',
+                        'type': 'NS',
+                        'name': '@',
+                        'value': 'a1',
+                        'ttl': 10800,
+                        'zone_id': '42',
+                    },
+                    {
+                        'id': '131',
+                        'type': 'NS',
+                        'name': '@',
+                        'value': 'a2',
+                        'ttl': 10800,
+                        'zone_id': '42',
+                    },
+                    {
+                        'id': '130',
+                        'type': 'NS',
+                        'name': '@',
+                        'value': 'a3',
+                        'ttl': 10800,
+                        'zone_id': '42',
+                    },
+                ],
+                'failed_records': [],
             }),
             FetchUrlCall('POST', 422)
             .expect_header('accept', 'application/json')
@@ -1067,44 +1067,41 @@ class TestHetznerDNSRecordJSON(BaseTestModule):
             FetchUrlCall('PUT', 200)
             .expect_header('accept', 'application/json')
             .expect_header('auth-api-token', 'foo')
-            .expect_url('https://dns.hetzner.com/api/v1/records/132')
-            .expect_json_value_absent(['id'])
-            .expect_json_value(['type'], 'NS')
-            .expect_json_value(['ttl'], 3600)
-            .expect_json_value(['zone_id'], '42')
-            .expect_json_value(['name'], '@')
-            .expect_json_value(['value'], 'helium.ns.hetzner.de.')
-            .return_header('Content-Type', 'application/json')
-            .result_json({
-                'record': {
-                    'id': '130',
-                    'type': 'NS',
-                    'name': '@',
-                    'value': 'ytterbium.ns.hetzner.com.',
-                    'ttl': 3600,
-                    'zone_id': '42',
-                },
-            }),
-            FetchUrlCall('PUT', 200)
-            .expect_header('accept', 'application/json')
-            .expect_header('auth-api-token', 'foo')
-            .expect_url('https://dns.hetzner.com/api/v1/records/131')
-            .expect_json_value_absent(['id'])
-            .expect_json_value(['type'], 'NS')
-            .expect_json_value(['ttl'], 3600)
-            .expect_json_value(['zone_id'], '42')
-            .expect_json_value(['name'], '@')
-            .expect_json_value(['value'], 'ytterbium.ns.hetzner.com.')
+            .expect_url('https://dns.hetzner.com/api/v1/records/bulk')
+            .expect_json_value(['records', 0, 'id'], '132')
+            .expect_json_value(['records', 0, 'type'], 'NS')
+            .expect_json_value(['records', 0, 'ttl'], 3600)
+            .expect_json_value(['records', 0, 'zone_id'], '42')
+            .expect_json_value(['records', 0, 'name'], '@')
+            .expect_json_value(['records', 0, 'value'], 'helium.ns.hetzner.de.')
+            .expect_json_value(['records', 1, 'id'], '131')
+            .expect_json_value(['records', 1, 'type'], 'NS')
+            .expect_json_value(['records', 1, 'ttl'], 3600)
+            .expect_json_value(['records', 1, 'zone_id'], '42')
+            .expect_json_value(['records', 1, 'name'], '@')
+            .expect_json_value(['records', 1, 'value'], 'ytterbium.ns.hetzner.com.')
+            .expect_json_value_absent(['records', 2])
             .return_header('Content-Type', 'application/json')
             .result_json({
-                'record': {
-                    'id': '131',
-                    'type': 'NS',
-                    'name': '@',
-                    'value': 'ytterbium.ns.hetzner.com.',
-                    'ttl': 3600,
-                    'zone_id': '42',
-                },
+                'records': [
+                    {
+                        'id': '132',
+                        'type': 'NS',
+                        'name': '@',
+                        'value': 'helium.ns.hetzner.de.',
+                        'ttl': 3600,
+                        'zone_id': '42',
+                    },
+                    {
+                        'id': '131',
+                        'type': 'NS',
+                        'name': '@',
+                        'value': 'ytterbium.ns.hetzner.com.',
+                        'ttl': 3600,
+                        'zone_id': '42',
+                    },
+                ],
+                'failed_records': [],
             }),
         ])
 
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# (c) 2021, Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+from ansible_collections.community.dns.plugins.plugin_utils.lru_cache import (
+    LRUCache,
+)
+
+
+def test_lru_cache():
+    calls = []
+
+    def create(value):
+        def f():
+            calls.append(value)
+            return value.upper()
+        return f
+
+    cache = LRUCache(maxsize=2)
+    assert cache.get('a', create('a')) == 'A'
+    assert cache.get('b', create('b')) == 'B'
+    assert cache.get('a', create('a')) == 'A'
+    assert calls == ['a', 'b']
+    assert cache.cache_info() == dict(hits=1, misses=2, maxsize=2, currsize=2)
+
+    # 'b' is the least recently used entry, so it is discarded
+    assert cache.get('c', create('c')) == 'C'
+    assert cache.get('a', create('a')) == 'A'
+    assert cache.get('b', create('b')) == 'B'
+    assert calls == ['a', 'b', 'c', 'b']
+    assert cache.cache_info() == dict(hits=2, misses=4, maxsize=2, currsize=2)
+
+    cache.clear()
+    assert cache.cache_info() == dict(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+def test_lru_cache_disabled():
+    calls = []
+
+    def create():
+        calls.append(1)
+        return 42
+
+    cache = LRUCache(maxsize=0)
+    assert cache.get('a', create) == 42
+    assert cache.get('a', create) == 42
+    assert calls == [1, 1]
+    assert cache.cache_info() == dict(hits=0, misses=2, maxsize=0, currsize=0)
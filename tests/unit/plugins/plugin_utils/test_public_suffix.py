@@ -14,9 +14,16 @@ __metaclass__ = type
 
 import pytest
 
+from ansible_collections.community.dns.plugins.plugin_utils import _public_suffix_list_data
+
 from ansible_collections.community.dns.plugins.plugin_utils.public_suffix import (
+    LazyPublicSuffixList,
+    PublicSuffixEntry,
     PublicSuffixList,
     PUBLIC_SUFFIX_LIST,
+    PUBLIC_SUFFIX_LIST_FILENAME,
+    get_file_checksum,
+    select_prevailing_rule,
 )
 
 
@@ -53,6 +60,22 @@ def test_get_suffix(domain, kwargs, reg_extra_kwargs, suffix, reg_domain):
     assert PUBLIC_SUFFIX_LIST.get_registrable_domain(domain, **kwargs) == reg_domain
 
 
+TEST_GET_SUFFIX_PART = [
+    ('', {}, None),
+    ('-a.com', {}, None),
+    ('foo.com', {}, 'icann'),
+    ('foobarbaz', {}, None),
+    ('test.cloudfront.net', {}, 'private'),
+    ('test.cloudfront.net', {'icann_only': True}, 'icann'),
+    ('www.ck', {'icann_only': True}, 'icann'),
+]
+
+
+@pytest.mark.parametrize("domain, kwargs, part", TEST_GET_SUFFIX_PART)
+def test_get_suffix_part(domain, kwargs, part):
+    assert PUBLIC_SUFFIX_LIST.get_suffix_part(domain, **kwargs) == part
+
+
 # -------------------------------------------------------------------------------------------------
 # The following list is taken from https://raw.githubusercontent.com/publicsuffix/list/master/tests/test_psl.txt
 # Any copyright for this list is dedicated to the Public Domain. (https://creativecommons.org/publicdomain/zero/1.0/)
@@ -179,6 +202,27 @@ def test_load_psl_dot(tmpdir):
     assert rule.part == 'bla bla'
 
 
+def test_parse_psl():
+    psl = PublicSuffixList.parse(iter([
+        '// ===BEGIN ICANN DOMAINS===',
+        'jp',
+        '*.kobe.jp',
+        '!city.kobe.jp  ',
+        '// ===END ICANN DOMAINS===',
+        '',
+        '// ===BEGIN PRIVATE DOMAINS===',
+        u'食狮.com.cn',
+        '// ===END PRIVATE DOMAINS===',
+    ]))
+    assert [(rule.labels, rule.exception_rule, rule.part) for rule in psl._rules] == [
+        (('cn', 'com', 'xn--85x722f'), False, 'private'),
+        (('jp', ), False, 'icann'),
+        (('jp', 'kobe', '*'), False, 'icann'),
+        (('jp', 'kobe', 'city'), True, 'icann'),
+    ]
+    assert psl.get_registrable_domain('www.city.kobe.jp') == 'city.kobe.jp'
+
+
 def test_load_psl_no_part(tmpdir):
     fn = tmpdir / 'psl.dat'
     fn.write('''// ===BEGIN BLA BLA DOMAINS===
@@ -188,3 +232,142 @@ net'''.encode('utf-8'))
     with pytest.raises(Exception) as excinfo:
         PublicSuffixList.load(str(fn))
     assert str(excinfo.value) == 'Internal error: found PSL entry with no part!'
+
+
+TEST_TRIE_RULES = [
+    PublicSuffixEntry(('com', ), part='icann'),
+    PublicSuffixEntry(('com', 'example'), part='private'),
+    PublicSuffixEntry(('jp', ), part='icann'),
+    PublicSuffixEntry(('jp', 'kobe', '*'), part='icann'),
+    PublicSuffixEntry(('jp', 'kobe', 'city'), exception_rule=True, part='icann'),
+    PublicSuffixEntry(('ck', '*'), part='icann'),
+    PublicSuffixEntry(('ck', 'www'), exception_rule=True, part='icann'),
+    PublicSuffixEntry(('net', '*', 'foo'), part='private'),
+]
+
+TEST_TRIE_NAMES = [
+    [],
+    ['com'],
+    ['com', 'example'],
+    ['com', 'example', 'www'],
+    ['com', 'foo'],
+    ['jp', 'kobe'],
+    ['jp', 'kobe', 'c'],
+    ['jp', 'kobe', 'c', 'b'],
+    ['jp', 'kobe', 'city'],
+    ['jp', 'kobe', 'city', 'www'],
+    ['ck'],
+    ['ck', 'test'],
+    ['ck', 'www'],
+    ['ck', 'www', 'www'],
+    ['ck', '*'],
+    ['net', 'bar', 'foo'],
+    ['net', 'bar', 'baz'],
+    ['org', 'example'],
+]
+
+
+@pytest.mark.parametrize("normalized_labels", TEST_TRIE_NAMES)
+@pytest.mark.parametrize("icann_only", [False, True])
+def test_get_suffix_length_and_rule_trie(normalized_labels, icann_only):
+    psl = PublicSuffixList(TEST_TRIE_RULES)
+    # Compare with result of linear scan over all rules
+    rules = [
+        rule for rule in psl._rules
+        if (not icann_only or rule.part == 'icann') and rule.matches(normalized_labels)
+    ] or [psl._generic_rule]
+    expected_rule = select_prevailing_rule(rules) if normalized_labels else None
+    suffix_length, rule = psl.get_suffix_length_and_rule(normalized_labels, icann_only=icann_only)
+    assert rule is expected_rule
+    if rule is not None:
+        assert suffix_length == len(rule.labels) - (1 if rule.exception_rule else 0)
+    else:
+        assert suffix_length == 0
+
+
+def test_snapshot():
+    psl = PublicSuffixList(TEST_TRIE_RULES)
+    snapshot = psl.to_snapshot()
+    assert snapshot == (
+        ('icann', ('*.ck', '!www.ck', 'com', 'jp', '*.kobe.jp', '!city.kobe.jp')),
+        ('private', ('example.com', 'foo.*.net')),
+    )
+    psl2 = PublicSuffixList.from_snapshot(snapshot)
+    assert [(rule.labels, rule.exception_rule, rule.part) for rule in psl2._rules] == [
+        (rule.labels, rule.exception_rule, rule.part) for rule in psl._rules
+    ]
+
+
+def test_snapshot_up_to_date():
+    assert _public_suffix_list_data.SOURCE_SHA256 == get_file_checksum(PUBLIC_SUFFIX_LIST_FILENAME)
+    psl = PublicSuffixList.load(PUBLIC_SUFFIX_LIST_FILENAME)
+    assert psl.to_snapshot() == _public_suffix_list_data.RULES
+
+
+def test_lazy_psl():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return PublicSuffixList(TEST_TRIE_RULES)
+
+    psl = LazyPublicSuffixList(loader)
+    assert calls == []
+    assert psl.get_suffix('www.city.kobe.jp') == 'kobe.jp'
+    assert psl.get_registrable_domain('a.b.c.kobe.jp') == 'b.c.kobe.jp'
+    assert calls == [1]
+    assert psl.get() is psl.get()
+    assert calls == [1]
+
+
+def test_get_suffixes():
+    names = [domain for domain, dummy, dummy2 in TEST_SUFFIX_OFFICIAL_TESTS] + ['www.example.com', 'www.example.com']
+    for kwargs in [{}, {'keep_unknown_suffix': False}, {'normalize_result': True}, {'icann_only': True}]:
+        assert PUBLIC_SUFFIX_LIST.get_suffixes(names, **kwargs) == [
+            PUBLIC_SUFFIX_LIST.get_suffix(name, **kwargs) for name in names
+        ]
+        assert PUBLIC_SUFFIX_LIST.get_registrable_domains(names, **kwargs) == [
+            PUBLIC_SUFFIX_LIST.get_registrable_domain(name, **kwargs) for name in names
+        ]
+    assert PUBLIC_SUFFIX_LIST.get_registrable_domains(iter(names), only_if_registerable=False) == [
+        PUBLIC_SUFFIX_LIST.get_registrable_domain(name, only_if_registerable=False) for name in names
+    ]
+
+
+def test_load_cached(tmpdir):
+    cache_dir = tmpdir / 'cache'
+    fn = tmpdir / 'psl.dat'
+    fn.write('''// ===BEGIN ICANN DOMAINS===
+jp
+*.kobe.jp
+!city.kobe.jp
+// ===END ICANN DOMAINS==='''.encode('utf-8'))
+
+    # Cache is created
+    psl = PublicSuffixList.load_cached(str(fn), cache_directory=str(cache_dir))
+    assert psl.get_registrable_domain('www.city.kobe.jp') == 'city.kobe.jp'
+    cache_files = cache_dir.listdir()
+    assert len(cache_files) == 1
+    cache_file = cache_files[0]
+
+    # Cache is used when the file did not change
+    cache_file.write(cache_file.read().replace('city.kobe.jp', 'town.kobe.jp'))
+    psl = PublicSuffixList.load_cached(str(fn), cache_directory=str(cache_dir))
+    assert psl.get_registrable_domain('www.city.kobe.jp') == 'www.city.kobe.jp'
+    assert psl.get_registrable_domain('www.town.kobe.jp') == 'town.kobe.jp'
+
+    # Cache is refreshed when the file changed
+    fn.write('''// ===BEGIN ICANN DOMAINS===
+jp
+// ===END ICANN DOMAINS==='''.encode('utf-8'))
+    psl = PublicSuffixList.load_cached(str(fn), cache_directory=str(cache_dir))
+    assert psl.get_registrable_domain('www.city.kobe.jp') == 'kobe.jp'
+    assert cache_dir.listdir() == [cache_file]
+
+    # Corrupt cache files are ignored
+    cache_file.write('{"version": 1, "rules": 42}')
+    psl = PublicSuffixList.load_cached(str(fn), cache_directory=str(cache_dir))
+    assert psl.get_registrable_domain('www.city.kobe.jp') == 'kobe.jp'
+    cache_file.write('foo')
+    psl = PublicSuffixList.load_cached(str(fn), cache_directory=str(cache_dir))
+    assert psl.get_registrable_domain('www.city.kobe.jp') == 'kobe.jp'
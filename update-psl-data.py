@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import os
+import sys
+
+
+PSL_FILENAME = os.path.join('plugins', 'public_suffix_list.dat')
+SNAPSHOT_FILENAME = os.path.join('plugins', 'plugin_utils', '_public_suffix_list_data.py')
+
+SNAPSHOT_HEADER = '''# -*- coding: utf-8 -*-
+
+# WARNING: This file is automatically generated by update-psl-data.py from plugins/public_suffix_list.dat.
+#          DO NOT EDIT MANUALLY!
+
+# The Public Suffix List is subject to the terms of the Mozilla Public License, v. 2.0.
+# See MPL or https://mozilla.org/MPL/2.0/ for details.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+'''
+
+
+def load_public_suffix_list_class():
+    sys.path.append(os.path.join('..', '..', '..'))
+    from ansible_collections.community.dns.plugins.plugin_utils.public_suffix import (
+        PublicSuffixList,
+        get_file_checksum,
+    )
+    return PublicSuffixList, get_file_checksum
+
+
+def create_snapshot_module(snapshot, checksum):
+    lines = SNAPSHOT_HEADER.splitlines()
+    lines.extend([
+        '',
+        "SOURCE_SHA256 = '{0}'".format(checksum),
+        '',
+        'RULES = (',
+    ])
+    for part, rules in snapshot:
+        lines.append("    ('{0}', (".format(part))
+        lines.extend("        '{0}',".format(rule) for rule in rules)
+        lines.append('    )),')
+    lines.append(')')
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def main(program, arguments):
+    lint = '--lint' in arguments
+    errors = []
+    try:
+        PublicSuffixList, get_file_checksum = load_public_suffix_list_class()
+        psl = PublicSuffixList.load(PSL_FILENAME)
+        data = create_snapshot_module(psl.to_snapshot(), get_file_checksum(PSL_FILENAME))
+
+        compare_data = None
+        if os.path.exists(SNAPSHOT_FILENAME):
+            with open(SNAPSHOT_FILENAME, 'r', encoding='utf-8') as f:
+                compare_data = f.read()
+
+        if data != compare_data:
+            if lint:
+                errors.append('{0}: Needs to be updated by update-psl-data.py'.format(SNAPSHOT_FILENAME))
+            else:
+                print('Writing {0}...'.format(SNAPSHOT_FILENAME))
+                with open(SNAPSHOT_FILENAME, 'w', encoding='utf-8') as f:
+                    f.write(data)
+
+    except Exception as e:
+        errors.append('{0}: Unexpected error: {1}'.format(program, e))
+
+    for error in errors:
+        print(error)
+    return 5 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[0], sys.argv[1:]))
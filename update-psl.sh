@@ -3,9 +3,11 @@ set +eux
 
 curl https://publicsuffix.org/list/public_suffix_list.dat --output plugins/public_suffix_list.dat
 
-git status plugins/public_suffix_list.dat
+./update-psl-data.py
 
-if [ -n "$(git status --porcelain=v1 plugins/public_suffix_list.dat)" ]; then
+git status plugins/public_suffix_list.dat plugins/plugin_utils/_public_suffix_list_data.py
+
+if [ -n "$(git status --porcelain=v1 plugins/public_suffix_list.dat plugins/plugin_utils/_public_suffix_list_data.py)" ]; then
     git diff
     if [ ! -e changelogs/fragments/update-psl.yml ]; then
         echo "bugfixes:" > changelogs/fragments/update-psl.yml